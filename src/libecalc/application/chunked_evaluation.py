@@ -0,0 +1,250 @@
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Type
+
+import numpy as np
+from numpy.typing import NDArray
+
+from libecalc import dto
+from libecalc.application.energy_calculator import EnergyCalculator
+from libecalc.common.logger import logger
+from libecalc.common.units import Unit
+from libecalc.common.utils.rates import (
+    TimeSeries,
+    TimeSeriesBoolean,
+    TimeSeriesCalendarDayRate,
+    TimeSeriesFloat,
+    TimeSeriesInt,
+    TimeSeriesStreamDayRate,
+)
+from libecalc.core.consumers.legacy_consumer.consumer_function_mapper import has_stateful_compressor_models
+from libecalc.core.result import EcalcModelResult
+from libecalc.core.result.emission import EmissionResult
+from libecalc.dto.component_graph import ComponentGraph
+
+# Time series types stored, with the dtype of the stored values. Other attributes of the results are not stored.
+STORED_TIME_SERIES_TYPES: Dict[str, Type[TimeSeries]] = {
+    time_series_type.__name__: time_series_type
+    for time_series_type in [
+        TimeSeriesFloat,
+        TimeSeriesStreamDayRate,
+        TimeSeriesCalendarDayRate,
+        TimeSeriesInt,
+        TimeSeriesBoolean,
+    ]
+}
+DTYPES = {
+    TimeSeriesInt: np.int64,
+    TimeSeriesBoolean: np.bool_,
+}
+
+TIME_VECTOR_FILENAME = "time_vector.bin"
+METADATA_FILENAME = "metadata.json"
+
+
+class ColumnarResultStore:
+    """
+    On-disk store of results, with one binary file per component and result attribute. Results are appended one chunk
+    of timesteps at a time, so that only the results of a single chunk need to be kept in memory.
+
+    Only the time series of the component results (energy usage, power, validity etc.) and the emission rates are
+    stored, not the results of the underlying models.
+    """
+
+    def __init__(self, directory: Path, resume: bool = False):
+        """
+        Args:
+            directory: the directory the results are stored in
+            resume: keep the results already stored in the directory, and append to them, e.g. to continue an
+                interrupted evaluation. Results of a chunk that was not completely stored are removed. Without resume,
+                the directory must be empty, to not mix the results of different evaluations.
+        """
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        if not resume and any(self._directory.iterdir()):
+            raise ValueError(
+                f"Can not store results in '{self._directory}', the directory is not empty. Use an empty directory, or"
+                f" resume to append to the results stored in it."
+            )
+
+        metadata_path = self._directory / METADATA_FILENAME
+        if metadata_path.exists():
+            self._columns: Dict[str, Dict[str, str]] = json.loads(metadata_path.read_text())["columns"]
+        else:
+            self._columns = {}
+        self._remove_incomplete_chunk()
+
+    @classmethod
+    def open(cls, directory: Path) -> "ColumnarResultStore":
+        """Open the results stored in a directory, e.g. to read them."""
+        if not (Path(directory) / METADATA_FILENAME).exists():
+            raise FileNotFoundError(f"No results stored in '{directory}'")
+        return cls(directory, resume=True)
+
+    def _remove_incomplete_chunk(self):
+        """
+        Truncate the stored values to the timesteps that are stored for all columns. The time vector of a chunk is
+        stored after the values, and the columns are only known after the first chunk is completely stored.
+        """
+        time_vector_path = self._directory / TIME_VECTOR_FILENAME
+        number_of_timesteps = len(self.time_vector) if self._columns else 0
+        if time_vector_path.exists():
+            os.truncate(time_vector_path, number_of_timesteps * np.dtype("datetime64[us]").itemsize)
+        for column in self._columns.values():
+            column_path = self._directory / column["filename"]
+            itemsize = np.dtype(DTYPES.get(STORED_TIME_SERIES_TYPES[column["type"]], np.float64)).itemsize
+            if column_path.exists() and column_path.stat().st_size > number_of_timesteps * itemsize:
+                os.truncate(column_path, number_of_timesteps * itemsize)
+
+    @staticmethod
+    def _get_column_name(component_id: str, attribute: str, emission_name: Optional[str] = None) -> str:
+        if emission_name is not None:
+            return f"{component_id}/emissions/{emission_name}/{attribute}"
+        return f"{component_id}/{attribute}"
+
+    def _append_column(self, column_name: str, time_series: TimeSeries):
+        time_series_type = type(time_series)
+        mode = "ab"
+        if column_name not in self._columns:
+            self._columns[column_name] = {
+                "filename": f"{len(self._columns)}.bin",
+                "type": time_series_type.__name__,
+                "unit": time_series.unit.value,
+            }
+            # Overwrite values left by an incomplete first chunk
+            mode = "wb"
+        dtype = DTYPES.get(time_series_type, np.float64)
+        values = np.asarray(time_series.values, dtype=dtype)
+        with open(self._directory / self._columns[column_name]["filename"], mode) as column_file:
+            values.tofile(column_file)
+
+    def append(
+        self,
+        time_vector: List[datetime],
+        consumer_results: Dict[str, EcalcModelResult],
+        emission_results: Dict[str, Dict[str, EmissionResult]],
+    ):
+        """
+        Append the results for a chunk of timesteps. Results must be appended in the order of the timesteps, and
+        all chunks must have results for the same components.
+        """
+        for component_id, consumer_result in consumer_results.items():
+            for attribute, value in consumer_result.component_result.__dict__.items():
+                if type(value).__name__ in STORED_TIME_SERIES_TYPES:
+                    self._append_column(self._get_column_name(component_id, attribute), value)
+
+        for component_id, emissions in emission_results.items():
+            for emission_name, emission_result in emissions.items():
+                self._append_column(self._get_column_name(component_id, "rate", emission_name), emission_result.rate)
+
+        with open(self._directory / TIME_VECTOR_FILENAME, "ab") as time_vector_file:
+            np.asarray(time_vector, dtype="datetime64[us]").tofile(time_vector_file)
+        (self._directory / METADATA_FILENAME).write_text(json.dumps({"columns": self._columns}))
+
+    @property
+    def time_vector(self) -> List[datetime]:
+        time_vector_path = self._directory / TIME_VECTOR_FILENAME
+        if not time_vector_path.exists():
+            return []
+        return np.fromfile(time_vector_path, dtype="datetime64[us]").tolist()
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._columns)
+
+    def read_values(self, component_id: str, attribute: str, emission_name: Optional[str] = None) -> NDArray:
+        """
+        Read the values of a result attribute for all timesteps, memory mapped to avoid reading the whole file.
+
+        Args:
+            component_id: the id of the component
+            attribute: the attribute of the component result, e.g. energy_usage, or rate for emissions
+            emission_name: the name of the emission, for emission rates
+
+        Returns: the values of the attribute
+        """
+        column = self._columns[self._get_column_name(component_id, attribute, emission_name)]
+        dtype = DTYPES.get(STORED_TIME_SERIES_TYPES[column["type"]], np.float64)
+        return np.memmap(self._directory / column["filename"], dtype=dtype, mode="r")
+
+    def read_time_series(self, component_id: str, attribute: str, emission_name: Optional[str] = None) -> TimeSeries:
+        """Read a result attribute for all timesteps as a time series of the same type as in the results."""
+        column = self._columns[self._get_column_name(component_id, attribute, emission_name)]
+        return STORED_TIME_SERIES_TYPES[column["type"]](
+            timesteps=self.time_vector,
+            values=self.read_values(component_id, attribute, emission_name).tolist(),
+            unit=Unit(column["unit"]),
+        )
+
+
+def get_components_with_state_between_timesteps(graph: ComponentGraph) -> List[str]:
+    """
+    Get the components where the result for a timestep depends on the earlier timesteps evaluated, i.e. consumers with
+    compressor trains with multiple streams, which recirculate the fluid that entered a stage in earlier timesteps when
+    there is no flow into the stage.
+    """
+    return [
+        component_id
+        for component_id, component_dto in graph.nodes.items()
+        if isinstance(component_dto, (dto.ElectricityConsumer, dto.FuelConsumer))
+        and any(has_stateful_compressor_models(model) for model in component_dto.energy_usage_model.values())
+    ]
+
+
+def evaluate_in_chunks(
+    energy_calculator: EnergyCalculator,
+    variables_map: dto.VariablesMap,
+    chunk_size: int,
+    store: ColumnarResultStore,
+) -> ColumnarResultStore:
+    """
+    Evaluate energy usage and emissions for chunks of the time vector, appending the results of each chunk to the
+    store, to bound the memory used by the results. Timesteps already in the store, when resuming an interrupted
+    evaluation, are not evaluated again.
+
+    Most components are evaluated independently for each timestep: the temporal models, regularity and the conversion
+    between stream day and calendar day rates are all given per timestep, so each chunk gives the same results as
+    evaluating the whole time vector at once. The exception is consumers keeping state between timesteps, see
+    get_components_with_state_between_timesteps. These start without state in each chunk, as in a separate
+    evaluation of the timesteps of the chunk, and may give other results than evaluating the whole time vector.
+
+    Args:
+        energy_calculator: the energy calculator for the graph to evaluate
+        variables_map: the variables for the whole time vector
+        chunk_size: the number of timesteps in each chunk
+        store: the store the results are appended to
+
+    Returns: the store with the results for the whole time vector
+    """
+    if chunk_size < 1:
+        raise ValueError(f"Chunk size must be at least 1, got {chunk_size}")
+
+    stored_time_vector = store.time_vector
+    if stored_time_vector != variables_map.time_vector[: len(stored_time_vector)]:
+        raise ValueError("Can not resume evaluation, the stored results are for another time vector")
+
+    components_with_state = get_components_with_state_between_timesteps(energy_calculator.graph)
+    if components_with_state:
+        logger.warning(
+            f"The components {', '.join(components_with_state)} keep state between timesteps, which is not kept"
+            f" between chunks. The results may differ from evaluating all timesteps at once."
+        )
+
+    number_of_timesteps = len(variables_map.time_vector)
+    for start_index in range(len(stored_time_vector), number_of_timesteps, chunk_size):
+        end_index = min(start_index + chunk_size, number_of_timesteps)
+        logger.debug(f"Evaluating timesteps {start_index} to {end_index} of {number_of_timesteps}")
+        variables_map_for_chunk = variables_map.get_subset(start_index=start_index, end_index=end_index)
+        consumer_results = energy_calculator.evaluate_energy_usage(variables_map_for_chunk)
+        emission_results = energy_calculator.evaluate_emissions(
+            variables_map=variables_map_for_chunk,
+            consumer_results=consumer_results,
+        )
+        store.append(
+            time_vector=variables_map_for_chunk.time_vector,
+            consumer_results=consumer_results,
+            emission_results=emission_results,
+        )
+    return store
@@ -1,27 +1,39 @@
+import multiprocessing
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 from functools import reduce
-from typing import Dict
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
 
 import numpy as np
 
 import libecalc.dto.components
 from libecalc import dto
+from libecalc.application.result_cache import ComponentResultCache
 from libecalc.common.list.list_utils import elementwise_sum
+from libecalc.common.logger import logger
 from libecalc.common.math.numbers import Numbers
 from libecalc.common.priorities import PriorityID
 from libecalc.common.priority_optimizer import PriorityOptimizer
 from libecalc.common.units import Unit
 from libecalc.common.utils.rates import TimeSeriesInt, TimeSeriesString
 from libecalc.core.consumers.consumer_system import ConsumerSystem
-from libecalc.core.consumers.factory import create_consumer
+from libecalc.core.consumers.evaluation_cache import ConsumerEvaluationCache
+from libecalc.core.consumers.factory import (
+    create_consumer,
+    group_timesteps_by_energy_usage_models,
+    has_stateful_energy_usage_models,
+)
 from libecalc.core.consumers.generator_set import Genset
 from libecalc.core.consumers.legacy_consumer.component import Consumer
+from libecalc.core.consumers.legacy_consumer.consumer_function_mapper import has_stateful_compressor_models
 from libecalc.core.models.fuel import FuelModel
+from libecalc.core.models.model_registry import DomainModelRegistry, use_domain_model_registry
 from libecalc.core.result import ComponentResult, EcalcModelResult
 from libecalc.core.result.emission import EmissionResult
 from libecalc.dto.component_graph import ComponentGraph
 from libecalc.dto.types import ConsumptionType
+from libecalc.expression.evaluation_context import ExpressionEvaluationContext, use_evaluation_context
 from libecalc.presentation.yaml.yaml_types.emitters.yaml_venting_emitter import (
     YamlDirectTypeEmitter,
     YamlOilTypeEmitter,
@@ -32,121 +44,503 @@ def merge_results(results_per_timestep: Dict[datetime, EcalcModelResult]) -> Eca
     return reduce(lambda acc, x: acc.merge(x), results_per_timestep.values())
 
 
+# Components evaluated by _evaluate_component, the other components give no results
+EVALUATED_COMPONENT_TYPES = (
+    dto.ElectricityConsumer,
+    dto.FuelConsumer,
+    dto.GeneratorSet,
+    libecalc.dto.components.ConsumerSystem,
+)
+
+
+def _get_domain_model(domain_models: Optional[Dict[Hashable, Any]], key: Hashable, create: Callable[[], Any]):
+    """Get the domain model with the given key, creating it if it does not exist."""
+    if domain_models is None:
+        return create()
+    if key not in domain_models:
+        domain_models[key] = create()
+    return domain_models[key]
+
+
+def _evaluate_component(
+    component_dto: dto.components.Component,
+    variables_map: dto.VariablesMap,
+    successor_results: Dict[str, EcalcModelResult],
+    use_evaluation_cache: bool,
+    domain_models: Optional[Dict[Hashable, Any]] = None,
+) -> Dict[str, EcalcModelResult]:
+    """
+    Evaluate the energy usage of a single component in the graph. Module level to be able to evaluate components in
+    worker processes.
+
+    Args:
+        component_dto: the component to evaluate
+        variables_map: the variables used to evaluate the component
+        successor_results: the results of the successors of the component in the graph, i.e. the consumers of a
+            generator set
+        use_evaluation_cache: reuse consumer results for identical stream conditions in consumer systems (v2)
+        domain_models: domain models created for earlier evaluations, reused and added to when given
+
+    Returns: the results of the component and its sub components, empty if the component is not evaluated
+    """
+    consumer_results: Dict[str, EcalcModelResult] = {}
+
+    if isinstance(component_dto, (dto.ElectricityConsumer, dto.FuelConsumer)):
+        # A consumer keeping state between evaluations is created for each evaluation, to give the same results
+        if any(has_stateful_compressor_models(model) for model in component_dto.energy_usage_model.values()):
+            domain_models = None
+        consumer = _get_domain_model(domain_models, component_dto.id, lambda: Consumer(consumer_dto=component_dto))
+        consumer_results[component_dto.id] = consumer.evaluate(variables_map=variables_map)
+    elif isinstance(component_dto, dto.GeneratorSet):
+        fuel_consumer = _get_domain_model(domain_models, component_dto.id, lambda: Genset(component_dto))
+
+        power_requirement = elementwise_sum(
+            *[successor_result.component_result.power.values for successor_result in successor_results.values()],
+            timesteps=variables_map.time_vector,
+        )
+
+        consumer_results[component_dto.id] = EcalcModelResult(
+            component_result=fuel_consumer.evaluate(
+                variables_map=variables_map,
+                power_requirement=power_requirement,
+            ),
+            models=[],
+            sub_components=[],
+        )
+    elif isinstance(component_dto, libecalc.dto.components.ConsumerSystem):
+        evaluated_stream_conditions = component_dto.evaluate_stream_conditions(
+            variables_map=variables_map,
+        )
+        optimizer = PriorityOptimizer()
+        priorities = list(evaluated_stream_conditions.keys())
+
+        results_per_consumer: Dict[str, List[ComponentResult]] = defaultdict(list)
+        priority_used_per_timestep: Dict[datetime, PriorityID] = {}
+        timestep_indices_per_models = group_timesteps_by_energy_usage_models(
+            consumers=component_dto.consumers,
+            timesteps=variables_map.time_vector,
+        )
+        if any(has_stateful_energy_usage_models(consumer) for consumer in component_dto.consumers):
+            # The results of consumers keeping state between evaluations depend on the order the timesteps and
+            # priorities are evaluated in. Evaluate one timestep at a time, trying the priorities in order, with
+            # consumers created for each timestep.
+            timestep_indices_per_models = [
+                [timestep_index]
+                for timestep_indices_for_models in timestep_indices_per_models
+                for timestep_index in timestep_indices_for_models
+            ]
+            domain_models = None
+        for timestep_indices_for_models in timestep_indices_per_models:
+            timesteps_for_models = [variables_map.time_vector[index] for index in timestep_indices_for_models]
+            # One cache per model period, since the consumers are created per model period
+            evaluation_cache = ConsumerEvaluationCache() if use_evaluation_cache else None
+            consumers_for_models = [
+                _get_domain_model(
+                    domain_models,
+                    (consumer.id, timesteps_for_models[0]),
+                    lambda consumer=consumer: create_consumer(
+                        consumer=consumer,
+                        timestep=timesteps_for_models[0],
+                    ),
+                )
+                for consumer in component_dto.consumers
+            ]
+
+            consumer_system = ConsumerSystem(
+                id=component_dto.id,
+                consumers=consumers_for_models,
+                component_conditions=component_dto.component_conditions,
+                evaluation_cache=evaluation_cache,
+            )
+
+            def evaluator(priority: PriorityID, timestep_indices: List[int]):
+                stream_conditions_for_priority = evaluated_stream_conditions[priority]
+                indices = [timestep_indices_for_models[index] for index in timestep_indices]
+                stream_conditions_for_timesteps = {
+                    component_id: [stream_condition.get_subset(indices) for stream_condition in stream_conditions]
+                    for component_id, stream_conditions in stream_conditions_for_priority.items()
+                }
+                return consumer_system.evaluate_consumers(stream_conditions_for_timesteps)
+
+            optimizer_result = optimizer.optimize(
+                priorities=priorities,
+                number_of_timesteps=len(timestep_indices_for_models),
+                evaluator=evaluator,
+            )
+            priority_used_per_timestep.update(zip(timesteps_for_models, optimizer_result.priorities_used))
+            for consumer_result in optimizer_result.priority_results:
+                results_per_consumer[consumer_result.id].append(consumer_result)
+            if evaluation_cache is not None:
+                logger.debug(
+                    f"Evaluation cache for consumer system '{component_dto.name}': "
+                    f"{evaluation_cache.statistics.hits} hits, {evaluation_cache.statistics.misses} misses"
+                )
+
+        priorities_used = TimeSeriesString(
+            timesteps=variables_map.time_vector,
+            values=[priority_used_per_timestep[timestep] for timestep in variables_map.time_vector],
+            unit=Unit.NONE,
+        )
+
+        # merge consumer results
+        consumer_ids = [consumer.id for consumer in component_dto.consumers]
+        merged_consumer_results = []
+        for consumer_id in consumer_ids:
+            first_result, *rest_results = sorted(
+                results_per_consumer[consumer_id], key=lambda result: result.timesteps[0]
+            )
+            merged_consumer_results.append(first_result.merge(*rest_results) if rest_results else first_result)
+
+        # Convert to legacy compatible operational_settings_used
+        priorities_to_int_map = {
+            priority_name: index + 1 for index, priority_name in enumerate(evaluated_stream_conditions.keys())
+        }
+        operational_settings_used = TimeSeriesInt(
+            timesteps=priorities_used.timesteps,
+            values=[priorities_to_int_map[priority_name] for priority_name in priorities_used.values],
+            unit=priorities_used.unit,
+        )
+
+        system_result = ConsumerSystem.get_system_result(
+            id=component_dto.id,
+            consumer_results=merged_consumer_results,
+            operational_settings_used=operational_settings_used,
+        )
+        consumer_results[component_dto.id] = system_result
+        for consumer_result in merged_consumer_results:
+            consumer_results[consumer_result.id] = EcalcModelResult(
+                component_result=consumer_result,
+                sub_components=[],
+                models=[],
+            )
+
+    return consumer_results
+
+
+# State of a worker process evaluating components in parallel, set up by _initialize_worker
+_worker_state: Dict[str, Any] = {}
+
+
+def _initialize_worker(graph: ComponentGraph, variables_map: dto.VariablesMap, use_evaluation_cache: bool):
+    """
+    Set up a worker process evaluating components of the graph in parallel, see
+    EnergyCalculator._evaluate_components_in_parallel. The graph and the variables are the same for all the tasks of a
+    worker, and are only sent to the worker once. The domain models, the shared facility models and the evaluated
+    expressions are reused between the subtrees evaluated by the worker, as in EnergyCalculator.evaluate_components.
+    """
+    _worker_state.update(
+        graph=graph,
+        variables_map=variables_map,
+        use_evaluation_cache=use_evaluation_cache,
+        domain_models={},
+        model_registry=DomainModelRegistry(),
+        evaluation_context=ExpressionEvaluationContext(),
+    )
+
+
+def _evaluate_subtree_in_worker(
+    component_ids: List[str], known_results: Dict[str, Dict[str, EcalcModelResult]]
+) -> Dict[str, Dict[str, EcalcModelResult]]:
+    """
+    Evaluate the components of an independent subtree of the graph in a worker set up by _initialize_worker.
+
+    Args:
+        component_ids: the ids of the components to evaluate, in the order they are evaluated in
+        known_results: the results of the successors of the generator sets that are not evaluated in the worker
+
+    Returns: the results of each evaluated component, see _evaluate_component
+    """
+    graph: ComponentGraph = _worker_state["graph"]
+    results_per_component = dict(known_results)
+    with use_domain_model_registry(_worker_state["model_registry"]), use_evaluation_context(
+        _worker_state["evaluation_context"]
+    ):
+        for component_id in component_ids:
+            component_dto = graph.get_node(component_id)
+            successor_results = (
+                {
+                    successor_id: results_per_component[successor_id][successor_id]
+                    for successor_id in graph.get_successors(component_id)
+                }
+                if isinstance(component_dto, dto.GeneratorSet)
+                else {}
+            )
+            results_per_component[component_id] = _evaluate_component(
+                component_dto=component_dto,
+                variables_map=_worker_state["variables_map"],
+                successor_results=successor_results,
+                use_evaluation_cache=_worker_state["use_evaluation_cache"],
+                domain_models=_worker_state["domain_models"],
+            )
+    return {component_id: results_per_component[component_id] for component_id in component_ids}
+
+
 class EnergyCalculator:
     def __init__(
         self,
         graph: ComponentGraph,
+        use_evaluation_cache: bool = True,
+        max_workers: int = 1,
+        result_cache: Optional[ComponentResultCache] = None,
     ):
+        """
+        Args:
+            graph: the component graph to evaluate
+            use_evaluation_cache: reuse consumer results for identical stream conditions in consumer systems (v2).
+                Disable to evaluate every timestep and priority, e.g. to verify the results of the cache.
+            max_workers: number of worker processes used to evaluate independent components in parallel. The
+                default, 1, evaluates all components in this process. The results are the same in both cases.
+                Experimental and opt-in: starting the workers, each with its own NeqSim gateway, usually takes longer
+                than evaluating the components in this process, so this is usually slower. It may only pay off with
+                several CPUs and components that take long to evaluate.
+            result_cache: on-disk cache of component results, reused between runs for unchanged components
+        """
         self._graph = graph
+        self._use_evaluation_cache = use_evaluation_cache
+        self._max_workers = max_workers
+        self._result_cache = result_cache
+        # Domain models created from the components, reused when evaluating the graph for other variables
+        self._domain_models: Dict[Hashable, Any] = {}
+        self._model_registry = DomainModelRegistry()
+
+    @property
+    def graph(self) -> ComponentGraph:
+        return self._graph
+
+    def update_graph(self, graph: ComponentGraph, changed_component_ids: Iterable[str]):
+        """
+        Change the graph to evaluate, keeping the domain models of the components that have not changed.
+
+        Args:
+            graph: the changed component graph
+            changed_component_ids: the ids of the components that are new or changed compared to the current graph
+        """
+        self._graph = graph
+        changed_component_ids = set(changed_component_ids)
+        for key in list(self._domain_models):
+            # Consumers in consumer systems (v2) are created per model period, and keyed by id and start of the period
+            component_id = key[0] if isinstance(key, tuple) else key
+            if component_id in changed_component_ids or component_id not in graph.nodes:
+                del self._domain_models[key]
 
     def evaluate_energy_usage(self, variables_map: dto.VariablesMap) -> Dict[str, EcalcModelResult]:
-        component_ids = list(reversed(self._graph.sorted_node_ids))
-        component_dtos = [self._graph.get_node(component_id) for component_id in component_ids]
+        results_per_component = self.evaluate_components(variables_map=variables_map)
+        return Numbers.format_results_to_precision(
+            self.collect_consumer_results(results_per_component),
+            precision=6,
+        )
 
-        consumer_results: Dict[str, EcalcModelResult] = {}
+    def evaluate_components(
+        self,
+        variables_map: dto.VariablesMap,
+        component_ids: Optional[Iterable[str]] = None,
+        results_per_component: Optional[Dict[str, Dict[str, EcalcModelResult]]] = None,
+    ) -> Dict[str, Dict[str, EcalcModelResult]]:
+        """
+        Evaluate the energy usage of the components in the graph, without rounding the results.
 
-        for component_dto in component_dtos:
-            if isinstance(component_dto, (dto.ElectricityConsumer, dto.FuelConsumer)):
-                consumer = Consumer(consumer_dto=component_dto)
-                consumer_results[component_dto.id] = consumer.evaluate(variables_map=variables_map)
-            elif isinstance(component_dto, dto.GeneratorSet):
-                fuel_consumer = Genset(component_dto)
-
-                power_requirement = elementwise_sum(
-                    *[
-                        consumer_results[consumer_id].component_result.power.values
-                        for consumer_id in self._graph.get_successors(component_dto.id)
-                    ],
-                    timesteps=variables_map.time_vector,
-                )
+        Args:
+            variables_map: the variables used to evaluate the components
+            component_ids: the components to evaluate, all components if not given
+            results_per_component: earlier results, reused for the components that are not evaluated
 
-                consumer_results[component_dto.id] = EcalcModelResult(
-                    component_result=fuel_consumer.evaluate(
-                        variables_map=variables_map,
-                        power_requirement=power_requirement,
-                    ),
-                    models=[],
-                    sub_components=[],
-                )
-            elif isinstance(component_dto, libecalc.dto.components.ConsumerSystem):
-                evaluated_stream_conditions = component_dto.evaluate_stream_conditions(
+        Returns: the results of each component, including the results of the sub components of consumer systems
+        """
+        sorted_component_ids = list(reversed(self._graph.sorted_node_ids))
+        if component_ids is not None:
+            component_ids_to_evaluate = set(component_ids)
+            sorted_component_ids = [
+                component_id for component_id in sorted_component_ids if component_id in component_ids_to_evaluate
+            ]
+
+        results_per_component = dict(results_per_component) if results_per_component is not None else {}
+        # Identical facility models referenced by several components are only set up once, and expressions are only
+        # evaluated once for the same variables
+        with use_domain_model_registry(self._model_registry), use_evaluation_context(ExpressionEvaluationContext()):
+            if self._max_workers > 1:
+                self._evaluate_components_in_parallel(
+                    component_ids=sorted_component_ids,
                     variables_map=variables_map,
+                    results_per_component=results_per_component,
                 )
-                optimizer = PriorityOptimizer()
+            else:
+                for component_id in sorted_component_ids:
+                    component_dto = self._graph.get_node(component_id)
+                    successor_results = self._get_successor_results(component_id, results_per_component)
+                    cache_key = self._get_result_cache_key(component_dto, variables_map, successor_results)
+                    cached_results = self._result_cache.get(cache_key) if cache_key is not None else None
+                    if cached_results is not None:
+                        results_per_component[component_id] = cached_results
+                        continue
 
-                results_per_timestep: Dict[str, Dict[datetime, ComponentResult]] = defaultdict(dict)
-                priorities_used = TimeSeriesString(
-                    timesteps=[],
-                    values=[],
-                    unit=Unit.NONE,
-                )
-                for timestep in variables_map.time_vector:
-                    consumers_for_timestep = [
-                        create_consumer(
-                            consumer=consumer,
-                            timestep=timestep,
-                        )
-                        for consumer in component_dto.consumers
-                    ]
-
-                    consumer_system = ConsumerSystem(
-                        id=component_dto.id,
-                        consumers=consumers_for_timestep,
-                        component_conditions=component_dto.component_conditions,
+                    results_per_component[component_id] = _evaluate_component(
+                        component_dto=component_dto,
+                        variables_map=variables_map,
+                        successor_results=successor_results,
+                        use_evaluation_cache=self._use_evaluation_cache,
+                        domain_models=self._domain_models,
                     )
+                    if cache_key is not None:
+                        self._result_cache.put(cache_key, results_per_component[component_id])
 
-                    def evaluator(priority: PriorityID):
-                        stream_conditions_for_priority = evaluated_stream_conditions[priority]
-                        stream_conditions_for_timestep = {
-                            component_id: [
-                                stream_condition.for_timestep(timestep) for stream_condition in stream_conditions
-                            ]
-                            for component_id, stream_conditions in stream_conditions_for_priority.items()
-                        }
-                        return consumer_system.evaluate_consumers(stream_conditions_for_timestep)
-
-                    optimizer_result = optimizer.optimize(
-                        priorities=list(evaluated_stream_conditions.keys()),
-                        evaluator=evaluator,
-                    )
-                    priorities_used.append(timestep=timestep, value=optimizer_result.priority_used)
-                    for consumer_result in optimizer_result.priority_results:
-                        results_per_timestep[consumer_result.id][timestep] = consumer_result
-
-                # merge consumer results
-                consumer_ids = [consumer.id for consumer in component_dto.consumers]
-                merged_consumer_results = []
-                for consumer_id in consumer_ids:
-                    first_result, *rest_results = list(results_per_timestep[consumer_id].values())
-                    merged_consumer_results.append(first_result.merge(*rest_results))
-
-                # Convert to legacy compatible operational_settings_used
-                priorities_to_int_map = {
-                    priority_name: index + 1 for index, priority_name in enumerate(evaluated_stream_conditions.keys())
-                }
-                operational_settings_used = TimeSeriesInt(
-                    timesteps=priorities_used.timesteps,
-                    values=[priorities_to_int_map[priority_name] for priority_name in priorities_used.values],
-                    unit=priorities_used.unit,
-                )
+        return results_per_component
+
+    def collect_consumer_results(
+        self, results_per_component: Dict[str, Dict[str, EcalcModelResult]]
+    ) -> Dict[str, EcalcModelResult]:
+        """
+        Collect the results of the components in the order of the graph, independent of the order the components were
+        evaluated in.
+        """
+        consumer_results: Dict[str, EcalcModelResult] = {}
+        for component_id in reversed(self._graph.sorted_node_ids):
+            consumer_results.update(results_per_component[component_id])
+        return consumer_results
+
+    def _get_result_cache_key(
+        self,
+        component_dto: dto.components.Component,
+        variables_map: dto.VariablesMap,
+        successor_results: Dict[str, EcalcModelResult],
+    ) -> Optional[str]:
+        """Get the key of the component in the result cache, None if not using a cache or the component is not evaluated."""
+        if self._result_cache is None or not isinstance(component_dto, EVALUATED_COMPONENT_TYPES):
+            return None
+        return self._result_cache.get_key(component_dto, variables_map, successor_results)
+
+    def _get_successor_results(
+        self, component_id: str, results_per_component: Dict[str, Dict[str, EcalcModelResult]]
+    ) -> Dict[str, EcalcModelResult]:
+        """
+        Get the results of the successors of a component. Only generator sets depend on the results of their
+        successors.
+        """
+        if not isinstance(self._graph.get_node(component_id), dto.GeneratorSet):
+            return {}
+        return {
+            successor_id: results_per_component[successor_id][successor_id]
+            for successor_id in self._graph.get_successors(component_id)
+        }
+
+    def _get_independent_subtrees(self, component_ids: List[str]) -> List[List[str]]:
+        """
+        Group the evaluated components in subtrees that can be evaluated independently of each other, i.e. each
+        generator set with its consumers, and each of the other consumers and consumer systems by itself.
+
+        Args:
+            component_ids: the ids of the components to evaluate, in the order they are evaluated in
 
-                system_result = ConsumerSystem.get_system_result(
-                    id=component_dto.id,
-                    consumer_results=merged_consumer_results,
-                    operational_settings_used=operational_settings_used,
+        Returns: the ids of the components in each subtree, in the order they are evaluated in
+        """
+        component_ids_to_evaluate = set(component_ids)
+        subtree_root_ids: Dict[str, str] = {}
+        for component_id in component_ids:
+            if isinstance(self._graph.get_node(component_id), dto.GeneratorSet):
+                for successor_id in self._graph.get_successors(component_id):
+                    if successor_id in component_ids_to_evaluate:
+                        subtree_root_ids[successor_id] = component_id
+
+        subtrees: Dict[str, List[str]] = defaultdict(list)
+        for component_id in component_ids:
+            if isinstance(self._graph.get_node(component_id), EVALUATED_COMPONENT_TYPES):
+                subtrees[subtree_root_ids.get(component_id, component_id)].append(component_id)
+        return list(subtrees.values())
+
+    def _evaluate_components_in_parallel(
+        self,
+        component_ids: List[str],
+        variables_map: dto.VariablesMap,
+        results_per_component: Dict[str, Dict[str, EcalcModelResult]],
+    ) -> None:
+        """
+        Evaluate the components in a pool of worker processes, one task for each independent subtree, see
+        _get_independent_subtrees. The graph and the variables are sent once to each worker, which sets up its own
+        domain models and expression evaluation context, see _initialize_worker.
+
+        Results are read from and written to the result cache in this process. Only the components of a subtree that
+        are not in the cache are evaluated in the workers.
+
+        The workers are spawned rather than forked, so that each worker starts its own NeqSim gateway instead of
+        sharing the connection of this process.
+
+        Args:
+            component_ids: the ids of the components to evaluate
+            variables_map: the variables used to evaluate the components
+            results_per_component: the results of each component, see _evaluate_component. Updated in place with the
+                results of the evaluated components.
+        """
+        for component_id in component_ids:
+            if not isinstance(self._graph.get_node(component_id), EVALUATED_COMPONENT_TYPES):
+                results_per_component[component_id] = {}
+
+        cache_keys: Dict[str, Optional[str]] = {}
+        tasks: List[Tuple[List[str], Dict[str, Dict[str, EcalcModelResult]]]] = []
+        for subtree in self._get_independent_subtrees(component_ids):
+            component_ids_to_evaluate = []
+            for component_id in subtree:
+                if component_ids_to_evaluate and isinstance(self._graph.get_node(component_id), dto.GeneratorSet):
+                    # Depends on the results of consumers evaluated in the worker
+                    component_ids_to_evaluate.append(component_id)
+                    continue
+                component_dto = self._graph.get_node(component_id)
+                successor_results = self._get_successor_results(component_id, results_per_component)
+                cache_keys[component_id] = self._get_result_cache_key(component_dto, variables_map, successor_results)
+                cached_results = (
+                    self._result_cache.get(cache_keys[component_id]) if cache_keys[component_id] is not None else None
                 )
-                consumer_results[component_dto.id] = system_result
-                for consumer_result in merged_consumer_results:
-                    consumer_results[consumer_result.id] = EcalcModelResult(
-                        component_result=consumer_result,
-                        sub_components=[],
-                        models=[],
-                    )
+                if cached_results is not None:
+                    results_per_component[component_id] = cached_results
+                else:
+                    component_ids_to_evaluate.append(component_id)
 
-        return Numbers.format_results_to_precision(consumer_results, precision=6)
+            if component_ids_to_evaluate:
+                # Results of the successors of the generator sets that are already known, from the cache or from
+                # earlier evaluations
+                known_results = {
+                    successor_id: results_per_component[successor_id]
+                    for component_id in component_ids_to_evaluate
+                    if isinstance(self._graph.get_node(component_id), dto.GeneratorSet)
+                    for successor_id in self._graph.get_successors(component_id)
+                    if successor_id in results_per_component
+                }
+                tasks.append((component_ids_to_evaluate, known_results))
+
+        if not tasks:
+            return
+
+        # Start the largest subtrees first, to not end with one worker evaluating a large subtree
+        tasks.sort(key=lambda task: len(task[0]), reverse=True)
+        with ProcessPoolExecutor(
+            max_workers=min(self._max_workers, len(tasks)),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_initialize_worker,
+            initargs=(self._graph, variables_map, self._use_evaluation_cache),
+        ) as executor:
+            futures = {
+                executor.submit(_evaluate_subtree_in_worker, component_ids_to_evaluate, known_results): (
+                    component_ids_to_evaluate
+                )
+                for component_ids_to_evaluate, known_results in tasks
+            }
+            for future in as_completed(futures):
+                subtree_results = future.result()
+                for component_id in futures[future]:
+                    results_per_component[component_id] = subtree_results[component_id]
+                    if self._result_cache is None:
+                        continue
+                    if cache_keys.get(component_id) is None:
+                        cache_keys[component_id] = self._get_result_cache_key(
+                            self._graph.get_node(component_id),
+                            variables_map,
+                            self._get_successor_results(component_id, results_per_component),
+                        )
+                    self._result_cache.put(cache_keys[component_id], results_per_component[component_id])
 
     def evaluate_emissions(
-        self, variables_map: dto.VariablesMap, consumer_results: Dict[str, EcalcModelResult]
+        self,
+        variables_map: dto.VariablesMap,
+        consumer_results: Dict[str, EcalcModelResult],
+        component_ids: Optional[Iterable[str]] = None,
     ) -> Dict[str, Dict[str, EmissionResult]]:
         """
         Calculate emissions for fuel consumers and emitters
@@ -154,40 +548,47 @@ class EnergyCalculator:
         Args:
             variables_map:
             consumer_results:
+            component_ids: the components to calculate emissions for, all components if not given
 
         Returns: a mapping from consumer_id to emissions
         """
+        component_dtos = (
+            self._graph.nodes.values()
+            if component_ids is None
+            else [self._graph.get_node(component_id) for component_id in component_ids]
+        )
         emission_results: Dict[str, Dict[str, EmissionResult]] = {}
-        for consumer_dto in self._graph.nodes.values():
-            if isinstance(consumer_dto, (dto.FuelConsumer, dto.GeneratorSet)):
-                fuel_model = FuelModel(consumer_dto.fuel)
-                energy_usage = consumer_results[consumer_dto.id].component_result.energy_usage
-                emission_results[consumer_dto.id] = fuel_model.evaluate_emissions(
-                    variables_map=variables_map,
-                    fuel_rate=np.asarray(energy_usage.values),
-                )
-            elif isinstance(consumer_dto, dto.components.ConsumerSystem):
-                if consumer_dto.consumes == ConsumptionType.FUEL:
+        # Expressions, e.g. emission factors of the same fuel, are only evaluated once for the same variables
+        with use_evaluation_context(ExpressionEvaluationContext()):
+            for consumer_dto in component_dtos:
+                if isinstance(consumer_dto, (dto.FuelConsumer, dto.GeneratorSet)):
                     fuel_model = FuelModel(consumer_dto.fuel)
                     energy_usage = consumer_results[consumer_dto.id].component_result.energy_usage
                     emission_results[consumer_dto.id] = fuel_model.evaluate_emissions(
                         variables_map=variables_map, fuel_rate=np.asarray(energy_usage.values)
                     )
-            elif isinstance(consumer_dto, (YamlDirectTypeEmitter, YamlOilTypeEmitter)):
-                installation_id = self._graph.get_parent_installation_id(consumer_dto.id)
-                installation = self._graph.get_node(installation_id)
-
-                venting_emitter_results = {}
-                emission_rates = consumer_dto.get_emissions(
-                    variables_map=variables_map, regularity=installation.regularity
-                )
+                elif isinstance(consumer_dto, dto.components.ConsumerSystem):
+                    if consumer_dto.consumes == ConsumptionType.FUEL:
+                        fuel_model = FuelModel(consumer_dto.fuel)
+                        energy_usage = consumer_results[consumer_dto.id].component_result.energy_usage
+                        emission_results[consumer_dto.id] = fuel_model.evaluate_emissions(
+                            variables_map=variables_map, fuel_rate=np.asarray(energy_usage.values)
+                        )
+                elif isinstance(consumer_dto, (YamlDirectTypeEmitter, YamlOilTypeEmitter)):
+                    installation_id = self._graph.get_parent_installation_id(consumer_dto.id)
+                    installation = self._graph.get_node(installation_id)
 
-                for emission_name, emission_rate in emission_rates.items():
-                    emission_result = EmissionResult(
-                        name=emission_name,
-                        timesteps=variables_map.time_vector,
-                        rate=emission_rate,
+                    venting_emitter_results = {}
+                    emission_rates = consumer_dto.get_emissions(
+                        variables_map=variables_map, regularity=installation.regularity
                     )
-                    venting_emitter_results[emission_name] = emission_result
-                emission_results[consumer_dto.id] = venting_emitter_results
+
+                    for emission_name, emission_rate in emission_rates.items():
+                        emission_result = EmissionResult(
+                            name=emission_name,
+                            timesteps=variables_map.time_vector,
+                            rate=emission_rate,
+                        )
+                        venting_emitter_results[emission_name] = emission_result
+                    emission_results[consumer_dto.id] = venting_emitter_results
         return Numbers.format_results_to_precision(emission_results, precision=6)
@@ -0,0 +1,172 @@
+from typing import Dict, Optional, Set
+
+import networkx as nx
+import numpy as np
+
+from libecalc import dto
+from libecalc.application.energy_calculator import EnergyCalculator
+from libecalc.common.math.numbers import Numbers
+from libecalc.core.result import EcalcModelResult
+from libecalc.core.result.emission import EmissionResult
+from libecalc.dto.component_graph import ComponentGraph
+from libecalc.dto.utils.referenced_variables import get_referenced_variables
+from libecalc.presentation.yaml.yaml_types.emitters.yaml_venting_emitter import (
+    YamlDirectTypeEmitter,
+    YamlOilTypeEmitter,
+)
+
+
+class EnergyCalculatorSession:
+    """
+    Keep the results of a model between changes to the model or the variables, only re-evaluating the components
+    affected by a change.
+
+    The variables read by each component are found from the expressions in the component. A component is affected
+    when the component itself changes, when one of the variables it reads changes, or when one of the components it
+    depends on is affected, i.e. a generator set is re-evaluated when one of its consumers is. Venting emitters are
+    given as yaml, and are treated as reading all the variables.
+
+    The same energy calculator is used for all the evaluations, keeping the domain models of the components that have
+    not changed.
+    """
+
+    def __init__(self, graph: ComponentGraph, variables_map: dto.VariablesMap, **energy_calculator_options):
+        """
+        Args:
+            graph: the component graph to evaluate
+            variables_map: the variables used to evaluate the components
+            **energy_calculator_options: options given to the energy calculator, e.g. max_workers
+        """
+        self._graph = graph
+        self._variables_map = variables_map
+        self._energy_calculator = EnergyCalculator(graph=graph, **energy_calculator_options)
+
+        self._results_per_component: Dict[str, Dict[str, EcalcModelResult]] = {}
+        self._formatted_results_per_component: Dict[str, Dict[str, EcalcModelResult]] = {}
+        self._emission_results: Dict[str, Dict[str, EmissionResult]] = {}
+        self._evaluate(component_ids=set(graph.nodes))
+
+    @property
+    def consumer_results(self) -> Dict[str, EcalcModelResult]:
+        """The energy usage results, as given by EnergyCalculator.evaluate_energy_usage"""
+        consumer_results: Dict[str, EcalcModelResult] = {}
+        for component_id in reversed(self._graph.sorted_node_ids):
+            consumer_results.update(self._formatted_results_per_component[component_id])
+        return consumer_results
+
+    @property
+    def emission_results(self) -> Dict[str, Dict[str, EmissionResult]]:
+        """The emission results, as given by EnergyCalculator.evaluate_emissions"""
+        return {
+            component_id: self._emission_results[component_id]
+            for component_id in self._graph.nodes
+            if component_id in self._emission_results
+        }
+
+    def update(
+        self,
+        graph: Optional[ComponentGraph] = None,
+        variables_map: Optional[dto.VariablesMap] = None,
+    ) -> Set[str]:
+        """
+        Change the graph and/or the variables, and re-evaluate the affected components.
+
+        Args:
+            graph: the changed component graph, the current graph if not given
+            variables_map: the changed variables, the current variables if not given
+
+        Returns: the ids of the re-evaluated components
+        """
+        graph = graph if graph is not None else self._graph
+        variables_map = variables_map if variables_map is not None else self._variables_map
+
+        changed_component_ids = self._get_changed_component_ids(graph)
+        changed_variables = self._get_changed_variables(variables_map)
+
+        self._graph = graph
+        self._variables_map = variables_map
+        self._energy_calculator.update_graph(graph=graph, changed_component_ids=changed_component_ids)
+
+        if changed_variables is None:
+            # Changed time vector
+            affected_component_ids = set(graph.nodes)
+        else:
+            affected_component_ids = {
+                component_id
+                for component_id in graph.nodes
+                if component_id in changed_component_ids
+                or self._reads_variables(graph, component_id, changed_variables)
+                or self._uses_changed_installation(graph, component_id, changed_component_ids)
+            }
+        for component_id in list(affected_component_ids):
+            affected_component_ids.update(nx.ancestors(graph.graph, component_id))
+
+        self._evaluate(component_ids=affected_component_ids)
+        return affected_component_ids
+
+    def _evaluate(self, component_ids: Set[str]):
+        for component_id in set(self._results_per_component) - set(self._graph.nodes):
+            # Removed from the graph
+            del self._results_per_component[component_id]
+            del self._formatted_results_per_component[component_id]
+            self._emission_results.pop(component_id, None)
+
+        self._results_per_component = self._energy_calculator.evaluate_components(
+            variables_map=self._variables_map,
+            component_ids=component_ids,
+            results_per_component=self._results_per_component,
+        )
+        for component_id in component_ids:
+            self._formatted_results_per_component[component_id] = Numbers.format_results_to_precision(
+                self._results_per_component[component_id], precision=6
+            )
+            self._emission_results.pop(component_id, None)
+
+        self._emission_results.update(
+            self._energy_calculator.evaluate_emissions(
+                variables_map=self._variables_map,
+                consumer_results=self.consumer_results,
+                component_ids=component_ids,
+            )
+        )
+
+    def _get_changed_component_ids(self, graph: ComponentGraph) -> Set[str]:
+        """Get the components that are new, changed or have changed successors compared to the current graph."""
+        return {
+            component_id
+            for component_id, component_dto in graph.nodes.items()
+            if component_id not in self._graph.nodes
+            or component_dto != self._graph.get_node(component_id)
+            or set(graph.get_successors(component_id)) != set(self._graph.get_successors(component_id))
+        }
+
+    def _get_changed_variables(self, variables_map: dto.VariablesMap) -> Optional[Set[str]]:
+        """Get the names of the changed variables, None if the time vector has changed."""
+        if variables_map.time_vector != self._variables_map.time_vector:
+            return None
+        return {
+            variable_name
+            for variable_name in {*variables_map.arrays, *self._variables_map.arrays}
+            if variable_name not in variables_map.arrays
+            or variable_name not in self._variables_map.arrays
+            or not np.array_equal(variables_map.arrays[variable_name], self._variables_map.arrays[variable_name])
+        }
+
+    @staticmethod
+    def _uses_changed_installation(graph: ComponentGraph, component_id: str, changed_component_ids: Set[str]) -> bool:
+        """Venting emitters use the regularity of their installation."""
+        return (
+            isinstance(graph.get_node(component_id), (YamlDirectTypeEmitter, YamlOilTypeEmitter))
+            and graph.get_parent_installation_id(component_id) in changed_component_ids
+        )
+
+    @staticmethod
+    def _reads_variables(graph: ComponentGraph, component_id: str, variables: Set[str]) -> bool:
+        if not variables:
+            return False
+        component_dto = graph.get_node(component_id)
+        if isinstance(component_dto, (YamlDirectTypeEmitter, YamlOilTypeEmitter)):
+            # Expressions given as strings
+            return True
+        referenced_variables = get_referenced_variables(component_dto)
+        return referenced_variables is None or not referenced_variables.isdisjoint(variables)
@@ -0,0 +1,137 @@
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+import libecalc.version
+from libecalc import dto
+from libecalc.common.logger import logger
+from libecalc.core.result import EcalcModelResult
+from libecalc.dto.utils.referenced_variables import get_referenced_variables
+
+RESULT_FILE_SUFFIX = ".pickle"
+
+
+class ComponentResultCache:
+    """
+    On-disk cache of component results, keyed by a hash of everything the evaluation of a component depends on: the
+    component itself (including facility data and fluids, which are part of the component), the variables it
+    references, the time vector, the results of its successors (for generator sets) and the version of eCalc.
+
+    The least recently used results are removed when the size of the cache exceeds the maximum size. The size is
+    tracked as results are stored, the directory is only scanned when creating the cache and when evicting results.
+    """
+
+    def __init__(self, directory: Path, max_size_bytes: int = 1024**3):
+        """
+        Args:
+            directory: the directory the results are stored in
+            max_size_bytes: the maximum total size of the stored results
+        """
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._max_size_bytes = max_size_bytes
+        self._size_bytes = sum(size for _, size, _ in self._get_result_files())
+
+    @staticmethod
+    def get_key(
+        component_dto: dto.components.Component,
+        variables_map: dto.VariablesMap,
+        successor_results: Dict[str, EcalcModelResult],
+    ) -> str:
+        """
+        Get a stable key for the evaluation of a component.
+
+        Args:
+            component_dto: the component to evaluate
+            variables_map: the variables used to evaluate the component
+            successor_results: the results of the successors the evaluation depends on
+
+        Returns: the key of the result
+        """
+        referenced_variables = get_referenced_variables(component_dto)
+        referenced_variables = sorted(
+            set(variables_map.variables)
+            if referenced_variables is None
+            else referenced_variables & set(variables_map.variables)
+        )
+        key = hashlib.sha256()
+        key.update(str(libecalc.version.current_version()).encode())
+        key.update(type(component_dto).__name__.encode())
+        key.update(component_dto.model_dump_json().encode())
+        key.update(json.dumps([timestep.isoformat() for timestep in variables_map.time_vector]).encode())
+        key.update(
+            json.dumps(
+                {variable_name: variables_map.arrays[variable_name].tolist() for variable_name in referenced_variables}
+            ).encode()
+        )
+        for successor_id, successor_result in successor_results.items():
+            key.update(successor_id.encode())
+            key.update(successor_result.model_dump_json().encode())
+        return key.hexdigest()
+
+    def _get_path(self, key: str) -> Path:
+        return self._directory / f"{key}{RESULT_FILE_SUFFIX}"
+
+    def get(self, key: str) -> Optional[Dict[str, EcalcModelResult]]:
+        """Get the stored results for the key, None if not stored."""
+        path = self._get_path(key)
+        try:
+            with open(path, "rb") as result_file:
+                results = pickle.load(result_file)  # noqa: S301 - only results written by this cache are read
+        except FileNotFoundError:
+            return None
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+            logger.warning(f"Could not read cached result '{path}', evaluating again: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+        # Mark as recently used, unless removed by another process meanwhile
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return results
+
+    def put(self, key: str, results: Dict[str, EcalcModelResult]):
+        """Store the results for the key, removing the least recently used results if the cache is full."""
+        path = self._get_path(key)
+        with tempfile.NamedTemporaryFile(dir=self._directory, suffix=".tmp", delete=False) as result_file:
+            try:
+                pickle.dump(results, result_file, protocol=pickle.HIGHEST_PROTOCOL)
+            except BaseException:
+                result_file.close()
+                os.unlink(result_file.name)
+                raise
+        size = os.path.getsize(result_file.name)
+        try:
+            self._size_bytes -= path.stat().st_size
+        except FileNotFoundError:
+            pass
+        os.replace(result_file.name, path)
+        self._size_bytes += size
+
+        if self._size_bytes > self._max_size_bytes:
+            self._evict()
+
+    def _get_result_files(self) -> Iterator[Tuple[int, int, Path]]:
+        """Get the last used time, size and path of the stored results, skipping results removed meanwhile."""
+        for result_file in self._directory.glob(f"*{RESULT_FILE_SUFFIX}"):
+            try:
+                stat = result_file.stat()
+            except FileNotFoundError:
+                continue
+            yield stat.st_mtime_ns, stat.st_size, result_file
+
+    def _evict(self):
+        # Other processes may use the same directory, the size is therefore recalculated when evicting
+        result_files = sorted(self._get_result_files())
+        self._size_bytes = sum(size for _, size, _ in result_files)
+        for _, size, result_file in result_files:
+            if self._size_bytes <= self._max_size_bytes:
+                break
+            result_file.unlink(missing_ok=True)
+            self._size_bytes -= size
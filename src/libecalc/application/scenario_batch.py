@@ -0,0 +1,161 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from libecalc import dto
+from libecalc.application.energy_calculator import EnergyCalculator
+from libecalc.application.graph_result import GraphResult
+from libecalc.dto.component_graph import ComponentGraph
+
+
+@dataclass
+class ScenarioSummary:
+    """
+    Results of all the scenarios stacked, with one row per scenario and one column per timestep.
+    """
+
+    time_vector: List[datetime]
+    energy_usage: Dict[str, NDArray[np.float64]]  # component id -> energy usage
+    power: Dict[str, NDArray[np.float64]]  # component id -> power, for components with power
+    emissions: Dict[str, Dict[str, NDArray[np.float64]]]  # component id -> emission name -> emission rate
+
+
+@dataclass
+class ScenarioBatchResult:
+    graph_results: List[GraphResult]
+
+    def get_summary(self) -> ScenarioSummary:
+        """
+        Stack the energy usage, power and emissions of all the scenarios. The scenarios must have the same time vector.
+        """
+        first, *rest = self.graph_results
+        time_vector = first.variables_map.time_vector
+        if any(graph_result.variables_map.time_vector != time_vector for graph_result in rest):
+            raise ValueError("Can not summarize scenarios with different time vectors")
+
+        energy_usage = {
+            component_id: np.asarray(
+                [
+                    graph_result.consumer_results[component_id].component_result.energy_usage.values
+                    for graph_result in self.graph_results
+                ],
+                dtype=np.float64,
+            )
+            for component_id in first.consumer_results
+        }
+        power = {
+            component_id: np.asarray(
+                [
+                    graph_result.consumer_results[component_id].component_result.power.values
+                    for graph_result in self.graph_results
+                ],
+                dtype=np.float64,
+            )
+            for component_id, consumer_result in first.consumer_results.items()
+            if consumer_result.component_result.power is not None
+        }
+        emissions = {
+            component_id: {
+                emission_name: np.asarray(
+                    [
+                        graph_result.emission_results[component_id][emission_name].rate.values
+                        for graph_result in self.graph_results
+                    ],
+                    dtype=np.float64,
+                )
+                for emission_name in emission_results
+            }
+            for component_id, emission_results in first.emission_results.items()
+        }
+        return ScenarioSummary(
+            time_vector=time_vector,
+            energy_usage=energy_usage,
+            power=power,
+            emissions=emissions,
+        )
+
+
+def _evaluate_scenarios(
+    graph: ComponentGraph, variables_maps: Sequence[dto.VariablesMap], **energy_calculator_options
+) -> List[GraphResult]:
+    """
+    Evaluate the graph for each of the variables maps, using the same energy calculator, and thereby the same domain
+    models, for all of them. Module level to be able to evaluate scenarios in worker processes.
+    """
+    energy_calculator = EnergyCalculator(graph=graph, **energy_calculator_options)
+    graph_results = []
+    for variables_map in variables_maps:
+        consumer_results = energy_calculator.evaluate_energy_usage(variables_map)
+        emission_results = energy_calculator.evaluate_emissions(
+            variables_map=variables_map,
+            consumer_results=consumer_results,
+        )
+        graph_results.append(
+            GraphResult(
+                graph=graph,
+                consumer_results=consumer_results,
+                emission_results=emission_results,
+                variables_map=variables_map,
+            )
+        )
+    return graph_results
+
+
+class ScenarioBatch:
+    """
+    Evaluate the same model for several scenarios, i.e. variables maps, such as the realisations of an uncertainty
+    study. The graph is built once by the caller, and the domain models of the components are created once and
+    reused for all the scenarios, or once per worker when the scenarios are evaluated in parallel.
+    """
+
+    def __init__(self, graph: ComponentGraph, max_workers: int = 1, **energy_calculator_options):
+        """
+        Args:
+            graph: the component graph to evaluate
+            max_workers: number of worker processes the scenarios are divided between. The default, 1, evaluates all
+                scenarios in this process.
+            **energy_calculator_options: options given to the energy calculator, e.g. use_evaluation_cache
+        """
+        self._graph = graph
+        self._max_workers = max_workers
+        self._energy_calculator_options = energy_calculator_options
+
+    def evaluate(self, variables_maps: Sequence[dto.VariablesMap]) -> ScenarioBatchResult:
+        """
+        Evaluate energy usage and emissions for each scenario.
+
+        Args:
+            variables_maps: the variables of each scenario
+
+        Returns: the results of each scenario, in the same order as the variables maps
+        """
+        if self._max_workers <= 1 or len(variables_maps) <= 1:
+            return ScenarioBatchResult(
+                graph_results=_evaluate_scenarios(self._graph, variables_maps, **self._energy_calculator_options)
+            )
+
+        # Contiguous chunks, one per worker, to keep the order of the scenarios and create the domain models once
+        # per worker.
+        number_of_chunks = min(self._max_workers, len(variables_maps))
+        chunks = [list(chunk) for chunk in np.array_split(np.arange(len(variables_maps)), number_of_chunks)]
+        with ProcessPoolExecutor(
+            max_workers=number_of_chunks,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _evaluate_scenarios,
+                    self._graph,
+                    [variables_maps[index] for index in chunk],
+                    **self._energy_calculator_options,
+                )
+                for chunk in chunks
+            ]
+            graph_results = [graph_result for future in futures for graph_result in future.result()]
+
+        return ScenarioBatchResult(graph_results=graph_results)
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+from collections.abc import MutableSequence
+from typing import Any, Iterable, Iterator, List, Optional, Union, overload
+
+import numpy as np
+from numpy.typing import DTypeLike, NDArray
+
+
+class ArrayList(MutableSequence):
+    """
+    List backed by a one-dimensional numpy array, used where values have been kept in lists but are mostly used as
+    arrays.
+
+    Slicing gives an ArrayList sharing the array, i.e. without copying the values. The array is copied the first time
+    an ArrayList sharing it is changed, so that changing a slice does not change the list it is taken from, as for
+    lists. Changing the array given by np.asarray is not allowed for the same reason.
+
+    Elements are given as Python objects, e.g. float and datetime, and an ArrayList is equal to a list or ArrayList
+    with equal elements. NaN values are equal to NaN.
+    """
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self, values: Iterable[Any] = (), dtype: Optional[DTypeLike] = None):
+        if isinstance(values, ArrayList) and (dtype is None or values.dtype == np.dtype(dtype)):
+            self._buffer = values._buffer
+            self._length = values._length
+            self._is_shared = values._is_shared = True
+        else:
+            self._buffer = np.array(values if isinstance(values, np.ndarray) else list(values), dtype=dtype)
+            if self._buffer.ndim != 1:
+                raise ValueError(f"ArrayList can only hold one-dimensional arrays, got {self._buffer.ndim} dimensions")
+            self._length = len(self._buffer)
+            self._is_shared = False
+
+    @classmethod
+    def from_array(cls, array: NDArray) -> ArrayList:
+        """Create an ArrayList sharing the array, which must not be changed afterwards."""
+        array_list = cls.__new__(cls)
+        array_list._buffer = array
+        array_list._length = len(array)
+        array_list._is_shared = True
+        return array_list
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._buffer.dtype
+
+    @property
+    def array(self) -> NDArray:
+        """A read-only view of the values."""
+        array = self._buffer[: self._length]
+        array.flags.writeable = False
+        # The view must not change when this list is changed
+        self._is_shared = True
+        return array
+
+    def __array__(self, dtype: Optional[DTypeLike] = None, copy: Optional[bool] = None) -> NDArray:
+        array = self.array
+        if dtype is not None and np.dtype(dtype) != array.dtype:
+            return array.astype(dtype)
+        if copy:
+            return array.copy()
+        return array
+
+    def tolist(self) -> List[Any]:
+        return self._buffer[: self._length].tolist()
+
+    def copy(self) -> ArrayList:
+        return ArrayList(self)
+
+    def _make_writable(self, capacity: Optional[int] = None):
+        capacity = self._length if capacity is None else capacity
+        if self._is_shared or capacity > len(self._buffer):
+            buffer = np.empty(max(capacity, self._length), dtype=self.dtype)
+            buffer[: self._length] = self._buffer[: self._length]
+            self._buffer = buffer
+            self._is_shared = False
+
+    def _as_array(self, values: Iterable[Any]) -> NDArray:
+        if isinstance(values, (ArrayList, np.ndarray)):
+            return np.asarray(values, dtype=self.dtype)
+        return np.array(list(values), dtype=self.dtype)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.tolist())
+
+    def __reversed__(self) -> Iterator[Any]:
+        return reversed(self.tolist())
+
+    def __contains__(self, value: object) -> bool:
+        return value in self.tolist()
+
+    def index(self, value: Any, start: int = 0, stop: Optional[int] = None) -> int:
+        return self.tolist().index(value, start, self._length if stop is None else stop)
+
+    def count(self, value: Any) -> int:
+        return self.tolist().count(value)
+
+    @overload
+    def __getitem__(self, index: int) -> Any: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> ArrayList: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            self._is_shared = True
+            return ArrayList.from_array(self._buffer[: self._length][index])
+
+        value = self._buffer[: self._length][index]
+        return value.item() if isinstance(value, np.generic) else value
+
+    def __setitem__(self, index: Union[int, slice], value: Any):
+        if isinstance(index, slice):
+            values = self._as_array(value)
+            start, stop, step = index.indices(self._length)
+            if step == 1 and len(values) != max(stop - start, 0):
+                # Replacing a part of the list with a part of another length
+                stop = max(start, stop)
+                self._buffer = np.concatenate([self._buffer[:start], values, self._buffer[stop : self._length]]).astype(
+                    self.dtype, copy=False
+                )
+                self._length = len(self._buffer)
+                self._is_shared = False
+                return
+            self._make_writable()
+            self._buffer[: self._length][index] = values
+        else:
+            self._make_writable()
+            self._buffer[: self._length][index] = value
+
+    def __delitem__(self, index: Union[int, slice]):
+        self._buffer = np.delete(self._buffer[: self._length], index)
+        self._length = len(self._buffer)
+        self._is_shared = False
+
+    def insert(self, index: int, value: Any):
+        self._buffer = np.insert(self._buffer[: self._length], min(max(index, -self._length), self._length), value)
+        self._length = len(self._buffer)
+        self._is_shared = False
+
+    def append(self, value: Any):
+        if self._length == len(self._buffer) or self._is_shared:
+            # Grow the array geometrically, for appending to take constant time on average
+            self._make_writable(capacity=max(2 * self._length, 8))
+        self._buffer[self._length] = value
+        self._length += 1
+
+    def extend(self, values: Iterable[Any]):
+        self[self._length :] = values
+
+    def pop(self, index: int = -1) -> Any:
+        value = self[index]
+        if index in (-1, self._length - 1):
+            self._length -= 1
+        else:
+            del self[index]
+        return value
+
+    def clear(self):
+        self._buffer = self._buffer[:0].copy()
+        self._length = 0
+        self._is_shared = False
+
+    def reverse(self):
+        self[:] = self._buffer[: self._length][::-1]
+
+    def sort(self, *, key=None, reverse: bool = False):
+        self[:] = sorted(self.tolist(), key=key, reverse=reverse)
+
+    def __add__(self, other: object) -> ArrayList:
+        if not isinstance(other, (list, ArrayList)):
+            return NotImplemented
+        return ArrayList(np.concatenate([self.array, self._as_array(other)]), dtype=self.dtype)
+
+    def __radd__(self, other: object) -> ArrayList:
+        if not isinstance(other, list):
+            return NotImplemented
+        return ArrayList(np.concatenate([self._as_array(other), self.array]), dtype=self.dtype)
+
+    def __iadd__(self, other: Iterable[Any]) -> ArrayList:
+        self.extend(other)
+        return self
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (list, ArrayList)):
+            return NotImplemented
+        if len(self) != len(other):
+            return False
+        if self.dtype.kind in "biufcmM":
+            try:
+                other_array = np.asarray(other)
+            except (TypeError, ValueError):
+                return self.tolist() == list(other)
+            if other_array.dtype.kind in "biufc" and self.dtype.kind in "biufc":
+                return bool(np.array_equal(self.array, other_array, equal_nan=self.dtype.kind in "fc"))
+            if other_array.dtype.kind in "mM" and self.dtype.kind in "mM":
+                return bool(np.array_equal(self.array, other_array.astype(self.dtype)))
+        return self.tolist() == list(other)
+
+    def __ne__(self, other: object) -> bool:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __repr__(self) -> str:
+        return repr(self.tolist())
+
+    def __reduce__(self):
+        return self.__class__, (self._buffer[: self._length].copy(), self.dtype)
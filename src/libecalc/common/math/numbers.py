@@ -5,6 +5,8 @@ from typing import TypeVar
 import numpy as np
 from pydantic import BaseModel
 
+from libecalc.common.list.array_list import ArrayList
+
 TResult = TypeVar("TResult")
 
 
@@ -82,7 +84,7 @@ class Numbers:
                 return value
             elif isinstance(value, dict):
                 return {k: recursive_rounding(v) for k, v in value.items()}
-            elif isinstance(value, list):
+            elif isinstance(value, (list, ArrayList)):
                 return [recursive_rounding(val) for val in value]
             elif isinstance(value, float):
                 return float(Numbers.format_to_precision(value, precision=precision))
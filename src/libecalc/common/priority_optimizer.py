@@ -1,71 +1,100 @@
-import operator
 import typing
-from collections import defaultdict
 from dataclasses import dataclass
-from functools import reduce
-from typing import Dict, Generic, List, TypeVar
+from typing import Generic, List, Protocol, TypeVar
+
+import numpy as np
+from typing_extensions import Self
 
 from libecalc.common.priorities import PriorityID
 
-TResult = TypeVar("TResult")
+
+class TimeSeriesResult(Protocol):
+    def get_subset(self, indices: List[int]) -> Self: ...
+
+
+TResult = TypeVar("TResult", bound=TimeSeriesResult)
 
 ComponentID = str
 
 
 @dataclass
 class PriorityOptimizerResult(Generic[TResult]):
-    priority_used: PriorityID
-    priority_results: List[typing.Any]  # TODO: typing. This is the consumer results merged based on priorities used
+    priorities_used: List[PriorityID]  # The priority used for each timestep
+    priority_results: List[TResult]  # The results for the timesteps where each priority is used
 
 
 @dataclass
 class EvaluatorResult(Generic[TResult]):
     id: ComponentID
     result: TResult
-    is_valid: bool
+    is_valid: List[bool]
 
 
 class PriorityOptimizer(Generic[TResult]):
     def optimize(
         self,
         priorities: List[PriorityID],
-        evaluator: typing.Callable[[PriorityID], List[EvaluatorResult[TResult]]],
-    ) -> PriorityOptimizerResult:
+        number_of_timesteps: int,
+        evaluator: typing.Callable[[PriorityID, List[int]], List[EvaluatorResult[TResult]]],
+    ) -> PriorityOptimizerResult[TResult]:
         """
-        Given a list of priorities, evaluate each priority using the evaluator. If the result of an evaluation is valid
-        the priority is selected, if invalid try the next priority.
+        Given a list of priorities, evaluate each priority for all the timesteps that have not been assigned a priority
+        yet. The timesteps where the results of a priority are valid are assigned that priority, the rest are evaluated
+        with the next priority.
 
-        It will default to the last priority if all settings fails
+        It will default to the last priority for the timesteps where all settings fails.
 
         Args:
             priorities: List of priorities
-            evaluator: The evaluator function gives a list of results back, each result with its own unique id.
+            number_of_timesteps: The number of timesteps to optimize
+            evaluator: The evaluator function gets the timestep indices to evaluate, and gives a list of results back,
+                each result with its own unique id and validity per timestep.
 
         Returns:
-            PriorityOptimizerResult: result containing priorities used and a list of the results merged on priorities
-            used,
+            PriorityOptimizerResult: result containing the priority used per timestep and the results for
+            the timesteps each priority is used, one result per evaluator result id and priority used.
 
         """
-        priority_used = priorities[-1]
-        priority_results: Dict[PriorityID, Dict[str, TResult]] = defaultdict(dict)
+        priorities_used = [priorities[-1]] * number_of_timesteps
+        priority_results: List[TResult] = []
+        remaining_timestep_indices = list(range(number_of_timesteps))
 
-        for priority in priorities:
-            evaluator_results = evaluator(priority)
-            for evaluator_result in evaluator_results:
-                priority_results[priority][evaluator_result.id] = evaluator_result.result
+        for priority_index, priority in enumerate(priorities):
+            if len(remaining_timestep_indices) == 0:
+                break
 
-            # Check if consumers are valid for this priority, should be valid for all consumers
-            all_evaluator_results_valid = reduce(
-                operator.mul, [evaluator_result.is_valid for evaluator_result in evaluator_results]
-            )
+            evaluator_results = evaluator(priority, remaining_timestep_indices)
+
+            if priority_index == len(priorities) - 1:
+                # Default to the last priority for the remaining timesteps
+                valid_timesteps = np.full(len(remaining_timestep_indices), True)
+            else:
+                # Check if consumers are valid for this priority, should be valid for all consumers
+                valid_timesteps = np.all(
+                    [evaluator_result.is_valid for evaluator_result in evaluator_results], axis=0
+                ).reshape(-1)
+
+            valid_positions = np.flatnonzero(valid_timesteps).tolist()
+            if len(valid_positions) == 0:
+                continue
+
+            for position in valid_positions:
+                priorities_used[remaining_timestep_indices[position]] = priority
+
+            for evaluator_result in evaluator_results:
+                priority_results.append(
+                    evaluator_result.result
+                    if len(valid_positions) == len(remaining_timestep_indices)
+                    else evaluator_result.result.get_subset(valid_positions)
+                )
+
+            remaining_timestep_indices = [
+                timestep_index
+                for timestep_index, is_valid in zip(remaining_timestep_indices, valid_timesteps)
+                if not is_valid
+            ]
 
-            if all_evaluator_results_valid:
-                priority_used = priority
-                # quit as soon as all time-steps are valid. This means that we do not need to test all settings.
-                break
         return PriorityOptimizerResult(
-            priority_used=priority_used,
-            priority_results=[
-                ecalc_model_result.component_result for ecalc_model_result in priority_results[priority_used].values()
-            ],
+            priorities_used=priorities_used,
+            priority_results=priority_results,
         )
@@ -51,7 +51,13 @@ class TimeSeriesStreamConditions(BaseModel):
             )
 
         target_pressure = self.pressure  # Assuming 'self' decides the target pressure
-        if any(stream.pressure < target_pressure for stream in other_streams):  # type: ignore
+        if any(
+            any(
+                pressure < target
+                for pressure, target in zip(stream.pressure.values, target_pressure.values)  # type: ignore
+            )
+            for stream in other_streams
+        ):
             # TODO: return a warning object with the specific timesteps?
             raise ValueError("Increasing pressure when mixing streams. That should not happen.")
 
@@ -60,6 +66,7 @@ class TimeSeriesStreamConditions(BaseModel):
             name=f"{'-'.join(stream.name for stream in streams)}",
             rate=reduce(operator.add, [stream.rate for stream in streams]),
             pressure=target_pressure,
+            temperature=self.temperature,
             fluid_density=self.fluid_density,  # TODO: Check that they are equal? Or handle it?
         )
 
@@ -104,12 +111,16 @@ class TimeSeriesStreamConditions(BaseModel):
                 timesteps=[stream_conditions.timestep],
                 values=[stream_conditions.rate.value],
                 unit=stream_conditions.rate.unit,
-            ),
+            )
+            if stream_conditions.rate is not None
+            else None,
             pressure=TimeSeriesFloat(
                 timesteps=[stream_conditions.timestep],
                 values=[stream_conditions.pressure.value],
                 unit=stream_conditions.pressure.unit,
-            ),
+            )
+            if stream_conditions.pressure is not None
+            else None,
             temperature=TimeSeriesFloat(
                 timesteps=[stream_conditions.timestep],
                 values=[stream_conditions.temperature.value],
@@ -126,6 +137,23 @@ class TimeSeriesStreamConditions(BaseModel):
             else None,
         )
 
+    def get_subset(self, indices: List[int]) -> "TimeSeriesStreamConditions":
+        """
+        Get the stream conditions for a subset of the timesteps.
+
+        Args:
+            indices: the indices of the timesteps to keep
+
+        Returns: the stream conditions for the given timesteps only
+        """
+        return self.model_copy(
+            update={
+                attribute: time_series[indices]
+                for attribute in ["rate", "pressure", "temperature", "fluid_density"]
+                if (time_series := getattr(self, attribute)) is not None
+            }
+        )
+
     @classmethod
     def mix_all(cls, streams: List["TimeSeriesStreamConditions"]) -> "TimeSeriesStreamConditions":
         if len(streams) == 0:
@@ -1,5 +1,7 @@
 import itertools
-from typing import Protocol, TypeVar
+from copy import deepcopy
+from functools import reduce
+from typing import Any, Dict, Protocol, TypeVar
 
 from pydantic import BaseModel
 from typing_extensions import Self
@@ -33,6 +35,10 @@ class TabularTimeSeriesUtils:
     def merge(cls, *objects_with_time_series: ObjectWithTimeSeries):
         """
         Merge objects containing TimeSeries. Other attributes will be copied from the first object.
+
+        The values of all the objects are written directly to their position in the merged time vector, i.e. the
+        objects are merged in one pass instead of pairwise.
+
         Args:
             *objects_with_time_series: list of objects to merge
 
@@ -44,41 +50,74 @@ class TabularTimeSeriesUtils:
             raise ValueError("Can not merge objects of differing types.")
 
         first, *others = objects_with_time_series
-        merged_object = first.model_copy(deep=True)
+        if len(others) == 0:
+            return first.model_copy(deep=True)
 
+        merged_attributes: Dict[str, Any] = {}
         for key, value in first.__dict__.items():
-            for other in others:
-                accumulated_value = merged_object.__getattribute__(key)
-                other_value = other.__getattribute__(key)
-                if key == "timesteps":
-                    merged_timesteps = sorted(itertools.chain(accumulated_value, other_value))
-                    merged_object.__setattr__(key, merged_timesteps)
-                elif isinstance(value, TimeSeries):
-                    merged_object.__setattr__(key, accumulated_value.merge(other_value))
-                elif isinstance(value, BaseModel):
-                    merged_object.__setattr__(
-                        key, cls.merge(*[obj.__getattribute__(key) for obj in objects_with_time_series])
-                    )
-                elif (
-                    isinstance(value, list)
-                    and len(value) > 0
-                    and (isinstance(value[0], TimeSeries) or isinstance(value[0], BaseModel))
-                ):
-                    list_attributes = [obj.__getattribute__(key) for obj in objects_with_time_series]
-                    transposed_list_attributes = transpose(list_attributes)
-                    merged_list_attributes = []
-                    if isinstance(value[0], TimeSeries):
-                        for time_series_to_merge in transposed_list_attributes:
-                            first_time_series, *others_time_series = time_series_to_merge
-                            merged_time_series = first_time_series
-                            for other_time_series in others_time_series:
-                                merged_time_series = merged_time_series.merge(other_time_series)
-                            merged_list_attributes.append(merged_time_series)
-                    elif isinstance(value[0], BaseModel):
-                        merged_list_attributes = [
-                            cls.merge(*objs_to_merge) for objs_to_merge in transposed_list_attributes
-                        ]
-
-                    merged_object.__setattr__(key, merged_list_attributes)
-
-        return merged_object
+            values_to_merge = [
+                object_with_time_series.__getattribute__(key) for object_with_time_series in objects_with_time_series
+            ]
+            if key == "timesteps":
+                merged_attributes[key] = sorted(itertools.chain(*values_to_merge))
+            elif isinstance(value, TimeSeries):
+                merged_attributes[key] = cls._merge_time_series(*values_to_merge)
+            elif isinstance(value, BaseModel):
+                merged_attributes[key] = cls.merge(*values_to_merge)
+            elif (
+                isinstance(value, list)
+                and len(value) > 0
+                and (isinstance(value[0], TimeSeries) or isinstance(value[0], BaseModel))
+            ):
+                transposed_list_attributes = transpose(values_to_merge)
+                if isinstance(value[0], TimeSeries):
+                    merged_attributes[key] = [
+                        cls._merge_time_series(*time_series_to_merge)
+                        for time_series_to_merge in transposed_list_attributes
+                    ]
+                else:
+                    merged_attributes[key] = [cls.merge(*objs_to_merge) for objs_to_merge in transposed_list_attributes]
+            else:
+                merged_attributes[key] = deepcopy(value)
+
+        return first.model_copy(update=merged_attributes)
+
+    @staticmethod
+    def _merge_time_series(*time_series: TimeSeries) -> TimeSeries:
+        """
+        Merge TimeSeries with differing timesteps, by writing the values of each TimeSeries to the position of its
+        timesteps in the merged (sorted) time vector.
+
+        Args:
+            *time_series: the TimeSeries to merge, the type and unit of the first is used for the merged TimeSeries
+
+        Returns: the merged TimeSeries
+
+        """
+        first, *others = time_series
+        if type(first).merge is not TimeSeries.merge:
+            # Time series with custom merge logic are merged pairwise
+            return reduce(lambda merged, other: merged.merge(other), others, first)
+
+        for other in others:
+            if not isinstance(other, type(first)):
+                raise ValueError(f"Can not merge {type(first)} with {type(other)}")
+
+            if first.unit != other.unit:
+                raise ValueError(f"Mismatching units: '{first.unit}' != '{other.unit}'")
+
+        merged_timesteps = sorted(itertools.chain(*[series.timesteps for series in time_series]))
+        timestep_indices = {timestep: index for index, timestep in enumerate(merged_timesteps)}
+        if len(timestep_indices) != len(merged_timesteps):
+            raise ValueError("Can not merge two TimeSeries with common timesteps")
+
+        merged_values = [None] * len(merged_timesteps)
+        for series in time_series:
+            for timestep, value in zip(series.timesteps, series.values):
+                merged_values[timestep_indices[timestep]] = value
+
+        return first.__class__(
+            timesteps=merged_timesteps,
+            values=merged_values,
+            unit=first.unit,
+        )
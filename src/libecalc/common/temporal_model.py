@@ -1,12 +1,16 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, Generic, Iterator, List, Tuple, TypeVar
+from typing import Callable, Dict, Generic, Iterator, List, Tuple, TypeVar
 
-from libecalc.common.time_utils import Period
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from libecalc.common.time_utils import Period, PeriodIndex
 from libecalc.dto.variables import VariablesMap
 from libecalc.expression import Expression
 
 ModelType = TypeVar("ModelType")
+DataType = TypeVar("DataType")
 
 
 @dataclass
@@ -15,28 +19,91 @@ class Model(Generic[ModelType]):
     model: ModelType
 
 
+def _get_periods(start_times: List[datetime]) -> List[Period]:
+    end_times = [*start_times[1:], datetime.max]
+    return [Period(start=start_time, end=end_time) for start_time, end_time in zip(start_times, end_times)]
+
+
 class TemporalModel(Generic[ModelType]):
     def __init__(self, data: Dict[datetime, ModelType]):
         self._data = data
-        start_times = list(data.keys())
-        end_times = [*start_times[1:], datetime.max]
         self.models = [
             Model(
-                period=Period(start=start_time, end=end_time),
+                period=period,
                 model=model,
             )
-            for start_time, end_time, model in zip(start_times, end_times, data.values())
+            for period, model in zip(_get_periods(list(data.keys())), data.values())
         ]
+        self._period_index = PeriodIndex([model.period for model in self.models])
 
     def items(self) -> Iterator[Tuple[Period, ModelType]]:
         return ((model.period, model.model) for model in self.models)
 
+    def items_in_period(self, period: Period) -> Iterator[Tuple[Period, ModelType]]:
+        """The models for the periods intersecting the given period, e.g. the period of the time vector evaluated."""
+        return (
+            (model_period, model) for model_period, model in self.items() if Period.intersects(model_period, period)
+        )
+
+    def _get_model(self, index: int) -> ModelType:
+        return self.models[index].model
+
     def get_model(self, timestep: datetime) -> ModelType:
-        for model in self.models:
-            if timestep in model.period:
-                return model.model
+        model_index = self._period_index.get_index(timestep)
+        if model_index is None:
+            raise ValueError(f"Model for timestep '{timestep}' not found in Temporal model")
+        return self._get_model(model_index)
 
-        raise ValueError(f"Model for timestep '{timestep}' not found in Temporal model")
+    def get_model_indices(self, timesteps: ArrayLike) -> NDArray[np.int64]:
+        """Get the index of the model of each of the timesteps, -1 if not in any of the periods of the models."""
+        return self._period_index.get_indices(timesteps)
+
+    def get_models(self, timesteps: List[datetime]) -> List[ModelType]:
+        """Get the model of each of the timesteps, looking up all the timesteps at once."""
+        model_indices = self.get_model_indices(timesteps)
+        if np.any(model_indices < 0):
+            timestep = timesteps[int(np.argmax(model_indices < 0))]
+            raise ValueError(f"Model for timestep '{timestep}' not found in Temporal model")
+        models = {model_index: self._get_model(model_index) for model_index in np.unique(model_indices).tolist()}
+        return [models[model_index] for model_index in model_indices.tolist()]
+
+
+class LazyTemporalModel(TemporalModel[ModelType]):
+    """
+    Temporal model creating the model of a period from its data the first time the period is used. Models for periods
+    outside the evaluated time vectors are then never created, i.e. old definitions kept in a model for history.
+    """
+
+    def __init__(self, data: Dict[datetime, DataType], create_model: Callable[[DataType], ModelType]):
+        self._data = data
+        self._create_model = create_model
+        self._periods = _get_periods(list(data.keys()))
+        self._period_index = PeriodIndex(self._periods)
+        self._created_models: Dict[int, ModelType] = {}
+
+    def _get_model(self, index: int) -> ModelType:
+        if index not in self._created_models:
+            self._created_models[index] = self._create_model(list(self._data.values())[index])
+        return self._created_models[index]
+
+    @property
+    def models(self) -> List[Model[ModelType]]:
+        return [Model(period=period, model=self._get_model(index)) for index, period in enumerate(self._periods)]
+
+    @property
+    def unused_periods(self) -> List[Period]:
+        """The periods where the model has not been created, i.e. not used in any evaluation."""
+        return [period for index, period in enumerate(self._periods) if index not in self._created_models]
+
+    def items(self) -> Iterator[Tuple[Period, ModelType]]:
+        return ((period, self._get_model(index)) for index, period in enumerate(self._periods))
+
+    def items_in_period(self, period: Period) -> Iterator[Tuple[Period, ModelType]]:
+        return (
+            (model_period, self._get_model(index))
+            for index, model_period in enumerate(self._periods)
+            if Period.intersects(model_period, period)
+        )
 
 
 class TemporalExpression:
@@ -46,13 +113,16 @@ class TemporalExpression:
         variables_map: VariablesMap,
     ) -> List[float]:
         result = variables_map.zeros()
-        for period, expression in temporal_expression.items():
-            if Period.intersects(period, variables_map.period):
-                start_index, end_index = period.get_timestep_indices(variables_map.time_vector)
-                variables_map_for_this_period = variables_map.get_subset(start_index=start_index, end_index=end_index)
-                evaluated_expression = expression.evaluate(
-                    variables=variables_map_for_this_period.variables,
-                    fill_length=len(variables_map_for_this_period.time_vector),
-                )
-                result[start_index:end_index] = evaluated_expression
+        # The periods of the models are consecutive, i.e. the timesteps of each model are a contiguous range
+        model_indices = temporal_expression.get_model_indices(variables_map.time_index)
+        for model_index in np.unique(model_indices[model_indices >= 0]).tolist():
+            timestep_indices = np.flatnonzero(model_indices == model_index)
+            start_index, end_index = int(timestep_indices[0]), int(timestep_indices[-1]) + 1
+            expression = temporal_expression.get_model(variables_map.time_vector[start_index])
+            variables_map_for_this_period = variables_map.get_subset(start_index=start_index, end_index=end_index)
+            evaluated_expression = expression.evaluate(
+                variables=variables_map_for_this_period.arrays,
+                fill_length=len(variables_map_for_this_period.time_vector),
+            )
+            result[start_index:end_index] = evaluated_expression
         return result
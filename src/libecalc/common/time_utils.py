@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import bisect
 import enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -16,8 +17,85 @@ from libecalc.common.errors.exceptions import (
 from libecalc.common.units import UnitConstants
 
 
+def get_timestep_index(timesteps: Sequence[datetime], timestep: datetime) -> int:
+    """
+    Get the index of the timestep, like timesteps.index(timestep), using a binary search for sorted timesteps.
+
+    Raises:
+        ValueError: if the timestep is not in the timesteps
+    """
+    index = bisect.bisect_left(timesteps, timestep)
+    if index < len(timesteps) and timesteps[index] == timestep:
+        return index
+    # Not found in sorted timesteps, search all the timesteps in case they are not sorted
+    return timesteps.index(timestep)
+
+
+def get_timestep_positions(timesteps: ArrayLike, requested_timesteps: ArrayLike) -> NDArray[np.int64]:
+    """
+    Get the index of each of the requested timesteps in the timesteps, -1 if a requested timestep is not in the
+    timesteps. The timesteps do not need to be sorted, the first index is given for duplicated timesteps.
+    """
+    timesteps = np.asarray(timesteps, dtype="datetime64[us]")
+    requested_timesteps = np.asarray(requested_timesteps, dtype="datetime64[us]")
+    if len(timesteps) == 0:
+        return np.full(requested_timesteps.shape, -1, dtype=np.int64)
+
+    sort_order = np.argsort(timesteps, kind="stable")
+    sorted_timesteps = timesteps[sort_order]
+    positions = np.searchsorted(sorted_timesteps, requested_timesteps, side="left")
+    valid_positions = np.minimum(positions, len(sorted_timesteps) - 1)
+    is_found = (positions < len(sorted_timesteps)) & (sorted_timesteps[valid_positions] == requested_timesteps)
+    return np.where(is_found, sort_order[valid_positions], -1).astype(np.int64)
+
+
+def reindex_values(
+    values: Sequence[Any],
+    time_vector: Sequence[datetime],
+    new_time_vector: ArrayLike,
+    fillna: Any,
+) -> Tuple[np.ndarray, bool]:
+    """
+    Reindex the values of the time vector to the sorted, unique timesteps of the new time vector. Timesteps in the new
+    time vector without a value are given the fill value.
+
+    Returns: the reindexed values, and whether values are lost because their timestep is not in the new time vector
+    """
+    new_timesteps = np.unique(np.asarray(new_time_vector, dtype="datetime64[us]"))
+    number_of_values = min(len(values), len(time_vector))
+    positions = get_timestep_positions(new_timesteps, time_vector[:number_of_values])
+    is_found = positions >= 0
+    is_losing_data = not bool(is_found.all())
+
+    value_array = np.asarray(values[:number_of_values])
+    fill_array = np.asarray([fillna])
+    if value_array.dtype.kind not in "biuf" or fill_array.dtype.kind not in "biuf":
+        # Strings and objects are reindexed as a list, to keep the types of the values
+        new_values = [fillna] * len(new_timesteps)
+        for position, value in zip(positions.tolist(), values[:number_of_values]):
+            if position >= 0:
+                new_values[position] = value
+        return np.array(new_values), is_losing_data
+
+    is_filled = np.zeros(len(new_timesteps), dtype=bool)
+    is_filled[positions[is_found]] = True
+    if len(new_timesteps) == 0:
+        dtype = np.dtype(np.float64)
+    elif is_filled.all():
+        dtype = value_array.dtype
+    elif not is_filled.any():
+        dtype = fill_array.dtype
+    else:
+        dtype = np.result_type(value_array.dtype, fill_array.dtype)
+
+    new_values = np.full(len(new_timesteps), fillna, dtype=dtype)
+    new_values[positions[is_found]] = value_array[is_found]
+    return new_values, is_losing_data
+
+
 def calculate_delta_days(time_vector: ArrayLike) -> NDArray[np.float64]:
-    return np.array([x.total_seconds() / UnitConstants.SECONDS_IN_A_DAY for x in np.diff(time_vector)])
+    time_deltas = np.diff(np.asarray(time_vector, dtype="datetime64[us]"))
+    return time_deltas / np.timedelta64(1, "s") / UnitConstants.SECONDS_IN_A_DAY
 
 
 @dataclass
@@ -55,11 +133,11 @@ class Period:
 
     def get_timestep_indices(self, timesteps: List[datetime]) -> Tuple[int, int]:
         try:
-            start_index = timesteps.index(max(self.start, timesteps[0]))
+            start_index = get_timestep_index(timesteps, max(self.start, timesteps[0]))
             if self.end > timesteps[-1]:
                 end_index = len(timesteps) + 1
             else:
-                end_index = timesteps.index(self.end)
+                end_index = get_timestep_index(timesteps, self.end)
 
             return start_index, end_index
         except (IndexError, ValueError) as e:
@@ -81,6 +159,7 @@ class Period:
 @dataclass
 class Periods:
     periods: List[Period]
+    _period_index: Optional[PeriodIndex] = field(default=None, init=False, repr=False, compare=False)
 
     @classmethod
     def create_periods(cls, times: List[datetime], include_before: bool = True, include_after: bool = True) -> Periods:
@@ -116,11 +195,60 @@ class Periods:
         return self.periods.__iter__()
 
     def get_period(self, time: datetime) -> Period:
-        for period in self.periods:
-            if time in period:
-                return period
+        if self._period_index is None or self._period_index.periods is not self.periods:
+            self._period_index = PeriodIndex(self.periods)
+
+        period_index = self._period_index.get_index(time)
+        if period_index is None:
+            raise ProgrammingError(f"Period for date '{time}' not found in periods")
+        return self.periods[period_index]
+
+
+class PeriodIndex:
+    """
+    Index of periods, finding the period containing a datetime with a binary search over the periods sorted by start,
+    instead of checking every period.
+
+    The index of the first period containing the datetime is given, as when checking the periods in order. Overlapping
+    periods are checked in order.
+    """
+
+    def __init__(self, periods: List[Period]):
+        self.periods = periods
+        # Empty periods do not contain any datetimes
+        self._sorted_indices = sorted(
+            (index for index, period in enumerate(periods) if period.start < period.end),
+            key=lambda index: periods[index].start,
+        )
+        self._starts = [periods[index].start for index in self._sorted_indices]
+        self._ends = [periods[index].end for index in self._sorted_indices]
+        self._is_overlapping = any(end > next_start for end, next_start in zip(self._ends, self._starts[1:]))
+
+    def get_index(self, time: datetime) -> Optional[int]:
+        """Get the index of the period containing the datetime, None if not in any of the periods."""
+        if self._is_overlapping:
+            return next((index for index, period in enumerate(self.periods) if time in period), None)
+
+        position = bisect.bisect_right(self._starts, time) - 1
+        if position >= 0 and time < self._ends[position]:
+            return self._sorted_indices[position]
+        return None
+
+    def get_indices(self, times: ArrayLike) -> NDArray[np.int64]:
+        """Get the index of the period containing each of the datetimes, -1 if not in any of the periods."""
+        times = np.asarray(times, dtype="datetime64[us]")
+        if len(self._sorted_indices) == 0:
+            return np.full(times.shape, -1, dtype=np.int64)
+        if self._is_overlapping:
+            return np.array(
+                [-1 if index is None else index for index in map(self.get_index, times.astype(datetime))],
+                dtype=np.int64,
+            )
 
-        raise ProgrammingError(f"Period for date '{time}' not found in periods")
+        positions = np.searchsorted(np.asarray(self._starts, dtype="datetime64[us]"), times, side="right") - 1
+        valid_positions = np.maximum(positions, 0)
+        is_in_period = (positions >= 0) & (times < np.asarray(self._ends, dtype="datetime64[us]")[valid_positions])
+        return np.where(is_in_period, np.asarray(self._sorted_indices, dtype=np.int64)[valid_positions], -1)
 
 
 def define_time_model_for_period(
@@ -1,14 +1,13 @@
 from __future__ import annotations
 
-import itertools
 import math
 from abc import ABC, abstractmethod
-from collections import defaultdict
 from datetime import datetime
 from enum import Enum
 from typing import (
     Any,
-    DefaultDict,
+    ClassVar,
+    Dict,
     Generic,
     Iterable,
     Iterator,
@@ -22,12 +21,14 @@ from typing import (
 import numpy
 import numpy as np
 import pandas as pd
-from numpy.typing import NDArray
-from pydantic import BaseModel, ConfigDict, field_validator
-from pydantic_core.core_schema import ValidationInfo
+from numpy.typing import DTypeLike, NDArray
+from pydantic import BaseModel, ConfigDict, field_serializer, field_validator
+from pydantic_core.core_schema import ValidationInfo, ValidatorFunctionWrapHandler
+from scipy.interpolate import interp1d
 from typing_extensions import Self
 
 from libecalc.common.errors.exceptions import ProgrammingError
+from libecalc.common.list.array_list import ArrayList
 from libecalc.common.list.list_utils import elementwise_sum
 from libecalc.common.logger import logger
 from libecalc.common.string.string_utils import to_camel_case
@@ -35,12 +36,18 @@ from libecalc.common.time_utils import (
     Frequency,
     Period,
     calculate_delta_days,
+    get_timestep_index,
+    get_timestep_positions,
+    reindex_values,
     resample_time_steps,
 )
 from libecalc.common.units import Unit
 
 TimeSeriesValue = TypeVar("TimeSeriesValue", bound=Union[int, float, bool, str])
 
+# Microseconds, as for datetime, to hold all timesteps, e.g. datetime.max, which do not fit in nanoseconds
+TIMESTEPS_DTYPE = np.dtype("datetime64[us]")
+
 
 class RateType(str, Enum):
     STREAM_DAY = "STREAM_DAY"
@@ -87,7 +94,13 @@ class Rates:
         Returns:
             The production rates where all NaN values are replaced with the last value that was not NaN
         """
-        return np.array(pd.Series(rates).ffill())
+        rates = np.asarray(rates)
+        if rates.dtype.kind != "f":
+            return rates.copy()
+        # The index of the last value that was not NaN, for each value
+        last_valid_indices = np.where(np.isnan(rates), 0, np.arange(len(rates)))
+        np.maximum.accumulate(last_valid_indices, out=last_valid_indices)
+        return rates[last_valid_indices]
 
     @staticmethod
     def to_volumes(
@@ -149,12 +162,157 @@ class Rates:
         return Rates.compute_cumulative(volumes)
 
 
+def _get_timestep_indices(timesteps: List[datetime], requested_timesteps: Iterable[datetime]) -> List[int]:
+    """
+    Get the index of each of the requested timesteps, like timesteps.index(timestep), without searching the timesteps
+    for every requested timestep.
+
+    Raises:
+        ValueError: if a requested timestep is not in the timesteps
+    """
+    index_by_timestep = {}
+    for index, timestep in enumerate(timesteps):
+        # Use the first index of duplicated timesteps, like list.index
+        index_by_timestep.setdefault(timestep, index)
+
+    try:
+        return [index_by_timestep[timestep] for timestep in requested_timesteps]
+    except KeyError as e:
+        raise ValueError(f"{e.args[0]!r} is not in list") from e
+
+
+def _reindex_forward_fill(
+    timesteps: List[datetime], values: List[TimeSeriesValue], new_timesteps: List[datetime]
+) -> NDArray[np.float64]:
+    """
+    Get the values at the new timesteps, where the values at new timesteps that are not in the timesteps are
+    forward filled from the previous new timestep.
+    """
+    positions = get_timestep_positions(timesteps, new_timesteps)
+    if len(values) == 0:
+        return np.full(len(positions), np.nan)
+    values = np.asarray(values, dtype=np.float64)
+    return Rates.forward_fill_nan_values(np.where(positions >= 0, values[np.maximum(positions, 0)], np.nan))
+
+
+def _interpolate_slinear(
+    timesteps: List[datetime], values: List[float], new_timesteps: List[datetime]
+) -> NDArray[np.float64]:
+    """
+    Get the values at the new timesteps by linear interpolation between the values that are not NaN, without
+    extrapolating.
+
+    Gives the same values as interpolating a pandas Series reindexed to the union of the timesteps and the new
+    timesteps, using 'slinear' with the timesteps in nanoseconds, i.e. values at existing timesteps are kept and NaN
+    values at existing timesteps are interpolated.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    is_valid = ~np.isnan(values)
+    if not is_valid.any():
+        return np.full(len(new_timesteps), np.nan)
+
+    positions = get_timestep_positions(timesteps, new_timesteps)
+    existing_values = values[np.maximum(positions, 0)]
+    is_existing_value = (positions >= 0) & ~np.isnan(existing_values)
+    if is_existing_value.all():
+        return existing_values
+
+    x = np.asarray(timesteps, dtype="datetime64[ns]").astype(np.int64)
+    new_x = np.asarray(new_timesteps, dtype="datetime64[ns]").astype(np.int64)
+    interpolated_values = interp1d(
+        x[is_valid], values[is_valid], kind="slinear", bounds_error=False, fill_value=np.nan, assume_sorted=False
+    )(new_x)
+    return np.where(is_existing_value, existing_values, interpolated_values)
+
+
+def _get_merge_order(timesteps: List[datetime], other_timesteps: List[datetime]) -> NDArray[np.intp]:
+    """Get the indices of the concatenated timesteps, sorted by timestep."""
+    return np.argsort(np.asarray(timesteps + other_timesteps), kind="stable")
+
+
+def _values_equal(values: List[Any], other_values: List[Any]) -> bool:
+    """Check that all values are either both NaN or equal, for the values in both lists."""
+    number_of_values = min(len(values), len(other_values))
+    return np.array_equal(
+        np.asarray(values[:number_of_values]), np.asarray(other_values[:number_of_values]), equal_nan=True
+    )
+
+
+def _to_array_list(values: Iterable[Any], dtype: np.dtype) -> ArrayList:
+    """Get the values as an ArrayList of the dtype, or of objects if the values can not be held by the dtype."""
+    if dtype.kind == "M" and any(getattr(value, "tzinfo", None) is not None for value in values):
+        # Timezone aware datetimes can not be held by a datetime64 array
+        return ArrayList(values, dtype=object)
+    try:
+        return ArrayList(values, dtype=dtype)
+    except (TypeError, ValueError, OverflowError):
+        return ArrayList(values, dtype=object)
+
+
+def _validate_array_list(values: Any, handler: ValidatorFunctionWrapHandler, dtype: np.dtype) -> ArrayList:
+    """
+    Validate the values as a list, and store them in an ArrayList. Arrays of the dtype are not validated element by
+    element, and ArrayLists of the dtype share the array with the time series they are taken from.
+    """
+    if isinstance(values, ArrayList) and values.dtype == dtype:
+        return ArrayList(values)
+    if isinstance(values, np.ndarray) and values.ndim == 1 and np.can_cast(values.dtype, dtype, casting="same_kind"):
+        return ArrayList(values, dtype=dtype)
+    return _to_array_list(handler(values), dtype)
+
+
+def _serialize_array_list(values: Union[ArrayList, List[Any]]) -> List[Any]:
+    return values.tolist() if isinstance(values, ArrayList) else values
+
+
 class TimeSeries(BaseModel, Generic[TimeSeriesValue], ABC):
+    """
+    The timesteps and values are stored as ArrayLists, i.e. lists backed by numpy arrays, with the timesteps as
+    datetime64. Slicing a time series does not copy the arrays, and np.asarray gives the arrays without copying.
+    The time series are serialized with lists.
+    """
+
     timesteps: List[datetime]
     values: List[TimeSeriesValue]
     unit: Unit
     model_config = ConfigDict(alias_generator=to_camel_case, populate_by_name=True, extra="forbid")
 
+    _values_dtype: ClassVar[DTypeLike] = np.float64
+    _array_fields: ClassVar[Tuple[str, ...]] = ("timesteps", "values")
+
+    @classmethod
+    def _get_array_dtype(cls, field_name: str) -> np.dtype:
+        if field_name == "timesteps":
+            return TIMESTEPS_DTYPE
+        if field_name == "values":
+            return np.dtype(cls._values_dtype)
+        return np.dtype(np.float64)
+
+    # Defined before the other validators, to be called after the values have been converted by them
+    @field_validator("timesteps", "values", mode="wrap")
+    @classmethod
+    def convert_to_array_list(cls, v: Any, handler: ValidatorFunctionWrapHandler, info: ValidationInfo) -> ArrayList:
+        return _validate_array_list(v, handler, cls._get_array_dtype(info.field_name))
+
+    @field_serializer("timesteps", "values")
+    def serialize_array_list(self, v: Union[ArrayList, List[Any]]) -> List[Any]:
+        return _serialize_array_list(v)
+
+    def __setattr__(self, name: str, value: Any):
+        if name in self._array_fields and not isinstance(value, ArrayList):
+            value = _to_array_list(value, self._get_array_dtype(name))
+        super().__setattr__(name, value)
+
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> Self:
+        if update is not None:
+            update = {
+                name: _to_array_list(value, self._get_array_dtype(name))
+                if name in self._array_fields and not isinstance(value, ArrayList)
+                else value
+                for name, value in update.items()
+            }
+        return super().model_copy(update=update, deep=deep)
+
     @field_validator("values", mode="before")
     @classmethod
     def timesteps_values_one_to_one(cls, v: List[Any], info: ValidationInfo):
@@ -215,20 +373,13 @@ class TimeSeries(BaseModel, Generic[TimeSeriesValue], ABC):
         if len(set(self.timesteps).intersection(other.timesteps)) != 0:
             raise ValueError("Can not merge two TimeSeries with common timesteps")
 
-        merged_timesteps = sorted(itertools.chain(self.timesteps, other.timesteps))
-        merged_values = []
-
-        for timestep in merged_timesteps:
-            if timestep in self.timesteps:
-                timestep_index = self.timesteps.index(timestep)
-                merged_values.append(self.values[timestep_index])
-            else:
-                timestep_index = other.timesteps.index(timestep)
-                merged_values.append(other.values[timestep_index])
+        merge_order = _get_merge_order(self.timesteps, other.timesteps)
+        all_timesteps = self.timesteps + other.timesteps
+        all_values = self.values + other.values
 
         return self.__class__(
-            timesteps=merged_timesteps,
-            values=merged_values,
+            timesteps=np.asarray(all_timesteps)[merge_order],
+            values=np.asarray(all_values)[merge_order],
             unit=self.unit,
         )
 
@@ -250,7 +401,7 @@ class TimeSeries(BaseModel, Generic[TimeSeriesValue], ABC):
         :param current_timestep:
         :return: A timeseries with a single step/value corresponding to the timestep given
         """
-        timestep_index = self.timesteps.index(current_timestep)
+        timestep_index = get_timestep_index(self.timesteps, current_timestep)
 
         return self.__class__(
             timesteps=self.timesteps[timestep_index : timestep_index + 1],
@@ -267,23 +418,20 @@ class TimeSeries(BaseModel, Generic[TimeSeriesValue], ABC):
         Returns:
 
         """
-        values: List[TimeSeriesValue] = []
-        for timestep in timesteps:
-            timestep_index = self.timesteps.index(timestep)
-            values.append(self.values[timestep_index])
+        values = np.asarray(self.values)[_get_timestep_indices(self.timesteps, timesteps)]
 
         return self.__class__(timesteps=timesteps, values=values, unit=self.unit)
 
     def to_unit(self, unit: Unit) -> Self:
         if unit == self.unit:
             return self.model_copy()
-        return self.model_copy(update={"values": [self.unit.to(unit)(rate) for rate in self.values], "unit": unit})
+        return self.model_copy(update={"values": self.unit.to(unit)(np.asarray(self.values)), "unit": unit})
 
     def forward_fill(self) -> Self:
-        return self.model_copy(update={"values": pd.Series(self.values).ffill().tolist()})
+        return self.model_copy(update={"values": pd.Series(self.values).ffill().to_numpy()})
 
     def fill_nan(self, fill_value: float) -> Self:
-        return self.model_copy(update={"values": pd.Series(self.values).fillna(fill_value).tolist()})
+        return self.model_copy(update={"values": pd.Series(self.values).fillna(fill_value).to_numpy()})
 
     def __getitem__(self, indices: Union[slice, int, List[int]]) -> Self:
         if isinstance(indices, slice):
@@ -292,8 +440,8 @@ class TimeSeries(BaseModel, Generic[TimeSeriesValue], ABC):
             return self.__class__(timesteps=[self.timesteps[indices]], values=[self.values[indices]], unit=self.unit)
         elif isinstance(indices, list):
             return self.__class__(
-                timesteps=[self.timesteps[i] for i in indices],
-                values=[self.values[i] for i in indices],
+                timesteps=np.asarray(self.timesteps)[indices],
+                values=np.asarray(self.values)[indices],
                 unit=self.unit,
             )
         raise ValueError(
@@ -333,27 +481,25 @@ class TimeSeries(BaseModel, Generic[TimeSeriesValue], ABC):
         """Based on a consumer time function result (EnergyFunctionResult), the corresponding time vector and
         the consumer time vector, we calculate the actual consumer (consumption) rate.
         """
-        new_values: DefaultDict[datetime, Union[float, str]] = defaultdict(float)
-        new_values.update({t: fillna for t in new_time_vector})
-        for t, v in zip(self.timesteps, self.values):
-            if t in new_values:
-                new_values[t] = v
-            else:
-                logger.warning(
-                    "Reindexing consumer time vector and losing data. This should not happen."
-                    " Please contact eCalc support."
-                )
+        new_values, is_losing_data = reindex_values(
+            values=self.values,
+            time_vector=self.timesteps,
+            new_time_vector=new_time_vector,
+            fillna=fillna,
+        )
+
+        if is_losing_data:
+            logger.warning(
+                "Reindexing consumer time vector and losing data. This should not happen. Please contact eCalc support."
+            )
 
-        return np.array([rate_sum for time, rate_sum in sorted(new_values.items())])
+        return new_values
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, TimeSeries):
             return NotImplemented
         return bool(
-            # Check that all values are either both NaN or equal
-            all(np.isnan(other) and np.isnan(this) or other == this for this, other in zip(self.values, other.values))
-            and self.timesteps == other.timesteps
-            and self.unit == other.unit
+            _values_equal(self.values, other.values) and self.timesteps == other.timesteps and self.unit == other.unit
         )
 
     def append(self, timestep: datetime, value: TimeSeriesValue):
@@ -362,6 +508,8 @@ class TimeSeries(BaseModel, Generic[TimeSeriesValue], ABC):
 
 
 class TimeSeriesString(TimeSeries[str]):
+    _values_dtype: ClassVar[DTypeLike] = object
+
     def resample(self, freq: Frequency, include_start_date: bool, include_end_date: bool) -> Self:
         """
         Resample using forward-fill This means that a value is assumed to be the same until the next observation,
@@ -389,6 +537,8 @@ class TimeSeriesString(TimeSeries[str]):
 
 
 class TimeSeriesInt(TimeSeries[int]):
+    _values_dtype: ClassVar[DTypeLike] = np.int64
+
     def resample(self, freq: Frequency, include_start_date: bool = True, include_end_date: bool = True) -> Self:
         """
         Resample using forward-fill This means that a value is assumed to be the same until the next observation,
@@ -403,22 +553,20 @@ class TimeSeriesInt(TimeSeries[int]):
         if freq is Frequency.NONE:
             return self.model_copy()
 
-        ds = pd.Series(index=self.timesteps, data=self.values)
-
         new_timesteps = resample_time_steps(
             self.timesteps, frequency=freq, include_start_date=include_start_date, include_end_date=include_end_date
         )
-        # New resampled pd.Series
-        ds_resampled = ds.reindex(new_timesteps).ffill()
 
         return TimeSeriesInt(
             timesteps=new_timesteps,
-            values=list(ds_resampled.values.tolist()),
+            values=_reindex_forward_fill(self.timesteps, self.values, new_timesteps),
             unit=self.unit,
         )
 
 
 class TimeSeriesBoolean(TimeSeries[bool]):
+    _values_dtype: ClassVar[DTypeLike] = np.bool_
+
     def resample(self, freq: Frequency, include_start_date: bool = True, include_end_date: bool = True) -> Self:
         """
         If a period between two time steps in the return time vector contains more than one time step in the
@@ -438,13 +586,20 @@ class TimeSeriesBoolean(TimeSeries[bool]):
         new_timeseries = resample_time_steps(
             self.timesteps, frequency=freq, include_start_date=include_start_date, include_end_date=True
         )
-        resampled = []
 
-        # Iterate over all pairs of subsequent dates in the new time vector
-        for start_period, end_period in zip(new_timeseries[:-1], new_timeseries[1:]):
-            start_index = self.timesteps.index(max([date for date in self.timesteps if date <= start_period]))
-            end_index = self.timesteps.index(max([date for date in self.timesteps if date < end_period]))
-            resampled.append(all(self.values[start_index : end_index + 1]))
+        # The time steps in the original time vector within each pair of subsequent dates in the new time vector,
+        # the timesteps are sorted
+        timesteps = np.asarray(self.timesteps, dtype="datetime64[us]")
+        new_timesteps = np.asarray(new_timeseries, dtype="datetime64[us]")
+        start_indices = np.searchsorted(timesteps, new_timesteps[:-1], side="right") - 1
+        end_indices = np.searchsorted(timesteps, new_timesteps[1:], side="left") - 1
+        is_missing_start = (start_indices < 0) | (end_indices < 0)
+        if is_missing_start.any():
+            raise ValueError(f"No time step before {new_timeseries[int(np.argmax(is_missing_start))]} to resample from")
+
+        # A period is False if any of the values in the period is False, counted using the cumulative number of False
+        number_of_false_values = np.concatenate(([0], np.cumsum(~np.asarray(self.values, dtype=bool))))
+        resampled = (number_of_false_values[end_indices + 1] - number_of_false_values[start_indices] <= 0).tolist()
 
         if include_end_date:
             resampled.append(self.values[-1])
@@ -465,7 +620,7 @@ class TimeSeriesBoolean(TimeSeries[bool]):
 
         return self.__class__(
             timesteps=self.timesteps,
-            values=[self_item and other_item for self_item, other_item in zip(self.values, other.values)],
+            values=np.logical_and(self.values, other.values),
             unit=self.unit,
         )
 
@@ -493,16 +648,13 @@ class TimeSeriesFloat(TimeSeries[float]):
         if freq is Frequency.NONE:
             return self.model_copy()
 
-        ds = pd.Series(index=self.timesteps, data=self.values)
-
         new_timeseries = resample_time_steps(
             self.timesteps, frequency=freq, include_start_date=include_start_date, include_end_date=include_end_date
         )
-        ds_resampled = ds.reindex(new_timeseries).ffill()
 
         return self.__class__(
             timesteps=new_timeseries,
-            values=[float(x) for x in ds_resampled.values.tolist()],
+            values=_reindex_forward_fill(self.timesteps, self.values, new_timeseries),
             unit=self.unit,
         )
 
@@ -511,7 +663,7 @@ class TimeSeriesFloat(TimeSeries[float]):
         Ensure to map correct value to correct timestep in the final resulting time vector.
         """
         reindex_values = self.reindex_time_vector(new_time_vector)
-        return self.__class__(timesteps=new_time_vector, values=reindex_values.tolist(), unit=self.unit)
+        return self.__class__(timesteps=new_time_vector, values=reindex_values, unit=self.unit)
 
 
 class TimeSeriesVolumesCumulative(TimeSeries[float]):
@@ -544,25 +696,19 @@ class TimeSeriesVolumesCumulative(TimeSeries[float]):
         if freq is Frequency.NONE:
             return self.model_copy()
 
-        ds = pd.Series(index=self.timesteps, data=self.values)
         new_timeseries = resample_time_steps(
             self.timesteps, frequency=freq, include_start_date=include_start_date, include_end_date=include_end_date
         )
-        if ds.index[-1] not in new_timeseries:
+        if self.timesteps[-1] not in new_timeseries:
             logger.warning(
-                f"The final date in the rate input ({ds.index[-1].strftime('%m/%d/%Y')}) does not "
+                f"The final date in the rate input ({self.timesteps[-1].strftime('%m/%d/%Y')}) does not "
                 f"correspond to the end of a period with the requested output frequency. There is a "
                 f"possibility that the resampling will drop volumes."
             )
-        ds_interpolated = ds.reindex(ds.index.union(new_timeseries)).interpolate("slinear")
-
-        # New resampled pd.Series
-        ds_resampled = ds_interpolated.reindex(new_timeseries)
 
         return TimeSeriesVolumesCumulative(
             timesteps=new_timeseries,
-            # Are we sure this is always an DatetimeIndex? type: ignore
-            values=ds_resampled.values.tolist(),
+            values=_interpolate_slinear(self.timesteps, self.values, new_timeseries),
             unit=self.unit,
         )
 
@@ -583,7 +729,7 @@ class TimeSeriesVolumesCumulative(TimeSeries[float]):
                 other.values,
                 out=np.full_like(self.values, fill_value=np.nan),
                 where=np.asarray(other.values) != 0.0,
-            ).tolist(),
+            ),
             unit=unit,
         )
 
@@ -599,7 +745,7 @@ class TimeSeriesVolumesCumulative(TimeSeries[float]):
         Returns:
             Periodic production volumes
         """
-        period_volumes = np.diff(self.values).tolist()
+        period_volumes = np.diff(self.values)
         return TimeSeriesVolumes(timesteps=self.timesteps, values=period_volumes, unit=self.unit)
 
 
@@ -640,20 +786,27 @@ class TimeSeriesVolumes(TimeSeries[float]):
         Note: we do not allow up-sampling, hence the ValueError if a new value is discovered within the existing
             time-vector.
         """
+        existing_time_steps = set(self.timesteps)
         for time_step in time_steps:
-            if self.timesteps[0] <= time_step <= self.timesteps[-1] and time_step not in self.timesteps:
+            if self.timesteps[0] <= time_step <= self.timesteps[-1] and time_step not in existing_time_steps:
                 raise ValueError(f"Could not reindex volumes. Missing time step `{time_step}`.")
 
         cumulative_volumes = Rates.compute_cumulative(self.values)
+        if len(cumulative_volumes) != len(self.timesteps):
+            raise ValueError(
+                f"Length of values ({len(cumulative_volumes)}) does not match length of index ({len(self.timesteps)})"
+            )
 
-        re_indexed_cumulative_values = pd.Series(index=self.timesteps, data=cumulative_volumes).reindex(time_steps)
+        # The cumulative volume at each of the new time steps, NaN if the time step is not in the existing time steps
+        positions = get_timestep_positions(self.timesteps, time_steps)
+        re_indexed_cumulative_values = np.where(positions >= 0, cumulative_volumes[np.maximum(positions, 0)], np.nan)
 
         # Diffing cumulative volume in order to go back to volumes per period.
-        re_indexed_volumes = re_indexed_cumulative_values.diff().shift(-1)[:-1]
+        re_indexed_volumes = np.diff(re_indexed_cumulative_values)
 
         return self.__class__(
-            timesteps=re_indexed_volumes.index.to_pydatetime().tolist(),
-            values=re_indexed_volumes.tolist(),
+            timesteps=list(time_steps[:-1]),
+            values=re_indexed_volumes,
             unit=self.unit,
         )
 
@@ -671,7 +824,7 @@ class TimeSeriesVolumes(TimeSeries[float]):
         """
         return TimeSeriesVolumesCumulative(
             timesteps=self.timesteps,
-            values=Rates.compute_cumulative(self.values).tolist(),
+            values=Rates.compute_cumulative(self.values),
             unit=self.unit,
         )
 
@@ -736,18 +889,13 @@ class TimeSeriesIntensity(TimeSeries[float]):
         if freq is Frequency.NONE:
             return self.model_copy()
 
-        ds = pd.Series(index=self.timesteps, data=self.values)
         new_timeseries = resample_time_steps(
             self.timesteps, frequency=freq, include_start_date=include_start_date, include_end_date=include_end_date
         )
-        ds_interpolated = ds.reindex(ds.index.union(new_timeseries)).interpolate("slinear")
-
-        # New resampled pd.Series
-        ds_resampled = ds_interpolated.reindex(new_timeseries)
 
         return TimeSeriesIntensity(
             timesteps=new_timeseries,
-            values=ds_resampled.to_numpy().tolist(),
+            values=_interpolate_slinear(self.timesteps, self.values, new_timeseries),
             unit=self.unit,
         )
 
@@ -778,7 +926,7 @@ class TimeSeriesStreamDayRate(TimeSeriesFloat):
         if isinstance(other, TimeSeriesStreamDayRate):
             return TimeSeriesStreamDayRate(
                 timesteps=self.timesteps,
-                values=elementwise_sum(self.values, other.values).tolist(),
+                values=elementwise_sum(self.values, other.values),
                 unit=self.unit,
             )
         else:
@@ -811,6 +959,19 @@ class TimeSeriesRate(TimeSeries[float]):
     rate_type: RateType
     regularity: List[float]
 
+    _array_fields: ClassVar[Tuple[str, ...]] = ("timesteps", "values", "regularity")
+
+    @field_validator("regularity", mode="wrap")
+    @classmethod
+    def convert_regularity_to_array_list(
+        cls, v: Any, handler: ValidatorFunctionWrapHandler, info: ValidationInfo
+    ) -> ArrayList:
+        return _validate_array_list(v, handler, cls._get_array_dtype(info.field_name))
+
+    @field_serializer("regularity")
+    def serialize_regularity(self, v: Union[ArrayList, List[float]]) -> List[float]:
+        return _serialize_array_list(v)
+
     @field_validator("values", "regularity", mode="before")
     @classmethod
     def convert_none_to_nan(cls, v: Any, info: ValidationInfo) -> List[TimeSeriesValue]:
@@ -845,7 +1006,7 @@ class TimeSeriesRate(TimeSeries[float]):
                 # Adding TimeSeriesRate with same regularity -> New TimeSeriesRate with same regularity
                 return self.__class__(
                     timesteps=self.timesteps,
-                    values=elementwise_sum(self.values, other.values).tolist(),
+                    values=elementwise_sum(self.values, other.values),
                     unit=self.unit,
                     regularity=self.regularity,
                     rate_type=self.rate_type,
@@ -857,9 +1018,9 @@ class TimeSeriesRate(TimeSeries[float]):
 
                 return TimeSeriesRate(
                     timesteps=self.timesteps,
-                    values=elementwise_sum(self.values, other.values).tolist(),
+                    values=elementwise_sum(self.values, other.values),
                     unit=self.unit,
-                    regularity=(sum_calendar_day / sum_stream_day).tolist(),
+                    regularity=sum_calendar_day / sum_stream_day,
                     rate_type=self.rate_type,
                 )
         else:
@@ -914,30 +1075,17 @@ class TimeSeriesRate(TimeSeries[float]):
         if len(set(self.timesteps).intersection(other.timesteps)) != 0:
             raise ValueError("Can not merge two TimeSeries with common timesteps")
 
-        merged_timesteps = sorted(itertools.chain(self.timesteps, other.timesteps))
-        merged_values = []
-        merged_regularity = []
-
-        for timestep in merged_timesteps:
-            if timestep in self.timesteps:
-                timestep_index = self.timesteps.index(timestep)
-                merged_values.append(self.values[timestep_index])
-                if self.regularity is not None:
-                    merged_regularity.append(self.regularity[timestep_index])
-                else:
-                    merged_regularity.append(1)  # whaaaaaaaaaa
-            else:
-                timestep_index = other.timesteps.index(timestep)
-                merged_values.append(other.values[timestep_index])
-                if other.regularity is not None:
-                    merged_regularity.append(other.regularity[timestep_index])
-                else:
-                    merged_regularity.append(1)  # whaaaaaaaaaa
+        merge_order = _get_merge_order(self.timesteps, other.timesteps)
+        all_timesteps = self.timesteps + other.timesteps
+        all_values = self.values + other.values
+        all_regularity = (
+            self.regularity if self.regularity is not None else [1] * len(self.timesteps)  # whaaaaaaaaaa
+        ) + (other.regularity if other.regularity is not None else [1] * len(other.timesteps))
 
         return self.__class__(
-            timesteps=merged_timesteps,
-            values=merged_values,
-            regularity=merged_regularity,
+            timesteps=np.asarray(all_timesteps)[merge_order],
+            values=np.asarray(all_values)[merge_order],
+            regularity=np.asarray(all_regularity)[merge_order],
             unit=self.unit,
             rate_type=self.rate_type,
         )
@@ -959,7 +1107,7 @@ class TimeSeriesRate(TimeSeries[float]):
         :param current_timestep:
         :return: A timeseries with a single step/value corresponding to the timestep given
         """
-        timestep_index = self.timesteps.index(current_timestep)
+        timestep_index = get_timestep_index(self.timesteps, current_timestep)
         return self.__class__(
             timesteps=self.timesteps[timestep_index : timestep_index + 1],
             values=self.values[timestep_index : timestep_index + 1],
@@ -976,7 +1124,7 @@ class TimeSeriesRate(TimeSeries[float]):
         calendar_day_rates = Rates.to_calendar_day(
             stream_day_rates=np.asarray(self.values),
             regularity=self.regularity,
-        ).tolist()
+        )
         return self.__class__(
             timesteps=self.timesteps,
             values=calendar_day_rates,
@@ -993,7 +1141,7 @@ class TimeSeriesRate(TimeSeries[float]):
         stream_day_rates = Rates.to_stream_day(
             calendar_day_rates=np.asarray(self.values),
             regularity=self.regularity,
-        ).tolist()
+        )
         return self.__class__(
             timesteps=self.timesteps,
             values=stream_day_rates,
@@ -1011,7 +1159,7 @@ class TimeSeriesRate(TimeSeries[float]):
         volumes = Rates.to_volumes(
             rates=self.to_calendar_day().values,
             time_steps=self.timesteps,
-        ).tolist()
+        )
         return TimeSeriesVolumes(timesteps=self.timesteps, values=volumes, unit=self.unit.rate_to_volume())
 
     def resample(
@@ -1044,7 +1192,7 @@ class TimeSeriesRate(TimeSeries[float]):
                 values=Rates.compute_cumulative_volumes_from_daily_rates(
                     rates=self.to_calendar_day().values,
                     time_steps=self.timesteps,
-                ).tolist(),
+                ),
                 timesteps=self.timesteps,
                 unit=self.to_volumes().unit,
             )
@@ -1057,7 +1205,7 @@ class TimeSeriesRate(TimeSeries[float]):
                 values=Rates.compute_cumulative_volumes_from_daily_rates(
                     rates=self.to_stream_day().values,
                     time_steps=self.timesteps,
-                ).tolist(),
+                ),
                 timesteps=self.timesteps,
                 unit=self.to_volumes().unit,
             )
@@ -1066,10 +1214,14 @@ class TimeSeriesRate(TimeSeries[float]):
         )
 
         # the ratio between calendar day and stream day volumes for a period gives the regularity for that period
-        new_regularity = [
-            float(cal_day) / float(stream_day) if stream_day != 0.0 else 0.0
-            for cal_day, stream_day in zip(calendar_day_volumes.values, stream_day_volumes.values)
-        ]
+        calendar_day_volume_values = np.asarray(calendar_day_volumes.values, dtype=np.float64)
+        stream_day_volume_values = np.asarray(stream_day_volumes.values, dtype=np.float64)
+        new_regularity = np.divide(
+            calendar_day_volume_values,
+            stream_day_volume_values,
+            out=np.zeros_like(calendar_day_volume_values),
+            where=stream_day_volume_values != 0.0,
+        ).tolist()
 
         # go from period volumes to average rate in period (regularity assumed to be 1 if not provided)
         new_time_series = calendar_day_volumes.to_rate(regularity=new_regularity)
@@ -1097,11 +1249,11 @@ class TimeSeriesRate(TimeSeries[float]):
                 rate_type=self.rate_type,
             )
         elif isinstance(indices, (list, np.ndarray)):
-            indices = list(indices)
+            indices = np.asarray(indices, dtype=np.intp)
             return self.__class__(
-                timesteps=[self.timesteps[i] for i in indices],
-                values=[self.values[i] for i in indices],
-                regularity=[self.regularity[i] for i in indices],
+                timesteps=np.asarray(self.timesteps)[indices],
+                values=np.asarray(self.values)[indices],
+                regularity=np.asarray(self.regularity)[indices],
                 unit=self.unit,
                 rate_type=self.rate_type,
             )
@@ -1113,8 +1265,7 @@ class TimeSeriesRate(TimeSeries[float]):
         if not isinstance(other, TimeSeriesRate):
             raise NotImplementedError
         return bool(
-            # Check that all values are either both NaN or equal
-            all(np.isnan(other) and np.isnan(this) or other == this for this, other in zip(self.values, other.values))
+            _values_equal(self.values, other.values)
             and self.timesteps == other.timesteps
             and self.unit == other.unit
             and self.regularity == other.regularity
@@ -1128,7 +1279,7 @@ class TimeSeriesRate(TimeSeries[float]):
         reindex_values = self.reindex_time_vector(new_time_vector)
         return TimeSeriesRate(
             timesteps=new_time_vector,
-            values=reindex_values.tolist(),
+            values=reindex_values,
             unit=self.unit,
             regularity=self.regularity,
             rate_type=self.rate_type,
@@ -4,6 +4,7 @@ from typing import List
 from libecalc.common.stream_conditions import TimeSeriesStreamConditions
 from libecalc.common.utils.rates import TimeSeriesFloat
 from libecalc.core.result import EcalcModelResult
+from libecalc.domain.stream_conditions import Pressure, StreamConditions
 from libecalc.dto import VariablesMap
 
 
@@ -20,9 +21,15 @@ class BaseConsumerWithoutOperationalSettings(ABC):
     id: str
 
     @abstractmethod
-    def get_max_rate(
+    def get_max_rate(self, inlet_stream: StreamConditions, target_pressure: Pressure) -> float: ...
+
+    @abstractmethod
+    def get_max_rates(
         self, inlet_stream: TimeSeriesStreamConditions, target_pressure: TimeSeriesFloat
     ) -> List[float]: ...
 
     @abstractmethod
     def evaluate(self, **kwargs) -> EcalcModelResult: ...
+
+    @abstractmethod
+    def evaluate_time_series(self, streams: List[TimeSeriesStreamConditions]) -> EcalcModelResult: ...
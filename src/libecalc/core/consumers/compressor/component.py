@@ -40,67 +40,91 @@ class Compressor(BaseConsumerWithoutOperationalSettings):
             discharge_pressures=np.asarray([target_pressure.value]),
         ).tolist()[0]
 
+    def get_max_rates(self, inlet_stream: TimeSeriesStreamConditions, target_pressure: TimeSeriesFloat) -> List[float]:
+        """
+        Get the maximum rate that this compressor can handle for each timestep, given in -and outlet pressures.
+
+        Args:
+            inlet_stream: the inlet stream
+            target_pressure: the target pressure
+        """
+        return self._compressor_model.get_max_standard_rate(
+            suction_pressures=np.asarray(inlet_stream.pressure.values),
+            discharge_pressures=np.asarray(target_pressure.values),
+        ).tolist()
+
     def evaluate(
         self,
         streams: List[StreamConditions],
     ) -> EcalcModelResult:
+        return self.evaluate_time_series(
+            streams=[TimeSeriesStreamConditions.from_stream_condition(stream) for stream in streams],
+        )
+
+    def evaluate_time_series(
+        self,
+        streams: List[TimeSeriesStreamConditions],
+    ) -> EcalcModelResult:
+        """
+        Evaluate the compressor for all timesteps of the streams in one model evaluation.
+
+        Args:
+            streams: the inlet streams followed by the outlet stream
+        """
         inlet_streams = streams[:-1]
         outlet_stream = streams[-1]
 
-        model_result = self._compressor_model.evaluate_streams(
+        model_result = self._compressor_model.evaluate_time_series_streams(
             inlet_streams=inlet_streams,
             outlet_stream=outlet_stream,
         )
 
         # Mixing all input rates to get total rate passed through compressor. Used when reporting streams.
-        total_requested_inlet_stream = StreamConditions.mix_all(inlet_streams)
+        total_requested_inlet_stream = TimeSeriesStreamConditions.mix_all(inlet_streams)
         total_requested_inlet_stream.name = "Total inlet"
-        current_timestep = total_requested_inlet_stream.timestep
+        timesteps = total_requested_inlet_stream.rate.timesteps
 
-        outlet_stream.rate = total_requested_inlet_stream.rate
+        outlet_stream = outlet_stream.model_copy(update={"rate": total_requested_inlet_stream.rate})
 
         energy_usage = TimeSeriesStreamDayRate(
             values=model_result.energy_usage,
-            timesteps=[current_timestep],
+            timesteps=timesteps,
             unit=model_result.energy_usage_unit,
         )
 
         outlet_pressure_before_choke = TimeSeriesFloat(
             values=model_result.outlet_pressure_before_choking
             if model_result.outlet_pressure_before_choking
-            else [np.nan],
-            timesteps=[current_timestep],
+            else [np.nan] * len(timesteps),
+            timesteps=timesteps,
             unit=Unit.BARA,
         )
 
         component_result = core_results.CompressorResult(
-            timesteps=[current_timestep],
+            timesteps=timesteps,
             power=TimeSeriesStreamDayRate(
                 values=model_result.power,
-                timesteps=[current_timestep],
+                timesteps=timesteps,
                 unit=model_result.power_unit,
             ).fill_nan(0.0),
             energy_usage=energy_usage.fill_nan(0.0),
-            is_valid=TimeSeriesBoolean(values=model_result.is_valid, timesteps=[current_timestep], unit=Unit.NONE),
+            is_valid=TimeSeriesBoolean(values=model_result.is_valid, timesteps=timesteps, unit=Unit.NONE),
             id=self.id,
             recirculation_loss=TimeSeriesStreamDayRate(
                 values=model_result.recirculation_loss,
-                timesteps=[current_timestep],
+                timesteps=timesteps,
                 unit=Unit.MEGA_WATT,
             ),
             rate_exceeds_maximum=TimeSeriesBoolean(
                 values=model_result.rate_exceeds_maximum,
-                timesteps=[current_timestep],
+                timesteps=timesteps,
                 unit=Unit.NONE,
             ),
             outlet_pressure_before_choking=outlet_pressure_before_choke,
             streams=[
-                TimeSeriesStreamConditions.from_stream_condition(total_requested_inlet_stream),
-                *[
-                    TimeSeriesStreamConditions.from_stream_condition(inlet_stream_conditions)
-                    for inlet_stream_conditions in inlet_streams
-                ],
-                TimeSeriesStreamConditions.from_stream_condition(outlet_stream),
+                total_requested_inlet_stream,
+                *inlet_streams,
+                outlet_stream,
             ],
         )
 
@@ -110,21 +134,21 @@ class Compressor(BaseConsumerWithoutOperationalSettings):
             models=[
                 core_results.CompressorModelResult(
                     name="N/A",  # No context available to populate model name
-                    timesteps=[current_timestep],
+                    timesteps=timesteps,
                     is_valid=TimeSeriesBoolean(
-                        timesteps=[current_timestep],
+                        timesteps=timesteps,
                         values=model_result.is_valid,
                         unit=Unit.NONE,
                     ),
                     power=TimeSeriesStreamDayRate(
-                        timesteps=[current_timestep],
+                        timesteps=timesteps,
                         values=model_result.power,
                         unit=model_result.power_unit,
                     )
                     if model_result.power is not None
                     else None,
                     energy_usage=TimeSeriesStreamDayRate(
-                        timesteps=[current_timestep],
+                        timesteps=timesteps,
                         values=model_result.energy_usage,
                         unit=model_result.energy_usage_unit,
                     ),
@@ -1,18 +1,22 @@
 import itertools
 import operator
 from functools import reduce
-from typing import Dict, List, Optional, Protocol, Tuple, TypeVar, Union
+from typing import Dict, Hashable, List, Optional, Protocol, Tuple, TypeVar, Union
 
 import networkx as nx
+import numpy as np
 
 from libecalc.common.priority_optimizer import EvaluatorResult
+from libecalc.common.stream_conditions import TimeSeriesStreamConditions
 from libecalc.common.utils.rates import (
+    TimeSeriesFloat,
     TimeSeriesInt,
+    TimeSeriesStreamDayRate,
 )
 from libecalc.core.consumers.compressor import Compressor
+from libecalc.core.consumers.evaluation_cache import ConsumerEvaluationCache
 from libecalc.core.consumers.pump import Pump
 from libecalc.core.result import ComponentResult, ConsumerSystemResult, EcalcModelResult
-from libecalc.domain.stream_conditions import Rate, StreamConditions
 
 Consumer = TypeVar("Consumer", bound=Union[Compressor, Pump])
 
@@ -38,16 +42,46 @@ class ConsumerSystem:
     """
 
     def __init__(
-        self, id: str, consumers: List[Union[Compressor, Pump]], component_conditions: SystemComponentConditions
+        self,
+        id: str,
+        consumers: List[Union[Compressor, Pump]],
+        component_conditions: SystemComponentConditions,
+        evaluation_cache: Optional[ConsumerEvaluationCache] = None,
     ):
         self.id = id
         self._consumers = consumers
         self._component_conditions = component_conditions
+        # Consumer results for stream conditions already evaluated, None to always evaluate the consumers
+        self._evaluation_cache = evaluation_cache
+        # Maximum rates already calculated for the consumers, shared between the priorities evaluated for the system
+        self._max_rates_cache: Dict[Hashable, List[float]] = {}
+
+    def _get_max_rates(
+        self, consumer: Consumer, inlet_stream: TimeSeriesStreamConditions, target_pressure: TimeSeriesFloat
+    ) -> List[float]:
+        """
+        Get the maximum rates of a consumer for each timestep, reusing the rates calculated for an earlier priority
+        with the same inlet and target conditions.
+        """
+        cache_key = (
+            consumer.id,
+            tuple(inlet_stream.pressure.values),
+            inlet_stream.pressure.unit,
+            tuple(inlet_stream.fluid_density.values) if inlet_stream.fluid_density is not None else None,
+            tuple(target_pressure.values),
+            target_pressure.unit,
+        )
+        if cache_key not in self._max_rates_cache:
+            self._max_rates_cache[cache_key] = consumer.get_max_rates(
+                inlet_stream=inlet_stream,
+                target_pressure=target_pressure,
+            )
+        return self._max_rates_cache[cache_key]
 
     def _get_stream_conditions_adjusted_for_crossover(
         self,
-        stream_conditions: Dict[str, List[StreamConditions]],
-    ) -> Dict[str, List[StreamConditions]]:
+        stream_conditions: Dict[str, List[TimeSeriesStreamConditions]],
+    ) -> Dict[str, List[TimeSeriesStreamConditions]]:
         """
         Calculate stream conditions for the current consumer, accounting for potential crossover from previous
         consumers.
@@ -56,9 +90,11 @@ class ConsumerSystem:
             crossover=self._component_conditions.crossover,
             consumers=self._consumers,
         )
-        adjusted_stream_conditions: Dict[str, List[StreamConditions]] = {}
+        adjusted_stream_conditions: Dict[str, List[TimeSeriesStreamConditions]] = {}
 
-        crossover_streams_map: Dict[str, List[StreamConditions]] = {consumer.id: [] for consumer in self._consumers}
+        crossover_streams_map: Dict[str, List[TimeSeriesStreamConditions]] = {
+            consumer.id: [] for consumer in self._consumers
+        }
         crossover_definitions_map: Dict[str, Crossover] = {
             crossover_stream.from_component_id: crossover_stream
             for crossover_stream in self._component_conditions.crossover
@@ -75,12 +111,13 @@ class ConsumerSystem:
             has_crossover_out = crossover_stream_definition is not None
             if has_crossover_out:
                 # TODO: Mix inlet streams and check pressure? Is consumer a Compressor or Pump or should it actually be trains also? Currently it is trains also.
-                max_rate = consumer.get_max_rate(
+                max_rates = self._get_max_rates(
+                    consumer=consumer,
                     inlet_stream=inlet_streams[0],
                     target_pressure=consumer_stream_conditions[-1].pressure,
                 )
                 crossover_stream, inlet_streams = ConsumerSystem._get_crossover_stream(
-                    max_rate,
+                    max_rates,
                     inlet_streams,
                     crossover_stream_name=crossover_stream_definition.stream_name
                     if crossover_stream_definition.stream_name is not None
@@ -96,29 +133,35 @@ class ConsumerSystem:
 
         return adjusted_stream_conditions
 
-    def evaluate_consumers(self, system_stream_conditions: Dict[str, List[StreamConditions]]) -> List[EvaluatorResult]:
+    def evaluate_consumers(
+        self, system_stream_conditions: Dict[str, List[TimeSeriesStreamConditions]]
+    ) -> List[EvaluatorResult]:
         """
-        Function to evaluate the consumers in the system given stream conditions for a single point in time
+        Function to evaluate the consumers in the system given stream conditions for several timesteps. Each consumer
+        is evaluated for all the timesteps at once, except the timesteps found in the evaluation cache.
 
         Args:
             system_stream_conditions:
 
-        Returns: list of evaluator results
+        Returns: list of evaluator results, with the component results and validity per timestep
 
         """
         adjusted_system_stream_conditions = self._get_stream_conditions_adjusted_for_crossover(
             stream_conditions=system_stream_conditions,
         )
-        consumer_results_for_priority = [
-            consumer.evaluate(adjusted_system_stream_conditions[consumer.id]) for consumer in self._consumers
+        consumer_results = [
+            self._evaluation_cache.evaluate(consumer, adjusted_system_stream_conditions[consumer.id])
+            if self._evaluation_cache is not None
+            else consumer.evaluate_time_series(adjusted_system_stream_conditions[consumer.id]).component_result
+            for consumer in self._consumers
         ]
         return [
             EvaluatorResult(
-                id=consumer_result_for_priority.component_result.id,
-                result=consumer_result_for_priority,
-                is_valid=consumer_result_for_priority.component_result.is_valid.values[0],
+                id=consumer_result.id,
+                result=consumer_result,
+                is_valid=consumer_result.is_valid.values,
             )
-            for consumer_result_for_priority in consumer_results_for_priority
+            for consumer_result in consumer_results
         ]
 
     @staticmethod
@@ -188,32 +231,33 @@ class ConsumerSystem:
 
     @staticmethod
     def _get_crossover_stream(
-        max_rate: float, inlet_streams: List[StreamConditions], crossover_stream_name: str
-    ) -> Tuple[StreamConditions, List[StreamConditions]]:
+        max_rates: List[float], inlet_streams: List[TimeSeriesStreamConditions], crossover_stream_name: str
+    ) -> Tuple[TimeSeriesStreamConditions, List[TimeSeriesStreamConditions]]:
         """
         This function is run over a single consumer only, and is normally run in a for loop
         across all "dependent" consumers in the consumer system, such as here, in a consumer system.
 
 
         Args:
-            max_rate: a list of max rates for one consumer, for each relevant timestep
+            max_rates: the max rates for the consumer, for each timestep
             inlet_streams: list of incoming streams to this consumer. Usually this will have an outer list of length 1, since the consumer
             will only have 1 incoming rate. However, due to potential incoming crossover stream, and due to multistream outer length may be > 1. Length of the outer list is
             1 (standard incoming stream) at index 0, + nr of crossover streams + nr of additional incoming streams (multi stream)
+            crossover_stream_name: the name of the crossover stream
 
         Returns:    1. the additional crossover stream that is required if the total incoming
         streams exceeds the max rate capacity for the consumer in question.
                     2. the streams within capacity of the given consumer
         """
-        # Get total rate across all input rates for this consumer (incl already crossovers from other consumers, if any)
-        total_stream = StreamConditions.mix_all(inlet_streams)
+        total_stream = TimeSeriesStreamConditions.mix_all(inlet_streams)
+        total_rate = np.asarray(total_stream.rate.values, dtype=np.float64)
+        max_rates = np.asarray(max_rates, dtype=np.float64)
 
-        # If we exceed total rate, we need to calculate exceeding rate, and return that as (potential) crossover rate to
-        # another consumer
-        crossover_stream = total_stream.copy(
+        crossover_stream = total_stream.model_copy(
             update={
-                "rate": Rate(
-                    value=total_stream.rate.value - max_rate if total_stream.rate.value > max_rate else 0,
+                "rate": TimeSeriesStreamDayRate(
+                    timesteps=total_stream.rate.timesteps,
+                    values=np.where(total_rate > max_rates, total_rate - max_rates, 0).tolist(),
                     unit=total_stream.rate.unit,
                 ),
                 "name": crossover_stream_name,
@@ -221,23 +265,21 @@ class ConsumerSystem:
         )
 
         streams_within_capacity = []
-        left_over_crossover_stream = crossover_stream.copy()
+        left_over_crossover_rate = np.asarray(crossover_stream.rate.values, dtype=np.float64)
         for inlet_stream in reversed(inlet_streams):
             # Inlet streams will have the requested streams first, then crossover streams. By reversing the list we
             # pass through the crossover rates first, then if needed, we reduce the requested inlet streams to capacity.
-            rate_diff = inlet_stream.rate.value - left_over_crossover_stream.rate.value
-
-            left_over_crossover_stream = left_over_crossover_stream.copy(
-                update={
-                    "rate": Rate(
-                        value=abs(rate_diff) if rate_diff < 0 else 0, unit=left_over_crossover_stream.rate.unit
-                    ),
-                }
-            )
+            rate_diff = np.asarray(inlet_stream.rate.values, dtype=np.float64) - left_over_crossover_rate
+
+            left_over_crossover_rate = np.where(rate_diff < 0, np.abs(rate_diff), 0)
             streams_within_capacity.append(
-                inlet_stream.copy(
+                inlet_stream.model_copy(
                     update={
-                        "rate": Rate(value=rate_diff if rate_diff >= 0 else 0, unit=inlet_stream.rate.unit),
+                        "rate": TimeSeriesStreamDayRate(
+                            timesteps=inlet_stream.rate.timesteps,
+                            values=np.where(rate_diff >= 0, rate_diff, 0).tolist(),
+                            unit=inlet_stream.rate.unit,
+                        ),
                     }
                 )
             )
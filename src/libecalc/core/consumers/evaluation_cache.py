@@ -0,0 +1,141 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Hashable, List, Optional, Protocol, Tuple, TypeVar
+
+import numpy as np
+from pydantic import BaseModel
+
+from libecalc.common.stream_conditions import TimeSeriesStreamConditions
+from libecalc.common.utils.rates import TimeSeries
+
+TResult = TypeVar("TResult", bound=BaseModel)
+
+STREAM_ATTRIBUTES = ["rate", "pressure", "fluid_density", "temperature"]
+
+
+class EvaluatedConsumer(Protocol):
+    id: str
+
+    def evaluate_time_series(self, streams: List[TimeSeriesStreamConditions]): ...
+
+
+@dataclass
+class EvaluationCacheStatistics:
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        number_of_lookups = self.hits + self.misses
+        return self.hits / number_of_lookups if number_of_lookups > 0 else 0.0
+
+
+class ConsumerEvaluationCache:
+    """
+    Cache of consumer component results for single timesteps, keyed by consumer id and the (optionally quantised)
+    rate, pressure, density and temperature of the streams going into the consumer.
+
+    The consumers in a consumer system are created per model period, so a cache should only be shared by consumers
+    using the same models, i.e. one cache per model period.
+
+    Args:
+        decimals: number of decimals the stream values are rounded to before looking up a result. None (default) means
+            that only identical stream conditions reuse a result.
+    """
+
+    def __init__(self, decimals: Optional[int] = None):
+        self._decimals = decimals
+        self._results: Dict[Hashable, Tuple[BaseModel, int]] = {}
+        self.statistics = EvaluationCacheStatistics()
+
+    def _get_keys(self, consumer_id: str, streams: List[TimeSeriesStreamConditions]) -> List[Hashable]:
+        """Get the cache key for each timestep of the streams."""
+        signature = []
+        columns = []
+        for stream in streams:
+            for attribute in STREAM_ATTRIBUTES:
+                time_series = getattr(stream, attribute)
+                if time_series is not None:
+                    signature.append((stream.name, attribute, time_series.unit))
+                    columns.append(time_series.values)
+
+        values = np.asarray(columns, dtype=np.float64).T
+        if self._decimals is not None:
+            values = np.round(values, self._decimals)
+        # Avoid -0.0 and 0.0 giving different keys
+        values = values + 0.0
+
+        signature = (consumer_id, tuple(signature))
+        return [(signature, row.tobytes()) for row in values]
+
+    def evaluate(self, consumer: EvaluatedConsumer, streams: List[TimeSeriesStreamConditions]) -> TResult:
+        """
+        Get the component result of the consumer for the timesteps of the streams. Only the timesteps with stream
+        conditions not seen before are evaluated by the consumer, the rest are taken from the cache.
+
+        Args:
+            consumer: the consumer to evaluate
+            streams: the streams going into and out of the consumer
+
+        Returns: the component result for all the timesteps of the streams
+        """
+        timesteps = next(
+            getattr(stream, attribute).timesteps
+            for stream in streams
+            for attribute in STREAM_ATTRIBUTES
+            if getattr(stream, attribute) is not None
+        )
+        keys = self._get_keys(consumer_id=consumer.id, streams=streams)
+
+        indices_to_evaluate: Dict[Hashable, int] = {}
+        for index, key in enumerate(keys):
+            if key not in self._results and key not in indices_to_evaluate:
+                indices_to_evaluate[key] = index
+
+        self.statistics.misses += len(indices_to_evaluate)
+        self.statistics.hits += len(keys) - len(indices_to_evaluate)
+
+        if indices_to_evaluate:
+            indices = list(indices_to_evaluate.values())
+            result = consumer.evaluate_time_series([stream.get_subset(indices) for stream in streams]).component_result
+            if len(indices) == len(keys):
+                # Nothing taken from the cache, use the result as is.
+                self._results.update({key: (result, position) for position, key in enumerate(keys)})
+                return result
+            self._results.update({key: (result, position) for position, key in enumerate(indices_to_evaluate)})
+
+        return self._gather(sources=[self._results[key] for key in keys], timesteps=timesteps)
+
+    @staticmethod
+    def _gather(sources: List[Tuple[TResult, int]], timesteps: List[datetime]) -> TResult:
+        """
+        Assemble a result from the cached result and position for each timestep.
+        """
+        positions_per_result: Dict[int, Tuple[TResult, List[int], List[datetime]]] = {}
+        for (result, position), timestep in zip(sources, timesteps):
+            _, positions, result_timesteps = positions_per_result.setdefault(id(result), (result, [], []))
+            positions.append(position)
+            result_timesteps.append(timestep)
+
+        results = [
+            _with_timesteps(result.get_subset(positions), result_timesteps)
+            for result, positions, result_timesteps in positions_per_result.values()
+        ]
+        first, *rest = results
+        return first.merge(*rest) if rest else first
+
+
+def _with_timesteps(obj: TResult, timesteps: List[datetime]) -> TResult:
+    """Replace the timesteps of a result, including the timesteps of all the time series in the result."""
+    if isinstance(obj, TimeSeries):
+        return obj.model_copy(update={"timesteps": timesteps})
+
+    update = {}
+    for attribute, value in obj.__dict__.items():
+        if attribute == "timesteps":
+            update[attribute] = timesteps
+        elif isinstance(value, BaseModel):
+            update[attribute] = _with_timesteps(value, timesteps)
+        elif isinstance(value, list) and all(isinstance(item, BaseModel) for item in value):
+            update[attribute] = [_with_timesteps(item, timesteps) for item in value]
+    return obj.model_copy(update=update)
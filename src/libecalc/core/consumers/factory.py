@@ -1,11 +1,13 @@
 from datetime import datetime
-from typing import Union, overload
+from typing import Dict, List, Optional, Tuple, Union, overload
+
+import numpy as np
 
 from libecalc import dto
 from libecalc.common.time_utils import Periods
 from libecalc.core.consumers.compressor import Compressor
 from libecalc.core.consumers.pump import Pump
-from libecalc.core.models.compressor import create_compressor_model
+from libecalc.core.models.compressor import create_compressor_model, is_stateful_compressor_model
 from libecalc.core.models.pump import create_pump_model
 from libecalc.dto.base import ComponentType
 
@@ -50,3 +52,47 @@ def create_consumer(
         )
     else:
         raise TypeError(f"Unknown consumer. Received consumer with type '{consumer.component_type}'")
+
+
+def has_stateful_energy_usage_models(
+    consumer: Union[dto.components.CompressorComponent, dto.components.PumpComponent],
+) -> bool:
+    """
+    Check if any of the energy usage models of the consumer keeps state between evaluations, i.e. if the consumer
+    must be created again to get the same results for the same stream conditions.
+    """
+    return consumer.component_type == ComponentType.COMPRESSOR and any(
+        is_stateful_compressor_model(energy_usage_model) for energy_usage_model in consumer.energy_usage_model.values()
+    )
+
+
+def group_timesteps_by_energy_usage_models(
+    consumers: List[Union[dto.components.CompressorComponent, dto.components.PumpComponent]],
+    timesteps: List[datetime],
+) -> List[List[int]]:
+    """
+    Group the timesteps where all the consumers use the same energy usage models, i.e. where the consumers can be
+    created once and evaluated for all the timesteps in the group.
+
+    Args:
+        consumers: the consumers to group timesteps for
+        timesteps: the timesteps to group
+
+    Returns: the indices of the timesteps in each group, with the groups in chronological order
+
+    """
+    time_index = np.asarray(timesteps, dtype="datetime64[us]")
+    # The start date of the energy usage model used by each consumer for each timestep, None before the first model
+    start_dates_per_consumer = []
+    for consumer in consumers:
+        start_dates = sorted(consumer.energy_usage_model)
+        start_date_indices = (
+            np.searchsorted(np.asarray(start_dates, dtype="datetime64[us]"), time_index, side="right") - 1
+        )
+        start_dates_per_consumer.append([start_dates[index] if index >= 0 else None for index in start_date_indices])
+
+    timestep_indices_per_models: Dict[Tuple[Optional[datetime], ...], List[int]] = {}
+    for timestep_index in range(len(timesteps)):
+        energy_usage_model_start_dates = tuple(start_dates[timestep_index] for start_dates in start_dates_per_consumer)
+        timestep_indices_per_models.setdefault(energy_usage_model_start_dates, []).append(timestep_index)
+    return list(timestep_indices_per_models.values())
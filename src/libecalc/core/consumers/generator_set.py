@@ -4,8 +4,7 @@ from numpy.typing import NDArray
 from libecalc import dto
 from libecalc.common.list.list_utils import array_to_list
 from libecalc.common.logger import logger
-from libecalc.common.temporal_model import TemporalModel
-from libecalc.common.time_utils import Period
+from libecalc.common.temporal_model import LazyTemporalModel
 from libecalc.common.units import Unit
 from libecalc.common.utils.rates import (
     Rates,
@@ -13,6 +12,7 @@ from libecalc.common.utils.rates import (
     TimeSeriesStreamDayRate,
 )
 from libecalc.core.models.generator import GeneratorModelSampled
+from libecalc.core.models.model_registry import get_shared_model
 from libecalc.core.result import GeneratorSetResult
 from libecalc.dto.variables import VariablesMap
 
@@ -24,11 +24,10 @@ class Genset:
     ):
         logger.debug(f"Creating Genset: {data_transfer_object.name}")
         self.data_transfer_object = data_transfer_object
-        self.temporal_generator_set_model = TemporalModel(
-            {
-                start_time: GeneratorModelSampled(model)
-                for start_time, model in data_transfer_object.generator_set_model.items()
-            }
+        # Generator set models are created when first evaluated, models outside the evaluated periods are never created
+        self.temporal_generator_set_model = LazyTemporalModel(
+            data_transfer_object.generator_set_model,
+            create_model=lambda model: get_shared_model(model, lambda: GeneratorModelSampled(model)),
         )
 
     def evaluate(
@@ -48,6 +47,13 @@ class Genset:
         fuel_rate = self.evaluate_fuel_rate(power_requirement, variables_map=variables_map)
         power_capacity_margin = self.evaluate_power_capacity_margin(power_requirement, variables_map=variables_map)
 
+        unused_periods = self.temporal_generator_set_model.unused_periods
+        if unused_periods:
+            logger.debug(
+                f"Generator set models of '{self.data_transfer_object.name}' not used in any evaluation:"
+                f" {', '.join(str(period) for period in unused_periods)}"
+            )
+
         # Convert fuel_rate to calendar day rate
         # fuel_rate = Rates.to_calendar_day(stream_day_rates=fuel_rate, regularity=regularity)
         # TODO: Ok to not convert to calendar day here? Seems that all legacy stuff needs to be dealt with anyways...
@@ -90,20 +96,18 @@ class Genset:
         self, power_requirement: NDArray[np.float64], variables_map: dto.VariablesMap
     ) -> NDArray[np.float64]:
         result = np.full_like(power_requirement, fill_value=np.nan).astype(float)
-        for period, model in self.temporal_generator_set_model.items():
-            if Period.intersects(period, variables_map.period):
-                start_index, end_index = period.get_timestep_indices(variables_map.time_vector)
-                result[start_index:end_index] = model.evaluate(power_requirement[start_index:end_index])
+        for period, model in self.temporal_generator_set_model.items_in_period(variables_map.period):
+            start_index, end_index = period.get_timestep_indices(variables_map.time_vector)
+            result[start_index:end_index] = model.evaluate(power_requirement[start_index:end_index])
         return result
 
     def evaluate_power_capacity_margin(
         self, power_requirement: NDArray[np.float64], variables_map: dto.VariablesMap
     ) -> NDArray[np.float64]:
         result = np.zeros_like(power_requirement).astype(float)
-        for period, model in self.temporal_generator_set_model.items():
-            if Period.intersects(period, variables_map.period):
-                start_index, end_index = period.get_timestep_indices(variables_map.time_vector)
-                result[start_index:end_index] = model.evaluate_power_capacity_margin(
-                    power_requirement[start_index:end_index]
-                )
+        for period, model in self.temporal_generator_set_model.items_in_period(variables_map.period):
+            start_index, end_index = period.get_timestep_indices(variables_map.time_vector)
+            result[start_index:end_index] = model.evaluate_power_capacity_margin(
+                power_requirement[start_index:end_index]
+            )
         return result
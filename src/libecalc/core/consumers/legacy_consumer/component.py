@@ -1,8 +1,7 @@
 import itertools
 import math
-from collections import defaultdict
 from datetime import datetime
-from typing import DefaultDict, Iterable, List, Union
+from typing import Iterable, List, Union
 
 import numpy as np
 from numpy.typing import NDArray
@@ -10,8 +9,12 @@ from numpy.typing import NDArray
 from libecalc import dto
 from libecalc.common.list.list_utils import array_to_list
 from libecalc.common.logger import logger
-from libecalc.common.temporal_model import TemporalExpression, TemporalModel
-from libecalc.common.time_utils import Period
+from libecalc.common.temporal_model import (
+    LazyTemporalModel,
+    TemporalExpression,
+    TemporalModel,
+)
+from libecalc.common.time_utils import reindex_values
 from libecalc.common.units import Unit
 from libecalc.common.utils.rates import (
     Rates,
@@ -69,11 +72,10 @@ class Consumer(BaseConsumer):
     ):
         logger.debug(f"Creating Consumer: {consumer_dto.name}")
         self._consumer_dto = consumer_dto
-        self._consumer_time_function = TemporalModel(
-            {
-                start_time: EnergyModelMapper.from_dto_to_domain(model)
-                for start_time, model in consumer_dto.energy_usage_model.items()
-            }
+        # Energy usage models are created when first evaluated, models outside the evaluated periods are never created
+        self._consumer_time_function = LazyTemporalModel(
+            consumer_dto.energy_usage_model,
+            create_model=EnergyModelMapper.from_dto_to_domain,
         )
 
     @property
@@ -339,24 +341,30 @@ class Consumer(BaseConsumer):
     ) -> List[ConsumerOrSystemFunctionResult]:
         """Evaluate each of the models in the temporal model for this consumer."""
         results = []
-        for period, consumer_model in self._consumer_time_function.items():
-            if Period.intersects(period, variables_map.period):
-                start_index, end_index = period.get_timestep_indices(variables_map.time_vector)
-                regularity_this_period = regularity[start_index:end_index]
-                variables_map_this_period = variables_map.get_subset(
-                    start_index=start_index,
-                    end_index=end_index,
-                )
-                logger.debug(
-                    f"Evaluating {consumer_model.__class__.__name__} with"
-                    f" {len(variables_map_this_period.time_vector)} timestep(s) in range"
-                    f" [{period}]"
-                )
-                consumer_function_result = consumer_model.evaluate(
-                    variables_map=variables_map_this_period,
-                    regularity=regularity_this_period,
-                )
-                results.append(consumer_function_result)
+        for period, consumer_model in self._consumer_time_function.items_in_period(variables_map.period):
+            start_index, end_index = period.get_timestep_indices(variables_map.time_vector)
+            regularity_this_period = regularity[start_index:end_index]
+            variables_map_this_period = variables_map.get_subset(
+                start_index=start_index,
+                end_index=end_index,
+            )
+            logger.debug(
+                f"Evaluating {consumer_model.__class__.__name__} with"
+                f" {len(variables_map_this_period.time_vector)} timestep(s) in range"
+                f" [{period}]"
+            )
+            consumer_function_result = consumer_model.evaluate(
+                variables_map=variables_map_this_period,
+                regularity=regularity_this_period,
+            )
+            results.append(consumer_function_result)
+
+        unused_periods = self._consumer_time_function.unused_periods
+        if unused_periods:
+            logger.debug(
+                f"Energy usage models of consumer '{self._consumer_dto.name}' not used in any evaluation:"
+                f" {', '.join(str(period) for period in unused_periods)}"
+            )
 
         return results
 
@@ -387,15 +395,15 @@ class Consumer(BaseConsumer):
         """Based on a consumer time function result (EnergyFunctionResult), the corresponding time vector and
         the consumer time vector, we calculate the actual consumer (consumption) rate.
         """
-        new_values: DefaultDict[datetime, Union[float, str]] = defaultdict(float)
-        new_values.update({t: fillna for t in new_time_vector})
-        for t, v in zip(time_vector, values):
-            if t in new_values:
-                new_values[t] = v
-            else:
-                logger.warning(
-                    "Reindexing consumer time vector and losing data. This should not happen."
-                    " Please contact eCalc support."
-                )
+        new_values, is_losing_data = reindex_values(
+            values=values,
+            time_vector=time_vector,
+            new_time_vector=new_time_vector,
+            fillna=fillna,
+        )
+        if is_losing_data:
+            logger.warning(
+                "Reindexing consumer time vector and losing data. This should not happen. Please contact eCalc support."
+            )
 
-        return np.array([rate_sum for time, rate_sum in sorted(new_values.items())])
+        return new_values
@@ -72,7 +72,7 @@ class CompressorConsumerFunction(ConsumerFunction):
         """
         calendar_day_rates = np.array(
             [
-                rate_expression.evaluate(variables=variables_map.variables, fill_length=len(variables_map.time_vector))
+                rate_expression.evaluate(variables=variables_map.arrays, fill_length=len(variables_map.time_vector))
                 for rate_expression in self._rate_expression
             ]
         )
@@ -100,21 +100,21 @@ class CompressorConsumerFunction(ConsumerFunction):
 
         intermediate_pressure = (
             self._intermediate_pressure_expression.evaluate(
-                variables=variables_map.variables, fill_length=len(variables_map.time_vector)
+                variables=variables_map.arrays, fill_length=len(variables_map.time_vector)
             )
             if self._intermediate_pressure_expression
             else None
         )
         suction_pressure = (
             self._suction_pressure_expression.evaluate(
-                variables=variables_map.variables, fill_length=len(variables_map.time_vector)
+                variables=variables_map.arrays, fill_length=len(variables_map.time_vector)
             )
             if self._suction_pressure_expression is not None
             else None
         )
         discharge_pressure = (
             self._discharge_pressure_expression.evaluate(
-                variables=variables_map.variables, fill_length=len(variables_map.time_vector)
+                variables=variables_map.arrays, fill_length=len(variables_map.time_vector)
             )
             if self._discharge_pressure_expression is not None
             else None
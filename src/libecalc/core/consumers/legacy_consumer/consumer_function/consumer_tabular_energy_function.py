@@ -51,7 +51,7 @@ class TabulatedConsumerFunction(ConsumerFunction):
             variable.name: Variable(
                 name=variable.name,
                 values=variable.expression.evaluate(
-                    variables=variables_map.variables, fill_length=len(variables_map.time_vector)
+                    variables=variables_map.arrays, fill_length=len(variables_map.time_vector)
                 ),
             )
             for variable in self._variables_expressions
@@ -69,7 +69,7 @@ class DirectExpressionConsumerFunction(ConsumerFunction):
         regularity: List[float],
     ) -> ConsumerFunctionResult:
         energy_usage_expression_evaluated = self._expression.evaluate(
-            variables=variables_map.variables, fill_length=len(variables_map.time_vector)
+            variables=variables_map.arrays, fill_length=len(variables_map.time_vector)
         )
 
         # Do conditioning first - set rates to zero if conditions are not met
@@ -72,7 +72,7 @@ class PumpConsumerFunction(ConsumerFunction):
             condition_expression=self._condition_expression,
         )
         calendar_day_rate = self._rate_expression.evaluate(
-            variables=variables_map.variables, fill_length=len(variables_map.time_vector)
+            variables=variables_map.arrays, fill_length=len(variables_map.time_vector)
         )
         # if regularity is 0 for a calendar day rate, set stream day rate to 0 for that step
         stream_day_rate = apply_condition(
@@ -83,13 +83,13 @@ class PumpConsumerFunction(ConsumerFunction):
             condition=condition,
         )
         suction_pressure = self._suction_pressure_expression.evaluate(
-            variables=variables_map.variables, fill_length=len(variables_map.time_vector)
+            variables=variables_map.arrays, fill_length=len(variables_map.time_vector)
         )
         discharge_pressure = self._discharge_pressure_expression.evaluate(
-            variables=variables_map.variables, fill_length=len(variables_map.time_vector)
+            variables=variables_map.arrays, fill_length=len(variables_map.time_vector)
         )
         fluid_density = self._fluid_density_expression.evaluate(
-            variables=variables_map.variables, fill_length=len(variables_map.time_vector)
+            variables=variables_map.arrays, fill_length=len(variables_map.time_vector)
         )
 
         # Do not input regularity to pump function. Handled outside
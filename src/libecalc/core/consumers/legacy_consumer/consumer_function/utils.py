@@ -23,7 +23,7 @@ def get_condition_from_expression(
     """
     if condition_expression is not None:
         condition = condition_expression.evaluate(
-            variables=variables_map.variables, fill_length=len(variables_map.time_vector)
+            variables=variables_map.arrays, fill_length=len(variables_map.time_vector)
         )
         condition = (condition != 0).astype(int)
     else:
@@ -65,7 +65,7 @@ def get_power_loss_factor_from_expression(
     """
     if power_loss_factor_expression is not None:
         power_loss_factor = power_loss_factor_expression.evaluate(
-            variables=variables_map.variables, fill_length=len(variables_map.time_vector)
+            variables=variables_map.arrays, fill_length=len(variables_map.time_vector)
         )
     else:
         return None
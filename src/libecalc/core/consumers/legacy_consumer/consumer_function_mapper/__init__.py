@@ -3,6 +3,7 @@ from typing import Any, Callable, Dict, Union
 from libecalc import dto
 from libecalc.common.logger import logger
 from libecalc.core.consumers.legacy_consumer.consumer_function import ConsumerFunction
+from libecalc.core.models.compressor import is_stateful_compressor_model
 from libecalc.dto.types import ConsumerType
 
 from .compressor_consumer_function import create_compressor_consumer_function
@@ -45,3 +46,17 @@ class EnergyModelMapper:
     @staticmethod
     def from_dto_to_domain(energy_usage_model: TConsumerFunction) -> ConsumerFunction:
         return consumer_function_map.get(energy_usage_model.typ, _invalid_energy_usage_type)(energy_usage_model)
+
+
+def has_stateful_compressor_models(energy_usage_model: TConsumerFunction) -> bool:
+    """
+    Check if the consumer function uses a compressor model that keeps state between evaluations, i.e. if the consumer
+    function must be created again to get the same results for the same variables.
+    """
+    if isinstance(energy_usage_model, dto.CompressorConsumerFunction):
+        return is_stateful_compressor_model(energy_usage_model.model)
+    if isinstance(energy_usage_model, dto.CompressorSystemConsumerFunction):
+        return any(
+            is_stateful_compressor_model(compressor.compressor_train) for compressor in energy_usage_model.compressors
+        )
+    return False
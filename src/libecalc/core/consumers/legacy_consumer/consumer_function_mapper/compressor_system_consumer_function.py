@@ -54,6 +54,7 @@ def create_compressor_system(model_dto: dto.CompressorSystemConsumerFunction) ->
         operational_settings_expressions=operational_settings,
         condition_expression=model_dto.condition,
         power_loss_factor_expression=model_dto.power_loss_factor,
+        priority_cascade=model_dto.priority_cascade,
     )
 
 
@@ -66,4 +66,5 @@ def create_pump_system(model_dto: dto.PumpSystemConsumerFunction) -> ConsumerSys
         ],
         condition_expression=model_dto.condition,
         power_loss_factor_expression=model_dto.power_loss_factor,
+        priority_cascade=model_dto.priority_cascade,
     )
@@ -6,6 +6,7 @@ from libecalc import dto
 from libecalc.core.consumers.legacy_consumer.consumer_function.consumer_tabular_energy_function import (
     TabulatedConsumerFunction,
 )
+from libecalc.core.models.model_registry import get_shared_model
 from libecalc.core.models.tabulated import (
     ConsumerTabularEnergyFunction,
     Variable,
@@ -18,7 +19,7 @@ def _get_column(data: List[List], headers: List[str], header: str) -> List:
     return data[headers.index(header)]
 
 
-def create_tabulated_consumer_function(model_dto: dto.TabulatedConsumerFunction) -> TabulatedConsumerFunction:
+def _create_tabulated_energy_function(model_dto: dto.TabulatedConsumerFunction) -> ConsumerTabularEnergyFunction:
     function_value_header = model_dto.energy_usage_type
     data = model_dto.model.data
     headers = model_dto.model.headers
@@ -35,7 +36,7 @@ def create_tabulated_consumer_function(model_dto: dto.TabulatedConsumerFunction)
     # required to set either "FUEL" or "POWER" (according to doc) and now also verified in validation
     energy_usage_type: EnergyUsageType = EnergyUsageType.FUEL if "FUEL" in headers else EnergyUsageType.POWER
 
-    tabulated_energy_function = ConsumerTabularEnergyFunction(
+    return ConsumerTabularEnergyFunction(
         function_values=function_values,
         variables=variables,
         energy_usage_adjustment_constant=model_dto.model.energy_usage_adjustment_constant,
@@ -43,8 +44,12 @@ def create_tabulated_consumer_function(model_dto: dto.TabulatedConsumerFunction)
         energy_usage_type=energy_usage_type,
     )
 
+
+def create_tabulated_consumer_function(model_dto: dto.TabulatedConsumerFunction) -> TabulatedConsumerFunction:
     return TabulatedConsumerFunction(
-        tabulated_energy_function=tabulated_energy_function,
+        tabulated_energy_function=get_shared_model(
+            model_dto.model, lambda: _create_tabulated_energy_function(model_dto)
+        ),
         variables_expressions=[
             VariableExpression(
                 name=variable.name,
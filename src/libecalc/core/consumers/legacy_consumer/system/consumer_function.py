@@ -1,6 +1,6 @@
 from abc import abstractmethod
 from copy import deepcopy
-from typing import List, Optional
+from typing import Dict, Hashable, List, Optional, Tuple
 
 import numpy as np
 from numpy.typing import NDArray
@@ -31,7 +31,11 @@ from libecalc.core.consumers.legacy_consumer.system.results import (
 from libecalc.core.consumers.legacy_consumer.system.types import ConsumerSystemComponent
 from libecalc.core.consumers.legacy_consumer.system.utils import (
     assemble_operational_setting_from_model_result_list,
+    gather_consumer_results_from_operational_settings_results,
+    get_array_cache_key,
+    get_not_calculated_operational_setting_result,
     get_operational_settings_number_used_from_model_results,
+    scatter_operational_setting_result,
 )
 from libecalc.core.models.compressor.base import CompressorModel
 from libecalc.core.models.pump import PumpModel
@@ -46,14 +50,21 @@ class ConsumerSystemConsumerFunction(ConsumerFunction):
         operational_settings_expressions: List[ConsumerSystemOperationalSettingExpressions],
         condition_expression: Optional[Expression],
         power_loss_factor_expression: Optional[Expression],
+        priority_cascade: bool = False,
     ):
         """operational_settings_expressions, condition_expression and power_loss_factor_expression
         defines one expression per time-step.
+
+        With priority_cascade, an operational setting is only evaluated for the timesteps where all the operational
+        settings with higher priority are invalid. The result is the same, but the reported results for each
+        operational setting are marked as not calculated for the timesteps that were skipped, including all timesteps
+        of the operational settings that are not needed at all.
         """
         self.consumers = consumer_components
         self.operational_settings_expressions = operational_settings_expressions
         self.condition_expression = condition_expression
         self.power_loss_factor_expression = power_loss_factor_expression
+        self.priority_cascade = priority_cascade
 
         for operational_settings_expression in operational_settings_expressions:
             if operational_settings_expression.number_of_consumers != len(consumer_components):
@@ -97,7 +108,7 @@ class ConsumerSystemConsumerFunction(ConsumerFunction):
         6. Assemble the settings number used for each time step
         7. Assemble the operational setting based on 4.
         8. Evaluate of cross-over has been used.
-        9. Run the consumers with the resulting Operational settings in 5.
+        9. Assemble the consumer results for the operational settings used from the results in 5.
         10. Compute the sum of energy and power used by the consumers
         11. Evaluate and apply power loss expressions
         12. Return a complete ConsumerSystemConsumerFunctionResult with data from the above steps.
@@ -108,7 +119,8 @@ class ConsumerSystemConsumerFunction(ConsumerFunction):
         )
 
         operational_settings_adjusted_for_cross_over = self.get_operational_settings_adjusted_for_cross_over(
-            operational_settings=operational_settings
+            operational_settings=operational_settings,
+            max_rate_cache={},
         )
 
         condition = get_condition_from_expression(
@@ -125,13 +137,21 @@ class ConsumerSystemConsumerFunction(ConsumerFunction):
                 for rate in operational_setting.rates
             ]
 
-        consumer_system_operational_settings_results = self.evaluate_system_operational_settings(
-            operational_settings=operational_settings_adjusted_for_cross_over
-        )
+        if self.priority_cascade:
+            (
+                consumer_system_operational_settings_results,
+                operational_setting_number_used_per_timestep,
+            ) = self.evaluate_system_operational_settings_in_priority_order(
+                operational_settings=operational_settings_adjusted_for_cross_over
+            )
+        else:
+            consumer_system_operational_settings_results = self.evaluate_system_operational_settings(
+                operational_settings=operational_settings_adjusted_for_cross_over
+            )
 
-        operational_setting_number_used_per_timestep = get_operational_settings_number_used_from_model_results(
-            consumer_system_operational_settings_results=consumer_system_operational_settings_results
-        )
+            operational_setting_number_used_per_timestep = get_operational_settings_number_used_from_model_results(
+                consumer_system_operational_settings_results=consumer_system_operational_settings_results
+            )
 
         operational_setting_used = assemble_operational_setting_from_model_result_list(
             operational_settings=operational_settings_adjusted_for_cross_over,
@@ -146,7 +166,10 @@ class ConsumerSystemConsumerFunction(ConsumerFunction):
             operational_settings_used=operational_setting_used,
         )
 
-        consumer_results = self.evaluate_consumers(operational_setting=operational_setting_used)
+        consumer_results = gather_consumer_results_from_operational_settings_results(
+            operational_settings_results=consumer_system_operational_settings_results,
+            setting_number_used_per_timestep=operational_setting_number_used_per_timestep,
+        )
         energy_usage = np.sum([np.asarray(result.energy_usage) for result in consumer_results], axis=0)
         power_usage = np.sum([np.asarray(result.power) for result in consumer_results], axis=0)
 
@@ -227,24 +250,128 @@ class ConsumerSystemConsumerFunction(ConsumerFunction):
             )
         return operational_settings_results
 
+    def evaluate_system_operational_settings_in_priority_order(
+        self,
+        operational_settings: List[ConsumerSystemOperationalSetting],
+    ) -> Tuple[List[ConsumerSystemOperationalSettingResult], NDArray[np.int_]]:
+        """Evaluate the operational settings in prioritized order, where each operational setting is only evaluated
+        for the timesteps where none of the previous operational settings are within capacity. If no operational setting
+        is within capacity, the last operational setting is used, same as in
+        get_operational_settings_number_used_from_model_results.
+
+        The results for each operational setting are expanded to all timesteps, where the skipped timesteps are marked
+        as not calculated. Operational settings that are not needed are not evaluated, and are reported as not
+        calculated for all timesteps, to have one result per operational setting as when evaluating all of them.
+
+        :return: The results per evaluated operational setting and the operational setting number used per timestep
+        """
+        number_of_timesteps = len(operational_settings[0].rates[0])
+        operational_setting_number_used_per_timestep = np.full(number_of_timesteps, 0)
+        remaining_timestep_indices = np.arange(number_of_timesteps)
+
+        operational_settings_results = []
+        for i, operational_setting in enumerate(operational_settings):
+            logger.debug(f"Evaluating operational setting #{i} for {len(remaining_timestep_indices)} timesteps")
+            operational_setting_result = ConsumerSystemOperationalSettingResult(
+                consumer_results=self.evaluate_consumers(
+                    operational_setting=operational_setting.get_subset_for_timestep_indices(
+                        timestep_indices=remaining_timestep_indices
+                    ),
+                ),
+            )
+            operational_setting_number_used_per_timestep[remaining_timestep_indices] = i
+            operational_settings_results.append(
+                scatter_operational_setting_result(
+                    operational_setting_result=operational_setting_result,
+                    timestep_indices=remaining_timestep_indices,
+                    number_of_timesteps=number_of_timesteps,
+                )
+            )
+
+            remaining_timestep_indices = remaining_timestep_indices[operational_setting_result.indices_outside_capacity]
+            if len(remaining_timestep_indices) == 0:
+                break
+
+        operational_settings_results.extend(
+            get_not_calculated_operational_setting_result(operational_settings_results[0])
+            for _ in range(len(operational_settings) - len(operational_settings_results))
+        )
+        return operational_settings_results, operational_setting_number_used_per_timestep
+
     def get_operational_settings_adjusted_for_cross_over(
-        self, operational_settings: List[ConsumerSystemOperationalSetting]
+        self,
+        operational_settings: List[ConsumerSystemOperationalSetting],
+        max_rate_cache: Optional[Dict[Hashable, NDArray[np.float64]]] = None,
     ) -> List[ConsumerSystemOperationalSetting]:
+        """Adjust the rates of the operational settings for cross-overs.
+
+        :param operational_settings: the operational settings to adjust
+        :param max_rate_cache: maximum rates already calculated, shared between the operational settings
+        """
+        max_rate_cache = max_rate_cache if max_rate_cache is not None else {}
         operational_settings_after_cross_over = []
         for operational_setting in operational_settings:
             if operational_setting.cross_overs:
                 operational_settings_after_cross_over.append(
                     self.calculate_operational_settings_after_cross_over(
                         operational_setting=operational_setting,
+                        max_rate_cache=max_rate_cache,
                     )
                 )
             else:
                 operational_settings_after_cross_over.append(operational_setting)
         return operational_settings_after_cross_over
 
+    def get_consumer_maximum_rate(
+        self,
+        consumer_index: int,
+        suction_pressure: Optional[NDArray[np.float64]],
+        discharge_pressure: Optional[NDArray[np.float64]],
+        fluid_density: Optional[NDArray[np.float64]],
+        max_rate_cache: Optional[Dict[Hashable, NDArray[np.float64]]] = None,
+    ) -> NDArray[np.float64]:
+        """Get the maximum rate of a consumer for the given pressures (and fluid density for pumps).
+
+        Operational settings often share pressure expressions, so the maximum rates are looked up in max_rate_cache,
+        keyed by the facility model and the input arrays, before the (expensive) model evaluation.
+        """
+        energy_usage_model = self.consumers[consumer_index].facility_model
+        if isinstance(energy_usage_model, CompressorModel):
+            fluid_density = None
+        elif not isinstance(energy_usage_model, PumpModel):
+            raise NotImplementedError(
+                f"consumer system with energy usage model type:"
+                f" {type(energy_usage_model).__name__} has not been implemented."
+                f" This should not happen. Please contact eCalc support."
+            )
+
+        cache_key = (
+            id(energy_usage_model),
+            *get_array_cache_key(suction_pressure, discharge_pressure, fluid_density),
+        )
+        if max_rate_cache is not None and cache_key in max_rate_cache:
+            return max_rate_cache[cache_key]
+
+        if isinstance(energy_usage_model, CompressorModel):
+            consumer_maximum_rate = energy_usage_model.get_max_standard_rate(
+                suction_pressures=suction_pressure,
+                discharge_pressures=discharge_pressure,
+            )
+        else:
+            consumer_maximum_rate = energy_usage_model.get_max_standard_rate(
+                suction_pressures=suction_pressure,
+                discharge_pressures=discharge_pressure,
+                fluid_density=fluid_density,
+            )
+
+        if max_rate_cache is not None:
+            max_rate_cache[cache_key] = consumer_maximum_rate
+        return consumer_maximum_rate
+
     def calculate_operational_settings_after_cross_over(
         self,
         operational_setting: ConsumerSystemOperationalSetting,
+        max_rate_cache: Optional[Dict[Hashable, NDArray[np.float64]]] = None,
     ) -> ConsumerSystemOperationalSetting:
         """Calculate rates after cross over is applied for consumers. Does not check if the
         "receiving" consumer now get a rate within it's capacity, just set rate of "sender"
@@ -267,26 +394,15 @@ class ConsumerSystemConsumerFunction(ConsumerFunction):
             receiver_discharge_pressure = (
                 discharge_pressures[cross_over_number - 1] if discharge_pressures is not None else None
             )
-            energy_usage_model = self.consumers[consumer_index].facility_model
-
-            if isinstance(energy_usage_model, CompressorModel):
-                consumer_maximum_rate = energy_usage_model.get_max_standard_rate(
-                    suction_pressures=consumer_suction_pressure,
-                    discharge_pressures=consumer_discharge_pressure,
-                )
-            elif isinstance(energy_usage_model, PumpModel):
-                consumer_fluid_density = fluid_densities[consumer_index] if fluid_densities is not None else None
-                consumer_maximum_rate = energy_usage_model.get_max_standard_rate(
-                    suction_pressures=consumer_suction_pressure,
-                    discharge_pressures=consumer_discharge_pressure,
-                    fluid_density=consumer_fluid_density,
-                )
-            else:
-                raise NotImplementedError(
-                    f"consumer system with energy usage model type:"
-                    f" {type(energy_usage_model).__name__} has not been implemented."
-                    f" This should not happen. Please contact eCalc support."
-                )
+            consumer_fluid_density = fluid_densities[consumer_index] if fluid_densities is not None else None
+
+            consumer_maximum_rate = self.get_consumer_maximum_rate(
+                consumer_index=consumer_index,
+                suction_pressure=consumer_suction_pressure,
+                discharge_pressure=consumer_discharge_pressure,
+                fluid_density=consumer_fluid_density,
+                max_rate_cache=max_rate_cache,
+            )
             transfer_rate = requested_rates[consumer_index] - consumer_maximum_rate
             # Only transfer when max rate is exceeded
             transfer_rate = np.where(transfer_rate > 0, transfer_rate, 0)
@@ -327,18 +443,18 @@ class CompressorSystemConsumerFunction(ConsumerSystemConsumerFunction):
         Evaluate rate and pressure expressions in an OperationalSettingExpressions object
         """
         rates = [
-            rate_expression.evaluate(variables=variables_map.variables, fill_length=len(variables_map.time_vector))
+            rate_expression.evaluate(variables=variables_map.arrays, fill_length=len(variables_map.time_vector))
             for rate_expression in operational_setting_expressions.rates
         ]
         suction_pressures = [
             suction_pressure_expression.evaluate(
-                variables=variables_map.variables, fill_length=len(variables_map.time_vector)
+                variables=variables_map.arrays, fill_length=len(variables_map.time_vector)
             )
             for suction_pressure_expression in operational_setting_expressions.suction_pressures
         ]
         discharge_pressures = [
             discharge_pressure_expression.evaluate(
-                variables=variables_map.variables, fill_length=len(variables_map.time_vector)
+                variables=variables_map.arrays, fill_length=len(variables_map.time_vector)
             )
             for discharge_pressure_expression in operational_setting_expressions.discharge_pressures
         ]
@@ -384,24 +500,24 @@ class PumpSystemConsumerFunction(ConsumerSystemConsumerFunction):
         returned in a data object with all arrays.
         """
         rates = [
-            rate_expression.evaluate(variables=variables_map.variables, fill_length=len(variables_map.time_vector))
+            rate_expression.evaluate(variables=variables_map.arrays, fill_length=len(variables_map.time_vector))
             for rate_expression in operational_setting_expressions.rates
         ]
         suction_pressures = [
             suction_pressure_expression.evaluate(
-                variables=variables_map.variables, fill_length=len(variables_map.time_vector)
+                variables=variables_map.arrays, fill_length=len(variables_map.time_vector)
             )
             for suction_pressure_expression in operational_setting_expressions.suction_pressures
         ]
         discharge_pressures = [
             discharge_pressure_expression.evaluate(
-                variables=variables_map.variables, fill_length=len(variables_map.time_vector)
+                variables=variables_map.arrays, fill_length=len(variables_map.time_vector)
             )
             for discharge_pressure_expression in operational_setting_expressions.discharge_pressures
         ]
         fluid_densities = [
             fluid_density_expression.evaluate(
-                variables=variables_map.variables, fill_length=len(variables_map.time_vector)
+                variables=variables_map.arrays, fill_length=len(variables_map.time_vector)
             )
             for fluid_density_expression in operational_setting_expressions.fluid_densities
         ]
@@ -131,6 +131,25 @@ class ConsumerSystemOperationalSetting(BaseModel):
 
         return operational_settings
 
+    def get_subset_for_timestep_indices(self, timestep_indices: NDArray[np.int_]) -> ConsumerSystemOperationalSetting:
+        """Get the operational setting for a subset of the timesteps, given by their indices."""
+        return self.model_copy(
+            update={
+                "rates": [np.asarray(rate)[timestep_indices] for rate in self.rates],
+                "suction_pressures": [
+                    np.asarray(suction_pressure)[timestep_indices] for suction_pressure in self.suction_pressures
+                ],
+                "discharge_pressures": [
+                    np.asarray(discharge_pressure)[timestep_indices] for discharge_pressure in self.discharge_pressures
+                ],
+                "fluid_densities": [
+                    np.asarray(fluid_density)[timestep_indices] for fluid_density in self.fluid_densities
+                ]
+                if self.fluid_densities is not None
+                else None,
+            }
+        )
+
     def set_rates_after_cross_over(
         self,
         rates_after_cross_over: List[NDArray[np.float64]],
@@ -1,4 +1,5 @@
-from typing import List
+from enum import Enum
+from typing import Any, Callable, Hashable, List, Optional, Sequence, Tuple
 
 import numpy as np
 from numpy.typing import NDArray
@@ -9,8 +10,20 @@ from libecalc.core.consumers.legacy_consumer.system.operational_setting import (
     ConsumerSystemOperationalSetting,
 )
 from libecalc.core.consumers.legacy_consumer.system.results import (
+    ConsumerSystemComponentResult,
     ConsumerSystemOperationalSettingResult,
 )
+from libecalc.core.models.results.base import EnergyModelBaseResult
+from libecalc.dto.types import ChartAreaFlag
+
+
+def get_array_cache_key(*arrays: Optional[NDArray[np.float64]]) -> Tuple[Hashable, ...]:
+    """Create a hashable key for a set of (optional) arrays, i.e. to look up results already calculated for the same
+    input values.
+    """
+    return tuple(
+        None if array is None else (np.shape(array), np.asarray(array, dtype=np.float64).tobytes()) for array in arrays
+    )
 
 
 def get_operational_settings_number_used_from_model_results(
@@ -120,3 +133,128 @@ def assemble_operational_setting_from_model_result_list(
         if fluid_densities is not None
         else None,
     )
+
+
+def _combine_timestep_values(values: Sequence[Any], combine: Callable[[List[list]], list]) -> Any:
+    """Combine structurally equal result values by applying combine to each of the lists that have one value per
+    timestep. Nested results (stages, stream conditions, turbine results) and lists of per-timestep lists (e.g. one
+    rate per stream) are traversed, everything else (units, charts, fluid composition etc.) is taken from the first.
+    """
+    first = values[0]
+    if first is None or any(value is None for value in values):
+        return first
+    elif isinstance(first, EnergyModelBaseResult):
+        return first.model_copy(
+            update={
+                field: _combine_timestep_values([getattr(value, field) for value in values], combine=combine)
+                for field in type(first).model_fields
+            }
+        )
+    elif isinstance(first, (list, np.ndarray)):
+        if len(first) == 0:
+            return first
+        elif isinstance(first[0], (EnergyModelBaseResult, list)):
+            return [_combine_timestep_values(element_values, combine=combine) for element_values in zip(*values)]
+        return combine([list(value) for value in values])
+    else:
+        return first
+
+
+def _get_not_calculated_value(example_value: Any) -> Any:
+    """The value used for timesteps that have not been calculated, based on the type of a calculated value."""
+    if isinstance(example_value, (bool, np.bool_)):
+        return False
+    elif isinstance(example_value, Enum):
+        return getattr(type(example_value), "NOT_CALCULATED", None)
+    elif isinstance(example_value, str):
+        # Chart area flags are stored as plain strings
+        return ChartAreaFlag.NOT_CALCULATED
+    elif example_value is None or isinstance(example_value, (float, int, np.number)):
+        return np.nan
+    else:
+        return None
+
+
+def scatter_operational_setting_result(
+    operational_setting_result: ConsumerSystemOperationalSettingResult,
+    timestep_indices: NDArray[np.int_],
+    number_of_timesteps: int,
+) -> ConsumerSystemOperationalSettingResult:
+    """Expand a result evaluated for a subset of the timesteps to all timesteps.
+
+    Timesteps that are not evaluated are marked as not calculated, i.e. NaN for numeric values, False for flags and
+    NOT_CALCULATED for statuses.
+    """
+
+    def scatter(values: List[list]) -> list:
+        (subset_values,) = values
+        all_values = [_get_not_calculated_value(subset_values[0])] * number_of_timesteps
+        for timestep_index, value in zip(timestep_indices, subset_values):
+            all_values[timestep_index] = value
+        return all_values
+
+    return _map_consumer_model_results(operational_setting_result, combine=scatter)
+
+
+def get_not_calculated_operational_setting_result(
+    operational_setting_result: ConsumerSystemOperationalSettingResult,
+) -> ConsumerSystemOperationalSettingResult:
+    """A result for an operational setting that has not been evaluated, with all timesteps marked as not calculated.
+
+    The given result of another operational setting, for the same timesteps, is used as a template.
+    """
+
+    def not_calculated(values: List[list]) -> list:
+        (template_values,) = values
+        return [_get_not_calculated_value(template_values[0])] * len(template_values)
+
+    return _map_consumer_model_results(operational_setting_result, combine=not_calculated)
+
+
+def _map_consumer_model_results(
+    operational_setting_result: ConsumerSystemOperationalSettingResult,
+    combine: Callable[[List[list]], list],
+) -> ConsumerSystemOperationalSettingResult:
+    return ConsumerSystemOperationalSettingResult(
+        consumer_results=[
+            consumer_result.model_copy(
+                update={
+                    "consumer_model_result": _combine_timestep_values(
+                        [consumer_result.consumer_model_result], combine=combine
+                    )
+                }
+            )
+            for consumer_result in operational_setting_result.consumer_results
+        ]
+    )
+
+
+def gather_consumer_results_from_operational_settings_results(
+    operational_settings_results: List[ConsumerSystemOperationalSettingResult],
+    setting_number_used_per_timestep: NDArray[np.int_],
+) -> List[ConsumerSystemComponentResult]:
+    """Assemble the consumer results for the operational setting used in each timestep, by picking the results for each
+    timestep from the results of the operational setting used. The operational settings results are evaluated with the
+    rates after cross-over, which is also what the assembled operational setting used would contain, hence there is no
+    need to evaluate the consumers again.
+    """
+    timestep_indices = np.arange(len(setting_number_used_per_timestep))
+
+    def gather(values: List[list]) -> list:
+        return [
+            values[setting_number][timestep]
+            for timestep, setting_number in zip(timestep_indices, setting_number_used_per_timestep)
+        ]
+
+    consumer_results = []
+    for consumer_index, consumer_result in enumerate(operational_settings_results[0].consumer_results):
+        consumer_model_results = [
+            operational_setting_result.consumer_results[consumer_index].consumer_model_result
+            for operational_setting_result in operational_settings_results
+        ]
+        consumer_results.append(
+            consumer_result.model_copy(
+                update={"consumer_model_result": _combine_timestep_values(consumer_model_results, combine=gather)}
+            )
+        )
+    return consumer_results
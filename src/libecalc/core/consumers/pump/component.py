@@ -40,66 +40,92 @@ class Pump(BaseConsumerWithoutOperationalSettings):
             fluid_density=np.asarray([inlet_stream.density.value]),
         ).tolist()[0]
 
+    def get_max_rates(self, inlet_stream: TimeSeriesStreamConditions, target_pressure: TimeSeriesFloat) -> List[float]:
+        """
+        For each timestep, get the maximum rate that this pump can handle, given
+        the in -and outlet pressures and fluid density of the inlet stream.
+
+        Args:
+            inlet_stream: the inlet stream
+            target_pressure: the target pressure
+        """
+        return self._pump_model.get_max_standard_rate(
+            suction_pressures=np.asarray(inlet_stream.pressure.values),
+            discharge_pressures=np.asarray(target_pressure.values),
+            fluid_density=np.asarray(inlet_stream.fluid_density.values),
+        ).tolist()
+
     def evaluate(
         self,
         streams: List[StreamConditions],
     ) -> EcalcModelResult:
+        return self.evaluate_time_series(
+            streams=[TimeSeriesStreamConditions.from_stream_condition(stream) for stream in streams],
+        )
+
+    def evaluate_time_series(
+        self,
+        streams: List[TimeSeriesStreamConditions],
+    ) -> EcalcModelResult:
+        """
+        Evaluate the pump for all timesteps of the streams in one model evaluation.
+
+        Args:
+            streams: the inlet streams followed by the outlet stream
+        """
         inlet_streams = streams[:-1]
         outlet_stream = streams[-1]
 
-        model_result = self._pump_model.evaluate_streams(
+        model_result = self._pump_model.evaluate_time_series_streams(
             inlet_streams=inlet_streams,
             outlet_stream=outlet_stream,
         )
 
         # Mixing all input rates to get total rate passed through compressor. Used when reporting streams.
-        total_requested_inlet_stream = StreamConditions.mix_all(inlet_streams)
+        total_requested_inlet_stream = TimeSeriesStreamConditions.mix_all(inlet_streams)
         total_requested_inlet_stream.name = "Total inlet"
-        current_timestep = total_requested_inlet_stream.timestep
+        timesteps = total_requested_inlet_stream.rate.timesteps
 
-        outlet_stream.rate = total_requested_inlet_stream.rate
+        outlet_stream = outlet_stream.model_copy(update={"rate": total_requested_inlet_stream.rate})
 
         component_result = core_results.PumpResult(
             id=self.id,
-            timesteps=[current_timestep],
+            timesteps=timesteps,
             power=TimeSeriesStreamDayRate(
                 values=model_result.power,
-                timesteps=[current_timestep],
+                timesteps=timesteps,
                 unit=model_result.power_unit,
             ).fill_nan(0.0),
             energy_usage=TimeSeriesStreamDayRate(
                 values=model_result.energy_usage,
-                timesteps=[current_timestep],
+                timesteps=timesteps,
                 unit=model_result.energy_usage_unit,
             ).fill_nan(0.0),
             inlet_liquid_rate_m3_per_day=TimeSeriesStreamDayRate(
                 values=model_result.rate,
-                timesteps=[current_timestep],
+                timesteps=timesteps,
                 unit=Unit.STANDARD_CUBIC_METER_PER_DAY,
             ),
             inlet_pressure_bar=TimeSeriesFloat(
                 values=model_result.suction_pressure,
-                timesteps=[current_timestep],
+                timesteps=timesteps,
                 unit=Unit.BARA,
             ),
             outlet_pressure_bar=TimeSeriesFloat(
                 values=model_result.discharge_pressure,
-                timesteps=[current_timestep],
+                timesteps=timesteps,
                 unit=Unit.BARA,
             ),
             operational_head=TimeSeriesFloat(
                 values=model_result.operational_head,
-                timesteps=[current_timestep],
+                timesteps=timesteps,
                 unit=Unit.POLYTROPIC_HEAD_KILO_JOULE_PER_KG,
             ),
-            is_valid=TimeSeriesBoolean(values=model_result.is_valid, timesteps=[current_timestep], unit=Unit.NONE),
+            is_valid=TimeSeriesBoolean(values=model_result.is_valid, timesteps=timesteps, unit=Unit.NONE),
             streams=[
-                TimeSeriesStreamConditions.from_stream_condition(total_requested_inlet_stream),
-                *[
-                    TimeSeriesStreamConditions.from_stream_condition(inlet_stream_conditions)
-                    for inlet_stream_conditions in inlet_streams
-                ],
-                TimeSeriesStreamConditions.from_stream_condition(outlet_stream),
+                total_requested_inlet_stream,
+                *inlet_streams,
+                outlet_stream,
             ],
         )
 
@@ -109,21 +135,21 @@ class Pump(BaseConsumerWithoutOperationalSettings):
             models=[
                 core_results.PumpModelResult(
                     name="N/A",  # No context available to populate model name
-                    timesteps=[current_timestep],
+                    timesteps=timesteps,
                     is_valid=TimeSeriesBoolean(
-                        timesteps=[current_timestep],
+                        timesteps=timesteps,
                         values=model_result.is_valid,
                         unit=Unit.NONE,
                     ),
                     power=TimeSeriesStreamDayRate(
-                        timesteps=[current_timestep],
+                        timesteps=timesteps,
                         values=model_result.power,
                         unit=model_result.power_unit,
                     )
                     if model_result.power is not None
                     else None,
                     energy_usage=TimeSeriesStreamDayRate(
-                        timesteps=[current_timestep],
+                        timesteps=timesteps,
                         values=model_result.energy_usage,
                         unit=model_result.energy_usage_unit,
                     ),
@@ -1,2 +1,2 @@
 from .base import CompressorModel
-from .factory import create_compressor_model
+from .factory import create_compressor_model, is_stateful_compressor_model
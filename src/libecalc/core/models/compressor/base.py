@@ -9,6 +9,7 @@ from numpy.typing import NDArray
 
 from libecalc import dto
 from libecalc.common.logger import logger
+from libecalc.common.stream_conditions import TimeSeriesStreamConditions
 from libecalc.common.units import Unit
 from libecalc.core.models.base import BaseModel
 from libecalc.core.models.compressor.train.utils.common import (
@@ -69,6 +70,25 @@ class CompressorModel(BaseModel):
     ):
         raise NotImplementedError
 
+    def evaluate_time_series_streams(
+        self,
+        inlet_streams: List[TimeSeriesStreamConditions],
+        outlet_stream: TimeSeriesStreamConditions,
+    ) -> CompressorTrainResult:
+        """Evaluate the compressor model for all timesteps of the inlet streams and the expected outlet stream.
+
+        The inlet streams are mixed, models with several inlet streams must override this.
+
+        :param inlet_streams: The inlet streams, with values per time step
+        :param outlet_stream: The outlet stream, with the discharge pressure per time step
+        """
+        mixed_inlet_stream = TimeSeriesStreamConditions.mix_all(inlet_streams)
+        return self.evaluate_rate_ps_pd(
+            rate=np.asarray(mixed_inlet_stream.rate.values),
+            suction_pressure=np.asarray(mixed_inlet_stream.pressure.values),
+            discharge_pressure=np.asarray(outlet_stream.pressure.values),
+        )
+
 
 class CompressorWithTurbineModel(CompressorModel):
     def __init__(
@@ -106,6 +126,17 @@ class CompressorWithTurbineModel(CompressorModel):
             )
         )
 
+    def evaluate_time_series_streams(
+        self,
+        inlet_streams: List[TimeSeriesStreamConditions],
+        outlet_stream: TimeSeriesStreamConditions,
+    ) -> CompressorTrainResult:
+        return self.evaluate_turbine_based_on_compressor_model_result(
+            compressor_energy_function_result=self.compressor_model.evaluate_time_series_streams(
+                inlet_streams=inlet_streams, outlet_stream=outlet_stream
+            )
+        )
+
     def evaluate_rate_ps_pint_pd(
         self,
         rate: NDArray[np.float64],
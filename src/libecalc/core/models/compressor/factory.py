@@ -24,6 +24,7 @@ from libecalc.core.models.compressor.train.variable_speed_compressor_train_commo
 from libecalc.core.models.compressor.train.variable_speed_compressor_train_common_shaft_multiple_streams_and_pressures import (
     VariableSpeedCompressorTrainCommonShaftMultipleStreamsAndPressures,
 )
+from libecalc.core.models.model_registry import get_shared_model
 from libecalc.core.models.turbine import TurbineModel
 from libecalc.dto.types import EnergyModelType
 
@@ -128,7 +129,34 @@ def _invalid_compressor_model_type(compressor_model_dto: Any) -> None:
         raise TypeError(msg) from e
 
 
+def is_stateful_compressor_model(compressor_model_dto: dto.CompressorModel) -> bool:
+    """
+    A train with multiple streams keeps the fluid entering each stage, and recirculates it when the rate to the stage
+    is zero. The results of the train depend on what it evaluated before.
+    """
+    if compressor_model_dto.typ == EnergyModelType.COMPRESSOR_WITH_TURBINE:
+        return is_stateful_compressor_model(compressor_model_dto.compressor_train)
+    return compressor_model_dto.typ == EnergyModelType.VARIABLE_SPEED_COMPRESSOR_TRAIN_MULTIPLE_STREAMS_AND_PRESSURES
+
+
+def _is_shareable(compressor_model_dto: dto.CompressorModel) -> bool:
+    """The number of stages of a train with unknown stages is set when evaluating, so it can not be shared."""
+    if compressor_model_dto.typ == EnergyModelType.COMPRESSOR_TRAIN_SIMPLIFIED_WITH_UNKNOWN_STAGES:
+        return False
+    if compressor_model_dto.typ == EnergyModelType.COMPRESSOR_WITH_TURBINE:
+        return _is_shareable(compressor_model_dto.compressor_train)
+    return not is_stateful_compressor_model(compressor_model_dto)
+
+
 def create_compressor_model(compressor_model_dto: dto.CompressorModel) -> CompressorModel:
-    return facility_model_map.get(compressor_model_dto.typ, _invalid_compressor_model_type)(
-        compressor_model_dto=compressor_model_dto,
+    create_model = facility_model_map.get(getattr(compressor_model_dto, "typ", None))
+    if create_model is None:
+        return _invalid_compressor_model_type(compressor_model_dto)
+
+    if not _is_shareable(compressor_model_dto):
+        return create_model(compressor_model_dto=compressor_model_dto)
+
+    return get_shared_model(
+        compressor_model_dto,
+        lambda: create_model(compressor_model_dto=compressor_model_dto),
     )
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Dict, List, Optional, Type, Union
 
 import numpy as np
@@ -97,7 +98,11 @@ class CompressorModelSampled(CompressorModel):
         self.required_variables = list(variables.keys())
 
         function_value_header = "ENERGY_USAGE"
-        sampled_data = pd.DataFrame(np.asarray(list(variables.values()) + [list(function_values_adjusted)]).transpose())
+        sampled_data = pd.DataFrame(
+            np.column_stack(
+                [np.asarray(values, dtype=np.float64) for values in variables.values()] + [function_values_adjusted]
+            )
+        )
         sampled_data.columns = list(variables.keys()) + [function_value_header]
 
         apparent_dimension: int = len(self.required_variables)
@@ -132,6 +137,15 @@ class CompressorModelSampled(CompressorModel):
             function_header=FUNCTION_VALUE_HEADER,
         )
 
+    @cached_property
+    def _turbine(self) -> "CompressorModelSampled.Turbine":
+        return self.Turbine(self.fuel_values_adjusted, self.power_interpolation_values_adjusted)
+
+    @property
+    def built_projection_functions(self) -> List[str]:
+        """Names of the projection functions built so far by the underlying sampled model, if it has any."""
+        return getattr(self._qhull_sampled, "built_projection_functions", [])
+
     def get_max_standard_rate(
         self,
         suction_pressures: Optional[NDArray[np.float64]] = None,
@@ -210,8 +224,7 @@ class CompressorModelSampled(CompressorModel):
             discharge_pressure=pd_to_evaluate,
         )
 
-        turbine = self.Turbine(self.fuel_values_adjusted, self.power_interpolation_values_adjusted)
-        turbine_result = turbine.calculate_turbine_power_usage(interpolated_consumer_values)
+        turbine_result = self._turbine.calculate_turbine_power_usage(interpolated_consumer_values)
         turbine_power = turbine_result.load if turbine_result is not None else None
 
         energy_usage = (
@@ -1,4 +1,5 @@
-from typing import List, Tuple, Union
+from functools import cached_property, wraps
+from typing import Callable, List, Tuple, TypeVar, Union
 
 import numpy as np
 import pandas as pd
@@ -22,6 +23,24 @@ from libecalc.core.models.compressor.sampled.convex_hull_common import (
 
 EPSILON_MAX_RATE = 1e-4
 
+T = TypeVar("T")
+
+
+def _projection_function(build_function: Callable[..., T]) -> "cached_property[T]":
+    """Build the decorated projection function on first use and memoise it on the instance.
+
+    Building the projection functions requires computing half convex hulls and interpolators, which is wasted work
+    for models where all evaluated points are inside the convex hull or where max rate is never requested.
+    """
+
+    @wraps(build_function)
+    def build(self):
+        logger.debug(f"Building projection function '{build_function.__name__}' for CompressorModelSampled3D")
+        return build_function(self)
+
+    return cached_property(build)
+
+
 # Projections - explanation of computations
 # The input data, with variables rate, ps and pd and function value power or fuel
 # is used to set up an interpolation function in 3D, i.e. the variables are defined
@@ -156,107 +175,125 @@ class CompressorModelSampled3D:
             "min_pd": convex_hull.min_bound[self.pd_axis],
         }
 
-        # Setup projection functions for rate
-        (
-            lower_rate_qh,
-            _,
-            self._upper_rate_monotonic_correct_qh,
-        ) = get_lower_upper_qhull(convex_hull, axis=self.rate_axis)
+        # Kept to build the projection functions below on first use
+        self._convex_hull = convex_hull
+        self._qhull_points = qhull_points
+        self._function_values = sampled_data[function_header[:]]
 
-        # Functions used for projection for evaluation
-        (
-            self._lower_rate_qh_upper_ps_function,
-            self._lower_rate_qh_lower_pd_function,
-            self._minimum_rate_function,
-        ) = _setup_minimum_rate_projection_functions(
+    @property
+    def built_projection_functions(self) -> List[str]:
+        """Names of the projection functions that have been built (i.e. used) so far for this model."""
+        return [name for name in _PROJECTION_FUNCTION_NAMES if name in self.__dict__]
+
+    @_projection_function
+    def _rate_halfhulls(self) -> Tuple[HalfConvexHull, HalfConvexHull]:
+        lower_rate_qh, _, upper_rate_monotonic_correct_qh = get_lower_upper_qhull(
+            self._convex_hull, axis=self.rate_axis
+        )
+        return lower_rate_qh, upper_rate_monotonic_correct_qh
+
+    @_projection_function
+    def _minimum_rate_projection_functions(self) -> Tuple[interp1d, interp1d, LinearInterpolatorSimplicesDefined]:
+        lower_rate_qh, _ = self._rate_halfhulls
+        return _setup_minimum_rate_projection_functions(
             lower_rate_halfhull=lower_rate_qh,
             rate_axis=self.rate_axis,
             ps_axis=self.ps_axis,
             pd_axis=self.pd_axis,
         )
 
-        self._minimum_rate_energy_function = LinearNDInterpolator(
-            qhull_points[lower_rate_qh.original_qhull_indices, :][:, [self.ps_axis, self.pd_axis]],
-            sampled_data[function_header[:]][lower_rate_qh.original_qhull_indices].values,
+    @_projection_function
+    def _minimum_rate_energy_function(self) -> LinearNDInterpolator:
+        lower_rate_qh, _ = self._rate_halfhulls
+        return LinearNDInterpolator(
+            self._qhull_points[lower_rate_qh.original_qhull_indices, :][:, [self.ps_axis, self.pd_axis]],
+            self._function_values[lower_rate_qh.original_qhull_indices].values,
             fill_value=np.nan,
             rescale=False,
         )
 
-        (
-            self._upper_rate_qh_upper_ps_function,
-            self._upper_rate_qh_lower_pd_function,
-            self._maximum_rate_function,
-        ) = _setup_maximum_rate_projection_functions(
-            upper_rate_monotonic_halfhull=self._upper_rate_monotonic_correct_qh,
+    @_projection_function
+    def _maximum_rate_projection_functions(self) -> Tuple[interp1d, interp1d, LinearInterpolatorSimplicesDefined]:
+        _, upper_rate_monotonic_correct_qh = self._rate_halfhulls
+        return _setup_maximum_rate_projection_functions(
+            upper_rate_monotonic_halfhull=upper_rate_monotonic_correct_qh,
             rate_axis=self.rate_axis,
             ps_axis=self.ps_axis,
             pd_axis=self.pd_axis,
         )
 
-        self._maximum_rate_energy_function = LinearNDInterpolator(
-            points=qhull_points[self._upper_rate_monotonic_correct_qh.original_qhull_indices, :][
+    @_projection_function
+    def _maximum_rate_energy_function(self) -> LinearNDInterpolator:
+        _, upper_rate_monotonic_correct_qh = self._rate_halfhulls
+        return LinearNDInterpolator(
+            points=self._qhull_points[upper_rate_monotonic_correct_qh.original_qhull_indices, :][
                 :, [self.ps_axis, self.pd_axis]
             ],
-            values=sampled_data[function_header[:]][
-                self._upper_rate_monotonic_correct_qh.original_qhull_indices
-            ].values,
+            values=self._function_values[upper_rate_monotonic_correct_qh.original_qhull_indices].values,
             fill_value=np.nan,
             rescale=False,
         )
 
-        # Setup projection functions for discharge pressure
-        lower_pd_qh, _, _ = get_lower_upper_qhull(convex_hull, axis=self.pd_axis)
-
-        self._minimum_pd_energy_function = LinearNDInterpolator(
-            qhull_points[lower_pd_qh.original_qhull_indices, :][:, [self.rate_axis, self.ps_axis]],
-            sampled_data[function_header[:]][lower_pd_qh.original_qhull_indices].values,
-            fill_value=np.nan,
-            rescale=False,
-        )
+    @_projection_function
+    def _lower_pd_halfhull(self) -> HalfConvexHull:
+        lower_pd_qh, _, _ = get_lower_upper_qhull(self._convex_hull, axis=self.pd_axis)
+        return lower_pd_qh
 
-        (
-            self._lower_pd_qh_lower_rate_function,
-            self._lower_pd_qh_upper_ps_function,
-            self._minimum_pd_function,
-        ) = _setup_minimum_pd_projection_functions(
-            lower_pd_halfhull=lower_pd_qh,
+    @_projection_function
+    def _minimum_pd_projection_functions(self) -> Tuple[interp1d, interp1d, LinearInterpolatorSimplicesDefined]:
+        return _setup_minimum_pd_projection_functions(
+            lower_pd_halfhull=self._lower_pd_halfhull,
             rate_axis=self.rate_axis,
             ps_axis=self.ps_axis,
             pd_axis=self.pd_axis,
         )
 
-        # Setup projection functions for suction pressure
-        _, upper_ps_qh, _ = get_lower_upper_qhull(convex_hull, axis=self.ps_axis)
-
-        self._maximum_ps_energy_function = LinearNDInterpolator(
-            qhull_points[upper_ps_qh.original_qhull_indices, :][:, [self.rate_axis, self.pd_axis]],
-            sampled_data[function_header[:]][upper_ps_qh.original_qhull_indices].values,
+    @_projection_function
+    def _minimum_pd_energy_function(self) -> LinearNDInterpolator:
+        return LinearNDInterpolator(
+            self._qhull_points[self._lower_pd_halfhull.original_qhull_indices, :][:, [self.rate_axis, self.ps_axis]],
+            self._function_values[self._lower_pd_halfhull.original_qhull_indices].values,
             fill_value=np.nan,
             rescale=False,
         )
 
-        (
-            self._upper_ps_qh_lower_rate_function,
-            self._upper_ps_qh_lower_pd_function,
-            self._maximum_ps_function,
-        ) = _setup_maximum_ps_projection_functions(
-            upper_ps_halfhull=upper_ps_qh,
+    @_projection_function
+    def _upper_ps_halfhull(self) -> HalfConvexHull:
+        _, upper_ps_qh, _ = get_lower_upper_qhull(self._convex_hull, axis=self.ps_axis)
+        return upper_ps_qh
+
+    @_projection_function
+    def _maximum_ps_projection_functions(self) -> Tuple[interp1d, interp1d, LinearInterpolatorSimplicesDefined]:
+        return _setup_maximum_ps_projection_functions(
+            upper_ps_halfhull=self._upper_ps_halfhull,
             rate_axis=self.rate_axis,
             ps_axis=self.ps_axis,
             pd_axis=self.pd_axis,
         )
 
+    @_projection_function
+    def _maximum_ps_energy_function(self) -> LinearNDInterpolator:
+        return LinearNDInterpolator(
+            self._qhull_points[self._upper_ps_halfhull.original_qhull_indices, :][:, [self.rate_axis, self.pd_axis]],
+            self._function_values[self._upper_ps_halfhull.original_qhull_indices].values,
+            fill_value=np.nan,
+            rescale=False,
+        )
+
     def get_max_rate(self, ps: Union[NDArray[np.float64], float], pd: Union[NDArray[np.float64], float]):
-        if self._maximum_rate_function is None:
-            self._setup_projection_functions_for_max_rate()  # Todo: Define this function?
+        (
+            upper_rate_qh_upper_ps_function,
+            upper_rate_qh_lower_pd_function,
+            maximum_rate_function,
+        ) = self._maximum_rate_projection_functions
 
         # Project ps and pd to qhull boundary if they are outside and may be projected
         # ps may be projected downwards to qhull, pd may be projected upwards to qhull
         # Project wrt pd first (lift pd if too low)
-        pd_projected = np.fmax(pd, self._upper_rate_qh_lower_pd_function(ps))
-        ps_projected = np.fmin(ps, self._upper_rate_qh_upper_ps_function(pd_projected))
+        pd_projected = np.fmax(pd, upper_rate_qh_lower_pd_function(ps))
+        ps_projected = np.fmin(ps, upper_rate_qh_upper_ps_function(pd_projected))
 
-        max_rates = self._maximum_rate_function(np.column_stack((ps_projected, pd_projected)))  # type: ignore[misc]
+        max_rates = maximum_rate_function(np.column_stack((ps_projected, pd_projected)))  # type: ignore[misc]
 
         if self._do_rescale:
             max_rates = max_rates * self._scale_factor_rate
@@ -276,13 +313,20 @@ class CompressorModelSampled3D:
         )
         energy_consumption = self._interpolator(x_for_interpolator)
 
+        # Points inside the convex hull need no projection, and the projection functions are only built when needed
         nan_value_indices = np.argwhere(np.isnan(energy_consumption))[:, 0]
+        if nan_value_indices.size == 0:
+            return energy_consumption
+
         energy_consumption[nan_value_indices] = self._project_and_calculate_outsiders_rate(
             rate=rate_scaled[nan_value_indices],
             suction_pressure=suction_pressure[nan_value_indices],
             discharge_pressure=discharge_pressure[nan_value_indices],
         )
         nan_value_indices = nan_value_indices[np.argwhere(np.isnan(energy_consumption[nan_value_indices]))[:, 0]]
+        if nan_value_indices.size == 0:
+            return energy_consumption
+
         energy_consumption[nan_value_indices] = self._project_and_calculate_outsiders_pd(
             rate=rate_scaled[nan_value_indices],
             suction_pressure=suction_pressure[nan_value_indices],
@@ -290,6 +334,9 @@ class CompressorModelSampled3D:
         )
 
         nan_value_indices = nan_value_indices[np.argwhere(np.isnan(energy_consumption[nan_value_indices]))[:, 0]]
+        if nan_value_indices.size == 0:
+            return energy_consumption
+
         energy_consumption[nan_value_indices] = self._project_and_calculate_outsiders_ps(
             rate=rate_scaled[nan_value_indices],
             suction_pressure=suction_pressure[nan_value_indices],
@@ -308,28 +355,43 @@ class CompressorModelSampled3D:
         points which are outside the operational area, but which are handled by
         ASV/recirculation and pressure choking.
         """
+        (
+            lower_rate_qh_upper_ps_function,
+            lower_rate_qh_lower_pd_function,
+            minimum_rate_function,
+        ) = self._minimum_rate_projection_functions
         rate, suction_pressure, discharge_pressure = _project_on_rate(
-            lower_rate_qh_lower_pd_function=self._lower_rate_qh_lower_pd_function,
-            lower_rate_qh_upper_ps_function=self._lower_rate_qh_upper_ps_function,
-            minimum_rate_function=self._minimum_rate_function,
+            lower_rate_qh_lower_pd_function=lower_rate_qh_lower_pd_function,
+            lower_rate_qh_upper_ps_function=lower_rate_qh_upper_ps_function,
+            minimum_rate_function=minimum_rate_function,
             rate=rate,
             suction_pressure=suction_pressure,
             discharge_pressure=discharge_pressure,
         )
 
+        (
+            lower_pd_qh_lower_rate_function,
+            lower_pd_qh_upper_ps_function,
+            minimum_pd_function,
+        ) = self._minimum_pd_projection_functions
         rate, suction_pressure, discharge_pressure = _project_on_pd(
-            lower_pd_qh_lower_rate_function=self._lower_pd_qh_lower_rate_function,
-            lower_pd_qh_upper_ps_function=self._lower_pd_qh_upper_ps_function,
-            minimum_pd_function=self._minimum_pd_function,
+            lower_pd_qh_lower_rate_function=lower_pd_qh_lower_rate_function,
+            lower_pd_qh_upper_ps_function=lower_pd_qh_upper_ps_function,
+            minimum_pd_function=minimum_pd_function,
             rate=rate,
             suction_pressure=suction_pressure,
             discharge_pressure=discharge_pressure,
         )
 
+        (
+            upper_ps_qh_lower_rate_function,
+            upper_ps_qh_lower_pd_function,
+            maximum_ps_function,
+        ) = self._maximum_ps_projection_functions
         rate, suction_pressure, discharge_pressure = _project_on_ps(
-            upper_ps_qh_lower_rate_function=self._upper_ps_qh_lower_rate_function,
-            upper_ps_qh_lower_pd_function=self._upper_ps_qh_lower_pd_function,
-            maximum_ps_function=self._maximum_ps_function,
+            upper_ps_qh_lower_rate_function=upper_ps_qh_lower_rate_function,
+            upper_ps_qh_lower_pd_function=upper_ps_qh_lower_pd_function,
+            maximum_ps_function=maximum_ps_function,
             rate=rate,
             suction_pressure=suction_pressure,
             discharge_pressure=discharge_pressure,
@@ -345,10 +407,15 @@ class CompressorModelSampled3D:
         # these points (projecting to full convex hull may
         # result in projected point still outside due to
         # numerical errors
+        (
+            lower_rate_qh_upper_ps_function,
+            lower_rate_qh_lower_pd_function,
+            minimum_rate_function,
+        ) = self._minimum_rate_projection_functions
         ps_projected, pd_projected, minimum_rates = _get_minimum_rates(
-            lower_rate_qh_lower_pd_function=self._lower_rate_qh_lower_pd_function,
-            lower_rate_qh_upper_ps_function=self._lower_rate_qh_upper_ps_function,
-            minimum_rate_function=self._minimum_rate_function,
+            lower_rate_qh_lower_pd_function=lower_rate_qh_lower_pd_function,
+            lower_rate_qh_upper_ps_function=lower_rate_qh_upper_ps_function,
+            minimum_rate_function=minimum_rate_function,
             suction_pressure=suction_pressure,
             discharge_pressure=discharge_pressure,
         )
@@ -365,10 +432,15 @@ class CompressorModelSampled3D:
         # Find indices where the rates are above, but very close to maximum
         # and evaluate with maximum rate energy function
         # To make robust wrt numerical errors (in e.g. max rate calculations)
+        (
+            upper_rate_qh_upper_ps_function,
+            upper_rate_qh_lower_pd_function,
+            maximum_rate_function,
+        ) = self._maximum_rate_projection_functions
         ps_projected, pd_projected, maximum_rates = _get_maximum_rates(
-            upper_rate_qh_lower_pd_function=self._upper_rate_qh_lower_pd_function,
-            upper_rate_qh_upper_ps_function=self._upper_rate_qh_upper_ps_function,
-            maximum_rate_function=self._maximum_rate_function,
+            upper_rate_qh_lower_pd_function=upper_rate_qh_lower_pd_function,
+            upper_rate_qh_upper_ps_function=upper_rate_qh_upper_ps_function,
+            maximum_rate_function=maximum_rate_function,
             suction_pressure=suction_pressure,
             discharge_pressure=discharge_pressure,
         )
@@ -388,10 +460,15 @@ class CompressorModelSampled3D:
         # these points (projecting to full convex hull may
         # result in projected point still outside due to
         # numerical errors
+        (
+            lower_pd_qh_lower_rate_function,
+            lower_pd_qh_upper_ps_function,
+            minimum_pd_function,
+        ) = self._minimum_pd_projection_functions
         ps_projected, rate_projected, minimum_pd = _get_minimum_pd(
-            lower_pd_qh_lower_rate_function=self._lower_pd_qh_lower_rate_function,
-            lower_pd_qh_upper_ps_function=self._lower_pd_qh_upper_ps_function,
-            minimum_pd_function=self._minimum_pd_function,
+            lower_pd_qh_lower_rate_function=lower_pd_qh_lower_rate_function,
+            lower_pd_qh_upper_ps_function=lower_pd_qh_upper_ps_function,
+            minimum_pd_function=minimum_pd_function,
             rate=rate,
             suction_pressure=suction_pressure,
         )
@@ -413,10 +490,15 @@ class CompressorModelSampled3D:
         # these points (projecting to full convex hull may
         # result in projected point still outside due to
         # numerical errors
+        (
+            upper_ps_qh_lower_rate_function,
+            upper_ps_qh_lower_pd_function,
+            maximum_ps_function,
+        ) = self._maximum_ps_projection_functions
         rate_projected, pd_projected, maximum_ps = _get_maximum_ps(
-            upper_ps_qh_lower_rate_function=self._upper_ps_qh_lower_rate_function,
-            upper_ps_qh_lower_pd_function=self._upper_ps_qh_lower_pd_function,
-            maximum_ps_function=self._maximum_ps_function,
+            upper_ps_qh_lower_rate_function=upper_ps_qh_lower_rate_function,
+            upper_ps_qh_lower_pd_function=upper_ps_qh_lower_pd_function,
+            maximum_ps_function=maximum_ps_function,
             rate=rate,
             discharge_pressure=discharge_pressure,
         )
@@ -431,6 +513,11 @@ class CompressorModelSampled3D:
         return energy_consumption
 
 
+_PROJECTION_FUNCTION_NAMES = [
+    name for name, attribute in vars(CompressorModelSampled3D).items() if isinstance(attribute, cached_property)
+]
+
+
 def _convert_variables_for_interpolator(
     rate: NDArray[np.float64], suction_pressure: NDArray[np.float64], discharge_pressure: NDArray[np.float64]
 ) -> NDArray[np.float64]:
@@ -1,6 +1,6 @@
 from copy import deepcopy
 from functools import partial
-from typing import Dict, List, Optional, Tuple, cast
+from typing import Dict, List, Optional, Tuple, TypeVar, Union, cast
 
 import numpy as np
 from numpy.typing import NDArray
@@ -8,6 +8,7 @@ from numpy.typing import NDArray
 from libecalc import dto
 from libecalc.common.errors.exceptions import EcalcError, IllegalStateException
 from libecalc.common.logger import logger
+from libecalc.common.stream_conditions import TimeSeriesStreamConditions
 from libecalc.common.units import Unit, UnitConstants
 from libecalc.core.models import ModelInputFailureStatus, validate_model_input
 from libecalc.core.models.compressor.results import CompressorTrainResultSingleTimeStep
@@ -40,6 +41,8 @@ from libecalc.dto.types import FixedSpeedPressureControl
 
 EPSILON = 1e-5
 
+TStreamConditions = TypeVar("TStreamConditions", bound=Union[StreamConditions, TimeSeriesStreamConditions])
+
 
 class VariableSpeedCompressorTrainCommonShaftMultipleStreamsAndPressures(
     CompressorTrainModel[dto.VariableSpeedCompressorTrainMultipleStreamsAndPressures]
@@ -99,18 +102,13 @@ class VariableSpeedCompressorTrainCommonShaftMultipleStreamsAndPressures(
         # previous time step to recirculate. This will take care of that.
         self.fluid_to_recirculate_in_stage_when_inlet_rate_is_zero = [None] * len(self.stages)
 
-    def evaluate_streams(
-        self,
-        inlet_streams: List[StreamConditions],
-        outlet_stream: StreamConditions,
-    ) -> CompressorTrainResult:
+    def _get_ordered_streams(self, inlet_streams: List[TStreamConditions]) -> List[TStreamConditions]:
         """
-        Evaluate model based on inlet streams and the expected outlet stream.
+        Order the inlet streams as the streams defined for the compressor train, either based on name or use index.
         Args:
             inlet_streams:
-            outlet_stream:
 
-        Returns:
+        Returns: the inlet streams ordered as the streams of the compressor train
 
         """
 
@@ -126,7 +124,7 @@ class VariableSpeedCompressorTrainCommonShaftMultipleStreamsAndPressures(
 
         # Order streams either based on name or use index
         stream_index_counter = 0
-        ordered_streams: List[StreamConditions] = []
+        ordered_streams: List[TStreamConditions] = []
         for stream_definition in self.streams:
             try:
                 inlet_stream = next(
@@ -137,6 +135,24 @@ class VariableSpeedCompressorTrainCommonShaftMultipleStreamsAndPressures(
                 ordered_streams.append(inlet_streams[stream_index_counter])
                 stream_index_counter += 1
 
+        return ordered_streams
+
+    def evaluate_streams(
+        self,
+        inlet_streams: List[StreamConditions],
+        outlet_stream: StreamConditions,
+    ) -> CompressorTrainResult:
+        """
+        Evaluate model based on inlet streams and the expected outlet stream.
+        Args:
+            inlet_streams:
+            outlet_stream:
+
+        Returns:
+
+        """
+        ordered_streams = self._get_ordered_streams(inlet_streams)
+
         # Currently ignoring pressures in intermediate streams
 
         return self.evaluate_rate_ps_pd(
@@ -147,6 +163,32 @@ class VariableSpeedCompressorTrainCommonShaftMultipleStreamsAndPressures(
             discharge_pressure=np.asarray([outlet_stream.pressure.value]),
         )
 
+    def evaluate_time_series_streams(
+        self,
+        inlet_streams: List[TimeSeriesStreamConditions],
+        outlet_stream: TimeSeriesStreamConditions,
+    ) -> CompressorTrainResult:
+        """
+        Evaluate model based on inlet streams and the expected outlet stream, for all timesteps of the streams.
+        Args:
+            inlet_streams:
+            outlet_stream:
+
+        Returns:
+
+        """
+        ordered_streams = self._get_ordered_streams(inlet_streams)
+
+        # Currently ignoring pressures in intermediate streams
+
+        return self.evaluate_rate_ps_pd(
+            rate=np.asarray(
+                [inlet_stream.rate.values for inlet_stream in ordered_streams]
+            ),  # TODO: This can also contain rates defined as outlet streams
+            suction_pressure=np.asarray(inlet_streams[0].pressure.values),
+            discharge_pressure=np.asarray(outlet_stream.pressure.values),
+        )
+
     @staticmethod
     def _check_intermediate_pressure_stage_number_is_valid(
         _stage_number_intermediate_pressure: int,
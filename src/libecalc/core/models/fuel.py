@@ -7,7 +7,6 @@ from numpy.typing import NDArray
 from libecalc import dto
 from libecalc.common.logger import logger
 from libecalc.common.temporal_model import TemporalModel
-from libecalc.common.time_utils import Period
 from libecalc.common.units import Unit
 from libecalc.common.utils.rates import TimeSeriesStreamDayRate
 from libecalc.core.result.emission import EmissionResult
@@ -35,8 +34,8 @@ class FuelModel:
         Then the resulting emission volume is calculated based on the fuel rate:
         - emission_rate = emission_factor * fuel_rate
 
-        This is done per time interval and all fuel related results both in terms of
-        fuel types and time intervals, are merged into one common fuel collection results object.
+        The factors are evaluated for all timesteps at once, and the emission rates of all emissions and time
+        intervals are kept in a single (emission x timestep) array before creating the results.
 
         The length of the fuel_rate array must equal the length of the time_vector
         array for the time_series. It is assumed that the fuel_rate array origins
@@ -45,47 +44,53 @@ class FuelModel:
         """
         logger.debug("Evaluating fuel usage and emissions")
 
-        # Creating a pseudo-default dict with all the emitters as keys. This is to handle changes in a temporal model.
-        emissions = {
-            emission_name: EmissionResult.create_empty(name=emission_name, timesteps=[])
-            for emission_name in {
-                emission.name for _, model in self.temporal_fuel_model.items() for emission in model.emissions
-            }
-        }
-
-        for period, model in self.temporal_fuel_model.items():
-            if Period.intersects(period, variables_map.period):
-                start_index, end_index = period.get_timestep_indices(variables_map.time_vector)
-                variables_map_this_period = variables_map.get_subset(
-                    start_index=start_index,
-                    end_index=end_index,
-                )
-                fuel_rate_this_period = fuel_rate[start_index:end_index]
-                for emission in model.emissions:
-                    factor = emission.factor.evaluate(
-                        variables=variables_map_this_period.variables,
-                        fill_length=len(variables_map_this_period.time_vector),
-                    )
-
-                    emission_rate_kg_per_day = fuel_rate_this_period * factor
-                    emission_rate_tons_per_day = Unit.KILO_PER_DAY.to(Unit.TONS_PER_DAY)(emission_rate_kg_per_day)
-
-                    result = EmissionResult(
-                        name=emission.name,
-                        timesteps=variables_map_this_period.time_vector,
-                        rate=TimeSeriesStreamDayRate(
-                            timesteps=variables_map_this_period.time_vector,
-                            values=emission_rate_tons_per_day.tolist(),
-                            unit=Unit.TONS_PER_DAY,
+        # All the emitters in the temporal model, to handle changes in emissions between periods. An emission not
+        # present in a period has zero rate in that period.
+        emission_names = sorted(
+            {emission.name for _, model in self.temporal_fuel_model.items() for emission in model.emissions}
+        )
+        emission_indices = {emission_name: index for index, emission_name in enumerate(emission_names)}
+
+        number_of_timesteps = len(variables_map.time_vector)
+        emission_rates_kg_per_day = np.zeros((len(emission_names), number_of_timesteps), dtype=np.float64)
+        is_in_period = np.zeros(number_of_timesteps, dtype=bool)
+        factors: Dict[str, NDArray[np.float64]] = {}
+
+        for period, model in self.temporal_fuel_model.items_in_period(variables_map.period):
+            start_index, end_index = period.get_timestep_indices(variables_map.time_vector)
+            is_in_period[start_index:end_index] = True
+            for emission in model.emissions:
+                # Evaluate each factor once for all timesteps, the same factor is often used in several periods
+                factor_key = str(emission.factor)
+                if factor_key not in factors:
+                    factors[factor_key] = np.broadcast_to(
+                        emission.factor.evaluate(
+                            variables=variables_map.arrays,
+                            fill_length=number_of_timesteps,
                         ),
+                        (number_of_timesteps,),
                     )
+                emission_rates_kg_per_day[emission_indices[emission.name], start_index:end_index] = (
+                    fuel_rate[start_index:end_index] * factors[factor_key][start_index:end_index]
+                )
 
-                    emissions[emission.name].extend(result)
-
-                for name in emissions:
-                    if name not in [emission.name for emission in model.emissions]:
-                        emissions[name].extend(
-                            EmissionResult.create_empty(name=name, timesteps=variables_map_this_period.time_vector)
-                        )
-
-        return dict(sorted(emissions.items()))
+        # Only the timesteps in one of the periods of the temporal model are part of the results
+        timesteps = [
+            timestep for timestep, in_period in zip(variables_map.time_vector, is_in_period.tolist()) if in_period
+        ]
+        emission_rates_tons_per_day = Unit.KILO_PER_DAY.to(Unit.TONS_PER_DAY)(
+            emission_rates_kg_per_day[:, is_in_period]
+        )
+
+        return {
+            emission_name: EmissionResult(
+                name=emission_name,
+                timesteps=timesteps,
+                rate=TimeSeriesStreamDayRate(
+                    timesteps=timesteps,
+                    values=emission_rates_tons_per_day[emission_indices[emission_name]].tolist(),
+                    unit=Unit.TONS_PER_DAY,
+                ),
+            )
+            for emission_name in emission_names
+        }
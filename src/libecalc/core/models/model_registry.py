@@ -0,0 +1,76 @@
+import hashlib
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional, TypeVar
+
+from pydantic import BaseModel
+
+from libecalc.common.logger import logger
+
+TModel = TypeVar("TModel")
+
+
+class DomainModelRegistry:
+    """
+    Domain models shared between identical data transfer objects, i.e. the same compressor chart, pump chart, sampled
+    table or generator set curve referenced by several consumers or periods is only set up once.
+
+    The shared models are used by one consumer at a time, so only models that do not keep state from one evaluation
+    to the next should be shared.
+    """
+
+    def __init__(self):
+        self._models: Dict[str, Any] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def get_key(model_dto: BaseModel) -> str:
+        key = hashlib.sha256()
+        key.update(type(model_dto).__name__.encode())
+        key.update(model_dto.model_dump_json().encode())
+        return key.hexdigest()
+
+    def get_or_create(self, model_dto: BaseModel, create: Callable[[], TModel]) -> TModel:
+        """
+        Get the domain model for the data transfer object, creating it if no identical data transfer object has been
+        seen before.
+
+        Args:
+            model_dto: the data transfer object of the model
+            create: creates the domain model for the data transfer object
+
+        Returns: the domain model
+        """
+        key = self.get_key(model_dto)
+        if key in self._models:
+            self.hits += 1
+        else:
+            self.misses += 1
+            self._models[key] = create()
+        return self._models[key]
+
+
+_active_registry: ContextVar[Optional[DomainModelRegistry]] = ContextVar("domain_model_registry", default=None)
+
+
+@contextmanager
+def use_domain_model_registry(registry: DomainModelRegistry) -> Iterator[DomainModelRegistry]:
+    """Share the domain models created in the context through the registry."""
+    token = _active_registry.set(registry)
+    try:
+        yield registry
+    finally:
+        _active_registry.reset(token)
+        logger.debug(f"Domain model registry: {registry.hits} shared, {registry.misses} created")
+
+
+def get_shared_model(model_dto: BaseModel, create: Callable[[], TModel]) -> TModel:
+    """
+    Get the domain model for the data transfer object from the active registry, or create a new domain model if no
+    registry is active.
+    """
+    registry = _active_registry.get()
+    if registry is None:
+        return create()
+    return registry.get_or_create(model_dto, create)
@@ -3,6 +3,7 @@ from typing import Any
 from libecalc import dto
 from libecalc.common.logger import logger
 from libecalc.core.models.chart import SingleSpeedChart, VariableSpeedChart
+from libecalc.core.models.model_registry import get_shared_model
 from libecalc.core.models.pump.pump import PumpModel, PumpSingleSpeed, PumpVariableSpeed
 
 
@@ -61,4 +62,7 @@ pump_model_map = {
 
 
 def create_pump_model(pump_model_dto: dto.PumpModel) -> PumpModel:
-    return pump_model_map.get(pump_model_dto.chart.typ, _invalid_pump_model_type)(pump_model_dto)
+    create_model = pump_model_map.get(pump_model_dto.chart.typ)
+    if create_model is None:
+        return _invalid_pump_model_type(pump_model_dto)
+    return get_shared_model(pump_model_dto, lambda: create_model(pump_model_dto))
@@ -9,6 +9,7 @@ from scipy.interpolate import interp1d
 
 from libecalc.common.list.adjustment import transform_linear
 from libecalc.common.logger import logger
+from libecalc.common.stream_conditions import TimeSeriesStreamConditions
 from libecalc.common.units import Unit, UnitConstants
 from libecalc.core.models.base import BaseModel
 from libecalc.core.models.chart import SingleSpeedChart, VariableSpeedChart
@@ -61,6 +62,24 @@ class PumpModel(BaseModel):
     ) -> PumpModelResult:
         pass
 
+    def evaluate_time_series_streams(
+        self,
+        inlet_streams: List[TimeSeriesStreamConditions],
+        outlet_stream: TimeSeriesStreamConditions,
+    ) -> PumpModelResult:
+        """Evaluate the pump for all timesteps of the (mixed) inlet streams and the expected outlet stream.
+
+        :param inlet_streams: The inlet streams, with values per time step
+        :param outlet_stream: The outlet stream, with the discharge pressure per time step
+        """
+        total_requested_stream = TimeSeriesStreamConditions.mix_all(inlet_streams)
+        return self.evaluate_rate_ps_pd_density(
+            rate=np.asarray(total_requested_stream.rate.values),
+            suction_pressures=np.asarray(total_requested_stream.pressure.values),
+            discharge_pressures=np.asarray(outlet_stream.pressure.values),
+            fluid_density=np.asarray(total_requested_stream.fluid_density.values),
+        )
+
     @staticmethod
     def _calculate_head(
         ps: NDArray[np.float64], pd: NDArray[np.float64], density: Union[NDArray[np.float64], float]
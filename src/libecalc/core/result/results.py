@@ -85,6 +85,7 @@ class CompressorResult(GenericComponentResult):
             recirculation_loss=self.recirculation_loss[indices],
             rate_exceeds_maximum=self.rate_exceeds_maximum[indices],
             outlet_pressure_before_choking=self.outlet_pressure_before_choking[indices],
+            streams=[stream.get_subset(indices) for stream in self.streams] if self.streams is not None else None,
         )
 
 
@@ -108,6 +109,7 @@ class PumpResult(GenericComponentResult):
             inlet_pressure_bar=self.inlet_pressure_bar[indices],
             outlet_pressure_bar=self.outlet_pressure_bar[indices],
             operational_head=self.operational_head[indices],
+            streams=[stream.get_subset(indices) for stream in self.streams] if self.streams is not None else None,
         )
 
 
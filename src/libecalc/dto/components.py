@@ -258,7 +258,7 @@ class ConsumerSystem(BaseConsumer):
                             timesteps=variables_map.time_vector,
                             values=list(
                                 Expression.setup_from_expression(stream_conditions.rate.value).evaluate(
-                                    variables=variables_map.variables, fill_length=len(variables_map.time_vector)
+                                    variables=variables_map.arrays, fill_length=len(variables_map.time_vector)
                                 )
                             ),
                             unit=stream_conditions.rate.unit,
@@ -269,7 +269,7 @@ class ConsumerSystem(BaseConsumer):
                             timesteps=variables_map.time_vector,
                             values=list(
                                 Expression.setup_from_expression(stream_conditions.pressure.value).evaluate(
-                                    variables=variables_map.variables, fill_length=len(variables_map.time_vector)
+                                    variables=variables_map.arrays, fill_length=len(variables_map.time_vector)
                                 )
                             ),
                             unit=stream_conditions.pressure.unit,
@@ -280,7 +280,7 @@ class ConsumerSystem(BaseConsumer):
                             timesteps=variables_map.time_vector,
                             values=list(
                                 Expression.setup_from_expression(stream_conditions.fluid_density.value).evaluate(
-                                    variables=variables_map.variables, fill_length=len(variables_map.time_vector)
+                                    variables=variables_map.arrays, fill_length=len(variables_map.time_vector)
                                 )
                             ),
                             unit=stream_conditions.fluid_density.unit,
@@ -62,6 +62,7 @@ class PumpSystemConsumerFunction(ConsumerFunction):
     fluid_density: Expression
     total_system_rate: Optional[Expression] = None
     operational_settings: List[PumpSystemOperationalSetting]
+    priority_cascade: bool = False
 
     _convert_expression = field_validator("fluid_density", "total_system_rate", "power_loss_factor", mode="before")(
         convert_expression
@@ -78,6 +79,7 @@ class CompressorSystemConsumerFunction(ConsumerFunction):
     compressors: List[CompressorSystemCompressor]
     total_system_rate: Optional[Expression] = None
     operational_settings: List[CompressorSystemOperationalSetting]
+    priority_cascade: bool = False
 
     _convert_total_system_rate_to_expression = field_validator("total_system_rate", "power_loss_factor", mode="before")(
         convert_expression
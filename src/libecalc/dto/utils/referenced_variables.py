@@ -0,0 +1,49 @@
+from enum import Enum
+from functools import lru_cache
+from typing import FrozenSet, Optional, Set
+
+from pydantic import BaseModel
+
+from libecalc.expression import Expression
+
+
+@lru_cache(maxsize=None)
+def _get_variables_in_expression_string(expression: str) -> Optional[FrozenSet[str]]:
+    try:
+        return frozenset(Expression.setup_from_expression(expression).variables)
+    except Exception:
+        return None
+
+
+def get_referenced_variables(value) -> Optional[Set[str]]:
+    """
+    Get the variables referenced by the expressions in a (data transfer) object. Strings are also treated as
+    expressions, since some expressions are kept as strings until evaluated. This might find variables that are not
+    used, which only means that the object is re-evaluated more often than needed.
+
+    Args:
+        value: the object to search for expressions
+
+    Returns: the names of the referenced variables, None if a string can not be parsed as an expression. The object
+        must then be treated as referencing all the variables, since the string might be an expression that is
+        evaluated later.
+    """
+    if isinstance(value, Expression):
+        return set(value.variables)
+    elif isinstance(value, str) and not isinstance(value, Enum):
+        variables = _get_variables_in_expression_string(value)
+        return set(variables) if variables is not None else None
+    elif isinstance(value, BaseModel):
+        return get_referenced_variables(list(value.__dict__.values()))
+    elif isinstance(value, dict):
+        return get_referenced_variables([*value.keys(), *value.values()])
+    elif isinstance(value, (list, tuple, set)):
+        referenced_variables: Set[str] = set()
+        for item in value:
+            item_variables = get_referenced_variables(item)
+            if item_variables is None:
+                return None
+            referenced_variables.update(item_variables)
+        return referenced_variables
+    else:
+        return set()
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
-from typing import Dict, List
+from typing import Dict, List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+import numpy as np
+from numpy.typing import NDArray
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 from typing_extensions import Annotated
 
 from libecalc.common.time_utils import Period
+from libecalc.expression.evaluation_context import get_evaluation_context
 
 
 class VariablesMap(BaseModel):
@@ -26,6 +29,10 @@ class VariablesMap(BaseModel):
     to make sure that the resolution of ALL variables are the same for everywhere it is being used,
     BEFORE the calculation starts; ie happens as a pre step before calculation, and not in the calculation
     directly.
+
+    The variables are also available as contiguous float64 arrays, see arrays, which should be used when evaluating
+    expressions. Subsets are not validated again, and the arrays of a subset are read-only views of the arrays of the
+    variables map the subset is taken from.
     """
 
     model_config = ConfigDict(extra="forbid")
@@ -33,6 +40,43 @@ class VariablesMap(BaseModel):
     time_vector: List[datetime] = Field(default_factory=list)
     variables: Dict[str, List[Annotated[float, Field(allow_inf_nan=False)]]] = Field(default_factory=dict)
 
+    _arrays: Optional[Dict[str, NDArray[np.float64]]] = PrivateAttr(default=None)
+    _time_index: Optional[NDArray[np.datetime64]] = PrivateAttr(default=None)
+    # The variables and time vector the arrays were created from
+    _arrays_source: Optional[Dict[str, List[float]]] = PrivateAttr(default=None)
+    _time_index_source: Optional[List[datetime]] = PrivateAttr(default=None)
+
+    @property
+    def arrays(self) -> Dict[str, NDArray[np.float64]]:
+        """The variables as read-only contiguous float64 arrays, created once for each variables map."""
+        # Created again if the variables are replaced, e.g. by model_copy, which copies the private attributes
+        if self._arrays is None or self._arrays_source is not self.variables:
+            self._arrays = {
+                reference_id: _as_read_only_array(values) for reference_id, values in self.variables.items()
+            }
+            self._arrays_source = self.variables
+        return self._arrays
+
+    def __eq__(self, other):
+        # The private attributes are only derived from the fields, and arrays can not be compared with ==
+        if not isinstance(other, VariablesMap):
+            return NotImplemented
+        return (
+            self.time_vector == other.time_vector
+            and self.arrays.keys() == other.arrays.keys()
+            and all(np.array_equal(values, other.arrays[reference_id]) for reference_id, values in self.arrays.items())
+        )
+
+    @property
+    def time_index(self) -> NDArray[np.datetime64]:
+        """The time vector as a datetime64 array, used to look up time steps."""
+        if self._time_index is None or self._time_index_source is not self.time_vector:
+            time_index = np.asarray(self.time_vector, dtype="datetime64[us]")
+            time_index.flags.writeable = False
+            self._time_index = time_index
+            self._time_index_source = self.time_vector
+        return self._time_index
+
     @property
     def period(self):
         return Period(
@@ -46,9 +90,28 @@ class VariablesMap(BaseModel):
         return len(self.time_vector)
 
     def get_subset(self, start_index: int = 0, end_index: int = -1) -> VariablesMap:
-        subset_time_vector = self.time_vector[start_index:end_index]
-        subset_dict = {ref: array[start_index:end_index] for ref, array in self.variables.items()}
-        return VariablesMap(variables=subset_dict, time_vector=subset_time_vector)
+        context = get_evaluation_context()
+        if context is not None:
+            # The same subset gives the same variables, for the expressions evaluated for the subset to be reused
+            return context.get_subset(
+                self, start_index, end_index, lambda: self._create_subset(start_index=start_index, end_index=end_index)
+            )
+        return self._create_subset(start_index=start_index, end_index=end_index)
+
+    def _create_subset(self, start_index: int, end_index: int) -> VariablesMap:
+        # The variables are already validated, and the arrays of the subset are views of the arrays of this map
+        subset_variables = {
+            reference_id: values[start_index:end_index] for reference_id, values in self.variables.items()
+        }
+        subset = VariablesMap.model_construct(
+            time_vector=self.time_vector[start_index:end_index],
+            variables=subset_variables,
+        )
+        subset._arrays = {reference_id: array[start_index:end_index] for reference_id, array in self.arrays.items()}
+        subset._arrays_source = subset_variables
+        subset._time_index = self.time_index[start_index:end_index]
+        subset._time_index_source = subset.time_vector
+        return subset
 
     def get_subset_from_period(self, period: Period) -> VariablesMap:
         start_index, end_index = period.get_timestep_indices(self.time_vector)
@@ -65,3 +128,12 @@ class VariablesMap(BaseModel):
 
     def zeros(self) -> List[float]:
         return [0.0] * len(self.time_vector)
+
+
+def _as_read_only_array(values: List[float]) -> NDArray[np.float64]:
+    array = np.ascontiguousarray(values, dtype=np.float64)
+    if array is values:
+        # Do not change the flags of an array given by the user
+        array = array.copy()
+    array.flags.writeable = False
+    return array
@@ -0,0 +1,102 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple, TypeVar
+
+from libecalc.common.logger import logger
+
+TValue = TypeVar("TValue")
+
+
+@dataclass
+class EvaluationContextStatistics:
+    expressions_evaluated: int = 0
+    expressions_reused: int = 0
+    subexpressions_evaluated: int = 0
+    subexpressions_reused: int = 0
+    subsets_created: int = 0
+    subsets_reused: int = 0
+
+
+class ExpressionMemo:
+    """Evaluated expressions and subexpressions for one set of variables."""
+
+    def __init__(self, statistics: EvaluationContextStatistics):
+        self._values: Dict[Hashable, Any] = {}
+        self._statistics = statistics
+
+    def get_or_evaluate(self, key: Hashable, evaluate: Callable[[], TValue], is_subexpression: bool = False) -> TValue:
+        if key in self._values:
+            if is_subexpression:
+                self._statistics.subexpressions_reused += 1
+            else:
+                self._statistics.expressions_reused += 1
+        else:
+            self._values[key] = evaluate()
+            if is_subexpression:
+                self._statistics.subexpressions_evaluated += 1
+            else:
+                self._statistics.expressions_evaluated += 1
+        return self._values[key]
+
+
+class ExpressionEvaluationContext:
+    """
+    Memoises evaluated expressions for a run, for the same expression evaluated for the same variables, e.g. rates and
+    pressures shared between operational settings, or conditions and power loss factors repeated in consumers.
+    Subexpressions in parentheses are shared between expressions.
+
+    The variables are identified by the identity of the variables, and subsets of the variables for the same time
+    indices are reused, so that the same subset gives the same variables. The variables must not be changed while the
+    context is active.
+    """
+
+    def __init__(self):
+        self.statistics = EvaluationContextStatistics()
+        # Keep the variables, so that the identity is not reused for other variables
+        self._memos: Dict[int, Tuple[Dict[str, List[float]], ExpressionMemo]] = {}
+        self._subsets: Dict[Tuple[int, int, int], Tuple[Any, Any]] = {}
+
+    def get_memo(self, variables: Dict[str, List[float]]) -> ExpressionMemo:
+        """Get the evaluated expressions for the variables."""
+        variables_id = id(variables)
+        if variables_id not in self._memos:
+            self._memos[variables_id] = (variables, ExpressionMemo(self.statistics))
+        return self._memos[variables_id][1]
+
+    def get_subset(self, variables_map: Any, start_index: int, end_index: int, create: Callable[[], TValue]) -> TValue:
+        """Get the subset of the variables map for the time indices, creating it if not created before."""
+        key = (id(variables_map), start_index, end_index)
+        if key in self._subsets:
+            self.statistics.subsets_reused += 1
+        else:
+            self._subsets[key] = (variables_map, create())
+            self.statistics.subsets_created += 1
+        return self._subsets[key][1]
+
+
+_active_context: ContextVar[Optional[ExpressionEvaluationContext]] = ContextVar(
+    "expression_evaluation_context", default=None
+)
+
+
+def get_evaluation_context() -> Optional[ExpressionEvaluationContext]:
+    return _active_context.get()
+
+
+@contextmanager
+def use_evaluation_context(context: ExpressionEvaluationContext) -> Iterator[ExpressionEvaluationContext]:
+    """Memoise the expressions evaluated in the context."""
+    token = _active_context.set(context)
+    try:
+        yield context
+    finally:
+        _active_context.reset(token)
+        statistics = context.statistics
+        logger.debug(
+            f"Expression evaluation context: {statistics.expressions_reused} of "
+            f"{statistics.expressions_evaluated + statistics.expressions_reused} expressions reused, "
+            f"{statistics.subexpressions_reused} of "
+            f"{statistics.subexpressions_evaluated + statistics.subexpressions_reused} subexpressions reused, "
+            f"{statistics.subsets_reused} of {statistics.subsets_created + statistics.subsets_reused} subsets reused"
+        )
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Union
 
 import numpy as np
 from numpy.typing import NDArray
@@ -10,6 +10,8 @@ from pydantic_core import CoreSchema, core_schema
 
 from libecalc.common.errors.exceptions import EcalcError, EcalcErrorType
 from libecalc.common.logger import logger
+from libecalc.expression.evaluation_context import ExpressionMemo, get_evaluation_context
+from libecalc.expression.expression_compiler import CompiledExpression, compile_tokens
 from libecalc.expression.expression_evaluator import (
     Operators,
     Token,
@@ -44,6 +46,26 @@ class Expression:
         tokens: List[Token],
     ):
         self.tokens = tokens
+        # Compiled when first evaluated, None if the tokens can not be compiled
+        self._compiled: Optional[CompiledExpression] = None
+        self._is_compiled = False
+
+    def __getstate__(self):
+        # The compiled expression can not be pickled, compile again when needed
+        return {"tokens": self.tokens}
+
+    def __setstate__(self, state):
+        self.__init__(tokens=state["tokens"])
+
+    def _get_compiled(self) -> Optional[CompiledExpression]:
+        if not self._is_compiled:
+            try:
+                self._compiled = compile_tokens(self.tokens)
+            except Exception:
+                # Evaluated by the token evaluator, giving the same error as before
+                self._compiled = None
+            self._is_compiled = True
+        return self._compiled
 
     @classmethod
     def setup_from_expression(
@@ -150,6 +172,33 @@ class Expression:
             logger.error(msg)
             raise InvalidExpressionError(msg)
 
+        context = get_evaluation_context()
+        if context is None:
+            return self._evaluate(variables=variables, fill_length=fill_length, memo=None)
+
+        memo = context.get_memo(variables)
+        # Copy to avoid changing the memoised result
+        return memo.get_or_evaluate(
+            ("expression", str(self), fill_length),
+            lambda: self._evaluate(variables=variables, fill_length=fill_length, memo=memo),
+        ).copy()
+
+    def _evaluate(
+        self, variables: Dict[str, List[float]], fill_length: int, memo: Optional[ExpressionMemo]
+    ) -> NDArray[np.float64]:
+        compiled = self._get_compiled()
+        if compiled is not None:
+            reference_values = {
+                reference_id: np.asarray(variables.get(reference_id)) for reference_id in self.variables
+            }
+            # References with a single value are evaluated as numbers by the token evaluator, not as arrays
+            if all(values.ndim == 1 and len(values) != 1 for values in reference_values.values()):
+                try:
+                    return compiled(reference_values, fill_length, memo)
+                except Exception as e:
+                    # Evaluate with the token evaluator to give the same error
+                    logger.debug(f"Could not evaluate compiled expression '{self}': {e}")
+
         tokens = [
             Token(
                 tag=TokenTag.numeric,
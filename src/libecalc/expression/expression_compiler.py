@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+import warnings
+from numbers import Number
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import numpy as np
+from numpy.typing import NDArray
+
+from libecalc.expression.evaluation_context import ExpressionMemo
+from libecalc.expression.expression_evaluator import (
+    OPERATORS,
+    Operators,
+    Token,
+    TokenTag,
+    check_tokens,
+    eval_additions,
+    eval_logicals,
+    eval_mults,
+    eval_powers,
+    eval_value,
+)
+
+"""
+Compile expression tokens into nested numpy closures, to avoid parsing the tokens every time an expression is
+evaluated.
+
+The compiled expression does exactly the same numpy operations, in the same order, as the token evaluator in
+expression_evaluator, so that the results are identical. The order of the evaluation in the token evaluator only
+depends on the operator tokens, given that the references are arrays with more than one value. Parts of the expression
+without references are evaluated when compiling, using the token evaluator.
+
+Subexpressions in parentheses are memoised by their text when evaluated with a memo, to share them between expressions.
+"""
+
+LOGICAL_OPERATORS = [">", "<", ">=", "<=", "==", "!="]
+ADDITION_OPERATORS = [Operators.add.value, Operators.subtract.value]
+MULTIPLICATION_OPERATORS = [Operators.multiply.value, Operators.divide.value]
+POWER_OPERATOR = Operators.power.value
+
+ReferenceValues = Dict[str, NDArray[np.float64]]
+CompiledExpression = Callable[[ReferenceValues, int, Optional[ExpressionMemo]], NDArray[np.float64]]
+
+
+class _Bindings(dict):
+    """The values of the references, and the memo used for subexpressions."""
+
+    __slots__ = ("memo",)
+
+    def __init__(self, reference_values: ReferenceValues, memo: Optional[ExpressionMemo]):
+        super().__init__(reference_values)
+        self.memo = memo
+
+
+class _Node:
+    """Part of an expression depending on references, evaluated to an array for the given reference values."""
+
+    __slots__ = ("evaluate",)
+
+    def __init__(self, evaluate: Callable[[ReferenceValues], Any]):
+        self.evaluate = evaluate
+
+
+# Tokens while compiling: operators (str), constants or nodes
+CompileToken = Union[str, float, int, bool, NDArray[np.float64], _Node]
+
+
+def _as_str(token: CompileToken) -> str:
+    """The string used by the token evaluator to identify operators. Arrays never give an operator."""
+    if isinstance(token, _Node):
+        return ""
+    return str(token)
+
+
+def _has_node(tokens: List[CompileToken]) -> bool:
+    return any(isinstance(token, _Node) for token in tokens)
+
+
+def _contains_operator(tokens: List[CompileToken], operators: List[str]) -> bool:
+    return any(isinstance(token, str) and operator in token for token in tokens for operator in operators)
+
+
+def _get_evaluate(value: Union[_Node, Any]) -> Callable[[ReferenceValues], Any]:
+    if isinstance(value, _Node):
+        return value.evaluate
+    return lambda reference_values: value
+
+
+def _compile_value(tokens: List[CompileToken]) -> Union[_Node, Any]:
+    if not _has_node(tokens):
+        return eval_value(tokens)
+    if len(tokens) != 1:
+        raise ValueError(f"expression_evaluator: I can not evaluate {len(tokens)} tokens as a value")
+
+    evaluate = tokens[0].evaluate
+    return _Node(lambda reference_values: np.nan_to_num(evaluate(reference_values)))
+
+
+def _compile_powers(tokens: List[CompileToken]) -> Union[_Node, Any]:
+    if not _has_node(tokens):
+        return eval_powers(tokens)
+    if not _contains_operator(tokens, [POWER_OPERATOR]):
+        # The value is already without nan and inf
+        return _compile_value(tokens)
+    if len(tokens) != 3:
+        raise ValueError("Number of tokens needs to be 3 for evalPowers, quotient, {^} and exponent")
+
+    evaluate_quotient = _get_evaluate(_compile_value([tokens[0]]))
+    evaluate_exponent = _get_evaluate(_compile_value([tokens[2]]))
+    return _Node(
+        lambda reference_values: np.nan_to_num(
+            np.power(evaluate_quotient(reference_values), evaluate_exponent(reference_values))
+        )
+    )
+
+
+def _compile_mults(tokens: List[CompileToken]) -> Union[_Node, Any]:
+    if not _has_node(tokens):
+        return eval_mults(tokens)
+
+    # Factors as (is_division, factor), with the divisions evaluated as 1 / denominator
+    factors = []
+    if _contains_operator(tokens, MULTIPLICATION_OPERATORS):
+        seqstart = 0
+        is_division = False
+        for ind, token in enumerate(tokens):
+            if _as_str(token) in MULTIPLICATION_OPERATORS:
+                factors.append((is_division, _compile_powers(tokens[seqstart:ind])))
+                is_division = token != Operators.multiply.value
+                seqstart = ind + 1
+        factors.append((tokens[seqstart - 1] != Operators.multiply.value, _compile_powers(tokens[seqstart:])))
+    else:
+        factors.append((False, _compile_powers(tokens)))
+
+    evaluate_factors = []
+    for is_division, factor in factors:
+        if isinstance(factor, _Node):
+            evaluate_factor = factor.evaluate
+            evaluate_factors.append(
+                (lambda reference_values, evaluate=evaluate_factor: np.divide(1.0, evaluate(reference_values)))
+                if is_division
+                else evaluate_factor
+            )
+        else:
+            constant = np.divide(1.0, factor) if is_division else factor
+            evaluate_factors.append(lambda reference_values, constant=constant: constant)
+
+    def evaluate(reference_values: ReferenceValues):
+        value = 1.0
+        for evaluate_factor in evaluate_factors:
+            value = value * evaluate_factor(reference_values)
+        return np.nan_to_num(value)
+
+    return _Node(evaluate)
+
+
+def _compile_additions(tokens: List[CompileToken]) -> Union[_Node, Any]:
+    if not _has_node(tokens):
+        return eval_additions(tokens)
+
+    # Terms as (sign, term), where the sign is None for a term that is not multiplied by a sign
+    terms = []
+    if _contains_operator(tokens, ADDITION_OPERATORS):
+        seqstart = 0
+        sign = 1.0
+        for ind, token in enumerate(tokens):
+            if _as_str(token) in ADDITION_OPERATORS:
+                terms.append((sign, _compile_mults(tokens[seqstart:ind])))
+                sign = 1.0 if token == Operators.add.value else -1.0
+                seqstart = ind + 1
+        terms.append((None if tokens[seqstart - 1] == Operators.add.value else -1.0, _compile_mults(tokens[seqstart:])))
+    else:
+        terms.append((None, _compile_mults(tokens)))
+
+    evaluate_terms = []
+    for sign, term in terms:
+        if isinstance(term, _Node):
+            evaluate_term = term.evaluate
+            evaluate_terms.append(
+                evaluate_term
+                if sign is None
+                else (lambda reference_values, sign=sign, evaluate=evaluate_term: sign * evaluate(reference_values))
+            )
+        else:
+            constant = term if sign is None else sign * term
+            evaluate_terms.append(lambda reference_values, constant=constant: constant)
+
+    return _Node(lambda reference_values: sum([evaluate_term(reference_values) for evaluate_term in evaluate_terms]))
+
+
+def _compile_logicals(tokens: List[CompileToken]) -> Union[_Node, Any]:
+    if not _has_node(tokens):
+        return eval_logicals(tokens)
+
+    for ind, token in enumerate(tokens):
+        if _as_str(token) in LOGICAL_OPERATORS:
+            for right_token in tokens[ind + 1 :]:
+                right_token_str = _as_str(right_token)
+                if right_token_str[:1] in LOGICAL_OPERATORS or right_token_str[:2] in LOGICAL_OPERATORS:
+                    raise KeyError("Not more than one logical operator within each parenthesis set")
+            operator = OPERATORS[token]
+            evaluate_left = _get_evaluate(_compile_additions(tokens[:ind]))
+            evaluate_right = _get_evaluate(_compile_additions(tokens[ind + 1 :]))
+            return _Node(
+                lambda reference_values: np.array(
+                    operator(evaluate_left(reference_values), evaluate_right(reference_values)),
+                    dtype=float,
+                )
+            )
+    return _compile_additions(tokens)
+
+
+def _count_parentheses(tokens: List[CompileToken]):
+    strings_in_tokens = [token for token in tokens if isinstance(token, str)]
+    return strings_in_tokens.count(Operators.left_parenthesis.value), strings_in_tokens.count(
+        Operators.right_parenthesis.value
+    )
+
+
+def _memoize(node: _Node, key: str) -> _Node:
+    evaluate = node.evaluate
+
+    def evaluate_memoized(bindings: _Bindings):
+        if bindings.memo is None:
+            return evaluate(bindings)
+        return bindings.memo.get_or_evaluate(("subexpression", key), lambda: evaluate(bindings), is_subexpression=True)
+
+    return _Node(evaluate_memoized)
+
+
+def _compile_parentheses(tokens: List[CompileToken], keys: List[str]) -> Union[_Node, Any]:
+    """
+    Args:
+        tokens: the tokens to compile
+        keys: the text of each token, used to identify subexpressions
+    """
+    number_of_left_parentheses, number_of_right_parentheses = _count_parentheses(tokens)
+    while number_of_left_parentheses or number_of_right_parentheses:
+        if number_of_left_parentheses != number_of_right_parentheses:
+            raise ValueError("Number of left and right parentheses do not match")
+
+        ind = 0
+        while ind < len(tokens) and _as_str(tokens[ind]) != Operators.right_parenthesis.value:
+            ind += 1
+        subend = ind
+        while ind >= 0 and _as_str(tokens[ind]) != Operators.left_parenthesis.value:
+            ind -= 1
+        substart = ind
+
+        subexpression_key = f"({' '.join(keys[substart + 1 : subend])})"
+        subexpression = _compile_parentheses(tokens[substart + 1 : subend], keys[substart + 1 : subend])
+        if isinstance(subexpression, _Node):
+            subexpression = _memoize(subexpression, subexpression_key)
+
+        tokens = tokens[:substart] + [subexpression] + tokens[subend + 1 :]
+        keys = keys[:substart] + [subexpression_key] + keys[subend + 1 :]
+        number_of_left_parentheses, number_of_right_parentheses = _count_parentheses(tokens)
+
+    return _compile_logicals(tokens)
+
+
+def compile_tokens(tokens: List[Token]) -> CompiledExpression:
+    """
+    Compile the tokens of an expression.
+
+    Args:
+        tokens: the tokens of the expression, with the references not replaced by values
+
+    Returns: the compiled expression, evaluated for the values of the references, the length of the result and
+        optionally a memo for subexpressions
+
+    Raises: the errors of the token evaluator if the expression can not be evaluated
+    """
+    compile_tokens_with_nodes: List[CompileToken] = [
+        _Node(lambda reference_values, reference=token.value: reference_values[reference])
+        if token.tag == TokenTag.reference
+        else token.value
+        for token in tokens
+    ]
+    check_tokens(compile_tokens_with_nodes)
+
+    with warnings.catch_warnings(), np.errstate(all="ignore"):
+        warnings.simplefilter("ignore")
+        value = _compile_parentheses(compile_tokens_with_nodes, keys=[str(token.value) for token in tokens])
+
+    if isinstance(value, _Node):
+        evaluate_node = value.evaluate
+
+        def evaluate(
+            reference_values: ReferenceValues, array_length: int, memo: Optional[ExpressionMemo] = None
+        ) -> NDArray[np.float64]:
+            with np.errstate(all="ignore"):
+                return np.nan_to_num(evaluate_node(_Bindings(reference_values, memo)))
+
+        return evaluate
+
+    constant = np.nan_to_num(value)
+    if isinstance(constant, Number):
+        return lambda reference_values, array_length, memo=None: np.full(fill_value=constant, shape=array_length)
+    return lambda reference_values, array_length, memo=None: np.array(constant)
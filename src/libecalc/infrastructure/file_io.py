@@ -9,7 +9,7 @@ from dataclasses import dataclass
 from io import BytesIO, StringIO
 from pathlib import Path
 from tempfile import TemporaryFile
-from typing import IO, Dict, List, Protocol, TextIO, Tuple, Union
+from typing import IO, Dict, List, Protocol, Sequence, TextIO, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -20,10 +20,16 @@ from libecalc.common.errors.exceptions import (
     InvalidResourceHeaderException,
 )
 from libecalc.common.logger import logger
-from libecalc.presentation.yaml.yaml_entities import Resource, YamlTimeseriesType
+from libecalc.presentation.yaml.yaml_entities import (
+    ArrayResource,
+    Resource,
+    YamlTimeseriesType,
+)
 
 YAML_EXTENSIONS = [".yml", ".yaml"]
 CSV_EXTENSION = ".csv"
+PARQUET_EXTENSION = ".parquet"
+ARROW_EXTENSIONS = [".arrow", ".feather"]
 ZIP_EXTENSION = ".zip"
 MAIN_PROVEN_FILE = ["INSTALLATION", "TIME_SERIES", "FACILITY_INPUTS", "FUEL_TYPES"]
 
@@ -74,6 +80,14 @@ class EcalcFile:
     def is_csv(filename: Path) -> bool:
         return filename.suffix.lower() == CSV_EXTENSION
 
+    @staticmethod
+    def is_parquet(filename: Path) -> bool:
+        return filename.suffix.lower() == PARQUET_EXTENSION
+
+    @staticmethod
+    def is_arrow(filename: Path) -> bool:
+        return filename.suffix.lower() in ARROW_EXTENSIONS
+
     @staticmethod
     def is_yaml(filename: Path) -> bool:
         try:
@@ -404,14 +418,17 @@ def _validate_headers(headers: List[str]):
             )
 
 
-def _validate_not_nan(columns: List[List]):
+def _validate_not_nan(columns: List[Sequence]):
     for column in columns:
-        for index, item in enumerate(column):
-            if isinstance(item, float) and math.isnan(item):
-                raise ValueError(
-                    f"csv file contains invalid data at row {index + 1}, "
-                    f"all headers must be associated with a valid column value"
-                )
+        if isinstance(column, np.ndarray) and column.dtype.kind == "f":
+            nan_indices = np.flatnonzero(np.isnan(column)).tolist()
+        else:
+            nan_indices = [index for index, item in enumerate(column) if isinstance(item, float) and math.isnan(item)]
+        if len(nan_indices) > 0:
+            raise ValueError(
+                f"csv file contains invalid data at row {nan_indices[0] + 1}, "
+                f"all headers must be associated with a valid column value"
+            )
 
 
 def _dataframe_to_resource(df: pd.DataFrame, validate_headers: bool = True) -> Resource:
@@ -427,6 +444,18 @@ def _dataframe_to_resource(df: pd.DataFrame, validate_headers: bool = True) -> R
     )
 
 
+def _dataframe_to_array_resource(df: pd.DataFrame, validate_headers: bool = True) -> ArrayResource:
+    """Keep the columns parsed by pandas as numpy arrays, see _dataframe_to_resource."""
+    headers = [header.strip() for header in df.columns.tolist()]
+    if validate_headers:
+        _validate_headers(headers)
+    columns = [df.iloc[:, index].to_numpy() for index in range(len(headers))]
+    return ArrayResource(
+        headers=headers,
+        columns=columns,
+    )
+
+
 def read_csv(csv_data: Union[str, TextIO, BytesIO]) -> pd.DataFrame:
     """Wrapper of pandas read csv function
 
@@ -446,6 +475,102 @@ def read_csv(csv_data: Union[str, TextIO, BytesIO]) -> pd.DataFrame:
     return pd.read_csv(stream, comment="#", float_precision="round_trip", skipinitialspace=True, thousands=" ")
 
 
+def read_arrow_table(resource_path: Path):
+    """Read a Parquet or Arrow IPC (Feather) file as a pyarrow table.
+
+    Arrow IPC files are memory mapped, i.e. numeric columns without missing values are not copied when converted to
+    numpy arrays. Parquet files are decoded when read. Requires pyarrow, which is installed with the optional
+    dependencies of libecalc[arrow].
+    """
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ValueError(
+            f"Reading '{resource_path.name}' requires pyarrow, which is not installed. "
+            "Install it with 'pip install libecalc[arrow]'."
+        ) from e
+
+    if EcalcFile.is_parquet(resource_path):
+        return pyarrow.parquet.read_table(resource_path, memory_map=True)
+    return pyarrow.ipc.open_file(pyarrow.memory_map(str(resource_path))).read_all()
+
+
+def _arrow_column_to_array(header: str, column) -> np.ndarray:
+    """Convert a column of a pyarrow table to the numpy array pandas would give for the same column in a csv file.
+
+    Numeric columns are given as float64 or int64 arrays, with missing values as nan, and string columns as object
+    arrays. Timestamp and date columns are given as object arrays of datetimes, used as they are for the dates of time
+    series.
+    """
+    import pyarrow
+
+    column_type = column.type
+    if pyarrow.types.is_integer(column_type) or pyarrow.types.is_floating(column_type):
+        # Integers with missing values are given as floats, as by pandas
+        values = column.to_numpy()
+        return values.astype(np.float64 if values.dtype.kind == "f" else np.int64, copy=False)
+    elif pyarrow.types.is_null(column_type):
+        # Columns without values, empty columns in csv files are read as nan
+        return np.full(len(column), np.nan)
+    elif (
+        pyarrow.types.is_boolean(column_type)
+        or pyarrow.types.is_string(column_type)
+        or pyarrow.types.is_large_string(column_type)
+    ):
+        values = column.to_numpy()
+    elif (pyarrow.types.is_timestamp(column_type) and column_type.tz is None) or pyarrow.types.is_date(column_type):
+        values = column.cast(pyarrow.timestamp("us")).to_numpy().astype(object)
+    else:
+        raise ValueError(
+            f"Column '{header}' has unsupported type '{column_type}'. "
+            f"Columns must be numbers, booleans, strings, dates or timestamps without time zone"
+        )
+
+    if column.null_count > 0:
+        values = np.where(pd.isna(values), np.nan, values)
+    return values
+
+
+def _arrow_table_to_array_resource(table, validate_headers: bool = True) -> ArrayResource:
+    """Create a resource with the columns of a pyarrow table, with the same validation of the headers as for csv."""
+    headers = [str(header).strip() for header in table.column_names]
+    if validate_headers:
+        _validate_headers(headers)
+    if len(set(headers)) != len(headers):
+        duplicated_headers = sorted({header for header in headers if headers.count(header) > 1})
+        raise ValueError(f"Headers must be unique, found duplicated headers: {', '.join(duplicated_headers)}")
+
+    columns = [_arrow_column_to_array(header, table.column(index)) for index, header in enumerate(headers)]
+    return ArrayResource(
+        headers=headers,
+        columns=columns,
+    )
+
+
+def _drop_empty_rows_and_columns(resource: ArrayResource) -> ArrayResource:
+    """Drop the rows and then the columns where all values are missing, as done for time series read from csv."""
+    missing = [pd.isna(column) for column in resource.columns]
+    if len(missing) == 0:
+        return resource
+
+    columns = resource.columns
+    empty_rows = np.logical_and.reduce(missing)
+    if empty_rows.any():
+        columns = [column[~empty_rows] for column in columns]
+        missing = [column_missing[~empty_rows] for column_missing in missing]
+
+    non_empty_columns = [index for index, column_missing in enumerate(missing) if not column_missing.all()]
+    if len(non_empty_columns) == len(columns) and columns is resource.columns:
+        return resource
+
+    return ArrayResource(
+        headers=[resource.headers[index] for index in non_empty_columns],
+        columns=[columns[index] for index in non_empty_columns],
+    )
+
+
 def read_resource_from_string(resource_string: str, validate_headers: bool = True) -> Resource:
     """Read resource from stream without validation."""
     resource_df = read_csv(resource_string)
@@ -454,7 +579,7 @@ def read_resource_from_string(resource_string: str, validate_headers: bool = Tru
     return resource
 
 
-def convert_dataframe_to_timeseries_resource(resource_df: pd.DataFrame) -> Resource:
+def convert_dataframe_to_timeseries_resource(resource_df: pd.DataFrame) -> ArrayResource:
     # TODO: This might give a different result than calculator-cli since we are not yet
     #  filtering on columns that are actually used. I.e. an unused column might have a number where all used columns
     #  have nan. This method would include that row. Although it is unlikely.
@@ -464,21 +589,31 @@ def convert_dataframe_to_timeseries_resource(resource_df: pd.DataFrame) -> Resou
     # Drop columns if all values are na
     resource_df = resource_df.dropna(axis=1, how="all")
 
-    return _dataframe_to_resource(resource_df, validate_headers=False)  # Validation of headers done at higher level
+    # Validation of headers done at higher level
+    return _dataframe_to_array_resource(resource_df, validate_headers=False)
 
 
 def read_timeseries_resource(
     resource_input: Union[Path, BytesIO, str],
     timeseries_type: YamlTimeseriesType,
     validate_headers: bool = True,
-) -> Resource:
+) -> ArrayResource:
     """Read timeseries resource from filepath with timeseries specific manipulation/validation.
 
     - Timeseries is allowed to have nans
+    - Parquet and Arrow IPC (Feather) files are read as tables, see read_arrow_table
     """
     if not isinstance(resource_input, (BytesIO, str, Path)):
         raise ValueError(f"Invalid resource_input type '{type(resource_input)}'")
 
+    if isinstance(resource_input, Path) and (
+        EcalcFile.is_parquet(resource_input) or EcalcFile.is_arrow(resource_input)
+    ):
+        if timeseries_type not in (YamlTimeseriesType.DEFAULT, YamlTimeseriesType.MISCELLANEOUS):
+            raise ValueError(f"Invalid timeseries type '{timeseries_type}' for resource '{resource_input}'")
+        resource = _arrow_table_to_array_resource(read_arrow_table(resource_input), validate_headers=validate_headers)
+        return _drop_empty_rows_and_columns(resource)
+
     if timeseries_type in (YamlTimeseriesType.DEFAULT, YamlTimeseriesType.MISCELLANEOUS):
         if isinstance(resource_input, Path):
             with open(resource_input) as resource_file:
@@ -495,11 +630,19 @@ def read_timeseries_resource(
     return convert_dataframe_to_timeseries_resource(resource_df=resource_df)
 
 
-def read_facility_resource(resource_input: Union[Path, BytesIO, str], validate_headers: bool = True) -> Resource:
+def read_facility_resource(resource_input: Union[Path, BytesIO, str], validate_headers: bool = True) -> ArrayResource:
     """Read facility file from filepath with facility file specific validation.
 
     - Facility files are not allowed to have nans
+    - Parquet and Arrow IPC (Feather) files are read as tables, see read_arrow_table
     """
+    if isinstance(resource_input, Path) and (
+        EcalcFile.is_parquet(resource_input) or EcalcFile.is_arrow(resource_input)
+    ):
+        resource = _arrow_table_to_array_resource(read_arrow_table(resource_input), validate_headers=validate_headers)
+        _validate_not_nan(resource.columns)
+        return resource
+
     if isinstance(resource_input, Path):
         with open(resource_input) as resource_file:
             resource_df = read_csv(resource_file)
@@ -511,16 +654,18 @@ def read_facility_resource(resource_input: Union[Path, BytesIO, str], validate_h
     headers = [header.strip() for header in headers]
     if validate_headers:
         _validate_headers(headers)
-    resource = _dataframe_to_resource(resource_df)
-    _validate_not_nan(resource.data)
+    resource = _dataframe_to_array_resource(resource_df)
+    _validate_not_nan(resource.columns)
     return resource
 
 
-def read_resource_from_filepath(resource_path: Path) -> Resource:
+def read_resource_from_filepath(resource_path: Path) -> ArrayResource:
     """Read resource from filepath without validation, should only be used as a util for tests/fixtures."""
     if EcalcFile.is_csv(resource_path):
         with open(resource_path) as resource_file:
             resource_df = read_csv(resource_file)
-            return _dataframe_to_resource(resource_df)
+            return _dataframe_to_array_resource(resource_df)
+    elif EcalcFile.is_parquet(resource_path) or EcalcFile.is_arrow(resource_path):
+        return _arrow_table_to_array_resource(read_arrow_table(resource_path))
     else:
         raise ValueError(f"Invalid file extension: {resource_path}")
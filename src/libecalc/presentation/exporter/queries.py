@@ -95,6 +95,7 @@ class FuelQuery(Query):
         if self.installation_category is None or installation_dto.user_defined_category == self.installation_category:
             for fuel_consumer in installation_dto.fuel_consumers:
                 temporal_category = TemporalModel(fuel_consumer.user_defined_category)
+                fuel_temporal_model = TemporalModel(fuel_consumer.fuel)
                 for period, category in temporal_category.items():
                     if self.consumer_categories is None or category in self.consumer_categories:
                         fuel_consumer_result = installation_graph.get_energy_result(fuel_consumer.id)
@@ -106,9 +107,11 @@ class FuelQuery(Query):
                             .to_volumes()
                         )
 
-                        fuel_temporal_model = TemporalModel(fuel_consumer.fuel)
-                        for timestep, fuel_volume in fuel_volumes.datapoints():
-                            fuel_model = fuel_temporal_model.get_model(timestep)
+                        fuel_volume_datapoints = list(fuel_volumes.datapoints())
+                        fuel_models = fuel_temporal_model.get_models(
+                            [timestep for timestep, _ in fuel_volume_datapoints]
+                        )
+                        for (timestep, fuel_volume), fuel_model in zip(fuel_volume_datapoints, fuel_models):
                             fuel_category = fuel_model.user_defined_category
 
                             if fuel_volume is not None:
@@ -258,10 +261,9 @@ class EmissionQuery(Query):
         if self.installation_category is None or installation_dto.user_defined_category == self.installation_category:
             for fuel_consumer in installation_dto.fuel_consumers:
                 temporal_category = TemporalModel(fuel_consumer.user_defined_category)
+                fuel_temporal_model = TemporalModel(fuel_consumer.fuel)
                 for period, category in temporal_category.items():
                     if self.consumer_categories is None or category in self.consumer_categories:
-                        fuel_temporal_model = TemporalModel(fuel_consumer.fuel)
-
                         emissions = installation_graph.get_emissions(fuel_consumer.id)
 
                         for emission in emissions.values():
@@ -271,8 +273,11 @@ class EmissionQuery(Query):
                                 .to_volumes()
                             )
                             unit_in = emission_volumes.unit
-                            for timestep, emission_volume in emission_volumes.datapoints():
-                                fuel_model = fuel_temporal_model.get_model(timestep)
+                            emission_volume_datapoints = list(emission_volumes.datapoints())
+                            fuel_models = fuel_temporal_model.get_models(
+                                [timestep for timestep, _ in emission_volume_datapoints]
+                            )
+                            for (timestep, emission_volume), fuel_model in zip(emission_volume_datapoints, fuel_models):
                                 fuel_category = fuel_model.user_defined_category
 
                                 if self.fuel_type_category is None or fuel_category == self.fuel_type_category:
@@ -442,7 +447,7 @@ class PowerSupplyOnshoreQuery(Query):
 
                             cable_loss = Expression.evaluate(
                                 fuel_consumer.cable_loss,
-                                variables=installation_graph.variables_map.variables,
+                                variables=installation_graph.variables_map.arrays,
                                 fill_length=len(installation_graph.variables_map.time_vector),
                             )
 
@@ -527,7 +532,7 @@ class MaxUsageFromShoreQuery(Query):
                                 values=array_to_list(
                                     Expression.evaluate(
                                         fuel_consumer.max_usage_from_shore,
-                                        variables=installation_graph.variables_map.variables,
+                                        variables=installation_graph.variables_map.arrays,
                                         fill_length=len(installation_graph.variables_map.time_vector),
                                     )
                                 ),
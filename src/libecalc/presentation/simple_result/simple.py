@@ -134,9 +134,13 @@ class SimpleComponentResult(SimpleBase):
             emission.name: SimpleEmissionResult(name=emission.name, rate=[])
             for emission in component.emissions.values()
         }
+        index_by_timestep: Dict[datetime, int] = {}
+        for index, component_timestep in enumerate(component.timesteps):
+            index_by_timestep.setdefault(component_timestep, index)
+
         for timestep in timesteps:
-            if timestep in component.timesteps:
-                timestep_index = component.timesteps.index(timestep)
+            if timestep in index_by_timestep:
+                timestep_index = index_by_timestep[timestep]
 
                 if component.power is not None:
                     power.append(component.power[timestep_index])
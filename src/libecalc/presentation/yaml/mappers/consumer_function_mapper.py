@@ -135,6 +135,7 @@ def _compressor_system_mapper(
             )
             for operational_setting in energy_usage_model.get(EcalcYamlKeywords.consumer_system_operational_settings)
         ],
+        priority_cascade=energy_usage_model.get(EcalcYamlKeywords.consumer_system_priority_cascade, False),
     )
 
 
@@ -182,6 +183,7 @@ def _pump_system_mapper(energy_usage_model: Dict, references: References = None)
             )
             for operational_setting in energy_usage_model.get(EcalcYamlKeywords.consumer_system_operational_settings)
         ],
+        priority_cascade=energy_usage_model.get(EcalcYamlKeywords.consumer_system_priority_cascade, False),
     )
 
 
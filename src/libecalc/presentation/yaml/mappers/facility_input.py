@@ -57,30 +57,23 @@ def _create_compressor_train_sampled_dto_model_data(
     fuel_header = EcalcYamlKeywords.consumer_tabular_fuel
 
     energy_usage_header = fuel_header if fuel_header in resource.headers else power_header
-    energy_usage_index = resource.headers.index(energy_usage_header)
-    rate_index = resource.headers.index(rate_header) if rate_header in resource.headers else None
-    suction_pressure_index = (
-        resource.headers.index(suction_pressure_header) if suction_pressure_header in resource.headers else None
-    )
-    discharge_pressure_index = (
-        resource.headers.index(discharge_pressure_header) if discharge_pressure_header in resource.headers else None
-    )
 
-    columns = resource.data
-    rate_values = list(columns[rate_index]) if rate_index is not None else None
-    suction_pressure_values = list(columns[suction_pressure_index]) if suction_pressure_index is not None else None
+    # The columns are validated by the DTO as they are, i.e. as arrays for resources read from files
+    rate_values = resource.get_column(rate_header) if rate_header in resource.headers else None
+    suction_pressure_values = (
+        resource.get_column(suction_pressure_header) if suction_pressure_header in resource.headers else None
+    )
     discharge_pressure_values = (
-        list(columns[discharge_pressure_index]) if discharge_pressure_index is not None else None
+        resource.get_column(discharge_pressure_header) if discharge_pressure_header in resource.headers else None
     )
-    energy_usage_values = list(columns[energy_usage_index])
+    energy_usage_values = resource.get_column(energy_usage_header)
 
     # In case of a fuel-driver compressor, the user may provide power interpolation data to emulate turbine power usage in results
     power_interpolation_values = None
     if fuel_header in resource.headers:
         power_interpolation_header = power_header if power_header in resource.headers else None
         if power_interpolation_header:
-            power_interpolation_index = resource.headers.index(power_interpolation_header)
-            power_interpolation_values = list(columns[power_interpolation_index])
+            power_interpolation_values = resource.get_column(power_interpolation_header)
 
     return CompressorTrainSampledDTO(
         energy_usage_values=energy_usage_values,
@@ -163,7 +156,7 @@ def _default_facility_to_dto_model_data(
     model_data = {
         "typ": typ,
         "headers": resource.headers,
-        "data": resource.data,
+        "data": resource.columns,
         "energy_usage_adjustment_constant": _get_adjustment_constant(data=facility_data),
         "energy_usage_adjustment_factor": _get_adjustment_factor(data=facility_data),
     }
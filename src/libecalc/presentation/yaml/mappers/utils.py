@@ -153,7 +153,8 @@ def convert_control_margin_to_fraction(control_margin: Optional[float], input_un
 
 def chart_curves_as_resource_to_dto_format(resource: Resource, resource_name: str) -> List[Dict[str, List[float]]]:
     try:
-        df = pd.DataFrame(data=resource.data, index=resource.headers).transpose().astype(float)
+        df = pd.DataFrame(dict(enumerate(resource.columns))).astype(float)
+        df.columns = resource.headers
     except ValueError as e:
         msg = f"Resource {resource_name} contains non-numeric value: {e}"
         logger.error(msg)
@@ -290,8 +291,7 @@ def get_single_speed_chart_data(resource: Resource, resource_name: str) -> Chart
 
 
 def _get_float_column(resource: Resource, header: str, resource_name: str) -> List[float]:
-    column_index = resource.headers.index(header)
-    column = resource.data[column_index]
+    column = resource.get_column(header)
     try:
         column = [float(value) for value in column]
     except ValueError as e:
@@ -1,7 +1,8 @@
 import re
 from datetime import datetime
-from typing import Dict, List, Tuple, Union
+from typing import Dict, List, Sequence, Tuple, Union
 
+import numpy as np
 import pandas
 from pydantic import Field, TypeAdapter, ValidationError
 from typing_extensions import Annotated
@@ -34,17 +35,21 @@ time_series_type_map = {
 }
 
 
-def _parse_date(date_input: Union[int, str]) -> datetime:
+def _parse_date(date_input: Union[int, str, datetime]) -> datetime:
     """
     Parse timeseries input:
 
     - Integer gets interpreted as year
+    - Datetimes, e.g. read from timestamp columns in Parquet or Arrow files, are used as they are
     - Starting with YYYY.xx.xx, then we assume ISO 8601
     - Other than that, we assume a day-first format (e.g. Norwegian: DD.MM.YYYY)
     """
+    if isinstance(date_input, datetime):
+        return date_input
+
     # Columns with integers as dates are interpreted as year
-    if isinstance(date_input, int):
-        return datetime(date_input, 1, 1)
+    if isinstance(date_input, (int, np.integer)):
+        return datetime(int(date_input), 1, 1)
 
     date_split = re.split(r"\D+", date_input)
     if len(date_split[0]) == 4:
@@ -53,12 +58,23 @@ def _parse_date(date_input: Union[int, str]) -> datetime:
         return pandas.to_datetime(date_input, dayfirst=True).to_pydatetime()
 
 
+def _parse_dates(date_inputs: Sequence[Union[int, str, datetime]]) -> List[datetime]:
+    """Parse the dates of a column, parsing each distinct date input once."""
+    date_by_input: Dict[Union[int, str, datetime], datetime] = {}
+    for date_input in date_inputs:
+        if date_input not in date_by_input:
+            date_by_input[date_input] = _parse_date(date_input)
+    return [date_by_input[date_input] for date_input in date_inputs]
+
+
 def _setup_time_series_data(
     date_index: int,
     time_series_resource: Resource,
-) -> Tuple[List[Union[datetime, pandas.Timestamp]], List[List]]:
-    time_vector = [_parse_date(date_input) for date_input in time_series_resource.data[date_index]]
-    columns = time_series_resource.data[:date_index] + time_series_resource.data[date_index + 1 :]
+) -> Tuple[List[Union[datetime, pandas.Timestamp]], List[Sequence]]:
+    # The columns are kept as given by the resource, i.e. as arrays for resources read from files
+    resource_columns = time_series_resource.columns
+    time_vector = _parse_dates(resource_columns[date_index])
+    columns = [*resource_columns[:date_index], *resource_columns[date_index + 1 :]]
 
     return time_vector, columns
 
@@ -1,8 +1,9 @@
 from datetime import datetime, timedelta
-from typing import List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Set
 
+import numpy as np
 import pandas as pd
-from scipy.interpolate import interp1d
+from numpy.typing import NDArray
 
 import libecalc.common.time_utils
 from libecalc.dto.types import InterpolationType
@@ -13,50 +14,92 @@ from libecalc.presentation.yaml.mappers.variables_mapper.time_series_collection
 from libecalc.presentation.yaml.validation_errors import ValidationError
 
 
-def _split_time_vector(
-    time_vector: List[datetime],
-    start: datetime,
-    end: datetime,
-) -> Tuple[int, List[datetime], int]:
-    """Find the entries between start and end, also counting the number of entries before start and after end."""
-    number_of_entries_before = len([date for date in time_vector if date < start])
-    number_of_entries_after = len([date for date in time_vector if date > end])
-    entries_between = [date for date in time_vector if start <= date <= end]
-    return number_of_entries_before, entries_between, number_of_entries_after
+def _get_seconds_since(times: NDArray[np.datetime64], start: np.datetime64) -> NDArray[np.float64]:
+    """The number of seconds from start to each of the times, as given by timedelta.total_seconds()."""
+    return (times - start).astype(np.int64) / 10**6
 
 
-def _get_interpolation_kind(rate_interpolation_type: InterpolationType) -> str:
+def _interpolate_linear(
+    x: NDArray[np.float64], columns: NDArray[np.float64], new_x: NDArray[np.float64]
+) -> NDArray[np.float64]:
+    """
+    Linear interpolation of all the columns at once, for new_x within x. Gives exactly the same values as np.interp
+    for each column, which is what scipy's interp1d uses for linear interpolation of a single column.
+    """
+    indices = np.clip(np.searchsorted(x, new_x, side="right") - 1, 0, len(x) - 1)
+    next_indices = np.minimum(indices + 1, len(x) - 1)
+    x_lo = x[indices][:, np.newaxis]
+    x_hi = x[next_indices][:, np.newaxis]
+    y_lo = columns[indices]
+    y_hi = columns[next_indices]
+    new_x = new_x[:, np.newaxis]
+
+    with np.errstate(all="ignore"):
+        slope = (y_hi - y_lo) / (x_hi - x_lo)
+        values = slope * (new_x - x_lo) + y_lo
+        # Avoid non-finite interpolation, as np.interp
+        values_from_hi = slope * (new_x - x_hi) + y_hi
+    values = np.where(
+        np.isnan(values), np.where(np.isnan(values_from_hi) & (y_lo == y_hi), y_lo, values_from_hi), values
+    )
+    # The values at the last time and at the given times are used as is
+    return np.where((x_lo == new_x) | (indices == len(x) - 1)[:, np.newaxis], y_lo, values)
+
+
+def _interpolate(
+    x: NDArray[np.float64],
+    columns: NDArray[np.float64],
+    new_x: NDArray[np.float64],
+    rate_interpolation_type: InterpolationType,
+) -> NDArray[np.float64]:
+    """Interpolate all the columns at the new x, which must be within x."""
     if rate_interpolation_type == InterpolationType.LINEAR:
-        return "linear"
+        return _interpolate_linear(x, columns, new_x)
     elif rate_interpolation_type == InterpolationType.RIGHT:
-        return "previous"
+        # The value at the previous time
+        return columns[np.searchsorted(x, new_x, side="right") - 1]
     elif rate_interpolation_type == InterpolationType.LEFT:
-        return "next"
+        # The value at the next time
+        return columns[np.searchsorted(x, new_x, side="left")]
     else:
         raise ValueError(f"Invalid interpolation typem, got {rate_interpolation_type}.")
 
 
-def _interpolate(
-    time_series: TimeSeries, time_vector: List[datetime], rate_interpolation_type: InterpolationType
-) -> List[float]:
-    interpolation_kind = _get_interpolation_kind(
-        rate_interpolation_type=rate_interpolation_type,
-    )
+def _fit_columns_to_time_vector(
+    columns_time_vector: List[datetime],
+    columns: NDArray[np.float64],
+    time_vector: List[datetime],
+    extrapolate_outside_defined_time_interval: bool,
+    interpolation_type: InterpolationType,
+) -> NDArray[np.float64]:
+    """
+    Fit all the columns, with a row for each time in the sorted time vector of the columns, to the time vector. Values
+    before the first time of the columns are zero, and values after the last time are either zero or extrapolated.
 
-    start_time = time_series.time_vector[0]
+    Returns: the fitted columns, with a row for each time in the time vector
+    """
+    times = np.asarray(columns_time_vector, dtype="datetime64[us]")
+    new_times = np.asarray(time_vector, dtype="datetime64[us]")
+    start, end = times[0], times[-1]
+    is_before = new_times < start
+    is_after = new_times > end
+    is_between = ~(is_before | is_after)
+
+    fitted_columns = np.zeros((len(new_times), columns.shape[1]), dtype=np.float64)
+    if extrapolate_outside_defined_time_interval:
+        fitted_columns[is_after] = columns[-1]
 
-    if len(time_series.time_vector) == 1:
-        # add dummy time 1 second later
-        setup_times = [0, 1]
-        setup_y = 2 * time_series.series
+    if len(times) == 1:
+        # Only the time of the columns is between start and end
+        fitted_columns[is_between] = columns[0]
     else:
-        # Interpolator x variable is number of seconds from first date time
-        setup_times = [(time - start_time).total_seconds() for time in time_series.time_vector]
-        setup_y = time_series.series
-
-    interpolator = interp1d(x=setup_times, y=setup_y, kind=interpolation_kind)
-    target_times = [(time - start_time).total_seconds() for time in time_vector]
-    return list(interpolator(target_times))
+        fitted_columns[is_between] = _interpolate(
+            x=_get_seconds_since(times, start),
+            columns=columns,
+            new_x=_get_seconds_since(new_times[is_between], start),
+            rate_interpolation_type=interpolation_type,
+        )
+    return fitted_columns
 
 
 def fit_time_series_to_time_vector(
@@ -65,23 +108,37 @@ def fit_time_series_to_time_vector(
     extrapolate_outside_defined_time_interval: bool,
     interpolation_type: InterpolationType,
 ) -> List[float]:
-    start, end = time_series.time_vector[0], time_series.time_vector[-1]
-    number_of_entries_before, entries_between, number_of_entries_after = _split_time_vector(
-        time_vector, start=start, end=end
-    )
+    return _fit_columns_to_time_vector(
+        columns_time_vector=time_series.time_vector,
+        columns=np.asarray(time_series.series, dtype=np.float64)[:, np.newaxis],
+        time_vector=time_vector,
+        extrapolate_outside_defined_time_interval=extrapolate_outside_defined_time_interval,
+        interpolation_type=interpolation_type,
+    )[:, 0].tolist()
 
-    if extrapolate_outside_defined_time_interval:
-        extrapolation_after_value = time_series.series[-1]
-    else:
-        extrapolation_after_value = 0.0
 
-    before_values = [0.0] * number_of_entries_before
-    between_values = _interpolate(
-        time_series=time_series, time_vector=entries_between, rate_interpolation_type=interpolation_type
-    )
-    after_values = [extrapolation_after_value] * number_of_entries_after
+def fit_time_series_collection_to_time_vector(
+    time_series_collection: TimeSeriesCollection,
+    time_vector: List[datetime],
+) -> Dict[str, List[float]]:
+    """
+    Fit all the time series of the collection to the time vector at once, as the time series share the time vector,
+    interpolation type and extrapolation of the collection.
 
-    return [*before_values, *between_values, *after_values]
+    Returns: the fitted values of each time series, by reference id
+    """
+    time_series_list = time_series_collection.time_series
+    fitted_columns = _fit_columns_to_time_vector(
+        columns_time_vector=time_series_collection.time_vector,
+        columns=np.asarray(time_series_collection.columns, dtype=np.float64).T,
+        time_vector=time_vector,
+        extrapolate_outside_defined_time_interval=time_series_collection.extrapolate_outside_defined_time_interval,
+        interpolation_type=time_series_collection.interpolation_type,
+    )
+    return {
+        time_series.reference_id: fitted_column
+        for time_series, fitted_column in zip(time_series_list, fitted_columns.T.tolist())
+    }
 
 
 def _get_date_range(start: datetime, end: datetime, frequency: libecalc.common.time_utils.Frequency) -> Set[datetime]:
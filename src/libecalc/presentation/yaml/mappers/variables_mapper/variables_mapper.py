@@ -1,16 +1,18 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, Iterable, List
+
+import networkx as nx
+import numpy as np
 
 from libecalc import dto
 from libecalc.common.logger import logger
-from libecalc.common.time_utils import Periods
 from libecalc.dto import VariablesMap
 from libecalc.presentation.yaml.mappers.variables_mapper.time_series_collection_mapper import (
     TimeSeriesCollectionMapper,
 )
 from libecalc.presentation.yaml.mappers.variables_mapper.timeseries_utils import (
-    fit_time_series_to_time_vector,
+    fit_time_series_collection_to_time_vector,
     get_global_time_vector,
 )
 from libecalc.presentation.yaml.yaml_entities import Resources
@@ -37,72 +39,114 @@ class VariableProcessor:
         if isinstance(self.variable, YamlSingleVariable):
             return list(self.variable.value.evaluate(variables, fill_length=len(time_vector)))
         else:
-            processed_expressions = {
-                time: variable.value.evaluate(variables, fill_length=len(time_vector))
-                for time, variable in self.variable.items()
-            }
-            sorted_times = sorted(processed_expressions)
-
-            periods = Periods.create_periods(sorted_times)
-
-            variable_result = []
-            should_warn_about_fill_value = False
-            for current_index, time_step in enumerate(time_vector):
-                period = periods.get_period(time_step)
-                if period.start in processed_expressions:
-                    variable_result.append(processed_expressions[period.start][current_index])
-                else:
-                    # Fill value before variable is defined
-                    variable_result.append(0.0)
-                    should_warn_about_fill_value = True
-
-            if should_warn_about_fill_value:
+            sorted_times = sorted(self.variable)
+
+            # Index of the definition used for each time step, -1 before the variable is defined
+            definition_indices = (
+                np.searchsorted(
+                    np.asarray(sorted_times, dtype="datetime64[us]"),
+                    np.asarray(time_vector, dtype="datetime64[us]"),
+                    side="right",
+                )
+                - 1
+            )
+
+            # Fill value before variable is defined
+            variable_result = np.zeros(len(time_vector))
+            for definition_index, time in enumerate(sorted_times):
+                is_in_period = definition_indices == definition_index
+                number_of_time_steps = int(np.count_nonzero(is_in_period))
+                if number_of_time_steps == 0:
+                    continue
+
+                expression = self.variable[time].value
+                variables_in_period = {
+                    reference_id: np.asarray(variables[reference_id])[is_in_period]
+                    for reference_id in expression.variables
+                    if reference_id in variables
+                }
+                variable_result[is_in_period] = expression.evaluate(
+                    variables_in_period, fill_length=number_of_time_steps
+                )
+
+            if np.any(definition_indices < 0):
                 logger.warning(
                     f"Variable {self.reference_id} is not defined for all time steps. Using 0.0 as fill value. "
                     f"Variable start: {sorted_times[0]}, time vector start: {min(time_vector)}"
                 )
 
-            return variable_result
+            return list(variable_result)
 
 
-def _evaluate_variables(variables: Dict[str, YamlVariable], variables_map: VariablesMap) -> VariablesMap:
-    variables_to_process = [
-        VariableProcessor(reference_id=f"$var.{reference_id}", variable=variable)
-        for reference_id, variable in variables.items()
-    ]
-    processed_variables = {**variables_map.variables}
+def _sort_variables(
+    variables_to_process: List[VariableProcessor], available_references: Iterable[str]
+) -> List[VariableProcessor]:
+    """
+    Sort the variables topologically, so that each variable is processed after the variables it refers to.
 
-    did_process_variable = True
-    while len(variables_to_process) > 0 and did_process_variable:
-        did_process_variable = False  # Reset
-        for variable in variables_to_process:
-            is_required_variables_processed = all(
-                required_variable in processed_variables for required_variable in variable.required_variables
-            )
-            if is_required_variables_processed:
-                processed_variables[variable.reference_id] = variable.process(
-                    variables=processed_variables,
-                    time_vector=variables_map.time_vector,
-                )
-                variables_to_process.remove(variable)
-                did_process_variable = True
+    Raises:
+        ValueError: if the variables refer to each other in a cycle, or refer to references that are not available
+    """
+    variables_by_reference_id = {variable.reference_id: variable for variable in variables_to_process}
+    available_references = set(available_references)
 
-    has_unsolvable_variables = len(variables_to_process) != 0
-    if has_unsolvable_variables:
+    graph = nx.DiGraph()
+    for variable in variables_to_process:
+        graph.add_node(variable.reference_id)
+        for required_variable in variable.required_variables:
+            if required_variable in variables_by_reference_id and required_variable not in available_references:
+                graph.add_edge(required_variable, variable.reference_id)
+
+    try:
+        sorted_reference_ids = list(nx.topological_sort(graph))
+    except nx.NetworkXUnfeasible as e:
+        cycle = [reference_id for reference_id, _ in nx.find_cycle(graph)]
+        raise ValueError(
+            f"Could not evaluate all variables, circular references between variables: "
+            f"{' -> '.join([*cycle, cycle[0]])}"
+        ) from e
+
+    # Variables referring to missing references, directly or through other variables
+    unsolvable_variables = set()
+    for reference_id in sorted_reference_ids:
+        if any(
+            required_variable in unsolvable_variables
+            or (required_variable not in available_references and required_variable not in variables_by_reference_id)
+            for required_variable in variables_by_reference_id[reference_id].required_variables
+        ):
+            unsolvable_variables.add(reference_id)
+
+    if len(unsolvable_variables) != 0:
         missing_references = sorted(
             {
-                reference_id
-                for variable in variables_to_process
-                for reference_id in variable.required_variables
-                if reference_id not in processed_variables
+                required_variable
+                for reference_id in unsolvable_variables
+                for required_variable in variables_by_reference_id[reference_id].required_variables
+                if required_variable not in available_references
+                and (required_variable not in variables_by_reference_id or required_variable in unsolvable_variables)
             }
         )
-        unsolvable_variables = sorted([variable.reference_id for variable in variables_to_process])
         raise ValueError(
-            f"Could not evaluate all variables, unable to resolve references in {', '.join(unsolvable_variables)}. "
+            f"Could not evaluate all variables, unable to resolve references in {', '.join(sorted(unsolvable_variables))}. "
             f"Missing references are {', '.join(missing_references)}"
         )
 
+    return [variables_by_reference_id[reference_id] for reference_id in sorted_reference_ids]
+
+
+def _evaluate_variables(variables: Dict[str, YamlVariable], variables_map: VariablesMap) -> VariablesMap:
+    variables_to_process = [
+        VariableProcessor(reference_id=f"$var.{reference_id}", variable=variable)
+        for reference_id, variable in variables.items()
+    ]
+    processed_variables = {**variables_map.variables}
+
+    for variable in _sort_variables(variables_to_process, available_references=processed_variables):
+        processed_variables[variable.reference_id] = variable.process(
+            variables=processed_variables,
+            time_vector=variables_map.time_vector,
+        )
+
     return VariablesMap(variables=processed_variables, time_vector=variables_map.time_vector)
 
 
@@ -126,14 +170,12 @@ def map_yaml_to_variables(
 
     variables = {}
     for timeseries_collection in timeseries_collections:
-        timeseries_list = timeseries_collection.time_series
-        for timeseries in timeseries_list:
-            variables[timeseries.reference_id] = fit_time_series_to_time_vector(
-                time_series=timeseries,
+        variables.update(
+            fit_time_series_collection_to_time_vector(
+                time_series_collection=timeseries_collection,
                 time_vector=global_time_vector,
-                extrapolate_outside_defined_time_interval=timeseries_collection.extrapolate_outside_defined_time_interval,
-                interpolation_type=timeseries_collection.interpolation_type,
             )
+        )
 
     return _evaluate_variables(
         configuration.variables_raise_if_invalid,
@@ -1,6 +1,9 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, TextIO, Union
+from typing import Dict, List, Optional, Sequence, TextIO, Union
+
+import numpy as np
+from numpy.typing import NDArray
 
 from libecalc import dto
 
@@ -10,6 +13,42 @@ class Resource:
     headers: List[str]
     data: List[List[Union[float, int, str]]]
 
+    @property
+    def columns(self) -> List[Sequence[Union[float, int, str]]]:
+        """The columns of the resource, in the same order as the headers."""
+        return self.data
+
+    def get_column(self, header: str) -> Sequence[Union[float, int, str]]:
+        """Get the column for the header, raises ValueError if the header is not in the resource."""
+        return self.columns[self.headers.index(header)]
+
+
+class ArrayResource(Resource):
+    """
+    Resource keeping the parsed columns as numpy arrays, i.e. float64 or int64 for numeric columns and object arrays
+    for other columns, avoiding conversion of the columns to lists when the resource is mapped.
+
+    The columns are only converted to lists if data is used.
+    """
+
+    def __init__(self, headers: List[str], columns: List[NDArray]):
+        self.headers = headers
+        self._columns = columns
+        self._data: Optional[List[List[Union[float, int, str]]]] = None
+
+    @property
+    def columns(self) -> List[NDArray]:
+        return self._columns
+
+    @property
+    def data(self) -> List[List[Union[float, int, str]]]:
+        if self._data is None:
+            self._data = [np.asarray(column).tolist() for column in self._columns]
+        return self._data
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(headers={self.headers!r}, columns={self._columns!r})"
+
 
 Resources = Dict[str, Resource]
 
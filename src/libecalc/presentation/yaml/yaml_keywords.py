@@ -36,6 +36,7 @@ class EcalcYamlKeywords:
     consumer_system_operational_settings_suction_pressure = "SUCTION_PRESSURE"
     consumer_system_operational_settings_discharge_pressure = "DISCHARGE_PRESSURE"
     consumer_system_operational_settings_crossover = "CROSSOVER"
+    consumer_system_priority_cascade = "PRIORITY_CASCADE"
 
     pump_system_pumps = "PUMPS"
     pump_system_pump_model = "CHART"
@@ -95,6 +95,11 @@ class YamlEnergyUsageModelCompressorSystem(EnergyUsageModelCommon):
         title="OPERATIONAL_SETTINGS",
         description="Operational settings of the system. \n\n$ECALC_DOCS_KEYWORDS_URL/OPERATIONAL_SETTINGS",
     )
+    priority_cascade: bool = Field(
+        False,
+        title="PRIORITY_CASCADE",
+        description="Only evaluate an operational setting for the time steps where the operational settings with higher priority are not valid. \n\n$ECALC_DOCS_KEYWORDS_URL/PRIORITY_CASCADE",
+    )
 
 
 class YamlPumpSystemPump(YamlBase):
@@ -136,3 +141,8 @@ class YamlEnergyUsageModelPumpSystem(EnergyUsageModelCommon):
         title="OPERATIONAL_SETTINGS",
         description="Operational settings of the system. \n\n$ECALC_DOCS_KEYWORDS_URL/OPERATIONAL_SETTINGS",
     )
+    priority_cascade: bool = Field(
+        False,
+        title="PRIORITY_CASCADE",
+        description="Only evaluate an operational setting for the time steps where the operational settings with higher priority are not valid. \n\n$ECALC_DOCS_KEYWORDS_URL/PRIORITY_CASCADE",
+    )
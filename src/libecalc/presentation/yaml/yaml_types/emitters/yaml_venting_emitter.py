@@ -128,7 +128,7 @@ class YamlDirectTypeEmitter(YamlBase):
         for emission in self.emissions:
             emission_rate = (
                 Expression.setup_from_expression(value=emission.rate.value)
-                .evaluate(variables=variables_map.variables, fill_length=len(variables_map.time_vector))
+                .evaluate(variables=variables_map.arrays, fill_length=len(variables_map.time_vector))
                 .tolist()
             )
 
@@ -216,7 +216,7 @@ class YamlOilTypeEmitter(YamlBase):
 
         oil_rates = (
             Expression.setup_from_expression(value=self.volume.rate.value)
-            .evaluate(variables=variables_map.variables, fill_length=len(variables_map.time_vector))
+            .evaluate(variables=variables_map.arrays, fill_length=len(variables_map.time_vector))
             .tolist()
         )
 
@@ -230,7 +230,7 @@ class YamlOilTypeEmitter(YamlBase):
         for emission in self.volume.emissions:
             factors = (
                 Expression.setup_from_expression(value=emission.emission_factor)
-                .evaluate(variables=variables_map.variables, fill_length=len(variables_map.time_vector))
+                .evaluate(variables=variables_map.arrays, fill_length=len(variables_map.time_vector))
                 .tolist()
             )
             unit = self.volume.rate.unit.to_unit()
@@ -254,7 +254,7 @@ class YamlOilTypeEmitter(YamlBase):
     ) -> TimeSeriesStreamDayRate:
         oil_rates = Expression.evaluate(
             convert_expression(self.volume.rate.value),
-            variables=variables_map.variables,
+            variables=variables_map.arrays,
             fill_length=len(variables_map.time_vector),
         )
 
@@ -0,0 +1,90 @@
+import copy
+import math
+import pickle
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from libecalc.common.list.array_list import ArrayList
+
+
+class TestArrayList:
+    def test_behaves_like_list(self):
+        array_list = ArrayList([1.0, 2.0, 3.0])
+
+        assert len(array_list) == 3
+        assert array_list[0] == 1.0
+        assert array_list[-1] == 3.0
+        assert list(array_list) == [1.0, 2.0, 3.0]
+        assert 2.0 in array_list
+        assert array_list.index(2.0) == 1
+        assert repr(array_list) == "[1.0, 2.0, 3.0]"
+
+    def test_elements_are_python_objects(self):
+        timesteps = ArrayList([datetime(2020, 1, 1), datetime(2021, 1, 1)], dtype="datetime64[us]")
+
+        assert timesteps[0] == datetime(2020, 1, 1)
+        assert isinstance(timesteps[0], datetime)
+        assert type(ArrayList([1.0])[0]) is float
+        assert timesteps.tolist() == [datetime(2020, 1, 1), datetime(2021, 1, 1)]
+
+    def test_equal_to_lists(self):
+        assert ArrayList([1.0, math.nan]) == [1, math.nan]
+        assert ArrayList([1.0, 2.0]) == ArrayList([1.0, 2.0])
+        assert ArrayList([1.0, 2.0]) != [1.0, 2.0, 3.0]
+        assert ArrayList([datetime(2020, 1, 1)], dtype="datetime64[us]") == [datetime(2020, 1, 1)]
+        assert ArrayList(["a", "b"], dtype=object) == ["a", "b"]
+
+    def test_slice_does_not_copy(self):
+        array_list = ArrayList([1.0, 2.0, 3.0])
+        sliced = array_list[1:]
+
+        assert sliced == [2.0, 3.0]
+        assert np.shares_memory(np.asarray(sliced), np.asarray(array_list))
+
+    def test_changing_slice_does_not_change_list(self):
+        array_list = ArrayList([1.0, 2.0, 3.0])
+        sliced = array_list[1:]
+
+        sliced[0] = 10.0
+        sliced.append(4.0)
+        array_list[2] = 30.0
+
+        assert array_list == [1.0, 2.0, 30.0]
+        assert sliced == [10.0, 3.0, 4.0]
+
+    def test_array_is_read_only(self):
+        array = np.asarray(ArrayList([1.0, 2.0]))
+
+        with pytest.raises(ValueError):
+            array[0] = 10.0
+
+    def test_change(self):
+        array_list = ArrayList([1.0, 2.0, 3.0])
+
+        array_list.append(4.0)
+        array_list.extend([5.0, 6.0])
+        array_list[0:2] = [0.0]
+        del array_list[1]
+        array_list.insert(0, -1.0)
+
+        assert array_list == [-1.0, 0.0, 4.0, 5.0, 6.0]
+        assert array_list.pop() == 6.0
+        assert array_list == [-1.0, 0.0, 4.0, 5.0]
+
+    def test_add(self):
+        assert ArrayList([1.0]) + [2.0] == [1.0, 2.0]
+        assert [1.0] + ArrayList([2.0]) == [1.0, 2.0]
+        assert isinstance([1.0] + ArrayList([2.0]), ArrayList)
+
+    def test_copy_and_pickle(self):
+        array_list = ArrayList([datetime(2020, 1, 1)], dtype="datetime64[us]")
+
+        assert pickle.loads(pickle.dumps(array_list)) == array_list  # noqa: S301
+        assert copy.deepcopy(array_list) == array_list
+        assert copy.deepcopy(array_list).dtype == array_list.dtype
+
+    def test_only_one_dimension(self):
+        with pytest.raises(ValueError):
+            ArrayList([[1.0, 2.0]])
@@ -0,0 +1,67 @@
+from dataclasses import dataclass
+from typing import Dict, List
+
+from libecalc.common.priority_optimizer import EvaluatorResult, PriorityOptimizer
+
+
+@dataclass
+class TimestepsResult:
+    id: str
+    timestep_indices: List[int]
+
+    def get_subset(self, indices: List[int]) -> "TimestepsResult":
+        return TimestepsResult(id=self.id, timestep_indices=[self.timestep_indices[index] for index in indices])
+
+
+# Validity per priority and timestep, for two consumers
+is_valid: Dict[str, Dict[str, List[bool]]] = {
+    "pri1": {"consumer1": [True, False, False, True, False], "consumer2": [True, True, False, False, False]},
+    "pri2": {"consumer1": [True, True, False, True, False], "consumer2": [True, True, True, True, False]},
+    "pri3": {"consumer1": [False, False, True, True, False], "consumer2": [True, True, True, True, False]},
+}
+
+
+class TestPriorityOptimizer:
+    def test_first_valid_priority_is_used_for_each_timestep(self):
+        result = PriorityOptimizer().optimize(
+            priorities=list(is_valid.keys()),
+            number_of_timesteps=5,
+            evaluator=lambda priority, timestep_indices: [
+                EvaluatorResult(
+                    id=consumer_id,
+                    result=TimestepsResult(id=consumer_id, timestep_indices=timestep_indices),
+                    is_valid=[consumer_is_valid[index] for index in timestep_indices],
+                )
+                for consumer_id, consumer_is_valid in is_valid[priority].items()
+            ],
+        )
+
+        assert result.priorities_used == ["pri1", "pri2", "pri3", "pri2", "pri3"]
+        assert result.priority_results == [
+            TimestepsResult(id="consumer1", timestep_indices=[0]),
+            TimestepsResult(id="consumer2", timestep_indices=[0]),
+            TimestepsResult(id="consumer1", timestep_indices=[1, 3]),
+            TimestepsResult(id="consumer2", timestep_indices=[1, 3]),
+            TimestepsResult(id="consumer1", timestep_indices=[2, 4]),
+            TimestepsResult(id="consumer2", timestep_indices=[2, 4]),
+        ]
+
+    def test_only_remaining_timesteps_are_evaluated(self):
+        evaluated_timestep_indices = []
+
+        def evaluator(priority, timestep_indices):
+            evaluated_timestep_indices.append(timestep_indices)
+            return [
+                EvaluatorResult(
+                    id="consumer",
+                    result=TimestepsResult(id="consumer", timestep_indices=timestep_indices),
+                    is_valid=[index % 2 == 0 for index in timestep_indices],
+                )
+            ]
+
+        result = PriorityOptimizer().optimize(
+            priorities=["pri1", "pri2", "pri3"], number_of_timesteps=4, evaluator=evaluator
+        )
+
+        assert evaluated_timestep_indices == [[0, 1, 2, 3], [1, 3], [1, 3]]
+        assert result.priorities_used == ["pri1", "pri3", "pri1", "pri3"]
@@ -270,3 +270,41 @@ class TestMerge:
             TabularTimeSeriesUtils.merge(first, other)
 
         assert str(exc_info.value) == "Can not merge objects of differing types."
+
+    def test_merge_many_objects(self):
+        class TimeSeriesObject(BaseModel):
+            id: str
+            timesteps: List[datetime]
+            time_series: TimeSeriesFloat
+            time_series_list: List[TimeSeriesStreamDayRate]
+
+        timesteps = [datetime(year, 1, 1) for year in range(2020, 2030)]
+
+        def create_object(indices: List[int]) -> TimeSeriesObject:
+            return TimeSeriesObject(
+                id="object",
+                timesteps=[timesteps[index] for index in indices],
+                time_series=TimeSeriesFloat(
+                    timesteps=[timesteps[index] for index in indices],
+                    values=[float(index) for index in indices],
+                    unit=Unit.NONE,
+                ),
+                time_series_list=[
+                    TimeSeriesStreamDayRate(
+                        timesteps=[timesteps[index] for index in indices],
+                        values=[-float(index) for index in indices],
+                        unit=Unit.STANDARD_CUBIC_METER_PER_DAY,
+                    )
+                ],
+            )
+
+        merged = TabularTimeSeriesUtils.merge(
+            create_object([3, 7]), create_object([0, 9, 1]), create_object([2, 4, 5, 6, 8])
+        )
+
+        assert merged == create_object(list(range(10)))
+
+        with pytest.raises(ValueError) as exc_info:
+            TabularTimeSeriesUtils.merge(create_object([0, 1]), create_object([2]), create_object([1, 3]))
+
+        assert str(exc_info.value) == "Can not merge two TimeSeries with common timesteps"
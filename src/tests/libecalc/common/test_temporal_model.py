@@ -1,7 +1,14 @@
 from datetime import datetime
 
+import pytest
+
 from libecalc import dto
-from libecalc.common.temporal_model import TemporalExpression, TemporalModel
+from libecalc.common.temporal_model import (
+    LazyTemporalModel,
+    TemporalExpression,
+    TemporalModel,
+)
+from libecalc.common.time_utils import Period
 from libecalc.expression import Expression
 
 
@@ -60,3 +67,55 @@ class TestTemporalExpression:
                 ],
             ),
         ) == [0, 1, 1, 5, 5]
+
+
+class TestTemporalModel:
+    def test_get_models(self):
+        temporal_model = TemporalModel({datetime(2020, 1, 1): "first", datetime(2022, 1, 1): "second"})
+        timesteps = [datetime(2020, 1, 1), datetime(2021, 1, 1), datetime(2022, 1, 1), datetime(2030, 1, 1)]
+
+        assert temporal_model.get_models(timesteps) == ["first", "first", "second", "second"]
+        assert temporal_model.get_models(timesteps) == [temporal_model.get_model(timestep) for timestep in timesteps]
+
+    def test_get_models_before_first_model(self):
+        temporal_model = TemporalModel({datetime(2020, 1, 1): "first"})
+
+        assert temporal_model.get_model_indices([datetime(2019, 1, 1), datetime(2020, 1, 1)]).tolist() == [-1, 0]
+        with pytest.raises(ValueError, match="2019-01-01"):
+            temporal_model.get_models([datetime(2019, 1, 1), datetime(2020, 1, 1)])
+
+
+class TestLazyTemporalModel:
+    def test_only_models_in_period_are_created(self):
+        created_models = []
+
+        def create_model(value: int) -> int:
+            created_models.append(value)
+            return value * 10
+
+        temporal_model = LazyTemporalModel(
+            {datetime(2000, 1, 1): 1, datetime(2010, 1, 1): 2, datetime(2020, 1, 1): 3},
+            create_model=create_model,
+        )
+
+        models_in_period = list(
+            temporal_model.items_in_period(Period(start=datetime(2021, 1, 1), end=datetime(2022, 1, 1)))
+        )
+
+        assert [model for _, model in models_in_period] == [30]
+        assert created_models == [3]
+        assert temporal_model.unused_periods == [
+            Period(start=datetime(2000, 1, 1), end=datetime(2010, 1, 1)),
+            Period(start=datetime(2010, 1, 1), end=datetime(2020, 1, 1)),
+        ]
+
+        assert temporal_model.get_model(datetime(2021, 1, 1)) == 30
+        assert temporal_model.get_model(datetime(2015, 1, 1)) == 20
+        assert created_models == [3, 2]
+
+        assert temporal_model.get_models([datetime(2015, 1, 1), datetime(2016, 1, 1), datetime(2021, 1, 1)]) == [
+            20,
+            20,
+            30,
+        ]
+        assert created_models == [3, 2]
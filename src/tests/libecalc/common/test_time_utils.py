@@ -1,12 +1,18 @@
 from datetime import datetime
 
+import numpy as np
 import pytest
 
+from libecalc.common.errors.exceptions import ProgrammingError
 from libecalc.common.time_utils import (
     Period,
+    PeriodIndex,
     Periods,
     calculate_delta_days,
     define_time_model_for_period,
+    get_timestep_index,
+    get_timestep_positions,
+    reindex_values,
 )
 
 
@@ -70,6 +76,101 @@ class TestPeriod:
         assert period.get_timesteps(timesteps) == []
 
 
+class TestGetTimestepIndex:
+    def test_sorted_timesteps(self):
+        timesteps = [datetime(2020, 1, 1), datetime(2021, 1, 1), datetime(2021, 1, 1), datetime(2022, 1, 1)]
+        assert get_timestep_index(timesteps, datetime(2021, 1, 1)) == 1
+        assert get_timestep_index(timesteps, datetime(2022, 1, 1)) == 3
+        with pytest.raises(ValueError):
+            get_timestep_index(timesteps, datetime(2021, 6, 1))
+
+    def test_unsorted_timesteps(self):
+        timesteps = [datetime(2022, 1, 1), datetime(2020, 1, 1), datetime(2021, 1, 1)]
+        assert get_timestep_index(timesteps, datetime(2020, 1, 1)) == 1
+
+
+class TestGetTimestepPositions:
+    def test_unsorted_timesteps(self):
+        timesteps = [datetime(2022, 1, 1), datetime(2020, 1, 1), datetime(2021, 1, 1), datetime(2020, 1, 1)]
+        requested_timesteps = [datetime(2020, 1, 1), datetime(2019, 1, 1), datetime(2022, 1, 1), datetime(2023, 1, 1)]
+
+        assert get_timestep_positions(timesteps, requested_timesteps).tolist() == [1, -1, 0, -1]
+        assert get_timestep_positions([], requested_timesteps).tolist() == [-1, -1, -1, -1]
+
+
+class TestReindexValues:
+    def test_reindex_to_sorted_unique_timesteps(self):
+        new_values, is_losing_data = reindex_values(
+            values=[1.0, 2.0],
+            time_vector=[datetime(2021, 1, 1), datetime(2020, 1, 1)],
+            new_time_vector=[datetime(2022, 1, 1), datetime(2020, 1, 1), datetime(2021, 1, 1), datetime(2020, 1, 1)],
+            fillna=-1,
+        )
+
+        assert new_values.tolist() == [2.0, 1.0, -1.0]
+        assert new_values.dtype == np.float64
+        assert not is_losing_data
+
+    def test_losing_data(self):
+        new_values, is_losing_data = reindex_values(
+            values=np.array([True, False]),
+            time_vector=[datetime(2020, 1, 1), datetime(2021, 1, 1)],
+            new_time_vector=[datetime(2021, 1, 1), datetime(2022, 1, 1)],
+            fillna=True,
+        )
+
+        assert new_values.tolist() == [False, True]
+        assert new_values.dtype == bool
+        assert is_losing_data
+
+    def test_strings(self):
+        new_values, _ = reindex_values(
+            values=["a", "b"],
+            time_vector=[datetime(2020, 1, 1), datetime(2021, 1, 1)],
+            new_time_vector=[datetime(2020, 1, 1), datetime(2022, 1, 1)],
+            fillna="",
+        )
+
+        assert new_values.tolist() == ["a", ""]
+
+
+class TestPeriodIndex:
+    def test_contiguous_periods(self):
+        periods = Periods.create_periods([datetime(2020, 1, 1), datetime(2021, 1, 1)])
+        period_index = PeriodIndex(periods.periods)
+        times = [datetime(1900, 1, 1), datetime(2020, 1, 1), datetime(2020, 6, 1), datetime(2021, 1, 1)]
+
+        assert [period_index.get_index(time) for time in times] == [0, 1, 1, 2]
+        assert period_index.get_indices(times).tolist() == [0, 1, 1, 2]
+        assert periods.get_period(datetime(2020, 6, 1)) == Period(start=datetime(2020, 1, 1), end=datetime(2021, 1, 1))
+
+    def test_times_outside_periods(self):
+        period_index = PeriodIndex(
+            [
+                Period(start=datetime(2025, 1, 1), end=datetime(2026, 1, 1)),
+                Period(start=datetime(2020, 1, 1), end=datetime(2021, 1, 1)),
+            ]
+        )
+        times = [datetime(2019, 1, 1), datetime(2020, 1, 1), datetime(2022, 1, 1), datetime(2025, 6, 1)]
+
+        assert [period_index.get_index(time) for time in times] == [None, 1, None, 0]
+        assert period_index.get_indices(times).tolist() == [-1, 1, -1, 0]
+        with pytest.raises(ProgrammingError):
+            Periods([Period(start=datetime(2020, 1, 1), end=datetime(2021, 1, 1))]).get_period(datetime(2022, 1, 1))
+
+    def test_overlapping_periods_use_first_period(self):
+        period_index = PeriodIndex(
+            [
+                Period(start=datetime(2020, 1, 1), end=datetime(2030, 1, 1)),
+                Period(start=datetime(2025, 1, 1)),
+            ]
+        )
+        times = [datetime(2019, 1, 1), datetime(2026, 1, 1), datetime(2031, 1, 1)]
+
+        assert [period_index.get_index(time) for time in times] == [None, 0, 1]
+        assert period_index.get_indices(times).tolist() == [-1, 0, 1]
+
+
 class TestCreatePeriods:
     def test_single_date(self):
         single_date = datetime(2020, 1, 1)
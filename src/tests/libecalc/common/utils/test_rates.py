@@ -11,6 +11,7 @@ from libecalc.common.utils.rates import (
     RateType,
     TimeSeriesBoolean,
     TimeSeriesFloat,
+    TimeSeriesInt,
     TimeSeriesRate,
     TimeSeriesVolumes,
     TimeSeriesVolumesCumulative,
@@ -212,6 +213,17 @@ class TestTimeSeriesVolumesCumulative:
         rates_yearly = rates.resample(freq=Frequency.YEAR, include_end_date=True)
         assert rates_yearly.values == [1, 5, 8]
 
+    def test_resample_interpolates_nan_values(self):
+        rates = TimeSeriesVolumesCumulative(
+            timesteps=[datetime(2023, 1, 1), datetime(2023, 7, 1), datetime(2024, 1, 1), datetime(2024, 7, 1)],
+            values=[np.nan, 2, np.nan, 6],
+            unit=Unit.KILO,
+        )
+
+        rates_yearly = rates.resample(freq=Frequency.YEAR, include_start_date=False, include_end_date=True)
+        assert rates_yearly.timesteps == [datetime(2024, 1, 1), datetime(2024, 7, 1)]
+        assert rates_yearly.values == pytest.approx([2 + 4 * 184 / 366, 6])
+
 
 class TestTimeSeriesVolumesReindex:
     def test_reindex(self):
@@ -371,6 +383,29 @@ class TestTimeSeriesRate:
             "Most likely a bug, report to eCalc Dev Team."
         )
 
+    def test_regularity_is_array(self):
+        rates = TimeSeriesRate(
+            timesteps=[datetime(2023, 1, 1), datetime(2024, 1, 1)],
+            values=[1, 2],
+            unit=Unit.STANDARD_CUBIC_METER_PER_DAY,
+            regularity=[0.5, 1],
+            rate_type=RateType.STREAM_DAY,
+        )
+
+        assert np.asarray(rates.regularity).dtype == np.float64
+        assert rates.to_calendar_day().values == [0.5, 2]
+        assert rates.model_dump()["regularity"] == [0.5, 1.0]
+
+    def test_int_values_are_serialized_as_ints(self):
+        time_series = TimeSeriesInt(
+            timesteps=[datetime(2023, 1, 1), datetime(2024, 1, 1)], values=[1, 2], unit=Unit.NONE
+        )
+
+        assert np.asarray(time_series.values).dtype == np.int64
+        assert time_series.model_dump_json() == (
+            '{"timesteps":["2023-01-01T00:00:00","2024-01-01T00:00:00"],"values":[1,2],"unit":"N/A"}'
+        )
+
 
 class TestTimeseriesRateToVolumes:
     def test_to_volumes(self):
@@ -531,6 +566,78 @@ class TestTimeSeriesFloat:
         rates_yearly = rates.resample(freq=Frequency.YEAR)
         assert np.allclose(rates_yearly.values, [10, 30, 40])
 
+    def test_for_timesteps(self):
+        time_series = TimeSeriesFloat(
+            timesteps=[datetime(2023, 1, 1), datetime(2024, 1, 1), datetime(2025, 1, 1)],
+            values=[10, 20, 30],
+            unit=Unit.BARA,
+        )
+
+        assert time_series.for_timesteps([datetime(2025, 1, 1), datetime(2023, 1, 1)]).values == [30, 10]
+        with pytest.raises(ValueError):
+            time_series.for_timesteps([datetime(2026, 1, 1)])
+
+    def test_reindex(self):
+        time_series = TimeSeriesFloat(
+            timesteps=[datetime(2023, 1, 1), datetime(2025, 1, 1)],
+            values=[10, np.nan],
+            unit=Unit.BARA,
+        )
+
+        reindexed = time_series.reindex([datetime(2023, 1, 1), datetime(2024, 1, 1), datetime(2025, 1, 1)])
+
+        assert reindexed == TimeSeriesFloat(
+            timesteps=[datetime(2023, 1, 1), datetime(2024, 1, 1), datetime(2025, 1, 1)],
+            values=[10, 0, np.nan],
+            unit=Unit.BARA,
+        )
+        assert reindexed != time_series.to_unit(Unit.KILO_PASCAL).reindex(reindexed.timesteps)
+
+    def test_to_unit(self):
+        time_series = TimeSeriesFloat(
+            timesteps=[datetime(2023, 1, 1), datetime(2024, 1, 1)], values=[1.5, np.nan], unit=Unit.BARA
+        )
+
+        assert time_series.to_unit(Unit.KILO_PASCAL) == TimeSeriesFloat(
+            timesteps=time_series.timesteps, values=[150.0, np.nan], unit=Unit.KILO_PASCAL
+        )
+
+    def test_values_are_arrays(self):
+        time_series = TimeSeriesFloat(
+            timesteps=[datetime(2023, 1, 1), datetime(2024, 1, 1), datetime(2025, 1, 1)],
+            values=[10, None, 30],
+            unit=Unit.BARA,
+        )
+
+        assert np.asarray(time_series.timesteps).dtype == np.dtype("datetime64[us]")
+        assert np.asarray(time_series.values).dtype == np.float64
+        assert time_series.values == [10, np.nan, 30]
+        assert time_series.timesteps[0] == datetime(2023, 1, 1)
+
+        sliced = time_series[1:]
+        assert np.shares_memory(np.asarray(sliced.values), np.asarray(time_series.values))
+        assert np.shares_memory(np.asarray(sliced.timesteps), np.asarray(time_series.timesteps))
+
+        sliced[0] = 20
+        time_series.append(datetime(2026, 1, 1), 40)
+        assert sliced.values == [20, 30]
+        assert time_series.values == [10, np.nan, 30, 40]
+
+    def test_serialized_with_lists(self):
+        time_series = TimeSeriesFloat(
+            timesteps=[datetime(2023, 1, 1), datetime(2024, 1, 1)], values=[1.5, np.nan], unit=Unit.BARA
+        )
+
+        dumped = time_series.model_dump()
+        assert type(dumped["timesteps"]) is list
+        assert type(dumped["values"]) is list
+        assert dumped["timesteps"] == [datetime(2023, 1, 1), datetime(2024, 1, 1)]
+        assert (
+            time_series.model_dump_json()
+            == '{"timesteps":["2023-01-01T00:00:00","2024-01-01T00:00:00"],"values":[1.5,null],"unit":"bara"}'
+        )
+        assert TimeSeriesFloat.model_validate_json(time_series.model_dump_json()) == time_series
+
 
 def test_resample_up_sampling():
     rates = TimeSeriesFloat(
@@ -162,6 +162,33 @@ class TestConsumerSystemConsumerFunction:
         assert operational_settings_after_cross_over.rates[0][0] == pytest.approx(12007, rel=0.01)
         assert operational_settings_after_cross_over.rates[1][0] == pytest.approx(8092, rel=0.01)
 
+    def test_max_rate_is_shared_between_operational_settings(self, pump_system):
+        """Operational settings with the same pressures and densities should only calculate the max rate once."""
+        consumer_system = pump_system
+        operational_settings = [
+            PumpSystemOperationalSetting(
+                rates=[np.array([rate]), np.array([100.0])],
+                suction_pressures=[np.array([1.0]), np.array([1.0])],
+                discharge_pressures=[np.array([100]), np.array([100.0])],
+                cross_overs=[2, 0],
+                fluid_densities=[np.array([1000.0]), np.array([1000.0])],
+            )
+            for rate in [20000.0, 30000.0]
+        ]
+        pump_model = consumer_system.consumers[0].facility_model
+
+        with patch.object(
+            pump_model, "get_max_standard_rate", wraps=pump_model.get_max_standard_rate
+        ) as get_max_standard_rate:
+            operational_settings_after_cross_over = consumer_system.get_operational_settings_adjusted_for_cross_over(
+                operational_settings=operational_settings,
+                max_rate_cache={},
+            )
+
+        assert get_max_standard_rate.call_count == 1
+        for operational_setting_after_cross_over in operational_settings_after_cross_over:
+            assert operational_setting_after_cross_over.rates[0][0] == pytest.approx(12007, rel=0.01)
+
     def test_calculate_rates_after_cross_over_compressor_system(self, compressor_system_sampled_2):
         """Check that rates after cross-over are calculated correctly."""
         consumer_system = compressor_system_sampled_2
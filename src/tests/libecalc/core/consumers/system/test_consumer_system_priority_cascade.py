@@ -0,0 +1,212 @@
+from typing import List, Tuple
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from libecalc import dto
+from libecalc.core.consumers.legacy_consumer.consumer_function_mapper.compressor_system_consumer_function import (
+    create_compressor_system,
+)
+from libecalc.core.consumers.legacy_consumer.consumer_function_mapper.pump_system_consumer_function import (
+    create_pump_system,
+)
+from libecalc.core.consumers.legacy_consumer.result_mapper import (
+    get_operational_settings_results_from_consumer_result,
+)
+from libecalc.core.consumers.legacy_consumer.system.consumer_function import (
+    ConsumerSystemConsumerFunction,
+)
+from libecalc.core.consumers.legacy_consumer.system.results import (
+    ConsumerSystemConsumerFunctionResult,
+)
+from libecalc.core.consumers.legacy_consumer.system.utils import (
+    assemble_operational_setting_from_model_result_list,
+)
+from libecalc.dto import VariablesMap
+from libecalc.expression import Expression
+
+
+@pytest.fixture
+def high_water_injection_variables(all_energy_usage_models_variables) -> VariablesMap:
+    """Water injection rates where the first operational setting of the pump system is not always within capacity."""
+    return all_energy_usage_models_variables.model_copy(
+        update={
+            "variables": {
+                **all_energy_usage_models_variables.variables,
+                "SIM1;WATER_INJ": [31977.0, 40000.0, 60000.0, 80000.0],
+            }
+        }
+    )
+
+
+def _evaluate_and_count_timesteps(
+    consumer_system: ConsumerSystemConsumerFunction, variables_map: VariablesMap
+) -> Tuple[ConsumerSystemConsumerFunctionResult, int]:
+    """Evaluate the consumer system, and count the number of timesteps evaluated by the consumer models."""
+    evaluated_timesteps: List[int] = []
+    evaluate_consumers = consumer_system.evaluate_consumers
+
+    def count_timesteps(operational_setting):
+        evaluated_timesteps.append(len(operational_setting.rates[0]))
+        return evaluate_consumers(operational_setting=operational_setting)
+
+    with patch.object(consumer_system, "evaluate_consumers", side_effect=count_timesteps):
+        result = consumer_system.evaluate(
+            variables_map=variables_map,
+            regularity=[1.0] * len(variables_map.time_vector),
+        )
+    return result, sum(evaluated_timesteps)
+
+
+def _assert_same_result(result: ConsumerSystemConsumerFunctionResult, expected: ConsumerSystemConsumerFunctionResult):
+    np.testing.assert_equal(result.operational_setting_used, expected.operational_setting_used)
+    np.testing.assert_equal(result.energy_usage, expected.energy_usage)
+    np.testing.assert_equal(result.power, expected.power)
+    np.testing.assert_equal(result.is_valid, expected.is_valid)
+    np.testing.assert_equal(result.cross_over_used, expected.cross_over_used)
+    np.testing.assert_equal(
+        [[consumer_result.model_dump() for consumer_result in results] for results in result.consumer_results],
+        [[consumer_result.model_dump() for consumer_result in results] for results in expected.consumer_results],
+    )
+
+
+@pytest.mark.parametrize(
+    "variables_fixture_name", ["all_energy_usage_models_variables", "high_water_injection_variables"]
+)
+def test_pump_system_priority_cascade(pump_system_el_consumer, variables_fixture_name, request):
+    variables_map = request.getfixturevalue(variables_fixture_name)
+    pump_system_dto = next(iter(pump_system_el_consumer.energy_usage_model.values()))
+
+    expected, timesteps_evaluated_all_settings = _evaluate_and_count_timesteps(
+        create_pump_system(pump_system_dto), variables_map
+    )
+    result, timesteps_evaluated_priority_cascade = _evaluate_and_count_timesteps(
+        create_pump_system(pump_system_dto.model_copy(update={"priority_cascade": True})), variables_map
+    )
+
+    _assert_same_result(result, expected)
+    assert timesteps_evaluated_priority_cascade < timesteps_evaluated_all_settings
+
+
+@pytest.fixture
+def multiple_settings_compressor_system_dto(compressor_system) -> dto.CompressorSystemConsumerFunction:
+    """The sampled compressor system, where the gas is first only sent to the first compressor, then split 60/40 and
+    then split evenly. The compressors have a maximum rate of 4 MSm3/day."""
+    compressor_system_dto = next(iter(compressor_system.energy_usage_model.values()))
+    return compressor_system_dto.model_copy(
+        update={
+            "total_system_rate": Expression.setup_from_expression(value="SIM1;GAS_PROD {*} 0.8"),
+            "operational_settings": [
+                dto.CompressorSystemOperationalSetting(
+                    rate_fractions=rate_fractions,
+                    suction_pressure=200,
+                    discharge_pressure=400,
+                )
+                for rate_fractions in [[1, 0], [0.6, 0.4], [0.5, 0.5]]
+            ],
+        }
+    )
+
+
+def test_compressor_system_priority_cascade(multiple_settings_compressor_system_dto, all_energy_usage_models_variables):
+    expected, timesteps_evaluated_all_settings = _evaluate_and_count_timesteps(
+        create_compressor_system(multiple_settings_compressor_system_dto), all_energy_usage_models_variables
+    )
+    result, timesteps_evaluated_priority_cascade = _evaluate_and_count_timesteps(
+        create_compressor_system(multiple_settings_compressor_system_dto.model_copy(update={"priority_cascade": True})),
+        all_energy_usage_models_variables,
+    )
+
+    _assert_same_result(result, expected)
+    assert expected.operational_setting_used.tolist() == [1, 0, 1, 1]
+    # All four timesteps for the first setting, the three remaining ones for the second and none for the third
+    assert timesteps_evaluated_all_settings == 12
+    assert timesteps_evaluated_priority_cascade == 7
+
+
+def test_operational_settings_results_are_mapped_to_the_operational_setting_evaluated(
+    multiple_settings_compressor_system_dto, all_energy_usage_models_variables
+):
+    def map_operational_settings_results(consumer_function_dto: dto.CompressorSystemConsumerFunction):
+        result = create_compressor_system(consumer_function_dto).evaluate(
+            variables_map=all_energy_usage_models_variables, regularity=[1.0] * 4
+        )
+        return get_operational_settings_results_from_consumer_result(result, parent_id="compressor_system")
+
+    expected = map_operational_settings_results(multiple_settings_compressor_system_dto)
+    operational_settings_results = map_operational_settings_results(
+        multiple_settings_compressor_system_dto.model_copy(update={"priority_cascade": True})
+    )
+
+    assert operational_settings_results.keys() == expected.keys() == {0, 1, 2}
+    for operational_setting_number, evaluated_timesteps in [(0, [0, 1, 2, 3]), (1, [0, 2, 3]), (2, [])]:
+        for model_result, expected_model_result in zip(
+            operational_settings_results[operational_setting_number], expected[operational_setting_number]
+        ):
+            assert model_result.timesteps == expected_model_result.timesteps
+            for timestep_index, energy_usage in enumerate(model_result.energy_usage.values):
+                if timestep_index in evaluated_timesteps:
+                    np.testing.assert_equal(energy_usage, expected_model_result.energy_usage.values[timestep_index])
+                else:
+                    assert np.isnan(energy_usage)
+
+
+def test_priority_cascade_operational_settings_results(pump_system_el_consumer, high_water_injection_variables):
+    pump_system_dto = next(iter(pump_system_el_consumer.energy_usage_model.values()))
+    expected = create_pump_system(pump_system_dto).evaluate(
+        variables_map=high_water_injection_variables, regularity=[1.0] * 4
+    )
+    result = create_pump_system(pump_system_dto.model_copy(update={"priority_cascade": True})).evaluate(
+        variables_map=high_water_injection_variables, regularity=[1.0] * 4
+    )
+
+    (expected_operational_settings_results,) = expected.operational_settings_results
+    (operational_settings_results,) = result.operational_settings_results
+
+    # The first operational setting is evaluated for all timesteps
+    np.testing.assert_equal(
+        operational_settings_results[0].model_dump(), expected_operational_settings_results[0].model_dump()
+    )
+
+    # The second operational setting is only evaluated for the last timestep, where the first one is invalid
+    for consumer_result, expected_consumer_result in zip(
+        operational_settings_results[1].consumer_results, expected_operational_settings_results[1].consumer_results
+    ):
+        assert np.isnan(consumer_result.energy_usage[:3]).all()
+        assert consumer_result.consumer_model_result.is_valid[:3] == [False] * 3
+        np.testing.assert_equal(consumer_result.energy_usage[3], expected_consumer_result.energy_usage[3])
+
+
+@pytest.mark.parametrize("priority_cascade", [False, True])
+def test_consumer_results_are_gathered_from_operational_settings_results(
+    pump_system_el_consumer, high_water_injection_variables, priority_cascade
+):
+    pump_system_dto = next(iter(pump_system_el_consumer.energy_usage_model.values()))
+    consumer_system = create_pump_system(pump_system_dto.model_copy(update={"priority_cascade": priority_cascade}))
+    evaluated_operational_settings = []
+    evaluate_consumers = consumer_system.evaluate_consumers
+
+    def record_operational_setting(operational_setting):
+        evaluated_operational_settings.append(operational_setting)
+        return evaluate_consumers(operational_setting=operational_setting)
+
+    with patch.object(consumer_system, "evaluate_consumers", side_effect=record_operational_setting):
+        result = consumer_system.evaluate(variables_map=high_water_injection_variables, regularity=[1.0] * 4)
+
+    # The consumers are not evaluated again for the operational settings used
+    assert len(evaluated_operational_settings) == len(pump_system_dto.operational_settings)
+
+    operational_setting_used = assemble_operational_setting_from_model_result_list(
+        operational_settings=consumer_system.get_operational_settings_adjusted_for_cross_over(
+            operational_settings=consumer_system.get_operational_settings_from_expressions(
+                variables_map=high_water_injection_variables, regularity=[1.0] * 4
+            ),
+        ),
+        setting_number_used_per_timestep=result.operational_setting_used,
+    )
+    expected_consumer_results = evaluate_consumers(operational_setting=operational_setting_used)
+    np.testing.assert_equal(
+        [consumer_result.model_dump() for consumer_result in result.consumer_results[0]],
+        [consumer_result.model_dump() for consumer_result in expected_consumer_results],
+    )
@@ -0,0 +1,156 @@
+from collections import defaultdict
+from typing import List, Optional
+
+import pytest
+
+from libecalc import dto
+from libecalc.common.priority_optimizer import PriorityOptimizer
+from libecalc.core.consumers.consumer_system import ConsumerSystem
+from libecalc.core.consumers.evaluation_cache import ConsumerEvaluationCache
+from libecalc.core.consumers.factory import (
+    create_consumer,
+    group_timesteps_by_energy_usage_models,
+)
+from libecalc.fixtures import consumer_system_v2_dto
+from libecalc.fixtures.cases.consumer_system_v2.consumer_system_v2_dto import (
+    compressor1,
+    compressor4_temporal_model,
+    compressor5_with_overlapping_temporal_model,
+)
+
+
+def evaluate_per_timestep(consumer_system_dto: dto.components.ConsumerSystem, variables_map: dto.VariablesMap):
+    """Evaluate the consumer system one timestep at a time, creating the consumers for each timestep."""
+    evaluated_stream_conditions = consumer_system_dto.evaluate_stream_conditions(variables_map=variables_map)
+    priorities_used = []
+    results_per_consumer = defaultdict(list)
+    for timestep_index, timestep in enumerate(variables_map.time_vector):
+        consumer_system = ConsumerSystem(
+            id=consumer_system_dto.id,
+            consumers=[create_consumer(consumer, timestep=timestep) for consumer in consumer_system_dto.consumers],
+            component_conditions=consumer_system_dto.component_conditions,
+        )
+
+        def evaluator(priority, indices):
+            return consumer_system.evaluate_consumers(
+                {
+                    component_id: [
+                        stream_condition.get_subset([timestep_index]) for stream_condition in stream_conditions
+                    ]
+                    for component_id, stream_conditions in evaluated_stream_conditions[priority].items()
+                }
+            )
+
+        optimizer_result = PriorityOptimizer().optimize(
+            priorities=list(evaluated_stream_conditions.keys()),
+            number_of_timesteps=1,
+            evaluator=evaluator,
+        )
+        priorities_used.extend(optimizer_result.priorities_used)
+        for consumer_result in optimizer_result.priority_results:
+            results_per_consumer[consumer_result.id].append(consumer_result)
+
+    return priorities_used, {
+        consumer_id: first.merge(*rest) for consumer_id, (first, *rest) in results_per_consumer.items()
+    }
+
+
+def evaluate_for_timesteps(
+    consumer_system_dto: dto.components.ConsumerSystem,
+    variables_map: dto.VariablesMap,
+    evaluation_caches: Optional[List[ConsumerEvaluationCache]] = None,
+):
+    """
+    Evaluate the consumer system for all timesteps using the same models at once. If a list is given for
+    evaluation_caches, a cache is used for each model period and added to the list.
+    """
+    evaluated_stream_conditions = consumer_system_dto.evaluate_stream_conditions(variables_map=variables_map)
+    priorities_used = []
+    results_per_consumer = defaultdict(list)
+    for timestep_indices in group_timesteps_by_energy_usage_models(
+        consumers=consumer_system_dto.consumers, timesteps=variables_map.time_vector
+    ):
+        evaluation_cache = None
+        if evaluation_caches is not None:
+            evaluation_cache = ConsumerEvaluationCache()
+            evaluation_caches.append(evaluation_cache)
+        consumer_system = ConsumerSystem(
+            id=consumer_system_dto.id,
+            consumers=[
+                create_consumer(consumer, timestep=variables_map.time_vector[timestep_indices[0]])
+                for consumer in consumer_system_dto.consumers
+            ],
+            component_conditions=consumer_system_dto.component_conditions,
+            evaluation_cache=evaluation_cache,
+        )
+
+        def evaluator(priority, indices):
+            return consumer_system.evaluate_consumers(
+                {
+                    component_id: [
+                        stream_condition.get_subset([timestep_indices[index] for index in indices])
+                        for stream_condition in stream_conditions
+                    ]
+                    for component_id, stream_conditions in evaluated_stream_conditions[priority].items()
+                }
+            )
+
+        optimizer_result = PriorityOptimizer().optimize(
+            priorities=list(evaluated_stream_conditions.keys()),
+            number_of_timesteps=len(timestep_indices),
+            evaluator=evaluator,
+        )
+        priorities_used.extend(optimizer_result.priorities_used)
+        for consumer_result in optimizer_result.priority_results:
+            results_per_consumer[consumer_result.id].append(consumer_result)
+
+    return priorities_used, {
+        consumer_id: first.merge(*rest) if rest else first
+        for consumer_id, (first, *rest) in results_per_consumer.items()
+    }
+
+
+@pytest.mark.parametrize("consumer_system_name", ["compressor_system_v2", "pump_system_v2"])
+def test_evaluate_consumers_for_timesteps_equals_evaluating_each_timestep(consumer_system_name):
+    consumer_system_v2 = consumer_system_v2_dto()
+    graph = consumer_system_v2.ecalc_model.get_graph()
+    consumer_system_dto = graph.get_node(graph.get_node_id_by_name(consumer_system_name))
+
+    expected_priorities_used, expected_results = evaluate_per_timestep(
+        consumer_system_dto, consumer_system_v2.variables
+    )
+    priorities_used, results = evaluate_for_timesteps(consumer_system_dto, consumer_system_v2.variables)
+
+    assert priorities_used == expected_priorities_used
+    assert results == expected_results
+
+
+@pytest.mark.parametrize("consumer_system_name", ["compressor_system_v2", "pump_system_v2"])
+def test_evaluation_cache_gives_same_results(consumer_system_name):
+    consumer_system_v2 = consumer_system_v2_dto()
+    graph = consumer_system_v2.ecalc_model.get_graph()
+    consumer_system_dto = graph.get_node(graph.get_node_id_by_name(consumer_system_name))
+
+    expected_priorities_used, expected_results = evaluate_for_timesteps(
+        consumer_system_dto, consumer_system_v2.variables
+    )
+    evaluation_caches = []
+    priorities_used, results = evaluate_for_timesteps(
+        consumer_system_dto, consumer_system_v2.variables, evaluation_caches=evaluation_caches
+    )
+
+    assert priorities_used == expected_priorities_used
+    assert results == expected_results
+    # Stream conditions without crossover are the same for all priorities, and are only evaluated once
+    assert sum(evaluation_cache.statistics.hits for evaluation_cache in evaluation_caches) > 0
+
+
+def test_group_timesteps_by_energy_usage_models():
+    time_vector = consumer_system_v2_dto().variables.time_vector
+
+    assert group_timesteps_by_energy_usage_models(
+        consumers=[compressor1, compressor4_temporal_model], timesteps=time_vector
+    ) == [[0], [1, 2, 3]]
+    assert group_timesteps_by_energy_usage_models(
+        consumers=[compressor4_temporal_model, compressor5_with_overlapping_temporal_model], timesteps=time_vector
+    ) == [[0], [1], [2, 3]]
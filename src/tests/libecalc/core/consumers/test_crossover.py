@@ -1,8 +1,11 @@
 from datetime import datetime
+from unittest.mock import Mock
 
 import pytest
 
+from libecalc.common.stream_conditions import TimeSeriesStreamConditions
 from libecalc.common.units import Unit
+from libecalc.common.utils.rates import TimeSeriesFloat
 from libecalc.core.consumers.consumer_system import ConsumerSystem
 from libecalc.domain.stream_conditions import Pressure, Rate, StreamConditions
 
@@ -94,11 +97,33 @@ class TestCrossover:
         Skipping test of edge-case where there are no streams, as that should be handled before this method.
         """
         crossover_stream, streams_within_capacity = ConsumerSystem._get_crossover_stream(
-            max_rate,
-            streams,
+            [max_rate],
+            [TimeSeriesStreamConditions.from_stream_condition(stream) for stream in streams],
             crossover_stream_name="test-stream-please-ignore",
         )
-        assert crossover_stream.rate == expected_crossover_stream.rate
-        assert [stream_within_capacity.rate for stream_within_capacity in streams_within_capacity] == [
-            expected_stream.rate for expected_stream in expected_streams_within_capacity
+        assert crossover_stream.rate.values == [expected_crossover_stream.rate.value]
+        assert [stream_within_capacity.rate.values for stream_within_capacity in streams_within_capacity] == [
+            [expected_stream.rate.value] for expected_stream in expected_streams_within_capacity
         ]
+
+
+def test_max_rates_are_reused_for_same_conditions():
+    """The max rates of a consumer are shared between the priorities of the consumer system."""
+    consumer = Mock(id="compressor")
+    consumer.get_max_rates.return_value = [4]
+    consumer_system = ConsumerSystem(id="system", consumers=[consumer], component_conditions=Mock(crossover=[]))
+    target_pressure = TimeSeriesFloat(timesteps=[datetime(2019, 1, 1)], values=[100], unit=Unit.BARA)
+
+    for rate in [2, 5]:
+        assert consumer_system._get_max_rates(
+            consumer=consumer,
+            inlet_stream=TimeSeriesStreamConditions.from_stream_condition(create_stream_from_rate(rate)),
+            target_pressure=target_pressure,
+        ) == [4]
+    consumer_system._get_max_rates(
+        consumer=consumer,
+        inlet_stream=TimeSeriesStreamConditions.from_stream_condition(create_stream_from_rate(2)),
+        target_pressure=target_pressure.model_copy(update={"values": [120]}),
+    )
+
+    assert consumer.get_max_rates.call_count == 2
@@ -0,0 +1,104 @@
+from datetime import datetime
+from types import SimpleNamespace
+from typing import List
+
+from libecalc.common.stream_conditions import TimeSeriesStreamConditions
+from libecalc.common.units import Unit
+from libecalc.common.utils.rates import (
+    TimeSeriesBoolean,
+    TimeSeriesFloat,
+    TimeSeriesStreamDayRate,
+)
+from libecalc.core.consumers.evaluation_cache import ConsumerEvaluationCache
+from libecalc.core.result.results import PumpResult
+
+timesteps = [datetime(2020, 1, 1), datetime(2021, 1, 1), datetime(2022, 1, 1), datetime(2023, 1, 1)]
+
+
+class DoubleRatePump:
+    """Pump using twice the inlet rate as power, recording the number of timesteps evaluated."""
+
+    def __init__(self):
+        self.id = "pump"
+        self.evaluated_timesteps: List[List[datetime]] = []
+
+    def evaluate_time_series(self, streams: List[TimeSeriesStreamConditions]):
+        inlet_stream = streams[0]
+        self.evaluated_timesteps.append(inlet_stream.rate.timesteps)
+        power = TimeSeriesStreamDayRate(
+            timesteps=inlet_stream.rate.timesteps,
+            values=[rate * 2 for rate in inlet_stream.rate.values],
+            unit=Unit.MEGA_WATT,
+        )
+        return SimpleNamespace(
+            component_result=PumpResult(
+                id=self.id,
+                timesteps=inlet_stream.rate.timesteps,
+                is_valid=TimeSeriesBoolean(
+                    timesteps=inlet_stream.rate.timesteps,
+                    values=[True] * len(inlet_stream.rate.timesteps),
+                    unit=Unit.NONE,
+                ),
+                energy_usage=power,
+                power=power,
+                inlet_liquid_rate_m3_per_day=inlet_stream.rate,
+                inlet_pressure_bar=inlet_stream.pressure,
+                outlet_pressure_bar=streams[-1].pressure,
+                operational_head=inlet_stream.pressure,
+                streams=streams,
+            )
+        )
+
+
+def create_streams(rates: List[float]) -> List[TimeSeriesStreamConditions]:
+    return [
+        TimeSeriesStreamConditions(
+            id="inlet",
+            name="inlet",
+            rate=TimeSeriesStreamDayRate(timesteps=timesteps, values=rates, unit=Unit.STANDARD_CUBIC_METER_PER_DAY),
+            pressure=TimeSeriesFloat(timesteps=timesteps, values=[10.0] * 4, unit=Unit.BARA),
+        ),
+        TimeSeriesStreamConditions(
+            id="outlet",
+            name="outlet",
+            pressure=TimeSeriesFloat(timesteps=timesteps, values=[50.0] * 4, unit=Unit.BARA),
+        ),
+    ]
+
+
+class TestConsumerEvaluationCache:
+    def test_identical_stream_conditions_are_evaluated_once(self):
+        pump = DoubleRatePump()
+        evaluation_cache = ConsumerEvaluationCache()
+        streams = create_streams([1.0, 2.0, 1.0, 2.0])
+
+        result = evaluation_cache.evaluate(pump, streams)
+
+        assert pump.evaluated_timesteps == [timesteps[:2]]
+        assert result == pump.evaluate_time_series(streams).component_result
+        assert evaluation_cache.statistics.hits == 2
+        assert evaluation_cache.statistics.misses == 2
+
+    def test_results_are_reused_between_evaluations(self):
+        pump = DoubleRatePump()
+        evaluation_cache = ConsumerEvaluationCache()
+        evaluation_cache.evaluate(pump, create_streams([1.0, 2.0, 3.0, 4.0]))
+
+        streams = create_streams([4.0, 3.0, 2.0, 5.0])
+        result = evaluation_cache.evaluate(pump, streams)
+
+        assert pump.evaluated_timesteps == [timesteps, [timesteps[3]]]
+        assert result == pump.evaluate_time_series(streams).component_result
+        assert evaluation_cache.statistics.hits == 3
+        assert evaluation_cache.statistics.misses == 5
+        assert evaluation_cache.statistics.hit_ratio == 3 / 8
+
+    def test_quantised_stream_conditions(self):
+        pump = DoubleRatePump()
+        evaluation_cache = ConsumerEvaluationCache(decimals=2)
+
+        result = evaluation_cache.evaluate(pump, create_streams([1.0, 1.001, 1.002, 2.0]))
+
+        assert pump.evaluated_timesteps == [[timesteps[0], timesteps[3]]]
+        assert result.power.values == [2.0, 2.0, 2.0, 4.0]
+        assert result.timesteps == timesteps
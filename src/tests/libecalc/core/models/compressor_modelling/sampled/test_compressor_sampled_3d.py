@@ -441,3 +441,38 @@ def test_compressor_sampled_3d():
 
     result = compressor_function.evaluate(rate=rate, suction_pressure=pss, discharge_pressure=pds)
     np.testing.assert_allclose(result, 3.92494047)
+
+
+def test_projection_functions_are_built_on_demand():
+    test_input_data = Path(__file__).parent / "input" / "compressor_sampled_3d_testdata3.csv"
+    df = pd.read_csv(test_input_data, comment="#")
+    compressor_function = CompressorModelSampled3D(df, "POWER", rescale_rate=False)
+    assert compressor_function.built_projection_functions == []
+
+    # Inside the convex hull, no projection is needed
+    compressor_function.evaluate(
+        rate=np.asarray([df[RATE_NAME].mean()]),
+        suction_pressure=np.asarray([df[PS_NAME].mean()]),
+        discharge_pressure=np.asarray([df[PD_NAME].mean()]),
+    )
+    assert compressor_function.built_projection_functions == []
+
+    compressor_function.get_max_rate(ps=np.asarray([140.0]), pd=np.asarray([180.0]))
+    assert compressor_function.built_projection_functions == [
+        "_rate_halfhulls",
+        "_maximum_rate_projection_functions",
+    ]
+
+    # Points below minimum rate are resolved by rate projection, no need for pressure projections
+    rate = np.asarray([13.47349524])
+    pss = np.asarray([130.8581215])
+    pds = np.asarray([0])
+    result = compressor_function.evaluate(rate=rate, suction_pressure=pss, discharge_pressure=pds)
+    np.testing.assert_allclose(result, 3.92494047)
+    assert compressor_function.built_projection_functions == [
+        "_rate_halfhulls",
+        "_minimum_rate_projection_functions",
+        "_minimum_rate_energy_function",
+        "_maximum_rate_projection_functions",
+        "_maximum_rate_energy_function",
+    ]
@@ -78,3 +78,44 @@ def test_temporal_fuel_model():
     # And they should cover the whole time index of 3 steps.
     for emission in emissions.values():
         assert len(emission.rate) == 3
+
+
+def test_temporal_fuel_model_with_variable_factors():
+    """Timesteps before the first period are not part of the results, and factors are evaluated per timestep."""
+    fuel_model = FuelModel(
+        {
+            datetime(2001, 1, 1): dto.FuelType(
+                name="fuel_gas",
+                emissions=[
+                    dto.Emission(
+                        name="CO2",
+                        factor=Expression.setup_from_expression("$var.factor"),
+                    ),
+                    dto.Emission(
+                        name="CH4",
+                        factor=Expression.setup_from_expression(2.0),
+                    ),
+                ],
+            ),
+            datetime(2002, 1, 1): dto.FuelType(
+                name="fuel_gas",
+                emissions=[
+                    dto.Emission(
+                        name="CO2",
+                        factor=Expression.setup_from_expression("$var.factor"),
+                    ),
+                ],
+            ),
+        }
+    )
+    timesteps = [datetime(2000, 1, 1), datetime(2001, 1, 1), datetime(2002, 1, 1), datetime(2003, 1, 1)]
+
+    emissions = fuel_model.evaluate_emissions(
+        variables_map=VariablesMap(time_vector=timesteps, variables={"$var.factor": [1.0, 2.0, 3.0, 4.0]}),
+        fuel_rate=np.asarray([1000, 2000, 3000, 4000]),
+    )
+
+    assert list(emissions) == ["ch4", "co2"]
+    assert emissions["co2"].timesteps == timesteps[1:]
+    assert emissions["co2"].rate.values == [4.0, 9.0, 16.0]
+    assert emissions["ch4"].rate.values == [4.0, 0.0, 0.0]
@@ -0,0 +1,166 @@
+import numpy as np
+import pytest
+
+from libecalc import dto
+from libecalc.core.models.compressor import create_compressor_model
+from libecalc.core.models.compressor.factory import _is_shareable
+from libecalc.core.models.model_registry import (
+    DomainModelRegistry,
+    use_domain_model_registry,
+)
+from libecalc.core.models.pump import create_pump_model
+
+
+def create_compressor_sampled_dto(energy_usage_factor: float = 1.0) -> dto.CompressorSampled:
+    return dto.CompressorSampled(
+        energy_usage_values=[0.0, 10.0, 11.0, 12.0],
+        energy_usage_type=dto.types.EnergyUsageType.POWER,
+        rate_values=[0.0, 0.01, 1.0, 2.0],
+        energy_usage_adjustment_constant=0,
+        energy_usage_adjustment_factor=energy_usage_factor,
+    )
+
+
+@pytest.fixture
+def pump_model_dto() -> dto.PumpModel:
+    return dto.PumpModel(
+        chart=dto.SingleSpeedChart(
+            speed_rpm=1,
+            rate_actual_m3_hour=[200, 500, 1000],
+            polytropic_head_joule_per_kg=[3000, 2500, 2000],
+            efficiency_fraction=[0.6, 0.7, 0.75],
+        ),
+        energy_usage_adjustment_constant=0,
+        energy_usage_adjustment_factor=1,
+        head_margin=0,
+    )
+
+
+@pytest.fixture
+def compressor_train_with_mixing_streams_dto(
+    rich_fluid, dry_fluid, variable_speed_compressor_chart_dto
+) -> dto.VariableSpeedCompressorTrainMultipleStreamsAndPressures:
+    stage = dto.MultipleStreamsCompressorStage(
+        compressor_chart=variable_speed_compressor_chart_dto,
+        inlet_temperature_kelvin=303.15,
+        remove_liquid_after_cooling=True,
+        pressure_drop_before_stage=0,
+        control_margin=0,
+    )
+    return dto.VariableSpeedCompressorTrainMultipleStreamsAndPressures(
+        streams=[
+            dto.MultipleStreamsAndPressureStream(
+                name="rich", typ=dto.types.FluidStreamType.INGOING, fluid_model=rich_fluid
+            ),
+            dto.MultipleStreamsAndPressureStream(name="export", typ=dto.types.FluidStreamType.OUTGOING),
+            dto.MultipleStreamsAndPressureStream(
+                name="dry", typ=dto.types.FluidStreamType.INGOING, fluid_model=dry_fluid
+            ),
+        ],
+        stages=[
+            stage.model_copy(update={"stream_reference": ["rich"]}),
+            stage.model_copy(update={"stream_reference": ["export", "dry"]}),
+        ],
+        calculate_max_rate=False,
+        energy_usage_adjustment_constant=0.0,
+        energy_usage_adjustment_factor=1.0,
+        pressure_control=dto.types.FixedSpeedPressureControl.DOWNSTREAM_CHOKE,
+    )
+
+
+def evaluate_compressor_train(compressor_model, rate: list):
+    number_of_timesteps = len(rate[0])
+    return compressor_model.evaluate_rate_ps_pd(
+        rate=np.asarray(rate, dtype=np.float64),
+        suction_pressure=np.full(number_of_timesteps, 30.0),
+        discharge_pressure=np.full(number_of_timesteps, 150.0),
+    )
+
+
+class TestDomainModelRegistry:
+    def test_identical_dtos_share_model(self, pump_model_dto):
+        registry = DomainModelRegistry()
+        with use_domain_model_registry(registry):
+            compressor_model = create_compressor_model(create_compressor_sampled_dto())
+            same_compressor_model = create_compressor_model(create_compressor_sampled_dto())
+            other_compressor_model = create_compressor_model(create_compressor_sampled_dto(energy_usage_factor=2.0))
+            pump_model = create_pump_model(pump_model_dto)
+            same_pump_model = create_pump_model(pump_model_dto.model_copy(deep=True))
+
+        assert compressor_model is same_compressor_model
+        assert compressor_model is not other_compressor_model
+        assert pump_model is same_pump_model
+        assert registry.hits == 2
+        assert registry.misses == 3
+
+    def test_no_sharing_without_registry(self):
+        assert create_compressor_model(create_compressor_sampled_dto()) is not create_compressor_model(
+            create_compressor_sampled_dto()
+        )
+
+    def test_train_with_unknown_stages_is_not_shared(self):
+        compressor_train_dto = dto.CompressorTrainSimplifiedWithUnknownStages(
+            fluid_model=dto.FluidModel(eos_model=dto.types.EoSModel.SRK, composition=dto.FluidComposition(methane=1)),
+            stage=dto.CompressorStage(
+                inlet_temperature_kelvin=303.15,
+                compressor_chart=dto.GenericChartFromInput(polytropic_efficiency_fraction=0.75),
+                remove_liquid_after_cooling=True,
+                pressure_drop_before_stage=0,
+            ),
+            maximum_pressure_ratio_per_stage=3.5,
+            energy_usage_adjustment_constant=0,
+            energy_usage_adjustment_factor=1,
+        )
+
+        # The number of stages is set when evaluating the train
+        assert not _is_shareable(compressor_train_dto)
+
+    def test_train_with_multiple_streams_is_not_shared(self, compressor_train_with_mixing_streams_dto):
+        with use_domain_model_registry(DomainModelRegistry()):
+            compressor_model = create_compressor_model(compressor_train_with_mixing_streams_dto)
+            same_compressor_model = create_compressor_model(compressor_train_with_mixing_streams_dto)
+
+        assert compressor_model is not same_compressor_model
+
+    def test_consumers_with_train_with_multiple_streams_are_independent(self, compressor_train_with_mixing_streams_dto):
+        """
+        The train keeps the fluid entering each stage, and recirculates it when the rate to the stage is zero. A consumer
+        must not recirculate fluid left behind by another consumer using an identical train.
+        """
+        rate_rich_fluid_exported_after_first_stage = [[3000000, 3000000], [3000000, 0], [0, 3000000]]
+        with use_domain_model_registry(DomainModelRegistry()):
+            compressor_model = create_compressor_model(compressor_train_with_mixing_streams_dto)
+            other_compressor_model = create_compressor_model(compressor_train_with_mixing_streams_dto)
+
+        result = evaluate_compressor_train(compressor_model, [[3000000], [0], [3000000]])
+        assert result.stage_results[1].mass_rate_kg_per_hr[0] > 0
+
+        # No fluid has entered the second stage of the other train, so there is nothing to recirculate
+        with pytest.raises(ValueError, match="without defining which composition"):
+            evaluate_compressor_train(other_compressor_model, rate_rich_fluid_exported_after_first_stage)
+
+    def test_compressor_with_turbine_is_shareable_as_its_train(self, compressor_train_with_mixing_streams_dto):
+        turbine = dto.Turbine(
+            lower_heating_value=38,
+            turbine_loads=[0, 2.352, 4.589, 6.853, 9.125, 11.399, 13.673, 15.947, 18.223, 20.496, 22.767],
+            turbine_efficiency_fractions=[0, 0.138, 0.21, 0.255, 0.286, 0.31, 0.328, 0.342, 0.353, 0.36, 0.362],
+            energy_usage_adjustment_constant=0,
+            energy_usage_adjustment_factor=1,
+        )
+
+        assert not _is_shareable(
+            dto.CompressorWithTurbine(
+                compressor_train=compressor_train_with_mixing_streams_dto,
+                turbine=turbine,
+                energy_usage_adjustment_constant=0,
+                energy_usage_adjustment_factor=1,
+            )
+        )
+        assert _is_shareable(
+            dto.CompressorWithTurbine(
+                compressor_train=create_compressor_sampled_dto(),
+                turbine=turbine,
+                energy_usage_adjustment_constant=0,
+                energy_usage_adjustment_factor=1,
+            )
+        )
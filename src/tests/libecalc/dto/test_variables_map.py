@@ -0,0 +1,44 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from libecalc.dto import VariablesMap
+
+
+@pytest.fixture
+def variables_map() -> VariablesMap:
+    return VariablesMap(
+        time_vector=[datetime(2020, 1, 1), datetime(2021, 1, 1), datetime(2022, 1, 1), datetime(2023, 1, 1)],
+        variables={"SIM1;A": [1, 2, 3, 4], "SIM1;B": [5.0, 6.0, 7.0, 8.0]},
+    )
+
+
+class TestVariablesMap:
+    def test_arrays(self, variables_map):
+        arrays = variables_map.arrays
+
+        assert variables_map.arrays is arrays
+        assert arrays["SIM1;A"].dtype == np.float64
+        assert arrays["SIM1;A"].flags.c_contiguous
+        assert not arrays["SIM1;A"].flags.writeable
+        np.testing.assert_equal(arrays["SIM1;A"], [1.0, 2.0, 3.0, 4.0])
+
+    def test_subset_is_view(self, variables_map):
+        subset = variables_map.get_subset(1, 3)
+
+        assert subset.time_vector == [datetime(2021, 1, 1), datetime(2022, 1, 1)]
+        assert np.shares_memory(subset.arrays["SIM1;B"], variables_map.arrays["SIM1;B"])
+        assert not subset.arrays["SIM1;B"].flags.writeable
+        assert subset.variables["SIM1;B"] == [6.0, 7.0]
+        np.testing.assert_equal(subset.time_index, variables_map.time_index[1:3])
+        assert subset == VariablesMap(time_vector=subset.time_vector, variables={"SIM1;A": [2, 3], "SIM1;B": [6, 7]})
+        assert subset.model_dump()["variables"] == {"SIM1;A": [2.0, 3.0], "SIM1;B": [6.0, 7.0]}
+
+    def test_arrays_are_created_again_for_changed_variables(self, variables_map):
+        np.testing.assert_equal(variables_map.arrays["SIM1;A"], [1.0, 2.0, 3.0, 4.0])
+
+        changed_variables_map = variables_map.model_copy(update={"variables": {"SIM1;A": [0, 0, 0, 0]}})
+
+        np.testing.assert_equal(changed_variables_map.arrays["SIM1;A"], [0.0, 0.0, 0.0, 0.0])
+        assert changed_variables_map != variables_map
@@ -0,0 +1,17 @@
+from libecalc import dto
+from libecalc.dto.utils.referenced_variables import get_referenced_variables
+from libecalc.expression import Expression
+
+
+class TestGetReferencedVariables:
+    def test_expressions_and_strings(self):
+        assert get_referenced_variables(
+            [Expression.setup_from_expression("SIM1;GAS_PROD {/} 2"), "SIM1;GAS_LIFT > 0", 5]
+        ) == {"SIM1;GAS_PROD", "SIM1;GAS_LIFT"}
+
+    def test_nested_models(self):
+        variables_map = dto.VariablesMap(time_vector=[], variables={})
+        assert get_referenced_variables([variables_map, ["1 {+} SIM1;WATER_INJ"]]) == {"SIM1;WATER_INJ"}
+
+    def test_string_that_is_not_an_expression_references_all_variables(self):
+        assert get_referenced_variables(["SIM1;GAS_PROD", "rate (A"]) is None
@@ -0,0 +1,79 @@
+from datetime import datetime
+
+import numpy as np
+
+from libecalc.dto import VariablesMap
+from libecalc.expression import Expression
+from libecalc.expression.evaluation_context import (
+    ExpressionEvaluationContext,
+    use_evaluation_context,
+)
+
+VARIABLES = {
+    "SIM1;A": [1.0, 0.0, -2.5, 3.0],
+    "SIM1;B": [2.0, 0.0, 0.0, -3.0],
+}
+
+
+class TestExpressionEvaluationContext:
+    def test_repeated_expressions_are_evaluated_once(self):
+        expression = Expression.setup_from_expression("SIM1;A {+} SIM1;B")
+        same_expression = Expression.setup_from_expression("SIM1;A {+} SIM1;B")
+        context = ExpressionEvaluationContext()
+        with use_evaluation_context(context):
+            value = expression.evaluate(variables=VARIABLES, fill_length=4)
+            same_value = same_expression.evaluate(variables=VARIABLES, fill_length=4)
+
+        np.testing.assert_equal(value, same_value)
+        assert context.statistics.expressions_evaluated == 1
+        assert context.statistics.expressions_reused == 1
+
+    def test_subexpressions_are_shared(self):
+        expressions = [
+            Expression.setup_from_expression("(SIM1;A {+} SIM1;B) {*} 2"),
+            Expression.setup_from_expression("(SIM1;A {+} SIM1;B) > 0"),
+        ]
+        context = ExpressionEvaluationContext()
+        with use_evaluation_context(context):
+            values = [expression.evaluate(variables=VARIABLES, fill_length=4) for expression in expressions]
+
+        expected = [expression.evaluate(variables=VARIABLES, fill_length=4) for expression in expressions]
+        for value, expected_value in zip(values, expected):
+            assert value.tobytes() == expected_value.tobytes()
+        assert context.statistics.expressions_evaluated == 2
+        assert context.statistics.subexpressions_evaluated == 1
+        assert context.statistics.subexpressions_reused == 1
+
+    def test_changing_result_does_not_change_memoised_result(self):
+        expression = Expression.setup_from_expression("SIM1;A {*} 2")
+        with use_evaluation_context(ExpressionEvaluationContext()):
+            value = expression.evaluate(variables=VARIABLES, fill_length=4)
+            value[0] = 100
+            np.testing.assert_equal(expression.evaluate(variables=VARIABLES, fill_length=4), [2.0, 0.0, -5.0, 6.0])
+
+    def test_different_variables_are_not_shared(self):
+        expression = Expression.setup_from_expression("SIM1;A")
+        context = ExpressionEvaluationContext()
+        with use_evaluation_context(context):
+            value = expression.evaluate(variables=VARIABLES, fill_length=4)
+            other_value = expression.evaluate(variables={"SIM1;A": [5.0, 6.0, 7.0, 8.0]}, fill_length=4)
+
+        np.testing.assert_equal(value, VARIABLES["SIM1;A"])
+        np.testing.assert_equal(other_value, [5.0, 6.0, 7.0, 8.0])
+        assert context.statistics.expressions_reused == 0
+
+    def test_subsets_are_reused(self):
+        variables_map = VariablesMap(
+            time_vector=[datetime(2020, 1, 1), datetime(2021, 1, 1), datetime(2022, 1, 1), datetime(2023, 1, 1)],
+            variables=VARIABLES,
+        )
+        context = ExpressionEvaluationContext()
+        with use_evaluation_context(context):
+            subset = variables_map.get_subset(1, 3)
+            assert variables_map.get_subset(1, 3) is subset
+            assert variables_map.get_subset(0, 3) is not subset
+
+        assert variables_map.get_subset(1, 3) is not subset
+        assert subset.time_vector == variables_map.time_vector[1:3]
+        assert context.statistics.subsets_created == 2
+        assert context.statistics.subsets_reused == 1
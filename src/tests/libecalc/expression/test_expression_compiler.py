@@ -0,0 +1,127 @@
+import re
+import time
+from typing import Any, Dict, List
+
+import numpy as np
+import pytest
+from pydantic import BaseModel
+
+from libecalc.common.logger import logger
+from libecalc.expression import Expression
+from libecalc.expression.expression import InvalidExpressionError
+from libecalc.expression.expression_evaluator import Token, TokenTag, eval_tokens
+
+
+def evaluate_with_token_evaluator(
+    expression: Expression, variables: Dict[str, List[float]], fill_length: int
+) -> np.ndarray:
+    tokens = [
+        Token(tag=TokenTag.numeric, value=np.asarray(variables.get(token.value)))
+        if token.tag == TokenTag.reference
+        else token
+        for token in expression.tokens
+    ]
+    return eval_tokens(tokens=tokens, array_length=fill_length)
+
+
+def assert_identical(values: np.ndarray, expected: np.ndarray):
+    assert type(values) is type(expected)
+    assert values.dtype == expected.dtype
+    assert values.shape == expected.shape
+    assert values.tobytes() == expected.tobytes()
+
+
+def get_expressions(value: Any) -> List[Expression]:
+    """Find all expressions in a DTO."""
+    if isinstance(value, Expression):
+        return [value]
+    if isinstance(value, BaseModel):
+        return [expression for field in value.__dict__.values() for expression in get_expressions(field)]
+    if isinstance(value, dict):
+        return [expression for item in value.values() for expression in get_expressions(item)]
+    if isinstance(value, (list, tuple)):
+        return [expression for item in value for expression in get_expressions(item)]
+    return []
+
+
+VARIABLES = {
+    "SIM1;A": [1.0, 0.0, -2.5, np.nan, np.inf, 1e-300, 3.0],
+    "SIM1;B": [2.0, 0.0, 0.0, 1.0, -np.inf, 1e300, -3.0],
+    "$var.c": [0.5, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+}
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "SIM1;A",
+        "SIM1;A {+} SIM1;B {-} 2 {*} $var.c",
+        "SIM1;A {/} SIM1;B",
+        "1 {/} SIM1;A {*} SIM1;B {/} $var.c",
+        "SIM1;A {^} 2",
+        "2 {^} SIM1;B",
+        "(SIM1;A > 0) {*} (SIM1;B <= 1) {+} ($var.c == 2)",
+        "((SIM1;A {+} 1) {*} (SIM1;B {-} 1)) {/} (2 {^} 3 {-} $var.c)",
+        "{-} SIM1;A",
+        "SIM1;A {-} (2 > 1) {*} 1e-05",
+        "3 {*} 0.5 {-} SIM1;A {^} 0.5",
+        "(1 {+} 2) {*} (3 > 2) {+} $var.c",
+        "2 {+} 3",
+        "(4 > 3) {*} 1e-05",
+        "SIM1;A SIM1;B",
+        "SIM1;A != 2",
+    ],
+)
+def test_compiled_expression_gives_identical_results(expression):
+    expression = Expression.setup_from_expression(expression)
+    fill_length = len(VARIABLES["$var.c"])
+
+    try:
+        expected = evaluate_with_token_evaluator(expression, VARIABLES, fill_length)
+    except (KeyError, ValueError) as e:
+        with pytest.raises(InvalidExpressionError, match=re.escape(str(e))):
+            expression.evaluate(variables=VARIABLES, fill_length=fill_length)
+        return
+
+    assert_identical(expression.evaluate(variables=VARIABLES, fill_length=fill_length), expected)
+
+
+def test_single_timestep_is_evaluated_as_numbers():
+    expression = Expression.setup_from_expression("(SIM1;A > 0) {*} 1e-05")
+    variables = {"SIM1;A": [2.0]}
+
+    assert_identical(
+        expression.evaluate(variables=variables, fill_length=1),
+        evaluate_with_token_evaluator(expression, variables, fill_length=1),
+    )
+
+
+@pytest.mark.parametrize(
+    "dto_case_fixture",
+    ["all_energy_usage_models_dto", "consumer_system_v2_dto_fixture"],
+)
+def test_benchmark_fixture_expressions(dto_case_fixture, request):
+    """Compare the compiled expressions with the token evaluator for all expressions in the fixtures."""
+    dto_case = request.getfixturevalue(dto_case_fixture)
+    variables = dto_case.variables.variables
+    fill_length = len(dto_case.variables.time_vector)
+    expressions = get_expressions(dto_case.ecalc_model)
+    assert expressions
+
+    repeats = 20
+    start = time.perf_counter()
+    for _ in range(repeats):
+        expected = [evaluate_with_token_evaluator(expression, variables, fill_length) for expression in expressions]
+    token_evaluator_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        values = [expression.evaluate(variables=variables, fill_length=fill_length) for expression in expressions]
+    compiled_seconds = time.perf_counter() - start
+
+    logger.info(
+        f"Evaluated {len(expressions)} expressions {repeats} times: token evaluator {token_evaluator_seconds:.3f}s,"
+        f" compiled {compiled_seconds:.3f}s"
+    )
+    for value, expected_value in zip(values, expected):
+        assert_identical(value, expected_value)
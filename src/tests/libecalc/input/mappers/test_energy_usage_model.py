@@ -128,6 +128,12 @@ pump_system = (
     ),
 )
 
+pump_system_priority_cascade = (
+    pump_system[0] + "PRIORITY_CASCADE: True\n",
+    pump_system[1].model_copy(update={"priority_cascade": True}),
+    pump_system[2],
+)
+
 direct = (
     """
 TYPE: DIRECT
@@ -145,7 +151,9 @@ CONDITION: SIM2;GAS_LIFT > 0
 
 
 class TestEnergyUsageModelMapper:
-    @pytest.mark.parametrize("yaml_text,expected_model_dto,references", [pump_system, direct])
+    @pytest.mark.parametrize(
+        "yaml_text,expected_model_dto,references", [pump_system, pump_system_priority_cascade, direct]
+    )
     def test_energy_usage_model_valid(self, yaml_text, expected_model_dto, references):
         read_yaml = PyYamlYamlModel.read_yaml(ResourceStream(name="main.yaml", stream=io.StringIO(yaml_text)))
         model_dto = ConsumerFunctionMapper(
@@ -2,6 +2,7 @@ import math
 from datetime import datetime
 from typing import Dict, Optional
 
+import numpy as np
 import pytest
 
 from libecalc.dto import TimeSeriesType
@@ -13,7 +14,7 @@ from libecalc.presentation.yaml.mappers.variables_mapper.time_series_collection_
     TimeSeriesCollectionMapper,
 )
 from libecalc.presentation.yaml.validation_errors import DtoValidationError
-from libecalc.presentation.yaml.yaml_entities import Resource
+from libecalc.presentation.yaml.yaml_entities import ArrayResource, Resource
 from libecalc.presentation.yaml.yaml_keywords import EcalcYamlKeywords
 
 
@@ -244,6 +245,25 @@ class TestTimeSeries:
             datetime(2014, 1, 1),
         ]
 
+    def test_array_resource(self):
+        filename = "sim1.csv"
+        resources = {
+            filename: ArrayResource(
+                headers=["HEADER1", "DATE"],
+                columns=[np.array([1.5, 2.5, 3.5]), np.array([2013, 2012, 2014])],
+            )
+        }
+        timeseries_mapper = TimeSeriesCollectionMapper(resources=resources)
+        timeseries_dto = timeseries_mapper.from_yaml_to_dto(
+            _create_timeseries_data(typ=TimeSeriesType.DEFAULT, name="SIM1", file=filename)
+        )
+        assert timeseries_dto.time_vector == [
+            datetime(2012, 1, 1),
+            datetime(2013, 1, 1),
+            datetime(2014, 1, 1),
+        ]
+        assert timeseries_dto.columns == [[2.5, 1.5, 3.5]]
+
     @pytest.mark.parametrize(
         "header",
         ["COLUMN;1", "1", "*A", "~ABC", "A?A", "A)A", "A£", "A $", "C*", "A!A"],
@@ -10,6 +10,7 @@ from libecalc.presentation.yaml.mappers.variables_mapper.time_series_collection
 )
 from libecalc.presentation.yaml.mappers.variables_mapper.timeseries_utils import (
     _get_end_boundary,
+    fit_time_series_collection_to_time_vector,
     fit_time_series_to_time_vector,
     get_global_time_vector,
 )
@@ -231,6 +232,45 @@ class TestGetGlobalTimeVector:
         assert "No time series found" in str(exc_info.value)
 
 
+class TestFitTimeSeriesCollectionToTimeVector:
+    @pytest.mark.parametrize(
+        "interpolation_type", [InterpolationType.LINEAR, InterpolationType.RIGHT, InterpolationType.LEFT]
+    )
+    @pytest.mark.parametrize("extrapolate_outside_defined_time_interval", [True, False])
+    def test_same_as_each_time_series(self, interpolation_type, extrapolate_outside_defined_time_interval):
+        time_series_collection = MiscellaneousTimeSeriesCollection(
+            name="test",
+            headers=["COL1_RATE", "COL2"],
+            columns=[[1, 2, 3, 4], [2, 4, 6, 8]],
+            time_vector=[datetime(2010, 1, 1), datetime(2011, 1, 1), datetime(2012, 1, 1), datetime(2013, 1, 1)],
+            interpolation_type=interpolation_type,
+            extrapolate_outside_defined_time_interval=extrapolate_outside_defined_time_interval,
+        )
+        time_vector = [
+            datetime(2009, 1, 1),
+            datetime(2010, 1, 1),
+            datetime(2011, 6, 1),
+            datetime(2012, 1, 1),
+            datetime(2012, 7, 1),
+            datetime(2014, 1, 1),
+        ]
+
+        fitted_time_series = fit_time_series_collection_to_time_vector(
+            time_series_collection=time_series_collection, time_vector=time_vector
+        )
+
+        assert fitted_time_series == {
+            time_series.reference_id: fit_time_series_to_time_vector(
+                time_series=time_series,
+                time_vector=time_vector,
+                extrapolate_outside_defined_time_interval=extrapolate_outside_defined_time_interval,
+                interpolation_type=interpolation_type,
+            )
+            for time_series in time_series_collection.time_series
+        }
+        assert list(fitted_time_series) == ["test;COL1_RATE", "test;COL2"]
+
+
 class TestFitTimeSeriesToTimeVector:
     def test_interpolate_linear(self, miscellaneous_time_series_collection_yearly):
         time_series = miscellaneous_time_series_collection_yearly.time_series
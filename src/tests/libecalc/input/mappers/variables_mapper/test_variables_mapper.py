@@ -29,6 +29,36 @@ class TestEvaluateVariables:
             "references are SIM1;TEST, SIM2;TEST, SIM3;TEST"
         )
 
+    def test_unsolvable_through_other_variable(self):
+        with pytest.raises(ValueError) as exc_info:
+            _evaluate_variables(
+                variables={
+                    "test_id": YamlSingleVariable(value=Expression.setup_from_expression("$var.test_id1 {*} 2")),
+                    "test_id1": YamlSingleVariable(value=Expression.setup_from_expression("SIM1;TEST")),
+                    "test_id2": YamlSingleVariable(value=Expression.setup_from_expression("SIM2;TEST")),
+                },
+                variables_map=VariablesMap(variables={"SIM2;TEST": [1]}, time_vector=[datetime(2010, 1, 1)]),
+            )
+        assert str(exc_info.value) == (
+            "Could not evaluate all variables, unable to resolve references in "
+            "$var.test_id, $var.test_id1. Missing references are $var.test_id1, SIM1;TEST"
+        )
+
+    def test_circular_references(self):
+        with pytest.raises(ValueError) as exc_info:
+            _evaluate_variables(
+                variables={
+                    "VAR1": YamlSingleVariable(value=Expression.setup_from_expression("$var.VAR2 {*} 2")),
+                    "VAR2": YamlSingleVariable(value=Expression.setup_from_expression("$var.VAR1 {+} SIM1;TEST")),
+                    "VAR3": YamlSingleVariable(value=Expression.setup_from_expression("SIM1;TEST")),
+                },
+                variables_map=VariablesMap(variables={"SIM1;TEST": [1]}, time_vector=[datetime(2010, 1, 1)]),
+            )
+        assert str(exc_info.value) == (
+            "Could not evaluate all variables, circular references between variables: "
+            "$var.VAR1 -> $var.VAR2 -> $var.VAR1"
+        )
+
     def test_two_layers(self):
         variables_map = VariablesMap(
             variables={"SIM1;TEST": [2, 4]},
@@ -98,3 +128,29 @@ class TestVariableProcessor:
             },
         )
         assert processor.process(variables={}, time_vector=time_vector) == [2.0, 2.0, 2.0]
+
+    def test_process_time_variable_with_references(self):
+        time_vector = [
+            datetime(2009, 1, 1),
+            datetime(2010, 1, 1),
+            datetime(2011, 1, 1),
+            datetime(2012, 1, 1),
+            datetime(2015, 1, 1),
+            datetime(2016, 1, 1),
+        ]
+        processor = VariableProcessor(
+            reference_id="$var.test",
+            variable={
+                datetime(2015, 1, 1): YamlSingleVariable(value=Expression.setup_from_expression("SIM1;TEST {/} 2")),
+                datetime(2010, 1, 1): YamlSingleVariable(value=Expression.setup_from_expression("SIM1;TEST {*} 2")),
+                datetime(2012, 1, 1): YamlSingleVariable(value=Expression.setup_from_expression("SIM1;TEST > 3")),
+            },
+        )
+        assert processor.process(variables={"SIM1;TEST": [1, 2, 3, 4, 5, 6]}, time_vector=time_vector) == [
+            0.0,
+            4.0,
+            6.0,
+            1.0,
+            2.5,
+            3.0,
+        ]
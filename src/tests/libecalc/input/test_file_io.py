@@ -1,9 +1,13 @@
 import io
 import math
+import sys
+from datetime import datetime
 from io import StringIO
 from pathlib import Path
 from typing import IO
+from unittest.mock import patch
 
+import numpy as np
 import pytest
 
 from libecalc.common.errors.exceptions import EcalcError, InvalidResourceHeaderException
@@ -118,6 +122,18 @@ def tmp_path_fixture(tmp_path: Path) -> Path:
 
 
 class TestReadFacilityResource:
+    def test_columns_as_arrays(self, tmp_path_fixture):
+        resource = file_io.read_facility_resource(
+            create_csv_from_line(tmp_path_fixture, "POWER, FUEL\n1, 0.5\n2, 1.5\n")
+        )
+
+        assert isinstance(resource, yaml_entities.ArrayResource)
+        assert resource.headers == ["POWER", "FUEL"]
+        assert resource.get_column("POWER").dtype == np.int64
+        assert resource.get_column("FUEL").dtype == np.float64
+        np.testing.assert_equal(resource.get_column("FUEL"), [0.5, 1.5])
+        assert resource.data == [[1, 2], [0.5, 1.5]]
+
     def test_no_nans(self, facility_resource_missing_value_file):
         with pytest.raises(ValueError) as exc:
             file_io.read_facility_resource(facility_resource_missing_value_file)
@@ -169,6 +185,97 @@ class TestReadFacilityResource:
         )
 
 
+def write_arrow_file(path: Path, columns: dict) -> Path:
+    pyarrow = pytest.importorskip("pyarrow")
+    table = pyarrow.table(columns)
+    if path.suffix == ".parquet":
+        import pyarrow.parquet
+
+        pyarrow.parquet.write_table(table, path)
+    else:
+        import pyarrow.feather
+
+        pyarrow.feather.write_feather(table, path, compression="uncompressed")
+    return path
+
+
+class TestReadArrowResource:
+    @pytest.mark.parametrize("file_name", ["facility.arrow", "facility.feather", "facility.parquet"])
+    def test_read_facility_resource(self, tmp_path, file_name):
+        csv_resource = file_io.read_facility_resource(
+            create_csv_from_line(tmp_path, "POWER, FUEL, NAME\n1, 0.5, a\n2, 1.5, b\n")
+        )
+        resource = file_io.read_facility_resource(
+            write_arrow_file(tmp_path / file_name, {" POWER": [1, 2], "FUEL": [0.5, 1.5], "NAME": ["a", "b"]})
+        )
+
+        assert isinstance(resource, yaml_entities.ArrayResource)
+        assert resource.headers == csv_resource.headers
+        for header in resource.headers:
+            assert resource.get_column(header).dtype == csv_resource.get_column(header).dtype
+        assert resource.data == csv_resource.data
+
+    def test_no_nans(self, tmp_path):
+        facility_file = write_arrow_file(tmp_path / "facility.arrow", {"POWER": [1.0, 2.0], "FUEL": [1.0, None]})
+
+        with pytest.raises(ValueError) as exc:
+            file_io.read_facility_resource(facility_file)
+        assert (
+            str(exc.value)
+            == "csv file contains invalid data at row 2, all headers must be associated with a valid column value"
+        )
+
+    def test_invalid_headers(self, tmp_path):
+        with pytest.raises(ValueError) as exc:
+            file_io.read_facility_resource(write_arrow_file(tmp_path / "facility.arrow", {"POWER @": [1.0]}))
+        assert str(exc.value).startswith("Each header value must start with a letter")
+
+    def test_unsupported_column_type(self, tmp_path):
+        with pytest.raises(ValueError) as exc:
+            file_io.read_facility_resource(write_arrow_file(tmp_path / "facility.arrow", {"POWER": [[1.0], [2.0]]}))
+        assert str(exc.value).startswith("Column 'POWER' has unsupported type 'list<item: double>'")
+
+    def test_read_timeseries_resource(self, tmp_path):
+        timeseries_file = write_arrow_file(
+            tmp_path / "timeseries.parquet",
+            {
+                "DATE": [datetime(2019, 1, 1), None, datetime(2020, 1, 1)],
+                "OIL_PROD": [1, None, None],
+                "EMPTY": [None, None, None],
+            },
+        )
+
+        resource = file_io.read_timeseries_resource(
+            resource_input=timeseries_file, timeseries_type=YamlTimeseriesType.DEFAULT
+        )
+
+        assert resource.headers == ["DATE", "OIL_PROD"]
+        assert resource.data[0] == [datetime(2019, 1, 1), datetime(2020, 1, 1)]
+        assert resource.data[1][0] == 1
+        assert math.isnan(resource.data[1][1])
+
+    def test_columns_are_not_copied(self, tmp_path):
+        pyarrow = pytest.importorskip("pyarrow")
+        resource = file_io.read_facility_resource(
+            write_arrow_file(tmp_path / "facility.arrow", {"POWER": [1.0, 2.0], "FUEL": [0.5, 1.5]})
+        )
+
+        fuel = resource.get_column("FUEL")
+        assert not fuel.flags.owndata
+        np.testing.assert_equal(fuel, pyarrow.array([0.5, 1.5]).to_numpy())
+
+    def test_pyarrow_not_installed(self, tmp_path):
+        facility_file = tmp_path / "facility.parquet"
+        facility_file.touch()
+
+        with patch.dict(sys.modules, {"pyarrow": None}), pytest.raises(ValueError) as exc:
+            file_io.read_facility_resource(facility_file)
+        assert str(exc.value) == (
+            "Reading 'facility.parquet' requires pyarrow, which is not installed. "
+            "Install it with 'pip install libecalc[arrow]'."
+        )
+
+
 @pytest.fixture
 def yaml_resource():
     return yaml_entities.ResourceStream(
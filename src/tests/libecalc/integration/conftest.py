@@ -0,0 +1,179 @@
+from datetime import datetime
+from typing import Dict, List, Union
+
+import numpy as np
+import pytest
+
+from libecalc import dto
+from libecalc.common.units import Unit
+from libecalc.common.utils.rates import RateType
+from libecalc.core.result import EcalcModelResult
+from libecalc.dto.base import ComponentType, ConsumerUserDefinedCategoryType, InstallationUserDefinedCategoryType
+from libecalc.dto.components import ExpressionStreamConditions, ExpressionTimeSeries, SystemComponentConditions
+from libecalc.dto.types import ConsumptionType, EnergyUsageType, FluidStreamType
+from libecalc.expression import Expression
+
+START = datetime(2022, 1, 1)
+REGULARITY = {START: Expression.setup_from_expression(1)}
+
+
+@pytest.fixture
+def compressor_train_with_mixing_streams_dto(
+    rich_fluid_dto, medium_fluid_dto, predefined_variable_speed_compressor_chart_dto
+) -> dto.CompressorWithTurbine:
+    """
+    Train where rich gas is compressed in the first stage, partly exported and mixed with medium gas before the second
+    stage. The train keeps the fluid entering each stage, to recirculate it when the rate to the stage is zero.
+    """
+    stage = dto.MultipleStreamsCompressorStage(
+        compressor_chart=predefined_variable_speed_compressor_chart_dto,
+        inlet_temperature_kelvin=303.15,
+        remove_liquid_after_cooling=True,
+        pressure_drop_before_stage=0,
+        control_margin=0,
+    )
+    return dto.CompressorWithTurbine(
+        compressor_train=dto.VariableSpeedCompressorTrainMultipleStreamsAndPressures(
+            streams=[
+                dto.MultipleStreamsAndPressureStream(
+                    name="rich", typ=FluidStreamType.INGOING, fluid_model=rich_fluid_dto
+                ),
+                dto.MultipleStreamsAndPressureStream(name="export", typ=FluidStreamType.OUTGOING),
+                dto.MultipleStreamsAndPressureStream(
+                    name="medium", typ=FluidStreamType.INGOING, fluid_model=medium_fluid_dto
+                ),
+            ],
+            stages=[
+                stage.model_copy(update={"stream_reference": ["rich"]}),
+                stage.model_copy(update={"stream_reference": ["export", "medium"]}),
+            ],
+            calculate_max_rate=False,
+            energy_usage_adjustment_constant=0.0,
+            energy_usage_adjustment_factor=1.0,
+            pressure_control=dto.types.FixedSpeedPressureControl.DOWNSTREAM_CHOKE,
+        ),
+        turbine=dto.Turbine(
+            lower_heating_value=38,
+            turbine_loads=[0, 2.352, 4.589, 6.853, 9.125, 11.399, 13.673, 15.947, 18.223, 20.496, 22.767],
+            turbine_efficiency_fractions=[0, 0.138, 0.21, 0.255, 0.286, 0.31, 0.328, 0.342, 0.353, 0.36, 0.362],
+            energy_usage_adjustment_constant=0,
+            energy_usage_adjustment_factor=1,
+        ),
+        energy_usage_adjustment_constant=0,
+        energy_usage_adjustment_factor=1,
+    )
+
+
+def _stream_conditions(rate: str) -> ExpressionStreamConditions:
+    return ExpressionStreamConditions(
+        rate=ExpressionTimeSeries(value=rate, unit=Unit.STANDARD_CUBIC_METER_PER_DAY, type=RateType.STREAM_DAY),
+        pressure=ExpressionTimeSeries(value=30, unit=Unit.BARA),
+    )
+
+
+@pytest.fixture
+def fuel_consumer_with_mixing_streams_dto(compressor_train_with_mixing_streams_dto, fuel_gas) -> dto.FuelConsumer:
+    """Compressor with mixing streams, with the rates of the streams given by SIM;RICH, SIM;EXPORT and SIM;MEDIUM."""
+    return dto.FuelConsumer(
+        name="compressor",
+        component_type=ComponentType.COMPRESSOR,
+        user_defined_category={START: ConsumerUserDefinedCategoryType.COMPRESSOR},
+        regularity=REGULARITY,
+        fuel=fuel_gas,
+        energy_usage_model={
+            START: dto.CompressorConsumerFunction(
+                energy_usage_type=EnergyUsageType.FUEL,
+                model=compressor_train_with_mixing_streams_dto,
+                rate_standard_m3_day=[
+                    Expression.setup_from_expression(rate) for rate in ["SIM;RICH", "SIM;EXPORT", "SIM;MEDIUM"]
+                ],
+                suction_pressure=Expression.setup_from_expression(30),
+                discharge_pressure=Expression.setup_from_expression(150),
+            )
+        },
+    )
+
+
+@pytest.fixture
+def consumer_system_v2_with_mixing_streams_dto(
+    compressor_train_with_mixing_streams_dto, fuel_gas
+) -> dto.components.ConsumerSystem:
+    """
+    Consumer system v2 with a compressor with mixing streams, with the rates of the streams given by SIM;RICH,
+    SIM;EXPORT and SIM;MEDIUM. The rich gas rate is doubled in the second priority.
+    """
+    return dto.components.ConsumerSystem(
+        name="compressor_system_v2",
+        user_defined_category={START: ConsumerUserDefinedCategoryType.COMPRESSOR},
+        regularity=REGULARITY,
+        consumes=ConsumptionType.FUEL,
+        fuel=fuel_gas,
+        component_conditions=SystemComponentConditions(crossover=[]),
+        stream_conditions_priorities={
+            priority: {
+                "compressor1": {
+                    "rich": _stream_conditions(rich_rate),
+                    "export": _stream_conditions("SIM;EXPORT"),
+                    "medium": _stream_conditions("SIM;MEDIUM"),
+                    "outlet": ExpressionStreamConditions(pressure=ExpressionTimeSeries(value=150, unit=Unit.BARA)),
+                },
+            }
+            for priority, rich_rate in [("pri1", "SIM;RICH"), ("pri2", "SIM;RICH {*} 2")]
+        },
+        consumers=[
+            dto.components.CompressorComponent(
+                name="compressor1",
+                user_defined_category={START: ConsumerUserDefinedCategoryType.COMPRESSOR},
+                regularity=REGULARITY,
+                consumes=ConsumptionType.FUEL,
+                fuel=fuel_gas,
+                energy_usage_model={START: compressor_train_with_mixing_streams_dto},
+            ),
+        ],
+    )
+
+
+@pytest.fixture
+def asset_dto_factory():
+    def asset_dto(*fuel_consumers: Union[dto.FuelConsumer, dto.components.ConsumerSystem]) -> dto.Asset:
+        return dto.Asset(
+            name="asset",
+            installations=[
+                dto.Installation(
+                    name="installation",
+                    regularity=REGULARITY,
+                    hydrocarbon_export={START: Expression.setup_from_expression(0)},
+                    user_defined_category=InstallationUserDefinedCategoryType.FIXED,
+                    fuel_consumers=list(fuel_consumers),
+                )
+            ],
+        )
+
+    return asset_dto
+
+
+@pytest.fixture
+def mixing_streams_variables_factory():
+    def mixing_streams_variables(rich: List[float], export: List[float], medium: List[float]) -> dto.VariablesMap:
+        """Yearly variables for the rates of the streams of the compressor with mixing streams, starting in 2022."""
+        return dto.VariablesMap(
+            time_vector=[datetime(START.year + index, 1, 1) for index in range(len(rich))],
+            variables={"SIM;RICH": rich, "SIM;EXPORT": export, "SIM;MEDIUM": medium},
+        )
+
+    return mixing_streams_variables
+
+
+@pytest.fixture
+def assert_same_consumer_results():
+    def assert_same_consumer_results(
+        consumer_results: Dict[str, EcalcModelResult], expected_consumer_results: Dict[str, EcalcModelResult]
+    ):
+        """Assert that the results of each component are equal, and in the same order, treating NaN as equal."""
+        assert list(consumer_results.keys()) == list(expected_consumer_results.keys())
+        np.testing.assert_equal(
+            {component_id: result.model_dump() for component_id, result in consumer_results.items()},
+            {component_id: result.model_dump() for component_id, result in expected_consumer_results.items()},
+        )
+
+    return assert_same_consumer_results
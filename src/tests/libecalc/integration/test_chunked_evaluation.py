@@ -0,0 +1,151 @@
+import numpy as np
+import pytest
+
+from libecalc.application.chunked_evaluation import (
+    TIME_VECTOR_FILENAME,
+    ColumnarResultStore,
+    evaluate_in_chunks,
+)
+from libecalc.application.energy_calculator import EnergyCalculator
+
+
+@pytest.fixture
+def assert_same_results_as_evaluating_all_timesteps():
+    def assert_same_results_as_evaluating_all_timesteps(store: ColumnarResultStore, graph, variables_map):
+        energy_calculator = EnergyCalculator(graph=graph)
+        consumer_results = energy_calculator.evaluate_energy_usage(variables_map)
+        emission_results = energy_calculator.evaluate_emissions(
+            variables_map=variables_map, consumer_results=consumer_results
+        )
+
+        assert store.time_vector == variables_map.time_vector
+        for component_id, consumer_result in consumer_results.items():
+            for attribute in ["energy_usage", "power", "is_valid"]:
+                expected = getattr(consumer_result.component_result, attribute)
+                if expected is None:
+                    continue
+                time_series = store.read_time_series(component_id, attribute)
+                assert type(time_series) is type(expected)
+                assert time_series.unit == expected.unit
+                np.testing.assert_equal(time_series.values, expected.values)
+
+        for component_id, emissions in emission_results.items():
+            for emission_name, emission_result in emissions.items():
+                np.testing.assert_equal(
+                    store.read_values(component_id, "rate", emission_name),
+                    emission_result.rate.values,
+                )
+
+    return assert_same_results_as_evaluating_all_timesteps
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 10])
+def test_chunked_evaluation_equals_evaluating_all_timesteps(
+    chunk_size, tmp_path, consumer_system_v2_dto_fixture, assert_same_results_as_evaluating_all_timesteps
+):
+    graph = consumer_system_v2_dto_fixture.ecalc_model.get_graph()
+    variables_map = consumer_system_v2_dto_fixture.variables
+
+    store = evaluate_in_chunks(
+        energy_calculator=EnergyCalculator(graph=graph),
+        variables_map=variables_map,
+        chunk_size=chunk_size,
+        store=ColumnarResultStore(tmp_path),
+    )
+
+    assert_same_results_as_evaluating_all_timesteps(store, graph, variables_map)
+
+
+def test_reopen_store(tmp_path, consumer_system_v2_dto_fixture):
+    evaluate_in_chunks(
+        energy_calculator=EnergyCalculator(graph=consumer_system_v2_dto_fixture.ecalc_model.get_graph()),
+        variables_map=consumer_system_v2_dto_fixture.variables,
+        chunk_size=2,
+        store=ColumnarResultStore(tmp_path),
+    )
+
+    store = ColumnarResultStore.open(tmp_path)
+
+    assert "compressor_system_v2/energy_usage" in store.columns
+    assert len(store.read_values("compressor_system_v2", "energy_usage")) == len(
+        consumer_system_v2_dto_fixture.variables.time_vector
+    )
+
+
+def test_directory_with_results_is_not_overwritten(tmp_path, consumer_system_v2_dto_fixture):
+    evaluate_in_chunks(
+        energy_calculator=EnergyCalculator(graph=consumer_system_v2_dto_fixture.ecalc_model.get_graph()),
+        variables_map=consumer_system_v2_dto_fixture.variables,
+        chunk_size=2,
+        store=ColumnarResultStore(tmp_path),
+    )
+
+    with pytest.raises(ValueError, match="the directory is not empty"):
+        ColumnarResultStore(tmp_path)
+
+
+def test_resume_interrupted_evaluation(
+    tmp_path, consumer_system_v2_dto_fixture, assert_same_results_as_evaluating_all_timesteps
+):
+    graph = consumer_system_v2_dto_fixture.ecalc_model.get_graph()
+    variables_map = consumer_system_v2_dto_fixture.variables
+    evaluate_in_chunks(
+        energy_calculator=EnergyCalculator(graph=graph),
+        variables_map=variables_map.get_subset(start_index=0, end_index=4),
+        chunk_size=2,
+        store=ColumnarResultStore(tmp_path),
+    )
+    # Interrupted while storing the next chunk, after storing some of the values
+    with open(tmp_path / "0.bin", "ab") as column_file:
+        np.asarray([1.0, 2.0]).tofile(column_file)
+
+    store = evaluate_in_chunks(
+        energy_calculator=EnergyCalculator(graph=graph),
+        variables_map=variables_map,
+        chunk_size=2,
+        store=ColumnarResultStore(tmp_path, resume=True),
+    )
+
+    assert_same_results_as_evaluating_all_timesteps(store, graph, variables_map)
+
+
+def test_resume_with_another_time_vector(tmp_path, consumer_system_v2_dto_fixture):
+    variables_map = consumer_system_v2_dto_fixture.variables
+    energy_calculator = EnergyCalculator(graph=consumer_system_v2_dto_fixture.ecalc_model.get_graph())
+    evaluate_in_chunks(
+        energy_calculator=energy_calculator,
+        variables_map=variables_map.get_subset(start_index=1, end_index=3),
+        chunk_size=2,
+        store=ColumnarResultStore(tmp_path),
+    )
+
+    with pytest.raises(ValueError, match="another time vector"):
+        evaluate_in_chunks(
+            energy_calculator=energy_calculator,
+            variables_map=variables_map,
+            chunk_size=2,
+            store=ColumnarResultStore(tmp_path, resume=True),
+        )
+    assert (tmp_path / TIME_VECTOR_FILENAME).exists()
+
+
+def test_state_is_not_kept_between_chunks(
+    tmp_path, fuel_consumer_with_mixing_streams_dto, asset_dto_factory, mixing_streams_variables_factory, caplog
+):
+    """
+    The train keeps the fluid entering each stage, and recirculates it when there is no flow into a stage. Evaluating
+    all timesteps at once, the fluid from the first timestep is recirculated in the second. Evaluated in chunks of one
+    timestep, there is no fluid to recirculate in the second chunk.
+    """
+    graph = asset_dto_factory(fuel_consumer_with_mixing_streams_dto).get_graph()
+    variables_map = mixing_streams_variables_factory([3000000, 3000000], [1000000, 3000000], [1000000, 0])
+    EnergyCalculator(graph=graph).evaluate_energy_usage(variables_map)
+
+    with pytest.raises(ValueError, match="without defining which composition"):
+        evaluate_in_chunks(
+            energy_calculator=EnergyCalculator(graph=graph),
+            variables_map=variables_map,
+            chunk_size=1,
+            store=ColumnarResultStore(tmp_path),
+        )
+    assert f"The components {fuel_consumer_with_mixing_streams_dto.id} keep state between timesteps" in caplog.text
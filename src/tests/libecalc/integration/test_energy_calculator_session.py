@@ -0,0 +1,142 @@
+import numpy as np
+import pytest
+
+from libecalc import dto
+from libecalc.application.energy_calculator import EnergyCalculator
+from libecalc.application.energy_calculator_session import EnergyCalculatorSession
+from libecalc.dto.component_graph import ComponentGraph
+from libecalc.dto.utils.referenced_variables import get_referenced_variables
+from libecalc.expression import Expression
+from libecalc.fixtures import consumer_system_v2_dto
+
+
+@pytest.fixture
+def assert_same_results_as_full_evaluation(assert_same_consumer_results):
+    def assert_same_results_as_full_evaluation(
+        session: EnergyCalculatorSession, graph: ComponentGraph, variables_map: dto.VariablesMap
+    ):
+        energy_calculator = EnergyCalculator(graph=graph)
+        consumer_results = energy_calculator.evaluate_energy_usage(variables_map)
+        emission_results = energy_calculator.evaluate_emissions(
+            variables_map=variables_map, consumer_results=consumer_results
+        )
+
+        assert_same_consumer_results(session.consumer_results, consumer_results)
+        assert list(session.emission_results.keys()) == list(emission_results.keys())
+        np.testing.assert_equal(
+            {
+                component_id: {name: emission.model_dump() for name, emission in emissions.items()}
+                for component_id, emissions in session.emission_results.items()
+            },
+            {
+                component_id: {name: emission.model_dump() for name, emission in emissions.items()}
+                for component_id, emissions in emission_results.items()
+            },
+        )
+
+    return assert_same_results_as_full_evaluation
+
+
+class TestEnergyCalculatorSession:
+    def test_initial_results(self, consumer_system_v2_dto_fixture, assert_same_results_as_full_evaluation):
+        graph = consumer_system_v2_dto_fixture.ecalc_model.get_graph()
+        session = EnergyCalculatorSession(graph=graph, variables_map=consumer_system_v2_dto_fixture.variables)
+
+        assert_same_results_as_full_evaluation(session, graph, consumer_system_v2_dto_fixture.variables)
+
+    def test_changed_variable(self, consumer_system_v2_dto_fixture, assert_same_results_as_full_evaluation):
+        graph = consumer_system_v2_dto_fixture.ecalc_model.get_graph()
+        session = EnergyCalculatorSession(graph=graph, variables_map=consumer_system_v2_dto_fixture.variables)
+
+        changed_variables_map = consumer_system_v2_dto_fixture.variables.model_copy(
+            update={
+                "variables": {
+                    **consumer_system_v2_dto_fixture.variables.variables,
+                    "$var.compressor1": [
+                        value * 0.5 for value in consumer_system_v2_dto_fixture.variables.variables["$var.compressor1"]
+                    ],
+                }
+            }
+        )
+        evaluated_component_ids = session.update(variables_map=changed_variables_map)
+
+        assert {"compressor_system", "compressor_system_v2", "installation"} <= evaluated_component_ids
+        assert not {"GeneratorSet", "pump_system", "pump_system_v2"} & evaluated_component_ids
+        assert_same_results_as_full_evaluation(session, graph, changed_variables_map)
+
+    def test_changed_component(self, consumer_system_v2_dto_fixture, assert_same_results_as_full_evaluation):
+        graph = consumer_system_v2_dto_fixture.ecalc_model.get_graph()
+        session = EnergyCalculatorSession(graph=graph, variables_map=consumer_system_v2_dto_fixture.variables)
+
+        changed_graph = consumer_system_v2_dto().ecalc_model.get_graph()
+        pump_system = changed_graph.get_node("pump_system")
+        changed_graph.nodes["pump_system"] = pump_system.model_copy(
+            update={
+                "regularity": {period: Expression.setup_from_expression(0.5) for period in pump_system.regularity},
+            }
+        )
+        evaluated_component_ids = session.update(graph=changed_graph)
+
+        assert {"pump_system", "GeneratorSet", "installation"} <= evaluated_component_ids
+        assert not {"compressor_system", "compressor_system_v2", "pump_system_v2"} & evaluated_component_ids
+        assert_same_results_as_full_evaluation(session, changed_graph, consumer_system_v2_dto_fixture.variables)
+
+    def test_unchanged(self, consumer_system_v2_dto_fixture):
+        graph = consumer_system_v2_dto_fixture.ecalc_model.get_graph()
+        session = EnergyCalculatorSession(graph=graph, variables_map=consumer_system_v2_dto_fixture.variables)
+
+        assert session.update(graph=consumer_system_v2_dto().ecalc_model.get_graph()) == set()
+
+    def test_domain_models_of_unchanged_components_are_kept(self, consumer_system_v2_dto_fixture):
+        graph = consumer_system_v2_dto_fixture.ecalc_model.get_graph()
+        session = EnergyCalculatorSession(graph=graph, variables_map=consumer_system_v2_dto_fixture.variables)
+        energy_calculator = session._energy_calculator
+        domain_models = dict(energy_calculator._domain_models)
+
+        changed_graph = consumer_system_v2_dto().ecalc_model.get_graph()
+        pump_system = changed_graph.get_node("pump_system")
+        changed_graph.nodes["pump_system"] = pump_system.model_copy(
+            update={
+                "regularity": {period: Expression.setup_from_expression(0.5) for period in pump_system.regularity},
+            }
+        )
+        session.update(graph=changed_graph)
+
+        assert session._energy_calculator is energy_calculator
+        assert energy_calculator._domain_models["compressor_system"] is domain_models["compressor_system"]
+        assert energy_calculator._domain_models["pump_system"] is not domain_models["pump_system"]
+
+    def test_component_with_string_that_is_not_an_expression_reads_all_variables(self, consumer_system_v2_dto_fixture):
+        graph = consumer_system_v2_dto_fixture.ecalc_model.get_graph()
+        session = EnergyCalculatorSession(graph=graph, variables_map=consumer_system_v2_dto_fixture.variables)
+
+        changed_graph = consumer_system_v2_dto().ecalc_model.get_graph()
+        pump_system = changed_graph.get_node("pump_system")
+        changed_graph.nodes["pump_system"] = pump_system.model_copy(
+            update={
+                "energy_usage_model": {
+                    period: energy_usage_model.model_copy(
+                        update={
+                            "pumps": [
+                                pump.model_copy(update={"name": f"{pump.name} (A"}) for pump in energy_usage_model.pumps
+                            ]
+                        }
+                    )
+                    for period, energy_usage_model in pump_system.energy_usage_model.items()
+                }
+            }
+        )
+        session.update(graph=changed_graph)
+        changed_variables_map = consumer_system_v2_dto_fixture.variables.model_copy(
+            update={
+                "variables": {
+                    **consumer_system_v2_dto_fixture.variables.variables,
+                    "$var.compressor1": [
+                        value * 0.5 for value in consumer_system_v2_dto_fixture.variables.variables["$var.compressor1"]
+                    ],
+                }
+            }
+        )
+
+        assert get_referenced_variables(changed_graph.get_node("pump_system")) is None
+        assert "pump_system" in session.update(variables_map=changed_variables_map)
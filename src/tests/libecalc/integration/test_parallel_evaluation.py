@@ -0,0 +1,89 @@
+from unittest.mock import patch
+
+from libecalc import dto
+from libecalc.application import energy_calculator as energy_calculator_module
+from libecalc.application.energy_calculator import EnergyCalculator
+from libecalc.application.result_cache import ComponentResultCache
+
+
+class TestParallelEvaluation:
+    def test_same_results_as_serial_evaluation(self, consumer_system_v2_dto_fixture, assert_same_consumer_results):
+        graph = consumer_system_v2_dto_fixture.ecalc_model.get_graph()
+        variables_map = consumer_system_v2_dto_fixture.variables
+
+        expected = EnergyCalculator(graph=graph).evaluate_energy_usage(variables_map)
+        result = EnergyCalculator(graph=graph, max_workers=2).evaluate_energy_usage(variables_map)
+
+        # Same order of the results, independent of the order the subtrees finished in the workers
+        assert_same_consumer_results(result, expected)
+
+    def test_generator_sets_with_consumers(self, all_energy_usage_models_dto, assert_same_consumer_results):
+        graph = all_energy_usage_models_dto.ecalc_model.get_graph()
+        variables_map = all_energy_usage_models_dto.variables
+
+        expected = EnergyCalculator(graph=graph).evaluate_energy_usage(variables_map)
+        result = EnergyCalculator(graph=graph, max_workers=2).evaluate_energy_usage(variables_map)
+
+        assert_same_consumer_results(result, expected)
+
+    def test_generator_set_is_evaluated_with_its_consumers(self, all_energy_usage_models_dto):
+        graph = all_energy_usage_models_dto.ecalc_model.get_graph()
+        component_ids = list(reversed(graph.sorted_node_ids))
+
+        subtrees = EnergyCalculator(graph=graph)._get_independent_subtrees(component_ids)
+
+        (generator_set_id,) = (
+            component_id for component_id in component_ids if isinstance(graph.get_node(component_id), dto.GeneratorSet)
+        )
+        (generator_set_subtree,) = (subtree for subtree in subtrees if generator_set_id in subtree)
+        assert generator_set_subtree == [
+            component_id
+            for component_id in component_ids
+            if component_id in graph.get_successors(generator_set_id) or component_id == generator_set_id
+        ]
+        assert generator_set_subtree[-1] == generator_set_id
+        # The other consumers are evaluated independently, and components without results are not evaluated in a worker
+        assert all(len(subtree) == 1 for subtree in subtrees if subtree != generator_set_subtree)
+        assert sorted(component_id for subtree in subtrees for component_id in subtree) == sorted(
+            component_id
+            for component_id in component_ids
+            if isinstance(graph.get_node(component_id), energy_calculator_module.EVALUATED_COMPONENT_TYPES)
+        )
+
+    def test_graph_and_variables_are_sent_to_each_worker_once(self, all_energy_usage_models_dto):
+        graph = all_energy_usage_models_dto.ecalc_model.get_graph()
+        variables_map = all_energy_usage_models_dto.variables
+        energy_calculator = EnergyCalculator(graph=graph, max_workers=2)
+        component_ids = list(reversed(graph.sorted_node_ids))
+
+        with patch.object(energy_calculator_module, "ProcessPoolExecutor") as process_pool_executor:
+            executor = process_pool_executor.return_value.__enter__.return_value
+            executor.submit.side_effect = RuntimeError("Stop before waiting for the results")
+            try:
+                energy_calculator.evaluate_components(variables_map)
+            except RuntimeError:
+                pass
+
+        (_, pool_options) = process_pool_executor.call_args
+        assert pool_options["initargs"] == (graph, variables_map, True)
+        # One task for each subtree, where the largest subtree, with the generator set, is started first
+        (_, component_ids_to_evaluate, _), _ = executor.submit.call_args
+        assert len(component_ids_to_evaluate) == max(
+            len(subtree) for subtree in energy_calculator._get_independent_subtrees(component_ids)
+        )
+
+    def test_cached_subtrees_are_not_evaluated(
+        self, all_energy_usage_models_dto, tmp_path, assert_same_consumer_results
+    ):
+        graph = all_energy_usage_models_dto.ecalc_model.get_graph()
+        variables_map = all_energy_usage_models_dto.variables
+        expected = EnergyCalculator(
+            graph=graph, max_workers=2, result_cache=ComponentResultCache(tmp_path)
+        ).evaluate_energy_usage(variables_map)
+
+        energy_calculator = EnergyCalculator(graph=graph, max_workers=2, result_cache=ComponentResultCache(tmp_path))
+        with patch.object(energy_calculator_module, "ProcessPoolExecutor") as process_pool_executor:
+            result = energy_calculator.evaluate_energy_usage(variables_map)
+
+        process_pool_executor.assert_not_called()
+        assert_same_consumer_results(result, expected)
@@ -0,0 +1,145 @@
+import copy
+import os
+import pickle
+from pathlib import Path
+from typing import List, Set
+from unittest.mock import patch
+
+import pytest
+
+from libecalc.application import energy_calculator as energy_calculator_module
+from libecalc.application import result_cache as result_cache_module
+from libecalc.application.energy_calculator import EnergyCalculator
+from libecalc.application.result_cache import ComponentResultCache
+
+RESULT_SIZE = 1000
+
+
+def evaluate_and_record_evaluated_components(energy_calculator: EnergyCalculator, variables_map):
+    evaluated_component_ids: List[str] = []
+    evaluate_component = energy_calculator_module._evaluate_component
+
+    def record_component(component_dto, **kwargs):
+        evaluated_component_ids.append(component_dto.id)
+        return evaluate_component(component_dto=component_dto, **kwargs)
+
+    with patch.object(energy_calculator_module, "_evaluate_component", side_effect=record_component):
+        consumer_results = energy_calculator.evaluate_energy_usage(variables_map)
+    return consumer_results, evaluated_component_ids
+
+
+def put_result_of_size(cache: ComponentResultCache, key: str, last_used: int):
+    """Store a result of about RESULT_SIZE bytes, last used at the given time."""
+    cache.put(key, {"component": b"x" * RESULT_SIZE})
+    os.utime(cache._get_path(key), ns=(last_used, last_used))
+
+
+def get_stored_keys(directory) -> Set[str]:
+    return {result_file.stem for result_file in directory.glob("*.pickle")}
+
+
+class TestComponentResultCache:
+    def test_cached_results_are_reused(self, consumer_system_v2_dto_fixture, assert_same_consumer_results, tmp_path):
+        graph = consumer_system_v2_dto_fixture.ecalc_model.get_graph()
+        variables_map = consumer_system_v2_dto_fixture.variables
+
+        expected, _ = evaluate_and_record_evaluated_components(EnergyCalculator(graph=graph), variables_map)
+        first_run, first_run_evaluated = evaluate_and_record_evaluated_components(
+            EnergyCalculator(graph=graph, result_cache=ComponentResultCache(tmp_path)), variables_map
+        )
+        second_run, second_run_evaluated = evaluate_and_record_evaluated_components(
+            EnergyCalculator(
+                graph=copy.deepcopy(consumer_system_v2_dto_fixture.ecalc_model).get_graph(),
+                result_cache=ComponentResultCache(tmp_path),
+            ),
+            variables_map,
+        )
+
+        assert {"compressor_system", "compressor_system_v2", "GeneratorSet"} <= set(first_run_evaluated)
+        # Only the components without results, i.e. installation and asset, are evaluated again
+        assert not {"compressor_system", "compressor_system_v2", "GeneratorSet"} & set(second_run_evaluated)
+        assert_same_consumer_results(first_run, expected)
+        assert_same_consumer_results(second_run, expected)
+
+    def test_changed_variable(self, consumer_system_v2_dto_fixture, assert_same_consumer_results, tmp_path):
+        graph = consumer_system_v2_dto_fixture.ecalc_model.get_graph()
+        variables_map = consumer_system_v2_dto_fixture.variables
+        EnergyCalculator(graph=graph, result_cache=ComponentResultCache(tmp_path)).evaluate_energy_usage(variables_map)
+
+        changed_variables_map = variables_map.model_copy(
+            update={
+                "variables": {
+                    **variables_map.variables,
+                    "$var.compressor1": [value * 0.5 for value in variables_map.variables["$var.compressor1"]],
+                }
+            }
+        )
+        result, evaluated_component_ids = evaluate_and_record_evaluated_components(
+            EnergyCalculator(graph=graph, result_cache=ComponentResultCache(tmp_path)), changed_variables_map
+        )
+
+        assert {"compressor_system", "compressor_system_v2"} <= set(evaluated_component_ids)
+        assert not {"pump_system", "pump_system_v2", "GeneratorSet"} & set(evaluated_component_ids)
+        assert_same_consumer_results(result, EnergyCalculator(graph=graph).evaluate_energy_usage(changed_variables_map))
+
+    def test_least_recently_used_results_are_evicted(self, tmp_path):
+        cache = ComponentResultCache(tmp_path, max_size_bytes=int(2.5 * RESULT_SIZE))
+        put_result_of_size(cache, "first", last_used=1)
+        put_result_of_size(cache, "second", last_used=2)
+        cache.get("first")
+
+        put_result_of_size(cache, "third", last_used=3)
+
+        assert get_stored_keys(tmp_path) == {"first", "third"}
+
+    def test_directory_is_only_scanned_when_full(self, tmp_path):
+        put_result_of_size(ComponentResultCache(tmp_path), "stored", last_used=1)
+        cache = ComponentResultCache(tmp_path, max_size_bytes=int(2.5 * RESULT_SIZE))
+
+        with patch.object(cache, "_get_result_files", wraps=cache._get_result_files) as get_result_files:
+            put_result_of_size(cache, "first", last_used=2)
+            # Storing a result again replaces the earlier result, and does not add to the size of the cache
+            put_result_of_size(cache, "first", last_used=3)
+            assert get_result_files.call_count == 0
+
+            put_result_of_size(cache, "second", last_used=4)
+            assert get_result_files.call_count == 1
+
+        assert get_stored_keys(tmp_path) == {"first", "second"}
+
+    def test_results_removed_by_others_are_ignored(self, tmp_path):
+        cache = ComponentResultCache(tmp_path, max_size_bytes=int(2.5 * RESULT_SIZE))
+        put_result_of_size(cache, "first", last_used=1)
+        put_result_of_size(cache, "second", last_used=2)
+        (tmp_path / "first.pickle").unlink()
+        ComponentResultCache(tmp_path).put("other", {"component": b"x" * RESULT_SIZE})
+
+        put_result_of_size(cache, "third", last_used=3)
+
+        assert get_stored_keys(tmp_path) == {"other", "third"}
+        assert cache._size_bytes <= int(2.5 * RESULT_SIZE)
+
+    def test_results_are_written_to_unique_temporary_files(self, tmp_path):
+        cache = ComponentResultCache(tmp_path)
+        temporary_paths = []
+        replace = os.replace
+
+        def record_temporary_path(source, destination):
+            temporary_paths.append(Path(source))
+            replace(source, destination)
+
+        with patch.object(result_cache_module.os, "replace", side_effect=record_temporary_path):
+            cache.put("key", {})
+            cache.put("key", {})
+
+        assert len(set(temporary_paths)) == 2
+        assert all(temporary_path.parent == tmp_path for temporary_path in temporary_paths)
+        assert [path.name for path in tmp_path.iterdir()] == ["key.pickle"]
+
+    def test_temporary_file_is_removed_when_storing_fails(self, tmp_path):
+        cache = ComponentResultCache(tmp_path)
+
+        with pytest.raises((AttributeError, pickle.PicklingError)):
+            cache.put("key", {"component": lambda: None})
+
+        assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,118 @@
+from typing import List
+
+import numpy as np
+import pytest
+
+from libecalc import dto
+from libecalc.application.energy_calculator import EnergyCalculator
+from libecalc.application.graph_result import GraphResult
+from libecalc.application.scenario_batch import ScenarioBatch
+
+
+@pytest.fixture
+def scenarios(consumer_system_v2_dto_fixture) -> List[dto.VariablesMap]:
+    variables_map = consumer_system_v2_dto_fixture.variables
+    return [
+        variables_map.model_copy(
+            update={
+                "variables": {
+                    **variables_map.variables,
+                    "$var.compressor1": [value * factor for value in variables_map.variables["$var.compressor1"]],
+                }
+            }
+        )
+        for factor in [0.5, 1.0, 1.5]
+    ]
+
+
+@pytest.fixture
+def assert_same_graph_results(assert_same_consumer_results):
+    def assert_same_graph_results(graph_results: List[GraphResult], expected_graph_results: List[GraphResult]):
+        assert len(graph_results) == len(expected_graph_results)
+        for graph_result, expected_graph_result in zip(graph_results, expected_graph_results):
+            assert graph_result.variables_map == expected_graph_result.variables_map
+            assert_same_consumer_results(graph_result.consumer_results, expected_graph_result.consumer_results)
+
+    return assert_same_graph_results
+
+
+def evaluate_separately(graph, variables_maps: List[dto.VariablesMap]) -> List[GraphResult]:
+    graph_results = []
+    for variables_map in variables_maps:
+        energy_calculator = EnergyCalculator(graph=graph)
+        consumer_results = energy_calculator.evaluate_energy_usage(variables_map)
+        graph_results.append(
+            GraphResult(
+                graph=graph,
+                consumer_results=consumer_results,
+                emission_results=energy_calculator.evaluate_emissions(
+                    variables_map=variables_map, consumer_results=consumer_results
+                ),
+                variables_map=variables_map,
+            )
+        )
+    return graph_results
+
+
+class TestScenarioBatch:
+    def test_same_results_as_separate_runs(self, consumer_system_v2_dto_fixture, scenarios, assert_same_graph_results):
+        graph = consumer_system_v2_dto_fixture.ecalc_model.get_graph()
+
+        result = ScenarioBatch(graph=graph).evaluate(scenarios)
+
+        assert_same_graph_results(result.graph_results, evaluate_separately(graph, scenarios))
+
+    def test_parallel_scenarios(self, consumer_system_v2_dto_fixture, scenarios, assert_same_graph_results):
+        graph = consumer_system_v2_dto_fixture.ecalc_model.get_graph()
+
+        result = ScenarioBatch(graph=graph, max_workers=2).evaluate(scenarios)
+
+        assert_same_graph_results(result.graph_results, ScenarioBatch(graph=graph).evaluate(scenarios).graph_results)
+
+    def test_summary(self, consumer_system_v2_dto_fixture, scenarios):
+        graph = consumer_system_v2_dto_fixture.ecalc_model.get_graph()
+
+        result = ScenarioBatch(graph=graph).evaluate(scenarios)
+        summary = result.get_summary()
+
+        number_of_timesteps = len(consumer_system_v2_dto_fixture.variables.time_vector)
+        assert summary.time_vector == consumer_system_v2_dto_fixture.variables.time_vector
+        assert summary.energy_usage["compressor_system_v2"].shape == (3, number_of_timesteps)
+        for scenario_index, graph_result in enumerate(result.graph_results):
+            np.testing.assert_equal(
+                summary.energy_usage["compressor_system_v2"][scenario_index],
+                graph_result.consumer_results["compressor_system_v2"].component_result.energy_usage.values,
+            )
+            np.testing.assert_equal(
+                summary.emissions["compressor_system"]["co2"][scenario_index],
+                graph_result.emission_results["compressor_system"]["co2"].rate.values,
+            )
+
+    def test_scenarios_with_stateful_compressor_trains_are_independent(
+        self,
+        fuel_consumer_with_mixing_streams_dto,
+        asset_dto_factory,
+        mixing_streams_variables_factory,
+        assert_same_graph_results,
+    ):
+        """
+        The train keeps the fluid entering each stage, and recirculates it when there is no flow into a stage. The
+        fluid from one scenario must not be recirculated in the next scenario.
+        """
+        graph = asset_dto_factory(fuel_consumer_with_mixing_streams_dto).get_graph()
+        flow_through_both_stages = mixing_streams_variables_factory([3000000], [1000000], [1000000])
+        flow_and_then_no_flow_into_second_stage = mixing_streams_variables_factory(
+            [3000000, 3000000], [1000000, 3000000], [2000000, 0]
+        )
+        no_flow_into_second_stage = mixing_streams_variables_factory([3000000], [3000000], [0])
+
+        scenarios = [flow_through_both_stages, flow_and_then_no_flow_into_second_stage]
+        assert_same_graph_results(
+            ScenarioBatch(graph=graph).evaluate(scenarios).graph_results, evaluate_separately(graph, scenarios)
+        )
+
+        # As when evaluated separately, there is no fluid to recirculate when there is no flow in the first timestep
+        with pytest.raises(ValueError, match="without defining which composition"):
+            evaluate_separately(graph, [no_flow_into_second_stage])
+        with pytest.raises(ValueError, match="without defining which composition"):
+            ScenarioBatch(graph=graph).evaluate([flow_through_both_stages, no_flow_into_second_stage])
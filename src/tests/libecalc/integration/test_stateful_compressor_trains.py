@@ -0,0 +1,77 @@
+import pytest
+
+from libecalc.application.energy_calculator import EnergyCalculator
+
+# Rates of the rich gas, the export after the first stage and the medium gas into the second stage
+FLOW_THROUGH_BOTH_STAGES = ([3000000], [1000000], [1000000])
+NO_FLOW_INTO_SECOND_STAGE = ([3000000], [3000000], [0])
+
+
+def concatenate_rates(*rates_per_timestep):
+    return tuple(sum(rates, []) for rates in zip(*rates_per_timestep))
+
+
+class TestFuelConsumerWithStatefulTrain:
+    def test_fluid_is_recirculated_within_an_evaluation(
+        self, fuel_consumer_with_mixing_streams_dto, asset_dto_factory, mixing_streams_variables_factory
+    ):
+        energy_calculator = EnergyCalculator(asset_dto_factory(fuel_consumer_with_mixing_streams_dto).get_graph())
+        variables = mixing_streams_variables_factory(
+            *concatenate_rates(FLOW_THROUGH_BOTH_STAGES, NO_FLOW_INTO_SECOND_STAGE)
+        )
+
+        result = energy_calculator.evaluate_energy_usage(variables)
+
+        assert len(result[fuel_consumer_with_mixing_streams_dto.id].component_result.energy_usage.values) == 2
+
+    def test_consumer_is_created_for_each_evaluation(
+        self, fuel_consumer_with_mixing_streams_dto, asset_dto_factory, mixing_streams_variables_factory
+    ):
+        energy_calculator = EnergyCalculator(asset_dto_factory(fuel_consumer_with_mixing_streams_dto).get_graph())
+        energy_calculator.evaluate_energy_usage(mixing_streams_variables_factory(*FLOW_THROUGH_BOTH_STAGES))
+
+        # As for a new calculator, there is no fluid from the earlier evaluation to recirculate
+        with pytest.raises(ValueError, match="without defining which composition"):
+            energy_calculator.evaluate_energy_usage(mixing_streams_variables_factory(*NO_FLOW_INTO_SECOND_STAGE))
+
+
+class TestConsumerSystemV2WithStatefulTrain:
+    def test_same_results_as_evaluating_each_timestep(
+        self, consumer_system_v2_with_mixing_streams_dto, asset_dto_factory, mixing_streams_variables_factory
+    ):
+        graph = asset_dto_factory(consumer_system_v2_with_mixing_streams_dto).get_graph()
+        # The rate of the last timestep is too high for the first priority
+        rates_per_timestep = [FLOW_THROUGH_BOTH_STAGES, ([2000000], [0], [2000000]), ([8000000], [0], [0])]
+
+        result = EnergyCalculator(graph).evaluate_energy_usage(
+            mixing_streams_variables_factory(*concatenate_rates(*rates_per_timestep))
+        )
+        result_per_timestep = [
+            EnergyCalculator(graph).evaluate_energy_usage(mixing_streams_variables_factory(*rates))
+            for rates in rates_per_timestep
+        ]
+
+        system_result = result[consumer_system_v2_with_mixing_streams_dto.id].component_result
+        system_results_per_timestep = [
+            result_for_timestep[consumer_system_v2_with_mixing_streams_dto.id].component_result
+            for result_for_timestep in result_per_timestep
+        ]
+        assert system_result.operational_settings_used.values == [
+            value for result in system_results_per_timestep for value in result.operational_settings_used.values
+        ]
+        assert system_result.operational_settings_used.values[-1] == 2
+        assert system_result.energy_usage.values == [
+            value for result in system_results_per_timestep for value in result.energy_usage.values
+        ]
+
+    def test_fluid_is_not_recirculated_from_other_timesteps(
+        self, consumer_system_v2_with_mixing_streams_dto, asset_dto_factory, mixing_streams_variables_factory
+    ):
+        energy_calculator = EnergyCalculator(asset_dto_factory(consumer_system_v2_with_mixing_streams_dto).get_graph())
+        variables = mixing_streams_variables_factory(
+            *concatenate_rates(FLOW_THROUGH_BOTH_STAGES, NO_FLOW_INTO_SECOND_STAGE)
+        )
+
+        # The consumers are created for each timestep, as when the system was evaluated one timestep at a time
+        with pytest.raises(ValueError, match="without defining which composition"):
+            energy_calculator.evaluate_energy_usage(variables)